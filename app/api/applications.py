@@ -7,23 +7,27 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
-from ..data.database import (
-    get_application_repository,
-    get_database_manager,
-    get_job_repository,
-    get_user_repository,
+from ..data.async_database import (
+    get_async_application_repository,
+    get_async_job_repository,
+    get_async_user_repository,
 )
+from ..data.counts import CountStrategy, total_is_lower_bound
+from ..data.database import get_database_manager
 from ..data.models import (
     ApplicationStatus,
     JobApplication,
-    JobApplicationDB,
-    JobListingDB,
+    JobListing,
     TimelineEvent,
+    TimelineEventDB,
     TimelineEventType,
+    UserProfile,
 )
+from ..services.timeline_service import TimelineService
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
@@ -83,7 +87,9 @@ class ApplicationsListResponse(BaseModel):
     """Response model for applications list."""
 
     applications: List[ApplicationResponse]
-    total: int
+    total: Optional[int]
+    total_strategy: CountStrategy
+    total_is_lower_bound: bool = False  # More than ``total`` applications match
     page: int
     page_size: int
 
@@ -97,16 +103,15 @@ class ApplicationsListResponse(BaseModel):
 async def create_application(request: CreateApplicationRequest):
     """Create a new job application."""
     try:
-        app_repo = get_application_repository()
-        job_repo = get_job_repository()
+        app_repo = get_async_application_repository()
 
         # Verify job exists
-        job = job_repo.get_job(request.job_id)
+        job = await get_async_job_repository().get_job(request.job_id)
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
 
         # Check if application already exists for this job/user combination
-        existing_app = app_repo.get_application_by_job_and_user(
+        existing_app = await app_repo.get_application_by_job_and_user(
             request.job_id, request.user_profile_id
         )
         if existing_app:
@@ -131,14 +136,16 @@ async def create_application(request: CreateApplicationRequest):
             notes=request.notes,
         )
 
-        application = app_repo.create_application(app_data)
+        application = await app_repo.create_application(app_data)
 
         # TODO: Create timeline event (implement when timeline service is ready)
 
         # Get full application data with job info
-        app_response = get_application_response(application.id)
+        app_response = await get_application_response(application.id)
         return app_response
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -149,26 +156,44 @@ async def get_applications(
     status: Optional[ApplicationStatus] = Query(None, description="Filter by status"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Page size"),
-    db=Depends(get_database_manager),
+    count: CountStrategy = Query(
+        CountStrategy.CACHED, description="How the total count is computed"
+    ),
 ):
     """Get user's job applications with filtering and pagination."""
     try:
         offset = (page - 1) * page_size
 
-        applications, total = await db.get_applications(
+        applications, total = await get_async_application_repository().get_applications(
             user_profile_id=user_profile_id,
             status=status,
             limit=page_size,
             offset=offset,
+            count_strategy=count,
         )
 
-        app_responses = []
-        for app in applications:
-            app_response = await get_application_response(app.id, db)
-            app_responses.append(app_response)
+        # Batch-load related jobs and profiles: same query count for any page size
+        jobs = await get_async_job_repository().get_jobs_by_ids(
+            app.job_id for app in applications
+        )
+        users = await get_async_user_repository().get_users_by_ids(
+            app.user_profile_id for app in applications
+        )
+
+        app_responses = [
+            build_application_response(
+                app, jobs.get(str(app.job_id)), users.get(str(app.user_profile_id))
+            )
+            for app in applications
+        ]
 
         return ApplicationsListResponse(
-            applications=app_responses, total=total, page=page, page_size=page_size
+            applications=app_responses,
+            total=total,
+            total_strategy=count,
+            total_is_lower_bound=total_is_lower_bound(count, total),
+            page=page,
+            page_size=page_size,
         )
 
     except Exception as e:
@@ -176,10 +201,10 @@ async def get_applications(
 
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
-async def get_application(application_id: str, db=Depends(get_database_manager)):
+async def get_application(application_id: str):
     """Get a specific job application."""
     try:
-        app_response = await get_application_response(application_id, db)
+        app_response = await get_application_response(application_id)
         if not app_response:
             raise HTTPException(status_code=404, detail="Application not found")
         return app_response
@@ -194,12 +219,13 @@ async def get_application(application_id: str, db=Depends(get_database_manager))
 async def update_application(
     application_id: str,
     request: UpdateApplicationRequest,
-    db=Depends(get_database_manager),
 ):
     """Update a job application."""
     try:
+        app_repo = get_async_application_repository()
+
         # Get existing application
-        existing_app = await db.get_application(application_id)
+        existing_app = await app_repo.get_application(application_id)
         if not existing_app:
             raise HTTPException(status_code=404, detail="Application not found")
 
@@ -223,19 +249,19 @@ async def update_application(
             update_data["interview_scheduled"] = request.interview_scheduled
 
         # Update application
-        await db.update_application(application_id, update_data)
+        await app_repo.update_application(application_id, update_data)
 
         # Create timeline event for status changes
         if request.status and request.status != existing_app.status:
-            job = await db.get_job(existing_app.job_id)
-            timeline_event = await create_status_change_timeline_event(
-                existing_app, request.status, job, db
+            job = await get_async_job_repository().get_job(str(existing_app.job_id))
+            timeline_event = create_status_change_timeline_event(
+                existing_app, request.status, job
             )
             if timeline_event:
-                await db.create_timeline_event(timeline_event)
+                await run_in_threadpool(save_timeline_event, timeline_event)
 
         # Get updated application data
-        app_response = await get_application_response(application_id, db)
+        app_response = await get_application_response(application_id)
         return app_response
 
     except HTTPException:
@@ -245,19 +271,21 @@ async def update_application(
 
 
 @router.delete("/{application_id}")
-async def delete_application(application_id: str, db=Depends(get_database_manager)):
+async def delete_application(application_id: str):
     """Delete a job application."""
     try:
+        app_repo = get_async_application_repository()
+
         # Get existing application
-        existing_app = await db.get_application(application_id)
+        existing_app = await app_repo.get_application(application_id)
         if not existing_app:
             raise HTTPException(status_code=404, detail="Application not found")
 
         # Delete related timeline events
-        await db.delete_timeline_events_by_application(application_id)
+        await run_in_threadpool(delete_application_timeline, application_id)
 
         # Delete application
-        await db.delete_application(application_id)
+        await app_repo.delete_application(application_id)
 
         return {"message": "Application deleted successfully"}
 
@@ -268,18 +296,20 @@ async def delete_application(application_id: str, db=Depends(get_database_manage
 
 
 @router.get("/{application_id}/timeline")
-async def get_application_timeline(
-    application_id: str, db=Depends(get_database_manager)
-):
+async def get_application_timeline(application_id: str):
     """Get timeline events for a specific application."""
     try:
         # Verify application exists
-        application = await db.get_application(application_id)
+        application = await get_async_application_repository().get_application(
+            application_id
+        )
         if not application:
             raise HTTPException(status_code=404, detail="Application not found")
 
         # Get timeline events
-        timeline_events = await db.get_application_timeline(application_id)
+        timeline_events = await run_in_threadpool(
+            load_application_timeline, application_id
+        )
 
         return {"application_id": application_id, "events": timeline_events}
 
@@ -294,18 +324,64 @@ async def get_application_timeline(
 # =====================================
 
 
-def get_application_response(application_id: str) -> Optional[ApplicationResponse]:
+async def get_application_response(
+    application_id: str,
+) -> Optional[ApplicationResponse]:
     """Get full application data with related job and user profile info."""
-    app_repo = get_application_repository()
-    job_repo = get_job_repository()
-    user_repo = get_user_repository()
-
-    application = app_repo.get_application(application_id)
+    application = await get_async_application_repository().get_application(
+        application_id
+    )
     if not application:
         return None
 
-    # Get related job data
-    job = job_repo.get_job(application.job_id)
+    return build_application_response(
+        application,
+        await get_async_job_repository().get_job(str(application.job_id)),
+        await get_async_user_repository().get_user(str(application.user_profile_id)),
+    )
+
+
+# Timeline events are still managed by the sync TimelineService; these run in
+# the thread pool so they don't block the event loop.
+
+
+def save_timeline_event(event: TimelineEvent) -> TimelineEvent:
+    """Store a timeline event."""
+    with get_database_manager().get_session() as session:
+        return TimelineService(session).create_event(
+            user_profile_id=event.user_profile_id,
+            event_type=event.event_type,
+            title=event.title,
+            description=event.description,
+            job_id=event.job_id,
+            application_id=event.application_id,
+            event_data=event.event_data,
+            is_milestone=event.is_milestone,
+        )
+
+
+def delete_application_timeline(application_id: str) -> int:
+    """Delete an application's timeline events, returning how many."""
+    with get_database_manager().get_session() as session:
+        return (
+            session.query(TimelineEventDB)
+            .filter(TimelineEventDB.application_id == application_id)
+            .delete(synchronize_session=False)
+        )
+
+
+def load_application_timeline(application_id: str) -> List[TimelineEvent]:
+    """Timeline events of an application, in chronological order."""
+    with get_database_manager().get_session() as session:
+        return TimelineService(session).get_application_timeline(application_id)
+
+
+def build_application_response(
+    application: JobApplication,
+    job: Optional[JobListing],
+    user_profile: Optional[UserProfile],
+) -> ApplicationResponse:
+    """Assemble an ApplicationResponse from already-loaded records."""
     job_data = (
         {
             "id": job.id,
@@ -324,8 +400,7 @@ def get_application_response(application_id: str) -> Optional[ApplicationRespons
         else None
     )
 
-    # Get user profile data (basic info only)
-    user_profile = user_repo.get_user(application.user_profile_id)
+    # User profile data (basic info only)
     profile_data = (
         {
             "id": user_profile.id,
@@ -339,9 +414,9 @@ def get_application_response(application_id: str) -> Optional[ApplicationRespons
     )
 
     return ApplicationResponse(
-        id=application.id,
-        job_id=application.job_id,
-        user_profile_id=application.user_profile_id,
+        id=str(application.id),
+        job_id=str(application.job_id),
+        user_profile_id=str(application.user_profile_id),
         status=application.status,
         applied_date=application.applied_date,
         response_date=application.response_date,
@@ -357,11 +432,10 @@ def get_application_response(application_id: str) -> Optional[ApplicationRespons
     )
 
 
-async def create_status_change_timeline_event(
-    application: JobApplicationDB,
+def create_status_change_timeline_event(
+    application: JobApplication,
     new_status: ApplicationStatus,
-    job: Optional[JobListingDB],
-    db,
+    job: Optional[JobListing],
 ) -> Optional[TimelineEvent]:
     """Create a timeline event for application status changes."""
     if not job:
@@ -382,7 +456,7 @@ async def create_status_change_timeline_event(
             "is_milestone": True,
         },
         ApplicationStatus.ACCEPTED: {
-            "type": TimelineEventType.OFFER_RECEIVED,
+            "type": TimelineEventType.RESPONSE_RECEIVED,
             "title": f"Offer received from {job.company}",
             "description": f"Job offer received for {job.title}",
             "is_milestone": True,
@@ -406,9 +480,9 @@ async def create_status_change_timeline_event(
         return None
 
     return TimelineEvent(
-        job_id=application.job_id,
-        application_id=application.id,
-        user_profile_id=application.user_profile_id,
+        job_id=str(application.job_id),
+        application_id=str(application.id),
+        user_profile_id=str(application.user_profile_id),
         event_type=event_info["type"],
         title=event_info["title"],
         description=event_info["description"],
@@ -10,8 +10,10 @@ from uuid import UUID, uuid4
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
+from ..data.counts import CountStrategy
 from ..data.database import get_application_repository, get_job_repository
 from ..data.models import ApplicationStatus, JobApplication
+from ..data.pagination import InvalidCursorError
 
 router = APIRouter(prefix="/api/applications", tags=["applications"])
 
@@ -115,20 +117,35 @@ def get_applications(
     user_profile_id: str = Query(DEFAULT_USER_ID, description="User profile ID"),
     status: Optional[ApplicationStatus] = Query(None, description="Filter by status"),
     limit: int = Query(20, ge=1, le=100, description="Limit"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    include_total: Optional[bool] = Query(
+        None, description="Compute the total count (default: first page only)"
+    ),
+    count: CountStrategy = Query(
+        CountStrategy.CACHED, description="How the total count is computed"
+    ),
 ):
-    """Get user's job applications."""
+    """Get user's job applications, newest first, with cursor pagination."""
     try:
         app_repo = get_application_repository()
-        job_repo = get_job_repository()
 
-        applications, total = app_repo.get_applications(
-            user_profile_id=user_profile_id, status=status, limit=limit, offset=0
-        )
+        try:
+            page = app_repo.get_applications_with_jobs(
+                user_profile_id=user_profile_id,
+                status=status,
+                limit=limit,
+                cursor=cursor,
+                include_total=(
+                    cursor is None if include_total is None else include_total
+                ),
+                count_strategy=count,
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-        # Enrich with job data
+        # Job data comes from the same JOIN query
         app_responses = []
-        for app in applications:
-            job = job_repo.get_job(app.job_id)
+        for app, job in page.items:
             app_response = ApplicationResponse(
                 id=str(app.id),
                 job_id=str(app.job_id),
@@ -143,8 +160,16 @@ def get_applications(
             )
             app_responses.append(app_response)
 
-        return {"applications": app_responses, "total": total}
+        return {
+            "applications": app_responses,
+            "total": page.total,
+            "total_strategy": page.total_strategy,
+            "total_is_lower_bound": page.total_is_lower_bound,
+            "next_cursor": page.next_cursor,
+        }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
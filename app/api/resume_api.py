@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Body, HTTPException, Path, Query
 from pydantic import BaseModel, Field
 
-from app.data.database import get_resume_repository
+from app.data.async_database import get_async_resume_repository
 from app.data.resume_models import (
     Certification as CertificationModel,
 )
@@ -230,11 +230,11 @@ async def get_user_resumes(
     """Get all resumes for a user with optional filtering and pagination."""
     try:
         # Get resume repository
-        resume_repo = get_resume_repository()
+        resume_repo = get_async_resume_repository()
 
         # Get resumes from database with pagination
         offset = (page - 1) * per_page
-        resumes, total = resume_repo.get_user_resumes(
+        resumes, total = await resume_repo.get_user_resumes(
             user_id=user_id, status=status, limit=per_page, offset=offset
         )
 
@@ -299,8 +299,8 @@ async def get_resume(
 ):
     """Get a specific resume by ID."""
     try:
-        resume_repo = get_resume_repository()
-        resume = resume_repo.get_resume(resume_id=resume_id)
+        resume_repo = get_async_resume_repository()
+        resume = await resume_repo.get_resume(resume_id=resume_id)
 
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
@@ -327,7 +327,7 @@ async def create_resume(
 ):
     """Create a new resume."""
     try:
-        resume_repo = get_resume_repository()
+        resume_repo = get_async_resume_repository()
         now = datetime.utcnow()
 
         # Create resume data
@@ -358,7 +358,7 @@ async def create_resume(
         )
 
         # Store the resume
-        created_resume = resume_repo.create_resume(resume_data)
+        created_resume = await resume_repo.create_resume(resume_data)
 
         logger.info(f"Created new resume: {created_resume.id} for user: {user_id}")
         return {
@@ -380,8 +380,8 @@ async def update_resume(
 ):
     """Update an existing resume."""
     try:
-        resume_repo = get_resume_repository()
-        resume = resume_repo.get_resume(resume_id=resume_id)
+        resume_repo = get_async_resume_repository()
+        resume = await resume_repo.get_resume(resume_id=resume_id)
 
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
@@ -394,7 +394,7 @@ async def update_resume(
         update_data = request.dict(exclude_unset=True)
 
         if update_data:
-            updated_resume = resume_repo.update_resume(
+            updated_resume = await resume_repo.update_resume(
                 resume_id=resume_id, update_data=update_data
             )
             if updated_resume:
@@ -422,16 +422,16 @@ async def delete_resume(
 ):
     """Delete a resume."""
     try:
-        resume_repo = get_resume_repository()
+        resume_repo = get_async_resume_repository()
 
         # First check if resume exists and belongs to user
-        resume = resume_repo.get_resume(resume_id=resume_id)
+        resume = await resume_repo.get_resume(resume_id=resume_id)
         if not resume or resume.user_id != user_id:
             raise HTTPException(
                 status_code=404, detail="Resume not found or access denied"
             )
 
-        success = resume_repo.delete_resume(resume_id=resume_id)
+        success = await resume_repo.delete_resume(resume_id=resume_id)
 
         if not success:
             raise HTTPException(status_code=404, detail="Resume not found")
@@ -499,8 +499,8 @@ async def export_resume(
 ):
     """Export an existing resume in various formats."""
     try:
-        resume_repo = get_resume_repository()
-        resume = resume_repo.get_resume(resume_id=resume_id)
+        resume_repo = get_async_resume_repository()
+        resume = await resume_repo.get_resume(resume_id=resume_id)
 
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
@@ -576,8 +576,8 @@ async def get_resume_analytics(
 ):
     """Get comprehensive analytics for a resume."""
     try:
-        resume_repo = get_resume_repository()
-        resume = resume_repo.get_resume(resume_id=resume_id)
+        resume_repo = get_async_resume_repository()
+        resume = await resume_repo.get_resume(resume_id=resume_id)
 
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
@@ -639,7 +639,7 @@ async def get_resume_analytics(
 async def resume_api_health():
     """Health check for resume API."""
     try:
-        resume_repo = get_resume_repository()
+        resume_repo = get_async_resume_repository()
         total_resumes = await resume_repo.get_total_resumes_count()
         return {
             "status": "healthy",
@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Path, Query
 from pydantic import BaseModel
 
-from app.data.database import get_database_manager
+from app.data.async_database import get_async_database_manager
 from app.data.skill_bank_models import (
     Certification,
     ContentFocusType,
@@ -190,7 +190,7 @@ class CertificationRequest(BaseModel):
 async def get_skill_bank(user_id: str = Path(..., description="User ID")):
     """Get user's complete skill bank."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         skill_bank = await skill_bank_repo.get_skill_bank(user_id)
@@ -212,7 +212,7 @@ async def update_skill_bank(
 ):
     """Update skill bank basic information."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         updates = {}
@@ -240,7 +240,7 @@ async def add_skill(
 ):
     """Add a new skill to the skill bank."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         skill = EnhancedSkill(**skill_request.dict())
@@ -262,7 +262,7 @@ async def get_skills(
 ):
     """Get all skills for a user, optionally filtered by category."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         skills = await skill_bank_repo.get_skills(user_id, category)
@@ -281,7 +281,7 @@ async def update_skill(
 ):
     """Update an existing skill."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         updates = {}
@@ -306,7 +306,7 @@ async def delete_skill(
 ):
     """Delete a skill from the skill bank."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         success = await skill_bank_repo.delete_skill(user_id, skill_id)
@@ -332,7 +332,7 @@ async def add_summary_variation(
 ):
     """Add a new summary variation."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         variation = SummaryVariation(**summary_request.dict())
@@ -355,7 +355,7 @@ async def update_summary_variation(
 ):
     """Update a summary variation."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         updates = summary_request.dict(exclude_unset=True)
@@ -381,7 +381,7 @@ async def delete_summary_variation(
 ):
     """Delete a summary variation."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         success = await skill_bank_repo.delete_summary_variation(user_id, variation_id)
@@ -409,7 +409,7 @@ async def add_experience(
 ):
     """Add a new work experience entry."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         experience = ExperienceEntry(**experience_request.dict())
@@ -430,7 +430,7 @@ async def update_experience(
 ):
     """Update a work experience entry."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         updates = experience_request.dict(exclude_unset=True)
@@ -456,7 +456,7 @@ async def delete_experience(
 ):
     """Delete a work experience entry."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         success = await skill_bank_repo.delete_experience(user_id, experience_id)
@@ -484,7 +484,7 @@ async def add_experience_content_variation(
 ):
     """Add a content variation to a work experience entry."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         # Ensure the experience_id in the request matches the path parameter
@@ -518,7 +518,7 @@ async def add_education(
 ):
     """Add a new education entry."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         education = EducationEntry(**education_request.dict())
@@ -539,7 +539,7 @@ async def update_education(
 ):
     """Update an education entry."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         updates = education_request.dict(exclude_unset=True)
@@ -563,7 +563,7 @@ async def delete_education(
 ):
     """Delete an education entry."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         success = await skill_bank_repo.delete_education(user_id, education_id)
@@ -589,7 +589,7 @@ async def add_project(
 ):
     """Add a new project entry."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         project = ProjectEntry(**project_request.dict())
@@ -610,7 +610,7 @@ async def update_project(
 ):
     """Update a project entry."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         updates = project_request.dict(exclude_unset=True)
@@ -634,7 +634,7 @@ async def delete_project(
 ):
     """Delete a project entry."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         success = await skill_bank_repo.delete_project(user_id, project_id)
@@ -660,7 +660,7 @@ async def add_certification(
 ):
     """Add a new certification entry."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         certification = Certification(**cert_request.dict())
@@ -685,7 +685,7 @@ async def update_certification(
 ):
     """Update a certification entry."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         updates = cert_request.dict(exclude_unset=True)
@@ -711,7 +711,7 @@ async def delete_certification(
 ):
     """Delete a certification entry."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         success = await skill_bank_repo.delete_certification(user_id, certification_id)
@@ -736,7 +736,7 @@ async def delete_certification(
 async def migrate_from_user_profile(user_id: str = Path(..., description="User ID")):
     """Migrate skills data from UserProfile to SkillBank."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         migrated_bank = await skill_bank_repo.migrate_from_user_profile(user_id)
@@ -758,7 +758,7 @@ async def migrate_from_user_profile(user_id: str = Path(..., description="User I
 async def get_skill_categories(user_id: str = Path(..., description="User ID")):
     """Get all skill categories for a user."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         skill_bank = await skill_bank_repo.get_or_create_skill_bank(user_id)
@@ -773,7 +773,7 @@ async def get_skill_categories(user_id: str = Path(..., description="User ID")):
 async def get_skill_bank_stats(user_id: str = Path(..., description="User ID")):
     """Get skill bank statistics."""
     try:
-        db_manager = get_database_manager()
+        db_manager = get_async_database_manager()
         skill_bank_repo = SkillBankRepository(db_manager)
 
         skill_bank = await skill_bank_repo.get_or_create_skill_bank(user_id)
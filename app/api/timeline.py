@@ -11,12 +11,13 @@ This module provides REST API endpoints for:
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.data.database import get_database_manager
 from app.data.models import TimelineEventType
+from app.data.pagination import InvalidCursorError
 from app.services.timeline_service import TimelineService
 
 router = APIRouter(prefix="/api/timeline", tags=["timeline"])
@@ -94,6 +95,9 @@ def get_user_timeline(
         50, ge=1, le=100, description="Maximum number of events to return"
     ),
     offset: int = Query(0, ge=0, description="Number of events to skip"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page's X-Next-Cursor header"
+    ),
     job_id: Optional[str] = Query(None, description="Filter by job ID"),
     event_types: Optional[List[TimelineEventType]] = Query(
         None, description="Filter by event types"
@@ -101,23 +105,44 @@ def get_user_timeline(
     days_back: Optional[int] = Query(
         None, ge=1, description="Only include events from the last N days"
     ),
+    response: Response = None,
     db: Session = Depends(get_database_session),
 ):
-    """Get timeline events for a specific user."""
+    """
+    Get timeline events for a specific user.
+
+    Unless ``offset`` is used, results are keyset-paginated and the cursor for
+    the next page is returned in the ``X-Next-Cursor`` response header.
+    """
 
     try:
         timeline_service = TimelineService(db)
-        events = timeline_service.get_user_timeline(
-            user_profile_id=user_profile_id,
-            limit=limit,
-            offset=offset,
-            job_id=job_id,
-            event_types=event_types,
-            days_back=days_back,
-        )
+        if offset:
+            events = timeline_service.get_user_timeline(
+                user_profile_id=user_profile_id,
+                limit=limit,
+                offset=offset,
+                job_id=job_id,
+                event_types=event_types,
+                days_back=days_back,
+            )
+        else:
+            page = timeline_service.get_user_timeline_page(
+                user_profile_id=user_profile_id,
+                limit=limit,
+                cursor=cursor,
+                job_id=job_id,
+                event_types=event_types,
+                days_back=days_back,
+            )
+            events = page.items
+            if page.next_cursor:
+                response.headers["X-Next-Cursor"] = page.next_cursor
 
         return [TimelineEventResponse.from_orm(event) for event in events]
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Error retrieving timeline: {str(e)}"
@@ -9,7 +9,7 @@ from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, EmailStr
 
-from app.data.database import get_user_repository
+from app.data.async_database import get_async_user_repository
 from app.data.models import JobType, RemoteType, UserProfile
 from app.logger import logger
 
@@ -92,13 +92,13 @@ class UserProfileResponse(BaseModel):
 async def create_user_profile(user_data: UserProfileCreate):
     """Create a new user profile."""
     try:
-        user_repo = get_user_repository()
+        user_repo = get_async_user_repository()
 
         # Convert to UserProfile model
         user_profile = UserProfile(**user_data.model_dump())
 
         # Create the user
-        created_user = user_repo.create_user(user_profile)
+        created_user = await user_repo.create_user(user_profile)
 
         return UserProfileResponse(
             id=str(created_user.id),
@@ -142,8 +142,8 @@ async def list_user_profiles(
 ):
     """List all user profiles with pagination."""
     try:
-        user_repo = get_user_repository()
-        users, total = user_repo.list_users(limit=limit, offset=offset)
+        user_repo = get_async_user_repository()
+        users, total = await user_repo.list_users(limit=limit, offset=offset)
 
         response_users = []
         for user in users:
@@ -184,8 +184,8 @@ async def list_user_profiles(
 async def get_user_profile(user_id: str):
     """Get a specific user profile by ID."""
     try:
-        user_repo = get_user_repository()
-        user = user_repo.get_user(user_id)
+        user_repo = get_async_user_repository()
+        user = await user_repo.get_user(user_id)
 
         # Handle demo user case - check if demo user exists by email first
         if not user and user_id == "demo-user-123":
@@ -194,7 +194,7 @@ async def get_user_profile(user_id: str):
             )
             # First try to find existing demo user by email
             try:
-                user = user_repo.get_user_by_email("demo@jobpilot.dev")
+                user = await user_repo.get_user_by_email("demo@jobpilot.dev")
                 logger.info(f"Found existing demo user with ID: {user.id}")
             except Exception:
                 # Demo user doesn't exist, create it
@@ -215,7 +215,7 @@ async def get_user_profile(user_id: str):
                     desired_salary_min=80000.0,
                     desired_salary_max=120000.0,
                 )
-                user = user_repo.create_user(demo_profile)
+                user = await user_repo.create_user(demo_profile)
                 logger.info(f"Created new demo user profile with ID: {user.id}")
 
         if not user:
@@ -256,7 +256,7 @@ async def get_user_profile(user_id: str):
 async def update_user_profile(user_id: str, user_data: UserProfileUpdate):
     """Update an existing user profile."""
     try:
-        user_repo = get_user_repository()
+        user_repo = get_async_user_repository()
 
         # Convert to dict and remove None values
         update_dict = {k: v for k, v in user_data.model_dump().items() if v is not None}
@@ -264,7 +264,7 @@ async def update_user_profile(user_id: str, user_data: UserProfileUpdate):
         if not update_dict:
             raise HTTPException(status_code=400, detail="No fields to update")
 
-        updated_user = user_repo.update_user(user_id, update_dict)
+        updated_user = await user_repo.update_user(user_id, update_dict)
 
         if not updated_user:
             raise HTTPException(status_code=404, detail="User profile not found")
@@ -304,8 +304,8 @@ async def update_user_profile(user_id: str, user_data: UserProfileUpdate):
 async def delete_user_profile(user_id: str):
     """Delete a user profile."""
     try:
-        user_repo = get_user_repository()
-        success = user_repo.delete_user(user_id)
+        user_repo = get_async_user_repository()
+        success = await user_repo.delete_user(user_id)
 
         if not success:
             raise HTTPException(status_code=404, detail="User profile not found")
@@ -323,10 +323,10 @@ async def delete_user_profile(user_id: str):
 async def get_default_user_profile():
     """Get the default user profile (for single-user mode)."""
     try:
-        user_repo = get_user_repository()
+        user_repo = get_async_user_repository()
 
         # Try to find a user by the demo email first
-        user = user_repo.get_user_by_email("demo@jobpilot.dev")
+        user = await user_repo.get_user_by_email("demo@jobpilot.dev")
 
         if not user:
             logger.info("Default user not found, creating default profile")
@@ -347,7 +347,7 @@ async def get_default_user_profile():
                 desired_salary_min=80000.0,
                 desired_salary_max=120000.0,
             )
-            user = user_repo.create_user(demo_profile)
+            user = await user_repo.create_user(demo_profile)
             logger.info(f"Created default user profile with ID: {user.id}")
 
         return UserProfileResponse(
@@ -387,8 +387,8 @@ async def get_user_by_email(
 ):
     """Get a user profile by email address."""
     try:
-        user_repo = get_user_repository()
-        user = user_repo.get_user_by_email(email)
+        user_repo = get_async_user_repository()
+        user = await user_repo.get_user_by_email(email)
 
         if not user:
             raise HTTPException(status_code=404, detail="User profile not found")
@@ -0,0 +1,106 @@
+"""
+JobPilot Job Archive
+Moves expired, filled and inactive job listings out of job_listings into
+job_listings_archive, so queries over current jobs only touch current rows.
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import delete, exists, insert, literal, select
+from sqlalchemy.engine import Engine
+
+from app.data.base import Base
+from app.data.models import JobListingArchiveDB, JobListingDB, JobStatus
+from app.logger import logger
+
+# Non-active listings untouched for this long are archived
+ARCHIVE_AFTER_DAYS = 90
+ARCHIVE_CHUNK_SIZE = 500
+
+ARCHIVED_STATUSES = (JobStatus.INACTIVE, JobStatus.FILLED, JobStatus.EXPIRED)
+
+# Rows derived from a listing that are dropped with it rather than keeping it
+# in job_listings; embeddings are regenerated if a listing is ever restored
+ARCHIVE_DROPPED_TABLES = frozenset({"job_embeddings"})
+
+
+def _referencing_columns() -> List:
+    """Foreign key columns pointing at job_listings.id that pin a listing."""
+    jobs = JobListingDB.__table__
+    return [
+        fk.parent
+        for table in Base.metadata.sorted_tables
+        if table.name not in ARCHIVE_DROPPED_TABLES
+        for fk in table.foreign_keys
+        if fk.column is jobs.c.id
+    ]
+
+
+def archivable_jobs(older_than_days: int, now: Optional[datetime] = None):
+    """
+    SELECT of job listing ids ready for the archive.
+
+    A listing qualifies once it has been non-active and unchanged for
+    ``older_than_days``. Listings still referenced by applications, saved
+    jobs, timelines, resumes or other listings stay in job_listings.
+    """
+    jobs = JobListingDB.__table__
+    cutoff = (now or datetime.utcnow()) - timedelta(days=older_than_days)
+    pinned = []
+    for column in _referencing_columns():
+        if column.table is jobs:
+            # Duplicates pointing at this listing through canonical_id
+            column = jobs.alias("referrer").c[column.name]
+        pinned.append(~exists().where(column == jobs.c.id))
+    return select(jobs.c.id).where(
+        jobs.c.status.in_(ARCHIVED_STATUSES),
+        jobs.c.updated_at < cutoff,
+        *pinned,
+    )
+
+
+def archive_jobs(
+    engine: Engine,
+    older_than_days: int = ARCHIVE_AFTER_DAYS,
+    chunk_size: int = ARCHIVE_CHUNK_SIZE,
+    now: Optional[datetime] = None,
+) -> int:
+    """
+    Move archivable job listings to job_listings_archive.
+
+    Works in transactions of ``chunk_size`` listings so the mover never
+    holds the write lock for long. Safe to run at any time; returns the
+    number of listings moved.
+    """
+    jobs = JobListingDB.__table__
+    archive = JobListingArchiveDB.__table__
+    dropped = [
+        Base.metadata.tables[name].c.job_id for name in sorted(ARCHIVE_DROPPED_TABLES)
+    ]
+    archived_at = now or datetime.utcnow()
+    candidates = archivable_jobs(older_than_days, now).order_by(jobs.c.id)
+
+    moved = 0
+    while True:
+        with engine.begin() as conn:
+            ids = conn.execute(candidates.limit(chunk_size)).scalars().all()
+            if not ids:
+                break
+
+            conn.execute(
+                insert(archive).from_select(
+                    [column.name for column in jobs.columns] + ["archived_at"],
+                    select(
+                        *jobs.columns, literal(archived_at, archive.c.archived_at.type)
+                    ).where(jobs.c.id.in_(ids)),
+                )
+            )
+            for column in dropped:
+                conn.execute(delete(column.table).where(column.in_(ids)))
+            conn.execute(delete(jobs).where(jobs.c.id.in_(ids)))
+            moved += len(ids)
+
+    if moved:
+        logger.info(f"Archived {moved} job listings older than {older_than_days} days")
+    return moved
@@ -0,0 +1,1537 @@
+"""
+JobPilot Async Database Management
+AsyncEngine-backed database manager and repositories for async request handlers.
+
+Mirrors the repositories in app.data.database so ``async def`` routes can
+await their queries instead of blocking the event loop on every round-trip.
+"""
+
+import os
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import desc, func, select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.util import greenlet_spawn
+
+from app.data.cache import get_record_cache
+from app.data.counts import (
+    COUNT_CACHE_TTL_SECONDS,
+    CountStrategy,
+    acount_statement,
+    filter_signature,
+    page_total_strategy,
+    total_is_lower_bound,
+)
+from app.data.database import create_schema
+from app.data.embedding_index import mark_jobs_changed
+from app.data.engine import (
+    POOL_SETTINGS,
+    SQLITE_PROFILE,
+    PoolSettings,
+    SQLiteProfile,
+    get_async_engine,
+)
+from app.data.facets import (
+    FACET_LIMIT,
+    FacetCounts,
+    company_names_statement,
+    group_facet_counts,
+    name_companies,
+)
+from app.data.models import (
+    ApplicationStatus,
+    ExperienceLevel,
+    JobApplication,
+    JobApplicationDB,
+    JobListing,
+    JobListingArchiveDB,
+    JobListingDB,
+    JobStatus,
+    JobSummary,
+    JobType,
+    RemoteType,
+    SavedJob,
+    SavedJobDB,
+    SavedJobStatus,
+    UserProfile,
+    UserProfileDB,
+    pydantic_to_sqlalchemy,
+    sqlalchemy_to_pydantic,
+)
+from app.data.pagination import (
+    InvalidCursorError,
+    Page,
+    keyset_query,
+    order_by_keys,
+    split_page,
+)
+from app.data.queries import (
+    APPLICATION_SORT_KEYS,
+    JOB_SUMMARY_COLUMNS,
+    active_saved_job_query,
+    application_by_job_and_user_query,
+    applications_count_signature,
+    archived_jobs_query,
+    build_job_facet_query,
+    build_job_search_query,
+    company_jobs_query,
+    job_applications_query,
+    recent_jobs_query,
+    resumes_by_type_query,
+    saved_jobs_query,
+    to_application_with_job,
+    to_job_summary,
+    to_saved_job_entry,
+    user_applications_query,
+    user_resumes_query,
+)
+from app.data.resume_models import Resume, ResumeDB
+from app.logger import logger
+from app.utils.retry import retry_db_write
+
+# Async DBAPI drivers for the sync URLs used by DatabaseManager
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def to_async_url(database_url: str) -> str:
+    """Translate a sync database URL to its async-driver equivalent."""
+    url = make_url(database_url)
+    drivername = ASYNC_DRIVERS.get(url.drivername, url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+async def _count(session, query_obj) -> int:
+    """Row count of a select() statement."""
+    count_query = select(func.count()).select_from(query_obj.order_by(None).subquery())
+    return (await session.execute(count_query)).scalar_one()
+
+
+class AsyncDatabaseManager:
+    """Manages async database connections and sessions."""
+
+    def __init__(
+        self,
+        database_url: str = None,
+        fulltext_enabled: bool = False,
+        sqlite_profile: Optional[SQLiteProfile] = SQLITE_PROFILE,
+        pool_settings: PoolSettings = POOL_SETTINGS,
+    ):
+        """
+        Initialize async database manager.
+
+        Accepts the same URLs, SQLite profile and pool settings as
+        DatabaseManager; the driver is swapped for its async counterpart.
+        Unlike DatabaseManager, tables are not created here: await
+        create_tables() or share a schema created by DatabaseManager.
+        """
+        if database_url is None:
+            # Default to SQLite in the data directory
+            data_dir = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+            os.makedirs(data_dir, exist_ok=True)
+            database_url = f"sqlite:///{data_dir}/jobpilot.db"
+
+        self.database_url = database_url
+        self.engine = get_async_engine(
+            to_async_url(database_url), sqlite_profile, pool_settings
+        )
+        self.SessionFactory = async_sessionmaker(self.engine, expire_on_commit=False)
+        self.fulltext_enabled = fulltext_enabled
+
+        logger.info(f"Async database manager initialized with URL: {database_url}")
+
+    async def create_tables(self):
+        """Create all database tables and migrate existing rows (see create_schema)."""
+        try:
+            # create_schema opens a transaction per migration chunk, so it is
+            # given the whole sync_engine rather than one run_sync connection
+            self.fulltext_enabled = await greenlet_spawn(
+                create_schema, self.engine.sync_engine
+            )
+            logger.info("Database tables created successfully")
+        except Exception as e:
+            logger.error(f"Error creating database tables: {e}")
+            raise
+
+    @asynccontextmanager
+    async def get_session(self):
+        """Get async database session with automatic cleanup."""
+        session = self.SessionFactory()
+        try:
+            yield session
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Database session error: {e}")
+            raise
+        finally:
+            await session.close()
+
+    async def health_check(self) -> bool:
+        """Check database connectivity."""
+        try:
+            async with self.get_session() as session:
+                await session.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            logger.error(f"Database health check failed: {e}")
+            return False
+
+    async def dispose(self):
+        """Close all pooled connections."""
+        await self.engine.dispose()
+
+
+class AsyncJobRepository:
+    """Async repository for job listing operations."""
+
+    def __init__(self, db_manager: AsyncDatabaseManager):
+        """Initialize job repository."""
+        self.db_manager = db_manager
+        self.cache = get_record_cache(db_manager.engine, "jobs")
+        self.counts = get_record_cache(
+            db_manager.engine, "job_counts", ttl_seconds=COUNT_CACHE_TTL_SECONDS
+        )
+
+    @retry_db_write()
+    async def create_job(self, job_data: JobListing) -> JobListing:
+        """Create a new job listing."""
+        try:
+            async with self.db_manager.get_session() as session:
+                job_db = pydantic_to_sqlalchemy(job_data, JobListingDB)
+                session.add(job_db)
+                await session.flush()  # Get the ID
+
+                result = sqlalchemy_to_pydantic(job_db, JobListing)
+                logger.info(f"Created job: {result.title} at {result.company}")
+
+            mark_jobs_changed(self.db_manager.engine, [result.id])
+            return result
+
+        except Exception as e:
+            logger.error(f"Error creating job: {e}")
+            raise
+        finally:
+            self.counts.clear()
+
+    async def get_job(
+        self, job_id: str, include_archived: bool = False
+    ) -> Optional[JobListing]:
+        """Get job by ID, through the record cache (see JobRepository.get_job)."""
+        job = await self.cache.aget_or_load(str(job_id), lambda: self._load_job(job_id))
+        if job is None and include_archived:
+            job = await self._load_archived_job(job_id)
+        return job
+
+    async def _load_job(self, job_id: str) -> Optional[JobListing]:
+        """Get job by ID."""
+        try:
+            async with self.db_manager.get_session() as session:
+                job_db = await session.get(JobListingDB, str(job_id))
+                if job_db:
+                    return sqlalchemy_to_pydantic(job_db, JobListing)
+                return None
+        except Exception as e:
+            logger.error(f"Error getting job {job_id}: {e}")
+            return None
+
+    async def _load_archived_job(self, job_id: str) -> Optional[JobListing]:
+        """Get an archived job by ID."""
+        try:
+            async with self.db_manager.get_session() as session:
+                job_db = await session.get(JobListingArchiveDB, str(job_id))
+                if job_db:
+                    return sqlalchemy_to_pydantic(job_db, JobListing, trusted=True)
+                return None
+        except Exception as e:
+            logger.error(f"Error getting archived job {job_id}: {e}")
+            return None
+
+    async def get_archived_jobs(
+        self, company: Optional[str] = None, limit: int = 50, offset: int = 0
+    ) -> List[JobListing]:
+        """Get archived job listings, most recently archived first."""
+        try:
+            async with self.db_manager.get_session() as session:
+                jobs_db = await session.scalars(
+                    archived_jobs_query(
+                        select(JobListingArchiveDB), company, limit, offset
+                    )
+                )
+                return [
+                    sqlalchemy_to_pydantic(job_db, JobListing, trusted=True)
+                    for job_db in jobs_db
+                ]
+        except Exception as e:
+            logger.error(f"Error getting archived jobs: {e}")
+            return []
+
+    async def get_jobs_by_ids(self, job_ids: Iterable[str]) -> Dict[str, JobListing]:
+        """
+        Get several jobs with one query, keyed by ID.
+
+        Cached jobs come from the record cache; IDs that don't exist are
+        absent from the result.
+        """
+        return await self.cache.aget_many_or_load(
+            (str(job_id) for job_id in job_ids), self._load_jobs
+        )
+
+    async def _load_jobs(self, job_ids: List[str]) -> Dict[str, JobListing]:
+        try:
+            async with self.db_manager.get_session() as session:
+                jobs_db = await session.scalars(
+                    select(JobListingDB).filter(JobListingDB.id.in_(job_ids))
+                )
+                return {
+                    job_db.id: sqlalchemy_to_pydantic(job_db, JobListing, trusted=True)
+                    for job_db in jobs_db
+                }
+        except Exception as e:
+            logger.error(f"Error getting {len(job_ids)} jobs by ID: {e}")
+            return {}
+
+    @retry_db_write()
+    async def update_job(
+        self, job_id: str, job_data: Dict[str, Any]
+    ) -> Optional[JobListing]:
+        """Update job listing."""
+        try:
+            async with self.db_manager.get_session() as session:
+                job_db = await session.get(JobListingDB, str(job_id))
+                if not job_db:
+                    return None
+
+                # Update fields
+                for field, value in job_data.items():
+                    if hasattr(job_db, field):
+                        setattr(job_db, field, value)
+
+                job_db.updated_at = datetime.utcnow()
+                await session.flush()
+
+                result = sqlalchemy_to_pydantic(job_db, JobListing)
+                logger.info(f"Updated job: {job_id}")
+                return result
+
+        except Exception as e:
+            logger.error(f"Error updating job {job_id}: {e}")
+            raise
+        finally:
+            self.cache.invalidate(str(job_id))
+            self.counts.clear()
+            mark_jobs_changed(self.db_manager.engine, [job_id])
+
+    async def delete_job(self, job_id: str) -> bool:
+        """Delete job listing."""
+        try:
+            async with self.db_manager.get_session() as session:
+                job_db = await session.get(JobListingDB, str(job_id))
+                if job_db:
+                    await session.delete(job_db)
+                    logger.info(f"Deleted job: {job_id}")
+                    return True
+                return False
+        except Exception as e:
+            logger.error(f"Error deleting job {job_id}: {e}")
+            return False
+        finally:
+            self.cache.invalidate(str(job_id))
+            self.counts.clear()
+            mark_jobs_changed(self.db_manager.engine, [job_id])
+
+    async def search_jobs(
+        self,
+        query: Optional[str] = None,
+        job_types: Optional[List[JobType]] = None,
+        remote_types: Optional[List[RemoteType]] = None,
+        experience_levels: Optional[List[ExperienceLevel]] = None,
+        locations: Optional[List[str]] = None,
+        companies: Optional[List[str]] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        max_age_days: Optional[int] = None,
+        sort_by: str = "recent",
+        limit: int = 50,
+        offset: int = 0,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Tuple[List[JobListing], Optional[int]]:
+        """Search jobs with filters (see JobRepository.search_jobs)."""
+        filters = dict(
+            query=query,
+            job_types=job_types,
+            remote_types=remote_types,
+            experience_levels=experience_levels,
+            locations=locations,
+            companies=companies,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            max_age_days=max_age_days,
+            sort_by=sort_by,
+        )
+        try:
+            async with self.db_manager.get_session() as session:
+                query_obj, sort_keys = build_job_search_query(
+                    select(JobListingDB), self.db_manager.fulltext_enabled, **filters
+                )
+
+                total_count = await acount_statement(
+                    session,
+                    query_obj,
+                    count_strategy,
+                    self.counts,
+                    filter_signature("jobs", **filters),
+                )
+
+                result = await session.scalars(
+                    query_obj.order_by(*order_by_keys(sort_keys))
+                    .offset(offset)
+                    .limit(limit)
+                )
+                jobs = [
+                    sqlalchemy_to_pydantic(job_db, JobListing, trusted=True)
+                    for job_db in result
+                ]
+
+                logger.info(
+                    f"Search returned {len(jobs)} jobs out of {total_count} total"
+                )
+                return jobs, total_count
+
+        except Exception as e:
+            logger.error(f"Error searching jobs: {e}")
+            return [], 0 if count_strategy != CountStrategy.NONE else None
+
+    async def search_jobs_page(
+        self,
+        query: Optional[str] = None,
+        job_types: Optional[List[JobType]] = None,
+        remote_types: Optional[List[RemoteType]] = None,
+        experience_levels: Optional[List[ExperienceLevel]] = None,
+        locations: Optional[List[str]] = None,
+        companies: Optional[List[str]] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        max_age_days: Optional[int] = None,
+        sort_by: str = "recent",
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Page[JobListing]:
+        """
+        Search jobs with keyset pagination (see JobRepository.search_jobs_page).
+
+        Raises:
+            InvalidCursorError: If ``cursor`` was not produced by this search
+        """
+        return await self._search_page(
+            (JobListingDB,),
+            lambda job_db: sqlalchemy_to_pydantic(job_db, JobListing, trusted=True),
+            limit,
+            cursor,
+            include_total,
+            count_strategy,
+            query=query,
+            job_types=job_types,
+            remote_types=remote_types,
+            experience_levels=experience_levels,
+            locations=locations,
+            companies=companies,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            max_age_days=max_age_days,
+            sort_by=sort_by,
+        )
+
+    async def search_job_summaries_page(
+        self,
+        query: Optional[str] = None,
+        job_types: Optional[List[JobType]] = None,
+        remote_types: Optional[List[RemoteType]] = None,
+        experience_levels: Optional[List[ExperienceLevel]] = None,
+        locations: Optional[List[str]] = None,
+        companies: Optional[List[str]] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        max_age_days: Optional[int] = None,
+        sort_by: str = "recent",
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Page[JobSummary]:
+        """
+        Search jobs like search_jobs_page, loading only listing-card columns.
+
+        Raises:
+            InvalidCursorError: If ``cursor`` was not produced by this search
+        """
+        return await self._search_page(
+            JOB_SUMMARY_COLUMNS,
+            to_job_summary,
+            limit,
+            cursor,
+            include_total,
+            count_strategy,
+            query=query,
+            job_types=job_types,
+            remote_types=remote_types,
+            experience_levels=experience_levels,
+            locations=locations,
+            companies=companies,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            max_age_days=max_age_days,
+            sort_by=sort_by,
+        )
+
+    async def _search_page(
+        self,
+        columns: Sequence[Any],
+        to_item: Callable[[Any], Any],
+        limit: int,
+        cursor: Optional[str],
+        include_total: bool,
+        count_strategy: CountStrategy,
+        **filters,
+    ) -> Page:
+        """Run a keyset-paginated job search selecting ``columns``."""
+        if not include_total:
+            count_strategy = CountStrategy.NONE
+        try:
+            async with self.db_manager.get_session() as session:
+                query_obj, sort_keys = build_job_search_query(
+                    select(*columns), self.db_manager.fulltext_enabled, **filters
+                )
+
+                total_count = await acount_statement(
+                    session,
+                    query_obj,
+                    count_strategy,
+                    self.counts,
+                    filter_signature("jobs", **filters),
+                )
+                page_query, keys_start = keyset_query(
+                    query_obj, sort_keys, limit, cursor
+                )
+                rows = (await session.execute(page_query)).all()
+                rows, next_cursor = split_page(rows, keys_start, limit)
+
+                items = [to_item(row) for row in rows]
+                logger.info(f"Search page returned {len(items)} jobs")
+                return Page(
+                    items=items,
+                    next_cursor=next_cursor,
+                    total=total_count,
+                    total_strategy=page_total_strategy(count_strategy),
+                    total_is_lower_bound=total_is_lower_bound(
+                        count_strategy, total_count
+                    ),
+                )
+
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error searching jobs: {e}")
+            return Page(items=[], total=0 if include_total else None)
+
+    async def get_job_facets(
+        self,
+        query: Optional[str] = None,
+        job_types: Optional[List[JobType]] = None,
+        remote_types: Optional[List[RemoteType]] = None,
+        experience_levels: Optional[List[ExperienceLevel]] = None,
+        locations: Optional[List[str]] = None,
+        companies: Optional[List[str]] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        max_age_days: Optional[int] = None,
+        limit: int = FACET_LIMIT,
+    ) -> FacetCounts:
+        """Count active jobs per facet value (see JobRepository.get_job_facets)."""
+        try:
+            async with self.db_manager.get_session() as session:
+                statement = build_job_facet_query(
+                    self.db_manager.engine.dialect.name,
+                    self.db_manager.fulltext_enabled,
+                    limit,
+                    query=query,
+                    job_types=job_types,
+                    remote_types=remote_types,
+                    experience_levels=experience_levels,
+                    locations=locations,
+                    companies=companies,
+                    min_salary=min_salary,
+                    max_salary=max_salary,
+                    max_age_days=max_age_days,
+                )
+                facets = group_facet_counts((await session.execute(statement)).all())
+                names = (await session.execute(company_names_statement(facets))).all()
+                return name_companies(facets, dict(names))
+
+        except Exception as e:
+            logger.error(f"Error counting job facets: {e}")
+            return group_facet_counts([])
+
+    async def get_recent_jobs(self, limit: int = 20) -> List[JobListing]:
+        """Get most recent job listings."""
+        try:
+            async with self.db_manager.get_session() as session:
+                result = await session.scalars(
+                    recent_jobs_query(select(JobListingDB), limit)
+                )
+
+                jobs = [
+                    sqlalchemy_to_pydantic(job_db, JobListing, trusted=True)
+                    for job_db in result
+                ]
+                logger.info(f"Retrieved {len(jobs)} recent jobs")
+                return jobs
+
+        except Exception as e:
+            logger.error(f"Error getting recent jobs: {e}")
+            return []
+
+    async def get_recent_job_summaries(self, limit: int = 20) -> List[JobSummary]:
+        """Get most recent job listings, loading only listing-card columns."""
+        try:
+            async with self.db_manager.get_session() as session:
+                rows = await session.execute(
+                    recent_jobs_query(select(*JOB_SUMMARY_COLUMNS), limit)
+                )
+
+                jobs = [to_job_summary(row) for row in rows]
+                logger.info(f"Retrieved {len(jobs)} recent job summaries")
+                return jobs
+
+        except Exception as e:
+            logger.error(f"Error getting recent job summaries: {e}")
+            return []
+
+    async def get_jobs_by_company(
+        self, company: str, limit: int = 20
+    ) -> List[JobListing]:
+        """Get jobs by company name."""
+        try:
+            async with self.db_manager.get_session() as session:
+                result = await session.scalars(
+                    company_jobs_query(select(JobListingDB), company, limit)
+                )
+
+                jobs = [
+                    sqlalchemy_to_pydantic(job_db, JobListing, trusted=True)
+                    for job_db in result
+                ]
+                logger.info(f"Retrieved {len(jobs)} jobs for company: {company}")
+                return jobs
+
+        except Exception as e:
+            logger.error(f"Error getting jobs for company {company}: {e}")
+            return []
+
+    async def update_job_status(self, job_id: str, status: JobStatus) -> bool:
+        """Update job status."""
+        try:
+            async with self.db_manager.get_session() as session:
+                job_db = await session.get(JobListingDB, str(job_id))
+                if job_db:
+                    job_db.status = status
+                    job_db.updated_at = datetime.utcnow()
+                    logger.info(f"Updated job {job_id} status to {status}")
+                    return True
+                return False
+        except Exception as e:
+            logger.error(f"Error updating job status {job_id}: {e}")
+            return False
+        finally:
+            self.cache.invalidate(str(job_id))
+            self.counts.clear()
+            mark_jobs_changed(self.db_manager.engine, [job_id])
+
+
+class AsyncUserRepository:
+    """Async repository for user profile operations."""
+
+    def __init__(self, db_manager: AsyncDatabaseManager):
+        """Initialize user repository."""
+        self.db_manager = db_manager
+        self.cache = get_record_cache(db_manager.engine, "users")
+
+    async def create_user(self, user_data: UserProfile) -> UserProfile:
+        """Create a new user profile."""
+        try:
+            async with self.db_manager.get_session() as session:
+                user_db = pydantic_to_sqlalchemy(user_data, UserProfileDB)
+                session.add(user_db)
+                await session.flush()
+
+                result = sqlalchemy_to_pydantic(user_db, UserProfile)
+                logger.info(f"Created user profile: {result.email}")
+                return result
+
+        except Exception as e:
+            logger.error(f"Error creating user: {e}")
+            raise
+
+    async def get_user(self, user_id: str) -> Optional[UserProfile]:
+        """Get user by ID, through the record cache."""
+        return await self.cache.aget_or_load(
+            str(user_id), lambda: self._load_user(user_id)
+        )
+
+    async def _load_user(self, user_id: str) -> Optional[UserProfile]:
+        """Get user by ID."""
+        try:
+            async with self.db_manager.get_session() as session:
+                user_db = await session.get(UserProfileDB, str(user_id))
+                if user_db:
+                    return sqlalchemy_to_pydantic(user_db, UserProfile)
+                return None
+        except Exception as e:
+            logger.error(f"Error getting user {user_id}: {e}")
+            return None
+
+    async def get_users_by_ids(self, user_ids: Iterable[str]) -> Dict[str, UserProfile]:
+        """
+        Get several users with one query, keyed by ID.
+
+        Cached users come from the record cache; IDs that don't exist are
+        absent from the result.
+        """
+        return await self.cache.aget_many_or_load(
+            (str(user_id) for user_id in user_ids), self._load_users
+        )
+
+    async def _load_users(self, user_ids: List[str]) -> Dict[str, UserProfile]:
+        try:
+            async with self.db_manager.get_session() as session:
+                users_db = await session.scalars(
+                    select(UserProfileDB).filter(UserProfileDB.id.in_(user_ids))
+                )
+                return {
+                    user_db.id: sqlalchemy_to_pydantic(user_db, UserProfile)
+                    for user_db in users_db
+                }
+        except Exception as e:
+            logger.error(f"Error getting {len(user_ids)} users by ID: {e}")
+            return {}
+
+    async def get_user_by_email(self, email: str) -> Optional[UserProfile]:
+        """Get user by email."""
+        try:
+            async with self.db_manager.get_session() as session:
+                user_db = await session.scalar(
+                    select(UserProfileDB).filter(UserProfileDB.email == email).limit(1)
+                )
+                if user_db:
+                    return sqlalchemy_to_pydantic(user_db, UserProfile)
+                return None
+        except Exception as e:
+            logger.error(f"Error getting user by email {email}: {e}")
+            return None
+
+    async def update_user(
+        self, user_id: str, user_data: Dict[str, Any]
+    ) -> Optional[UserProfile]:
+        """Update user profile."""
+        try:
+            async with self.db_manager.get_session() as session:
+                user_db = await session.get(UserProfileDB, str(user_id))
+                if not user_db:
+                    return None
+
+                # Update fields
+                for field, value in user_data.items():
+                    if hasattr(user_db, field):
+                        setattr(user_db, field, value)
+
+                user_db.updated_at = datetime.utcnow()
+                await session.flush()
+
+                result = sqlalchemy_to_pydantic(user_db, UserProfile)
+                logger.info(f"Updated user profile: {user_id}")
+                return result
+
+        except Exception as e:
+            logger.error(f"Error updating user {user_id}: {e}")
+            raise
+        finally:
+            self.cache.invalidate(str(user_id))
+
+    async def delete_user(self, user_id: str) -> bool:
+        """Delete user profile."""
+        try:
+            async with self.db_manager.get_session() as session:
+                user_db = await session.get(UserProfileDB, str(user_id))
+                if user_db:
+                    await session.delete(user_db)
+                    logger.info(f"Deleted user profile: {user_id}")
+                    return True
+                return False
+        except Exception as e:
+            logger.error(f"Error deleting user {user_id}: {e}")
+            return False
+        finally:
+            self.cache.invalidate(str(user_id))
+
+    async def list_users(
+        self, limit: int = 50, offset: int = 0
+    ) -> Tuple[List[UserProfile], int]:
+        """List all user profiles with pagination."""
+        try:
+            async with self.db_manager.get_session() as session:
+                query_obj = select(UserProfileDB)
+
+                total_count = await _count(session, query_obj)
+
+                result = await session.scalars(
+                    query_obj.order_by(desc(UserProfileDB.created_at))
+                    .offset(offset)
+                    .limit(limit)
+                )
+                users = [
+                    sqlalchemy_to_pydantic(user_db, UserProfile, trusted=True)
+                    for user_db in result
+                ]
+
+                logger.info(f"Listed {len(users)} users out of {total_count} total")
+                return users, total_count
+
+        except Exception as e:
+            logger.error(f"Error listing users: {e}")
+            return [], 0
+
+
+class AsyncSavedJobRepository:
+    """Async repository for saved job operations."""
+
+    def __init__(self, db_manager: AsyncDatabaseManager):
+        """Initialize saved job repository."""
+        self.db_manager = db_manager
+
+    async def save_job(
+        self,
+        job_id: str,
+        user_profile_id: str,
+        notes: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> SavedJob:
+        """Save a job for a user."""
+        try:
+            async with self.db_manager.get_session() as session:
+                existing = await session.scalar(
+                    active_saved_job_query(select(SavedJobDB), job_id, user_profile_id)
+                )
+
+                if existing:
+                    # Update existing saved job
+                    existing.notes = notes
+                    existing.tags = tags or []
+                    existing.updated_at = datetime.utcnow()
+                    await session.flush()
+                    result = sqlalchemy_to_pydantic(existing, SavedJob)
+                    logger.info(
+                        f"Updated saved job: {job_id} for user: {user_profile_id}"
+                    )
+                else:
+                    # Create new saved job
+                    saved_job_data = SavedJob(
+                        job_id=UUID(job_id),
+                        user_profile_id=UUID(user_profile_id),
+                        notes=notes,
+                        tags=tags or [],
+                    )
+                    saved_job_db = pydantic_to_sqlalchemy(saved_job_data, SavedJobDB)
+                    session.add(saved_job_db)
+                    await session.flush()
+
+                    result = sqlalchemy_to_pydantic(saved_job_db, SavedJob)
+                    logger.info(f"Saved job: {job_id} for user: {user_profile_id}")
+
+                return result
+
+        except Exception as e:
+            logger.error(f"Error saving job {job_id}: {e}")
+            raise
+
+    async def unsave_job(self, job_id: str, user_profile_id: str) -> bool:
+        """Remove a job from saved jobs."""
+        try:
+            async with self.db_manager.get_session() as session:
+                saved_job_db = await session.scalar(
+                    active_saved_job_query(select(SavedJobDB), job_id, user_profile_id)
+                )
+                if saved_job_db:
+                    await session.delete(saved_job_db)
+                    logger.info(f"Unsaved job: {job_id} for user: {user_profile_id}")
+                    return True
+                return False
+
+        except Exception as e:
+            logger.error(f"Error unsaving job {job_id}: {e}")
+            return False
+
+    async def get_saved_jobs(
+        self,
+        user_profile_id: str,
+        status: SavedJobStatus = SavedJobStatus.SAVED,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """Get saved jobs for a user with job details."""
+        try:
+            async with self.db_manager.get_session() as session:
+                rows = await session.execute(
+                    saved_jobs_query(
+                        select(SavedJobDB, JobListingDB),
+                        user_profile_id,
+                        status,
+                        limit,
+                    )
+                )
+
+                result = [
+                    to_saved_job_entry(
+                        saved_job_db,
+                        sqlalchemy_to_pydantic(job_db, JobListing, trusted=True),
+                    )
+                    for saved_job_db, job_db in rows
+                ]
+
+                logger.info(
+                    f"Retrieved {len(result)} saved jobs for user: {user_profile_id}"
+                )
+                return result
+
+        except Exception as e:
+            logger.error(f"Error getting saved jobs for user {user_profile_id}: {e}")
+            return []
+
+    async def get_saved_job_summaries(
+        self,
+        user_profile_id: str,
+        status: SavedJobStatus = SavedJobStatus.SAVED,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """Get saved jobs like get_saved_jobs, with JobSummary job details."""
+        try:
+            async with self.db_manager.get_session() as session:
+                rows = await session.execute(
+                    saved_jobs_query(
+                        select(SavedJobDB, *JOB_SUMMARY_COLUMNS),
+                        user_profile_id,
+                        status,
+                        limit,
+                    )
+                )
+
+                result = [
+                    to_saved_job_entry(row[0], to_job_summary(row[1:])) for row in rows
+                ]
+
+                logger.info(
+                    f"Retrieved {len(result)} saved job summaries for user: {user_profile_id}"
+                )
+                return result
+
+        except Exception as e:
+            logger.error(f"Error getting saved jobs for user {user_profile_id}: {e}")
+            return []
+
+    async def is_job_saved(self, job_id: str, user_profile_id: str) -> bool:
+        """Check if a job is saved by a user."""
+        try:
+            async with self.db_manager.get_session() as session:
+                saved_job = await session.scalar(
+                    active_saved_job_query(select(SavedJobDB), job_id, user_profile_id)
+                )
+                return saved_job is not None
+
+        except Exception as e:
+            logger.error(f"Error checking if job {job_id} is saved: {e}")
+            return False
+
+    async def archive_saved_job(self, job_id: str, user_profile_id: str) -> bool:
+        """Archive a saved job (change status to archived)."""
+        try:
+            async with self.db_manager.get_session() as session:
+                saved_job_db = await session.scalar(
+                    active_saved_job_query(select(SavedJobDB), job_id, user_profile_id)
+                )
+                if saved_job_db:
+                    saved_job_db.status = SavedJobStatus.ARCHIVED
+                    saved_job_db.updated_at = datetime.utcnow()
+                    logger.info(
+                        f"Archived saved job: {job_id} for user: {user_profile_id}"
+                    )
+                    return True
+                return False
+
+        except Exception as e:
+            logger.error(f"Error archiving saved job {job_id}: {e}")
+            return False
+
+    async def update_saved_job(
+        self,
+        job_id: str,
+        user_profile_id: str,
+        notes: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> Optional[SavedJob]:
+        """Update notes and tags for a saved job."""
+        try:
+            async with self.db_manager.get_session() as session:
+                saved_job_db = await session.scalar(
+                    active_saved_job_query(select(SavedJobDB), job_id, user_profile_id)
+                )
+                if saved_job_db:
+                    if notes is not None:
+                        saved_job_db.notes = notes
+                    if tags is not None:
+                        saved_job_db.tags = tags
+                    saved_job_db.updated_at = datetime.utcnow()
+                    await session.flush()
+
+                    result = sqlalchemy_to_pydantic(saved_job_db, SavedJob)
+                    logger.info(
+                        f"Updated saved job: {job_id} for user: {user_profile_id}"
+                    )
+                    return result
+                return None
+
+        except Exception as e:
+            logger.error(f"Error updating saved job {job_id}: {e}")
+            return None
+
+
+class AsyncResumeRepository:
+    """Async repository for resume operations."""
+
+    def __init__(self, db_manager: AsyncDatabaseManager):
+        """Initialize resume repository."""
+        self.db_manager = db_manager
+        self.cache = get_record_cache(db_manager.engine, "resumes")
+
+    @retry_db_write()
+    async def create_resume(self, resume_data: Resume) -> Resume:
+        """Create a new resume."""
+        try:
+            async with self.db_manager.get_session() as session:
+                resume_db = pydantic_to_sqlalchemy(resume_data, ResumeDB)
+                session.add(resume_db)
+                await session.flush()  # Get the ID
+
+                result = sqlalchemy_to_pydantic(resume_db, Resume)
+                logger.info(f"Created resume: {result.title} for user {result.user_id}")
+                return result
+
+        except Exception as e:
+            logger.error(f"Error creating resume: {e}")
+            raise
+
+    async def get_resume(self, resume_id: str) -> Optional[Resume]:
+        """Get resume by ID, through the record cache."""
+        return await self.cache.aget_or_load(
+            str(resume_id), lambda: self._load_resume(resume_id)
+        )
+
+    async def _load_resume(self, resume_id: str) -> Optional[Resume]:
+        """Get resume by ID."""
+        try:
+            async with self.db_manager.get_session() as session:
+                resume_db = await session.get(ResumeDB, str(resume_id))
+                if resume_db:
+                    return sqlalchemy_to_pydantic(resume_db, Resume)
+                return None
+        except Exception as e:
+            logger.error(f"Error getting resume {resume_id}: {e}")
+            return None
+
+    async def get_user_resumes(
+        self,
+        user_id: str,
+        status: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Tuple[List[Resume], int]:
+        """Get resumes for a user with filtering and pagination."""
+        try:
+            async with self.db_manager.get_session() as session:
+                query_obj = user_resumes_query(select(ResumeDB), user_id, status)
+
+                total_count = await _count(session, query_obj)
+
+                result = await session.scalars(
+                    query_obj.order_by(desc(ResumeDB.updated_at))
+                    .offset(offset)
+                    .limit(limit)
+                )
+                resumes = [
+                    sqlalchemy_to_pydantic(resume_db, Resume, trusted=True)
+                    for resume_db in result
+                ]
+
+                logger.info(
+                    f"Retrieved {len(resumes)} resumes out of {total_count} total for user {user_id}"
+                )
+                return resumes, total_count
+
+        except Exception as e:
+            logger.error(f"Error getting resumes for user {user_id}: {e}")
+            return [], 0
+
+    @retry_db_write()
+    async def update_resume(
+        self, resume_id: str, update_data: Dict[str, Any]
+    ) -> Optional[Resume]:
+        """Update resume."""
+        try:
+            async with self.db_manager.get_session() as session:
+                resume_db = await session.get(ResumeDB, str(resume_id))
+                if not resume_db:
+                    return None
+
+                # Update fields
+                for field, value in update_data.items():
+                    if hasattr(resume_db, field):
+                        setattr(resume_db, field, value)
+
+                resume_db.updated_at = datetime.utcnow()
+                await session.flush()
+
+                result = sqlalchemy_to_pydantic(resume_db, Resume)
+                logger.info(f"Updated resume: {resume_id}")
+                return result
+
+        except Exception as e:
+            logger.error(f"Error updating resume {resume_id}: {e}")
+            raise
+        finally:
+            self.cache.invalidate(str(resume_id))
+
+    async def delete_resume(self, resume_id: str) -> bool:
+        """Delete resume."""
+        try:
+            async with self.db_manager.get_session() as session:
+                resume_db = await session.get(ResumeDB, str(resume_id))
+                if resume_db:
+                    await session.delete(resume_db)
+                    logger.info(f"Deleted resume: {resume_id}")
+                    return True
+                return False
+        except Exception as e:
+            logger.error(f"Error deleting resume {resume_id}: {e}")
+            return False
+        finally:
+            self.cache.invalidate(str(resume_id))
+
+    async def get_resumes_by_type(
+        self, user_id: str, resume_type: str, limit: int = 20
+    ) -> List[Resume]:
+        """Get resumes by type for a user."""
+        try:
+            async with self.db_manager.get_session() as session:
+                result = await session.scalars(
+                    resumes_by_type_query(select(ResumeDB), user_id, resume_type, limit)
+                )
+
+                resumes = [
+                    sqlalchemy_to_pydantic(resume_db, Resume, trusted=True)
+                    for resume_db in result
+                ]
+                logger.info(
+                    f"Retrieved {len(resumes)} {resume_type} resumes for user {user_id}"
+                )
+                return resumes
+
+        except Exception as e:
+            logger.error(f"Error getting {resume_type} resumes for user {user_id}: {e}")
+            return []
+
+    async def get_total_resumes_count(self) -> int:
+        """Get total count of all resumes in the database."""
+        try:
+            async with self.db_manager.get_session() as session:
+                count = await _count(session, select(ResumeDB))
+                logger.info(f"Total resumes count: {count}")
+                return count
+        except Exception as e:
+            logger.error(f"Error getting total resumes count: {e}")
+            return 0
+
+
+class AsyncApplicationRepository:
+    """Async repository for job application operations."""
+
+    def __init__(self, db_manager: AsyncDatabaseManager):
+        """Initialize application repository."""
+        self.db_manager = db_manager
+        self.counts = get_record_cache(
+            db_manager.engine,
+            "application_counts",
+            ttl_seconds=COUNT_CACHE_TTL_SECONDS,
+        )
+
+    @retry_db_write()
+    async def create_application(self, app_data: JobApplication) -> JobApplication:
+        """Create a new job application."""
+        try:
+            async with self.db_manager.get_session() as session:
+                app_db = pydantic_to_sqlalchemy(app_data, JobApplicationDB)
+                session.add(app_db)
+                await session.flush()  # Get the ID
+
+                result = sqlalchemy_to_pydantic(app_db, JobApplication)
+                logger.info(f"Created application: {result.id} for job {result.job_id}")
+                return result
+
+        except Exception as e:
+            logger.error(f"Error creating application: {e}")
+            raise
+        finally:
+            self.counts.clear()
+
+    async def get_application(self, application_id: str) -> Optional[JobApplication]:
+        """Get application by ID."""
+        try:
+            async with self.db_manager.get_session() as session:
+                app_db = await session.get(JobApplicationDB, str(application_id))
+                if app_db:
+                    return sqlalchemy_to_pydantic(app_db, JobApplication)
+                return None
+        except Exception as e:
+            logger.error(f"Error getting application {application_id}: {e}")
+            return None
+
+    async def get_application_by_job_and_user(
+        self, job_id: str, user_profile_id: str
+    ) -> Optional[JobApplication]:
+        """Get application by job and user combination."""
+        try:
+            async with self.db_manager.get_session() as session:
+                app_db = await session.scalar(
+                    application_by_job_and_user_query(
+                        select(JobApplicationDB), job_id, user_profile_id
+                    )
+                )
+                if app_db:
+                    return sqlalchemy_to_pydantic(app_db, JobApplication)
+                return None
+        except Exception as e:
+            logger.error(
+                f"Error getting application for job {job_id} and user {user_profile_id}: {e}"
+            )
+            return None
+
+    async def get_applications(
+        self,
+        user_profile_id: str,
+        status: Optional[ApplicationStatus] = None,
+        limit: int = 50,
+        offset: int = 0,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Tuple[List[JobApplication], Optional[int]]:
+        """Get user's applications with filtering; the total uses ``count_strategy``."""
+        try:
+            async with self.db_manager.get_session() as session:
+                query_obj = user_applications_query(
+                    select(JobApplicationDB), user_profile_id, status
+                )
+
+                total = await acount_statement(
+                    session,
+                    query_obj,
+                    count_strategy,
+                    self.counts,
+                    applications_count_signature(user_profile_id, status),
+                )
+
+                result = await session.scalars(
+                    query_obj.order_by(desc(JobApplicationDB.created_at))
+                    .offset(offset)
+                    .limit(limit)
+                )
+                applications = [
+                    sqlalchemy_to_pydantic(app_db, JobApplication, trusted=True)
+                    for app_db in result
+                ]
+
+                logger.info(
+                    f"Retrieved {len(applications)} applications for user {user_profile_id}"
+                )
+                return applications, total
+
+        except Exception as e:
+            logger.error(f"Error getting applications for user {user_profile_id}: {e}")
+            return [], 0 if count_strategy != CountStrategy.NONE else None
+
+    async def get_applications_page(
+        self,
+        user_profile_id: str,
+        status: Optional[ApplicationStatus] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Page[JobApplication]:
+        """
+        Get user's applications with keyset pagination (newest first).
+
+        Raises:
+            InvalidCursorError: If ``cursor`` was not produced by this listing
+        """
+        try:
+            async with self.db_manager.get_session() as session:
+                query_obj = user_applications_query(
+                    select(JobApplicationDB), user_profile_id, status
+                )
+
+                if not include_total:
+                    count_strategy = CountStrategy.NONE
+                total = await acount_statement(
+                    session,
+                    query_obj,
+                    count_strategy,
+                    self.counts,
+                    applications_count_signature(user_profile_id, status),
+                )
+                page_query, keys_start = keyset_query(
+                    query_obj,
+                    APPLICATION_SORT_KEYS,
+                    limit,
+                    cursor,
+                )
+                rows = (await session.execute(page_query)).all()
+                apps_db, next_cursor = split_page(rows, keys_start, limit)
+
+                applications = [
+                    sqlalchemy_to_pydantic(app_db, JobApplication, trusted=True)
+                    for app_db in apps_db
+                ]
+
+                logger.info(
+                    f"Retrieved {len(applications)} applications for user {user_profile_id}"
+                )
+                return Page(
+                    items=applications,
+                    next_cursor=next_cursor,
+                    total=total,
+                    total_strategy=page_total_strategy(count_strategy),
+                    total_is_lower_bound=total_is_lower_bound(count_strategy, total),
+                )
+
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting applications for user {user_profile_id}: {e}")
+            return Page(items=[], total=0 if include_total else None)
+
+    async def get_applications_with_jobs(
+        self,
+        user_profile_id: str,
+        status: Optional[ApplicationStatus] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Page[Tuple[JobApplication, Optional[JobListing]]]:
+        """
+        get_applications_page with each application's job, in one JOIN query.
+
+        Items are ``(application, job)`` pairs; ``job`` is None when the
+        listing no longer exists.
+
+        Raises:
+            InvalidCursorError: If ``cursor`` was not produced by this listing
+        """
+        try:
+            async with self.db_manager.get_session() as session:
+                query_obj = user_applications_query(
+                    select(JobApplicationDB, JobListingDB),
+                    user_profile_id,
+                    status,
+                    with_jobs=True,
+                )
+
+                if not include_total:
+                    count_strategy = CountStrategy.NONE
+                total = await acount_statement(
+                    session,
+                    query_obj,
+                    count_strategy,
+                    self.counts,
+                    applications_count_signature(user_profile_id, status),
+                )
+                page_query, keys_start = keyset_query(
+                    query_obj,
+                    APPLICATION_SORT_KEYS,
+                    limit,
+                    cursor,
+                )
+                rows = (await session.execute(page_query)).all()
+                rows, next_cursor = split_page(rows, keys_start, limit)
+
+                items = [
+                    to_application_with_job(app_db, job_db) for app_db, job_db in rows
+                ]
+
+                logger.info(
+                    f"Retrieved {len(items)} applications with jobs for user {user_profile_id}"
+                )
+                return Page(
+                    items=items,
+                    next_cursor=next_cursor,
+                    total=total,
+                    total_strategy=page_total_strategy(count_strategy),
+                    total_is_lower_bound=total_is_lower_bound(count_strategy, total),
+                )
+
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting applications for user {user_profile_id}: {e}")
+            return Page(items=[], total=0 if include_total else None)
+
+    @retry_db_write()
+    async def update_application(
+        self, application_id: str, update_data: Dict[str, Any]
+    ) -> Optional[JobApplication]:
+        """Update application."""
+        try:
+            async with self.db_manager.get_session() as session:
+                app_db = await session.get(JobApplicationDB, str(application_id))
+                if not app_db:
+                    return None
+
+                # Update fields
+                for field, value in update_data.items():
+                    if hasattr(app_db, field):
+                        setattr(app_db, field, value)
+
+                app_db.updated_at = datetime.utcnow()
+                await session.flush()
+
+                result = sqlalchemy_to_pydantic(app_db, JobApplication)
+                logger.info(f"Updated application: {application_id}")
+                return result
+
+        except Exception as e:
+            logger.error(f"Error updating application {application_id}: {e}")
+            raise
+        finally:
+            self.counts.clear()
+
+    async def delete_application(self, application_id: str) -> bool:
+        """Delete application."""
+        try:
+            async with self.db_manager.get_session() as session:
+                app_db = await session.get(JobApplicationDB, str(application_id))
+                if app_db:
+                    await session.delete(app_db)
+                    logger.info(f"Deleted application: {application_id}")
+                    return True
+                return False
+        except Exception as e:
+            logger.error(f"Error deleting application {application_id}: {e}")
+            return False
+        finally:
+            self.counts.clear()
+
+    async def get_applications_by_job(self, job_id: str) -> List[JobApplication]:
+        """Get all applications for a specific job."""
+        try:
+            async with self.db_manager.get_session() as session:
+                result = await session.scalars(
+                    job_applications_query(select(JobApplicationDB), job_id)
+                )
+
+                return [
+                    sqlalchemy_to_pydantic(app_db, JobApplication, trusted=True)
+                    for app_db in result
+                ]
+
+        except Exception as e:
+            logger.error(f"Error getting applications for job {job_id}: {e}")
+            return []
+
+
+# Global instances (initialized together with app.data.database's globals)
+async_db_manager = None
+async_job_repo = None
+async_user_repo = None
+async_saved_job_repo = None
+async_application_repo = None
+async_resume_repo = None
+
+
+def initialize_async_database(database_url: str = None, fulltext_enabled=False):
+    """
+    Initialize global async database instances.
+
+    Called by app.data.database.initialize_database with the URL of the sync
+    manager, which has already created the schema for both.
+    """
+    global async_db_manager, async_job_repo, async_user_repo
+    global async_saved_job_repo, async_application_repo, async_resume_repo
+
+    async_db_manager = AsyncDatabaseManager(database_url, fulltext_enabled)
+    async_job_repo = AsyncJobRepository(async_db_manager)
+    async_user_repo = AsyncUserRepository(async_db_manager)
+    async_saved_job_repo = AsyncSavedJobRepository(async_db_manager)
+    async_application_repo = AsyncApplicationRepository(async_db_manager)
+    async_resume_repo = AsyncResumeRepository(async_db_manager)
+
+    logger.info("Async database repositories initialized")
+
+
+def _ensure_initialized():
+    if async_db_manager is None:
+        # Initializing the sync globals creates the schema and, in turn,
+        # the async globals for the same database
+        from app.data.database import initialize_database
+
+        initialize_database()
+
+
+def get_async_database_manager() -> AsyncDatabaseManager:
+    """Get or create async database manager."""
+    _ensure_initialized()
+    return async_db_manager
+
+
+def get_async_job_repository() -> AsyncJobRepository:
+    """Get or create async job repository."""
+    _ensure_initialized()
+    return async_job_repo
+
+
+def get_async_user_repository() -> AsyncUserRepository:
+    """Get or create async user repository."""
+    _ensure_initialized()
+    return async_user_repo
+
+
+def get_async_saved_job_repository() -> AsyncSavedJobRepository:
+    """Get or create async saved job repository."""
+    _ensure_initialized()
+    return async_saved_job_repo
+
+
+def get_async_application_repository() -> AsyncApplicationRepository:
+    """Get or create async application repository."""
+    _ensure_initialized()
+    return async_application_repo
+
+
+def get_async_resume_repository() -> AsyncResumeRepository:
+    """Get or create async resume repository."""
+    _ensure_initialized()
+    return async_resume_repo
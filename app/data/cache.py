@@ -0,0 +1,260 @@
+"""
+JobPilot Record Cache
+Bounded in-process LRU + TTL cache in front of repository lookups by id.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.data.engine import database_key
+
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+
+
+def _copy(value: Any) -> Any:
+    # Records are mutable; other cached values (counts) are immutable
+    return value.model_copy(deep=True) if isinstance(value, BaseModel) else value
+
+
+class RecordCache:
+    """
+    Read-through cache of Pydantic records keyed by id.
+
+    Entries expire after ``ttl_seconds`` and the least recently used entry is
+    evicted once ``max_entries`` is reached. Repositories invalidate keys
+    after their writes commit; the TTL bounds staleness for writes made
+    outside the repositories (e.g. the ETL loader).
+
+    Every invalidation bumps a generation counter. A load only populates
+    the cache if no invalidation happened while it ran, so a read racing a
+    write can never store the pre-write row.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, BaseModel]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Optional[BaseModel]:
+        """Return a copy of the cached record, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+
+        # Callers may mutate what they get back
+        return _copy(value)
+
+    def put(self, key: str, value: BaseModel, generation: Optional[int] = None):
+        """
+        Cache ``value`` under ``key``.
+
+        With ``generation`` (from :attr:`generation` before loading), the
+        value is dropped if anything was invalidated since.
+        """
+        value = _copy(value)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    @property
+    def generation(self) -> int:
+        """Number of invalidations so far."""
+        return self._generation
+
+    def invalidate(self, key: str):
+        """Drop ``key`` and fence off loads that started before this call."""
+        self.invalidate_many([key])
+
+    def invalidate_many(self, keys: Iterable[str]):
+        """invalidate() for several keys at once."""
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def get_or_load(
+        self, key: str, load: Callable[[], Optional[BaseModel]]
+    ) -> Optional[BaseModel]:
+        """Return the cached record or load and cache it. None is not cached."""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        generation = self._generation
+        value = load()
+        if value is not None:
+            self.put(key, value, generation)
+        return value
+
+    async def aget_or_load(
+        self, key: str, load: Callable[[], Awaitable[Optional[BaseModel]]]
+    ) -> Optional[BaseModel]:
+        """get_or_load for an async loader."""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        generation = self._generation
+        value = await load()
+        if value is not None:
+            self.put(key, value, generation)
+        return value
+
+    def get_many_or_load(
+        self,
+        keys: Iterable[str],
+        load_many: Callable[[List[str]], Dict[str, BaseModel]],
+    ) -> Dict[str, BaseModel]:
+        """
+        Batch get_or_load: ``load_many`` is called once with every missed key
+        and returns the records it found, keyed like ``keys``.
+        """
+        found, missing = self._get_many(keys)
+        if missing:
+            generation = self._generation
+            loaded = load_many(missing)
+            self._put_many(loaded, generation)
+            found.update(loaded)
+        return found
+
+    async def aget_many_or_load(
+        self,
+        keys: Iterable[str],
+        load_many: Callable[[List[str]], Awaitable[Dict[str, BaseModel]]],
+    ) -> Dict[str, BaseModel]:
+        """get_many_or_load for an async loader."""
+        found, missing = self._get_many(keys)
+        if missing:
+            generation = self._generation
+            loaded = await load_many(missing)
+            self._put_many(loaded, generation)
+            found.update(loaded)
+        return found
+
+    def _get_many(self, keys: Iterable[str]) -> Tuple[Dict[str, BaseModel], List[str]]:
+        found, missing = {}, []
+        for key in dict.fromkeys(keys):
+            value = self.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+        return found, missing
+
+    def _put_many(self, values: Dict[str, BaseModel], generation: int):
+        for key, value in values.items():
+            self.put(key, value, generation)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+# One cache per (database, record type), shared by the sync and async
+# repositories so a write through either invalidates both
+_record_caches: Dict[Tuple[str, str], RecordCache] = {}
+_registry_lock = threading.Lock()
+
+
+def get_record_cache(
+    engine: Union[Engine, AsyncEngine], name: str, **options: Any
+) -> RecordCache:
+    """
+    Get the process-wide cache of ``name`` records for ``engine``'s database.
+
+    ``options`` (``max_entries``, ``ttl_seconds``) apply when the cache is
+    first created.
+    """
+    key = (database_key(engine), name)
+    with _registry_lock:
+        cache = _record_caches.get(key)
+        if cache is None:
+            cache = _record_caches[key] = RecordCache(name, **options)
+        return cache
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Counters of every record cache, keyed by record type and database."""
+    with _registry_lock:
+        caches = list(_record_caches.items())
+    return {
+        f"{name}@{_database_label(database)}": cache.stats()
+        for (database, name), cache in caches
+    }
+
+
+def _database_label(database: str) -> str:
+    # In-memory keys are not URLs; the others are rendered without password
+    if database.startswith("memory:"):
+        return database
+    return make_url(database).render_as_string()
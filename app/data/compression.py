@@ -0,0 +1,97 @@
+"""
+JobPilot Compressed Payloads
+Column type that stores large JSON documents as compressed blobs.
+"""
+
+import json
+import lzma
+import zlib
+from typing import Any, Optional
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+# One tag byte in front of every blob names the codec that wrote it, so rows
+# written with different settings can live in the same column.
+_CODEC_TAGS = {"none": b"j", "zlib": b"z", "lzma": b"x"}
+_TAG_CODECS = {tag: codec for codec, tag in _CODEC_TAGS.items()}
+CODECS = tuple(_CODEC_TAGS)
+
+
+def dumps_json(value: Any) -> bytes:
+    """Serialize ``value`` as compact UTF-8 JSON."""
+    return json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def compress_bytes(data: bytes, codec: str = "zlib") -> bytes:
+    """Compress serialized JSON with ``codec`` and prefix its tag byte."""
+    if codec == "zlib":
+        payload = zlib.compress(data, 6)
+    elif codec == "lzma":
+        payload = lzma.compress(data, preset=6)
+    elif codec == "none":
+        payload = data
+    else:
+        raise ValueError(f"codec must be one of {list(CODECS)}, got {codec!r}")
+    return _CODEC_TAGS[codec] + payload
+
+
+def compress_json(value: Any, codec: str = "zlib") -> bytes:
+    """Serialize and compress a JSON document."""
+    return compress_bytes(dumps_json(value), codec)
+
+
+def decompress_json(value: Any) -> Any:
+    """
+    Decode a stored document.
+
+    Handles blobs from any codec as well as plain JSON text written before
+    the column was compressed.
+    """
+    if isinstance(value, str):
+        return json.loads(value)
+    if not isinstance(value, (bytes, bytearray, memoryview)):
+        return value
+
+    value = bytes(value)
+    codec = _TAG_CODECS.get(value[:1])
+    if codec == "zlib":
+        data = zlib.decompress(value[1:])
+    elif codec == "lzma":
+        data = lzma.decompress(value[1:])
+    elif codec == "none":
+        data = value[1:]
+    else:
+        data = value  # untagged JSON bytes
+    return json.loads(data)
+
+
+class CompressedJSON(TypeDecorator):
+    """
+    JSON document stored as a compressed BLOB.
+
+    Binds dicts/lists (compressed with the column's codec) or blobs already
+    produced by ``compress_bytes``/``compress_json``, and always loads the
+    decoded document, whatever codec wrote it.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, codec: str = "zlib"):
+        if codec not in CODECS:
+            raise ValueError(f"codec must be one of {list(CODECS)}, got {codec!r}")
+        super().__init__()
+        self.codec = codec
+
+    def process_bind_param(self, value, dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return bytes(value)
+        return compress_json(value, self.codec)
+
+    def process_result_value(self, value, dialect) -> Any:
+        if value is None:
+            return None
+        return decompress_json(value)
@@ -0,0 +1,121 @@
+"""
+JobPilot Result Counts
+Count strategies for the totals reported alongside search and list pages.
+"""
+
+import json
+from enum import Enum
+from typing import Any, Optional
+
+from sqlalchemy import func, select
+
+from app.data.cache import RecordCache
+
+# Rows an "estimate" count is exact up to; it reads one row more to tell
+# whether there are more
+ESTIMATE_COUNT_CAP = 1000
+
+# Cached totals go stale on writes made outside the repositories (e.g. the
+# ETL loader), so they live shorter than cached records
+COUNT_CACHE_TTL_SECONDS = 60.0
+
+
+class CountStrategy(str, Enum):
+    """How the total number of matching rows is computed."""
+
+    EXACT = "exact"  # COUNT(*) over the full filtered set
+    CACHED = "cached"  # exact count, memoized per filter signature
+    ESTIMATE = "estimate"  # exact up to ESTIMATE_COUNT_CAP, else a lower bound
+    NONE = "none"  # no total
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, str):
+        return " ".join(value.lower().split())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sorted({_normalize(item) for item in value}, key=str)
+    return value
+
+
+def filter_signature(kind: str, **filters: Any) -> str:
+    """
+    Cache key for a set of filters.
+
+    Unset filters are dropped, text is lower-cased with collapsed whitespace
+    and lists are de-duplicated and sorted, so equivalent searches share a
+    cached count.
+    """
+    normalized = {
+        name: _normalize(value)
+        for name, value in filters.items()
+        if value is not None and value != "" and value != []
+    }
+    return f"{kind}:{json.dumps(normalized, sort_keys=True, default=str)}"
+
+
+def page_total_strategy(strategy: CountStrategy) -> Optional[str]:
+    """Page.total_strategy for a count; None when no total was computed."""
+    strategy = CountStrategy(strategy)
+    return None if strategy is CountStrategy.NONE else strategy.value
+
+
+def total_is_lower_bound(strategy: CountStrategy, total: Optional[int]) -> bool:
+    """
+    Whether ``total`` only bounds the number of matching rows from below.
+
+    An ESTIMATE count that hit its cap reports ESTIMATE_COUNT_CAP + 1: more
+    than ESTIMATE_COUNT_CAP rows match, shown as e.g. "1000+".
+    """
+    return (
+        CountStrategy(strategy) is CountStrategy.ESTIMATE
+        and total is not None
+        and total > ESTIMATE_COUNT_CAP
+    )
+
+
+def count_query(
+    query_obj,
+    strategy: CountStrategy,
+    cache: Optional[RecordCache] = None,
+    signature: Optional[str] = None,
+) -> Optional[int]:
+    """
+    Total for an ORM query under ``strategy``; None for CountStrategy.NONE.
+
+    Capped ESTIMATE totals are lower bounds (see total_is_lower_bound).
+    """
+    strategy = CountStrategy(strategy)
+    if strategy is CountStrategy.NONE:
+        return None
+    if strategy is CountStrategy.ESTIMATE:
+        return query_obj.order_by(None).limit(ESTIMATE_COUNT_CAP + 1).count()
+    if strategy is CountStrategy.CACHED:
+        return cache.get_or_load(signature, query_obj.count)
+    return query_obj.count()
+
+
+async def acount_statement(
+    session,
+    statement,
+    strategy: CountStrategy,
+    cache: Optional[RecordCache] = None,
+    signature: Optional[str] = None,
+) -> Optional[int]:
+    """count_query for a select() statement on an AsyncSession."""
+    strategy = CountStrategy(strategy)
+    if strategy is CountStrategy.NONE:
+        return None
+
+    statement = statement.order_by(None)
+    if strategy is CountStrategy.ESTIMATE:
+        statement = statement.limit(ESTIMATE_COUNT_CAP + 1)
+
+    async def count() -> int:
+        count_statement = select(func.count()).select_from(statement.subquery())
+        return (await session.execute(count_statement)).scalar_one()
+
+    if strategy is CountStrategy.CACHED:
+        return await cache.aget_or_load(signature, count)
+    return await count()
@@ -5,23 +5,71 @@ Database operations and repository pattern for job hunting data.
 
 import os
 from contextlib import contextmanager
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, create_engine, desc, or_, text
+from sqlalchemy import desc, select, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
+from app.data.archive import ARCHIVE_AFTER_DAYS, ARCHIVE_CHUNK_SIZE, archive_jobs
+from app.data.cache import get_record_cache
+from app.data.counts import (
+    COUNT_CACHE_TTL_SECONDS,
+    CountStrategy,
+    count_query,
+    filter_signature,
+    page_total_strategy,
+    total_is_lower_bound,
+)
+from app.data.dimensions import assign_dimension_ids
+from app.data.embedding_index import (
+    invalidate_embedding_indexes,
+    mark_jobs_changed,
+)
+from app.data.engine import (
+    POOL_SETTINGS,
+    SQLITE_PROFILE,
+    PoolSettings,
+    SQLiteProfile,
+    get_engine,
+)
+from app.data.facets import (
+    FACET_LIMIT,
+    FacetCounts,
+    company_names_statement,
+    ensure_facet_counts,
+    group_facet_counts,
+    name_companies,
+)
+from app.data.fulltext import ensure_job_search_index, rebuild_job_search_index
+from app.data.migrations import (
+    drop_schema_version,
+    ensure_columns,
+    ensure_indexes,
+    migrate_annual_salaries,
+    migrate_compressed_payloads,
+    migrate_embedding_vectors,
+    migrate_job_dimensions,
+    read_schema_version,
+    schema_version,
+    write_schema_version,
+)
 from app.data.models import (
     ApplicationStatus,
     Base,
-    CompanyInfoDB,
     ExperienceLevel,
     JobApplication,
     JobApplicationDB,
     JobListing,
+    JobListingArchiveDB,
     JobListingDB,
     JobStatus,
+    JobSummary,
     JobType,
     RemoteType,
     SavedJob,
@@ -32,16 +80,72 @@ from app.data.models import (
     pydantic_to_sqlalchemy,
     sqlalchemy_to_pydantic,
 )
+from app.data.pagination import InvalidCursorError, Page, order_by_keys, paginate
+from app.data.queries import (
+    APPLICATION_SORT_KEYS,
+    JOB_SUMMARY_COLUMNS,
+    active_saved_job_query,
+    application_by_job_and_user_query,
+    applications_count_signature,
+    archived_jobs_query,
+    build_job_facet_query,
+    build_job_search_query,
+    company_jobs_query,
+    job_applications_query,
+    recent_jobs_query,
+    resumes_by_type_query,
+    saved_jobs_query,
+    to_application_with_job,
+    to_job_summary,
+    to_saved_job_entry,
+    user_applications_query,
+    user_resumes_query,
+)
 from app.data.resume_models import Resume, ResumeDB
+from app.data.salary import annual_salary_range
+from app.data.table_stats import get_table_stats
 from app.logger import logger
-from app.utils.retry import retry_db_critical, retry_db_write
+from app.utils.retry import retry_db_write
+
+
+def create_schema(engine: Engine) -> bool:
+    """
+    Create tables, indexes and search structures, then migrate existing rows.
+
+    Records schema_version() so later startups can skip this, and returns
+    whether the full-text index is available. AsyncDatabaseManager runs it
+    on its sync_engine, so both managers build the same schema.
+    """
+    Base.metadata.create_all(engine)
+    ensure_columns(engine)
+    ensure_indexes(engine)
+    migrate_embedding_vectors(engine)
+    migrate_job_dimensions(engine)
+    migrate_annual_salaries(engine)
+    migrate_compressed_payloads(engine)
+    fulltext_enabled = ensure_job_search_index(engine)
+    ensure_facet_counts(engine)
+    with engine.begin() as conn:
+        write_schema_version(conn, fulltext_enabled)
+    get_table_stats(engine).invalidate()
+    return fulltext_enabled
 
 
 class DatabaseManager:
     """Manages database connections and provides basic operations."""
 
-    def __init__(self, database_url: str = None):
-        """Initialize database manager."""
+    def __init__(
+        self,
+        database_url: str = None,
+        sqlite_profile: Optional[SQLiteProfile] = SQLITE_PROFILE,
+        pool_settings: PoolSettings = POOL_SETTINGS,
+    ):
+        """
+        Initialize database manager.
+
+        ``sqlite_profile`` sets the connection pragmas for SQLite databases
+        (None keeps SQLite's defaults); ``pool_settings`` sizes the pool.
+        """
         if database_url is None:
             # Default to SQLite in the data directory
             data_dir = os.path.join(os.path.dirname(__file__), "..", "..", "data")
@@ -49,18 +153,35 @@ class DatabaseManager:
             database_url = f"sqlite:///{data_dir}/jobpilot.db"
 
         self.database_url = database_url
-        self.engine = create_engine(database_url, echo=False)
+        self.engine = get_engine(database_url, sqlite_profile, pool_settings)
         self.SessionFactory = sessionmaker(bind=self.engine)
+        self.fulltext_enabled = False
 
         # Create tables if they don't exist
-        self.create_tables()
+        self.ensure_schema()
 
         logger.info(f"Database manager initialized with URL: {database_url}")
 
+    def ensure_schema(self):
+        """
+        Run create_tables only if the database predates the current schema.
+
+        The version recorded by the last create_tables is compared with
+        schema_version(); when they match, startup costs a single query.
+        """
+        with self.engine.connect() as conn:
+            stored = read_schema_version(conn)
+
+        if stored and stored[0] == schema_version():
+            self.fulltext_enabled = stored[1]
+            return
+
+        self.create_tables()
+
     def create_tables(self):
         """Create all database tables."""
         try:
-            Base.metadata.create_all(self.engine)
+            self.fulltext_enabled = create_schema(self.engine)
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Error creating database tables: {e}")
@@ -74,12 +195,19 @@ class DatabaseManager:
         """Drop all database tables (DANGEROUS - for development only)."""
         try:
             Base.metadata.drop_all(self.engine)
+            with self.engine.begin() as conn:
+                drop_schema_version(conn)
+            get_table_stats(self.engine).invalidate()
             logger.info("All database tables dropped successfully")
         except Exception as e:
             logger.error(f"Error dropping database tables: {e}")
             raise
 
-    @retry_db_critical(max_retries=5, base_delay=2.0)
+    def rebuild_search_index(self):
+        """Rebuild the job full-text index from the job_listings table."""
+        if self.fulltext_enabled:
+            rebuild_job_search_index(self.engine)
+
     @contextmanager
     def get_session(self):
         """Get database session with automatic cleanup."""
@@ -105,14 +233,15 @@ class DatabaseManager:
             return False
 
     def get_table_stats(self) -> Dict[str, int]:
-        """Get statistics about table row counts."""
-        stats = {}
+        """
+        Get the row count of every table, keyed by table name.
+
+        Counts come from one UNION ALL query and are then kept current from
+        committed inserts and deletes (see app.data.table_stats), so repeated
+        calls only recount after TABLE_STATS_TTL_SECONDS.
+        """
         try:
-            with self.get_session() as session:
-                stats["job_listings"] = session.query(JobListingDB).count()
-                stats["user_profiles"] = session.query(UserProfileDB).count()
-                stats["applications"] = session.query(JobApplicationDB).count()
-                stats["companies"] = session.query(CompanyInfoDB).count()
+            stats = get_table_stats(self.engine).counts(self.engine)
         except Exception as e:
             logger.error(f"Error getting table stats: {e}")
             stats = {"error": str(e)}
@@ -120,12 +249,54 @@ class DatabaseManager:
         return stats
 
 
+# Columns bulk_create_jobs can match existing rows on
+JOB_UPSERT_KEYS = ("id", "job_url")
+BULK_UPSERT_CHUNK_SIZE = 1000
+
+_UPSERT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+# Kept from the stored row when an upsert updates it
+_UPSERT_PRESERVED_COLUMNS = frozenset(["id", "created_at"])
+
+
+@dataclass
+class BulkWriteResult:
+    """Row counts from a bulk upsert."""
+
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.skipped
+
+
+def _job_row(job_data: JobListing) -> Dict[str, Any]:
+    """Column values for a job listing, as a Core executemany parameter set."""
+    row = job_data.model_dump()
+    row["id"] = str(row["id"])
+    if row["canonical_id"] is not None:
+        row["canonical_id"] = str(row["canonical_id"])
+    # Core inserts skip the ORM hook that derives these
+    row["salary_annual_min"], row["salary_annual_max"] = annual_salary_range(
+        row["salary_min"],
+        row["salary_max"],
+        row["salary_period"],
+        row["salary_currency"],
+    )
+    return row
+
+
 class JobRepository:
     """Repository for job listing operations."""
 
     def __init__(self, db_manager: DatabaseManager):
         """Initialize job repository."""
         self.db_manager = db_manager
+        self.cache = get_record_cache(db_manager.engine, "jobs")
+        self.counts = get_record_cache(
+            db_manager.engine, "job_counts", ttl_seconds=COUNT_CACHE_TTL_SECONDS
+        )
 
     @retry_db_write()
     def create_job(self, job_data: JobListing) -> JobListing:
@@ -139,13 +310,30 @@ class JobRepository:
                 # Convert back to Pydantic model
                 result = sqlalchemy_to_pydantic(job_db, JobListing)
                 logger.info(f"Created job: {result.title} at {result.company}")
-                return result
+
+            mark_jobs_changed(self.db_manager.engine, [result.id])
+            return result
 
         except Exception as e:
             logger.error(f"Error creating job: {e}")
             raise
-
-    def get_job(self, job_id: str) -> Optional[JobListing]:
+        finally:
+            self.counts.clear()
+
+    def get_job(
+        self, job_id: str, include_archived: bool = False
+    ) -> Optional[JobListing]:
+        """
+        Get job by ID, through the record cache.
+
+        Archived listings are only looked up when ``include_archived`` is set.
+        """
+        job = self.cache.get_or_load(str(job_id), lambda: self._load_job(job_id))
+        if job is None and include_archived:
+            job = self._load_archived_job(job_id)
+        return job
+
+    def _load_job(self, job_id: str) -> Optional[JobListing]:
         """Get job by ID."""
         try:
             with self.db_manager.get_session() as session:
@@ -161,6 +349,45 @@ class JobRepository:
             logger.error(f"Error getting job {job_id}: {e}")
             return None
 
+    def _load_archived_job(self, job_id: str) -> Optional[JobListing]:
+        """Get an archived job by ID."""
+        try:
+            with self.db_manager.get_session() as session:
+                job_db = session.get(JobListingArchiveDB, str(job_id))
+                if job_db:
+                    return sqlalchemy_to_pydantic(job_db, JobListing, trusted=True)
+                return None
+        except Exception as e:
+            logger.error(f"Error getting archived job {job_id}: {e}")
+            return None
+
+    def get_jobs_by_ids(self, job_ids: Iterable[str]) -> Dict[str, JobListing]:
+        """
+        Get several jobs with one query, keyed by ID.
+
+        Cached jobs come from the record cache; IDs that don't exist are
+        absent from the result.
+        """
+        return self.cache.get_many_or_load(
+            (str(job_id) for job_id in job_ids), self._load_jobs
+        )
+
+    def _load_jobs(self, job_ids: List[str]) -> Dict[str, JobListing]:
+        try:
+            with self.db_manager.get_session() as session:
+                jobs_db = (
+                    session.query(JobListingDB)
+                    .filter(JobListingDB.id.in_(job_ids))
+                    .all()
+                )
+                return {
+                    job_db.id: sqlalchemy_to_pydantic(job_db, JobListing, trusted=True)
+                    for job_db in jobs_db
+                }
+        except Exception as e:
+            logger.error(f"Error getting {len(job_ids)} jobs by ID: {e}")
+            return {}
+
     @retry_db_write()
     def update_job(self, job_id: str, job_data: Dict[str, Any]) -> Optional[JobListing]:
         """Update job listing."""
@@ -189,6 +416,10 @@ class JobRepository:
         except Exception as e:
             logger.error(f"Error updating job {job_id}: {e}")
             raise
+        finally:
+            self.cache.invalidate(str(job_id))
+            self.counts.clear()
+            mark_jobs_changed(self.db_manager.engine, [job_id])
 
     def delete_job(self, job_id: str) -> bool:
         """Delete job listing."""
@@ -207,6 +438,44 @@ class JobRepository:
         except Exception as e:
             logger.error(f"Error deleting job {job_id}: {e}")
             return False
+        finally:
+            self.cache.invalidate(str(job_id))
+            self.counts.clear()
+            mark_jobs_changed(self.db_manager.engine, [job_id])
+
+    def get_archived_jobs(
+        self, company: Optional[str] = None, limit: int = 50, offset: int = 0
+    ) -> List[JobListing]:
+        """Get archived job listings, most recently archived first."""
+        try:
+            with self.db_manager.get_session() as session:
+                jobs_db = archived_jobs_query(
+                    session.query(JobListingArchiveDB), company, limit, offset
+                ).all()
+                return [
+                    sqlalchemy_to_pydantic(job_db, JobListing, trusted=True)
+                    for job_db in jobs_db
+                ]
+        except Exception as e:
+            logger.error(f"Error getting archived jobs: {e}")
+            return []
+
+    def archive_jobs(
+        self,
+        older_than_days: int = ARCHIVE_AFTER_DAYS,
+        chunk_size: int = ARCHIVE_CHUNK_SIZE,
+    ) -> int:
+        """
+        Move expired, filled and inactive listings to the archive table.
+
+        See app.data.archive.archive_jobs; returns the number of listings moved.
+        """
+        try:
+            return archive_jobs(self.db_manager.engine, older_than_days, chunk_size)
+        finally:
+            self.cache.clear()
+            self.counts.clear()
+            invalidate_embedding_indexes(self.db_manager.engine)
 
     def search_jobs(
         self,
@@ -219,81 +488,51 @@ class JobRepository:
         min_salary: Optional[float] = None,
         max_salary: Optional[float] = None,
         max_age_days: Optional[int] = None,
+        sort_by: str = "recent",
         limit: int = 50,
         offset: int = 0,
-    ) -> Tuple[List[JobListing], int]:
-        """Search jobs with filters."""
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Tuple[List[JobListing], Optional[int]]:
+        """
+        Search jobs with filters.
+
+        With the FTS5 index available, ``query`` results are ranked by BM25:
+        words match as prefixes and double-quoted text as exact phrases.
+        Salary bounds compare annual USD figures, and ``sort_by="salary"``
+        lists the best-paid jobs first. The total is computed with
+        ``count_strategy`` (None for NONE).
+        """
+        filters = dict(
+            query=query,
+            job_types=job_types,
+            remote_types=remote_types,
+            experience_levels=experience_levels,
+            locations=locations,
+            companies=companies,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            max_age_days=max_age_days,
+            sort_by=sort_by,
+        )
         try:
             with self.db_manager.get_session() as session:
-                query_obj = session.query(JobListingDB).filter(
-                    JobListingDB.status == JobStatus.ACTIVE
+                query_obj, sort_keys = build_job_search_query(
+                    session.query(JobListingDB),
+                    self.db_manager.fulltext_enabled,
+                    **filters,
                 )
 
-                # Text search across title, company, and description
-                if query:
-                    search_filter = or_(
-                        JobListingDB.title.ilike(f"%{query}%"),
-                        JobListingDB.company.ilike(f"%{query}%"),
-                        JobListingDB.description.ilike(f"%{query}%"),
-                        JobListingDB.requirements.ilike(f"%{query}%"),
-                    )
-                    query_obj = query_obj.filter(search_filter)
-
-                # Filter by job types
-                if job_types:
-                    query_obj = query_obj.filter(JobListingDB.job_type.in_(job_types))
-
-                # Filter by remote types
-                if remote_types:
-                    query_obj = query_obj.filter(
-                        JobListingDB.remote_type.in_(remote_types)
-                    )
-
-                # Filter by experience levels
-                if experience_levels:
-                    query_obj = query_obj.filter(
-                        JobListingDB.experience_level.in_(experience_levels)
-                    )
-
-                # Filter by locations
-                if locations:
-                    location_filters = [
-                        JobListingDB.location.ilike(f"%{loc}%") for loc in locations
-                    ]
-                    query_obj = query_obj.filter(or_(*location_filters))
-
-                # Filter by companies
-                if companies:
-                    query_obj = query_obj.filter(JobListingDB.company.in_(companies))
-
-                # Salary filters
-                if min_salary is not None:
-                    query_obj = query_obj.filter(
-                        or_(
-                            JobListingDB.salary_min >= min_salary,
-                            JobListingDB.salary_max >= min_salary,
-                        )
-                    )
-
-                if max_salary is not None:
-                    query_obj = query_obj.filter(
-                        or_(
-                            JobListingDB.salary_max <= max_salary,
-                            JobListingDB.salary_min <= max_salary,
-                        )
-                    )
-
-                # Age filter
-                if max_age_days is not None:
-                    cutoff_date = datetime.utcnow() - timedelta(days=max_age_days)
-                    query_obj = query_obj.filter(JobListingDB.created_at >= cutoff_date)
-
                 # Get total count
-                total_count = query_obj.count()
+                total_count = count_query(
+                    query_obj,
+                    count_strategy,
+                    self.counts,
+                    filter_signature("jobs", **filters),
+                )
 
                 # Apply pagination and ordering
                 jobs_db = (
-                    query_obj.order_by(desc(JobListingDB.created_at))
+                    query_obj.order_by(*order_by_keys(sort_keys))
                     .offset(offset)
                     .limit(limit)
                     .all()
@@ -301,7 +540,8 @@ class JobRepository:
 
                 # Convert to Pydantic models
                 jobs = [
-                    sqlalchemy_to_pydantic(job_db, JobListing) for job_db in jobs_db
+                    sqlalchemy_to_pydantic(job_db, JobListing, trusted=True)
+                    for job_db in jobs_db
                 ]
 
                 logger.info(
@@ -311,22 +551,194 @@ class JobRepository:
 
         except Exception as e:
             logger.error(f"Error searching jobs: {e}")
-            return [], 0
+            return [], 0 if count_strategy != CountStrategy.NONE else None
+
+    def search_jobs_page(
+        self,
+        query: Optional[str] = None,
+        job_types: Optional[List[JobType]] = None,
+        remote_types: Optional[List[RemoteType]] = None,
+        experience_levels: Optional[List[ExperienceLevel]] = None,
+        locations: Optional[List[str]] = None,
+        companies: Optional[List[str]] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        max_age_days: Optional[int] = None,
+        sort_by: str = "recent",
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Page[JobListing]:
+        """
+        Search jobs with keyset pagination.
+
+        Pass the returned ``next_cursor`` back as ``cursor`` to fetch the next
+        page; every page costs the same regardless of depth. The total count
+        is only computed when ``include_total`` is set, with ``count_strategy``.
+
+        Raises:
+            InvalidCursorError: If ``cursor`` was not produced by this search
+        """
+        return self._search_page(
+            (JobListingDB,),
+            lambda job_db: sqlalchemy_to_pydantic(job_db, JobListing, trusted=True),
+            limit,
+            cursor,
+            include_total,
+            count_strategy,
+            query=query,
+            job_types=job_types,
+            remote_types=remote_types,
+            experience_levels=experience_levels,
+            locations=locations,
+            companies=companies,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            max_age_days=max_age_days,
+            sort_by=sort_by,
+        )
+
+    def search_job_summaries_page(
+        self,
+        query: Optional[str] = None,
+        job_types: Optional[List[JobType]] = None,
+        remote_types: Optional[List[RemoteType]] = None,
+        experience_levels: Optional[List[ExperienceLevel]] = None,
+        locations: Optional[List[str]] = None,
+        companies: Optional[List[str]] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        max_age_days: Optional[int] = None,
+        sort_by: str = "recent",
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Page[JobSummary]:
+        """
+        Search jobs like search_jobs_page, loading only listing-card columns.
+
+        Raises:
+            InvalidCursorError: If ``cursor`` was not produced by this search
+        """
+        return self._search_page(
+            JOB_SUMMARY_COLUMNS,
+            to_job_summary,
+            limit,
+            cursor,
+            include_total,
+            count_strategy,
+            query=query,
+            job_types=job_types,
+            remote_types=remote_types,
+            experience_levels=experience_levels,
+            locations=locations,
+            companies=companies,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            max_age_days=max_age_days,
+            sort_by=sort_by,
+        )
+
+    def _search_page(
+        self,
+        columns: Sequence[Any],
+        to_item: Callable[[Any], Any],
+        limit: int,
+        cursor: Optional[str],
+        include_total: bool,
+        count_strategy: CountStrategy,
+        **filters,
+    ) -> Page:
+        """Run a keyset-paginated job search selecting ``columns``."""
+        if not include_total:
+            count_strategy = CountStrategy.NONE
+        try:
+            with self.db_manager.get_session() as session:
+                query_obj, sort_keys = build_job_search_query(
+                    session.query(*columns), self.db_manager.fulltext_enabled, **filters
+                )
+
+                total_count = count_query(
+                    query_obj,
+                    count_strategy,
+                    self.counts,
+                    filter_signature("jobs", **filters),
+                )
+                rows, next_cursor = paginate(query_obj, sort_keys, limit, cursor)
+
+                items = [to_item(row) for row in rows]
+                logger.info(f"Search page returned {len(items)} jobs")
+                return Page(
+                    items=items,
+                    next_cursor=next_cursor,
+                    total=total_count,
+                    total_strategy=page_total_strategy(count_strategy),
+                    total_is_lower_bound=total_is_lower_bound(
+                        count_strategy, total_count
+                    ),
+                )
+
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error searching jobs: {e}")
+            return Page(items=[], total=0 if include_total else None)
+
+    def get_job_facets(
+        self,
+        query: Optional[str] = None,
+        job_types: Optional[List[JobType]] = None,
+        remote_types: Optional[List[RemoteType]] = None,
+        experience_levels: Optional[List[ExperienceLevel]] = None,
+        locations: Optional[List[str]] = None,
+        companies: Optional[List[str]] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        max_age_days: Optional[int] = None,
+        limit: int = FACET_LIMIT,
+    ) -> FacetCounts:
+        """
+        Count active jobs per facet value, for the search filters.
+
+        Takes the filters of search_jobs; each facet lists up to ``limit``
+        ``{"value", "count"}`` entries, most frequent first (see
+        app.data.facets).
+        """
+        try:
+            with self.db_manager.get_session() as session:
+                statement = build_job_facet_query(
+                    self.db_manager.engine.dialect.name,
+                    self.db_manager.fulltext_enabled,
+                    limit,
+                    query=query,
+                    job_types=job_types,
+                    remote_types=remote_types,
+                    experience_levels=experience_levels,
+                    locations=locations,
+                    companies=companies,
+                    min_salary=min_salary,
+                    max_salary=max_salary,
+                    max_age_days=max_age_days,
+                )
+                facets = group_facet_counts(session.execute(statement).all())
+                names = session.execute(company_names_statement(facets)).all()
+                return name_companies(facets, dict(names))
+
+        except Exception as e:
+            logger.error(f"Error counting job facets: {e}")
+            return group_facet_counts([])
 
     def get_recent_jobs(self, limit: int = 20) -> List[JobListing]:
         """Get most recent job listings."""
         try:
             with self.db_manager.get_session() as session:
-                jobs_db = (
-                    session.query(JobListingDB)
-                    .filter(JobListingDB.status == JobStatus.ACTIVE)
-                    .order_by(desc(JobListingDB.created_at))
-                    .limit(limit)
-                    .all()
-                )
+                jobs_db = recent_jobs_query(session.query(JobListingDB), limit).all()
 
                 jobs = [
-                    sqlalchemy_to_pydantic(job_db, JobListing) for job_db in jobs_db
+                    sqlalchemy_to_pydantic(job_db, JobListing, trusted=True)
+                    for job_db in jobs_db
                 ]
                 logger.info(f"Retrieved {len(jobs)} recent jobs")
                 return jobs
@@ -335,25 +747,33 @@ class JobRepository:
             logger.error(f"Error getting recent jobs: {e}")
             return []
 
+    def get_recent_job_summaries(self, limit: int = 20) -> List[JobSummary]:
+        """Get most recent job listings, loading only listing-card columns."""
+        try:
+            with self.db_manager.get_session() as session:
+                rows = recent_jobs_query(
+                    session.query(*JOB_SUMMARY_COLUMNS), limit
+                ).all()
+
+                jobs = [to_job_summary(row) for row in rows]
+                logger.info(f"Retrieved {len(jobs)} recent job summaries")
+                return jobs
+
+        except Exception as e:
+            logger.error(f"Error getting recent job summaries: {e}")
+            return []
+
     def get_jobs_by_company(self, company: str, limit: int = 20) -> List[JobListing]:
         """Get jobs by company name."""
         try:
             with self.db_manager.get_session() as session:
-                jobs_db = (
-                    session.query(JobListingDB)
-                    .filter(
-                        and_(
-                            JobListingDB.company.ilike(f"%{company}%"),
-                            JobListingDB.status == JobStatus.ACTIVE,
-                        )
-                    )
-                    .order_by(desc(JobListingDB.created_at))
-                    .limit(limit)
-                    .all()
-                )
+                jobs_db = company_jobs_query(
+                    session.query(JobListingDB), company, limit
+                ).all()
 
                 jobs = [
-                    sqlalchemy_to_pydantic(job_db, JobListing) for job_db in jobs_db
+                    sqlalchemy_to_pydantic(job_db, JobListing, trusted=True)
+                    for job_db in jobs_db
                 ]
                 logger.info(f"Retrieved {len(jobs)} jobs for company: {company}")
                 return jobs
@@ -363,24 +783,186 @@ class JobRepository:
             return []
 
     @retry_db_write(max_retries=2, base_delay=1.5)
-    def bulk_create_jobs(self, jobs_data: List[JobListing]) -> int:
-        """Create multiple job listings efficiently."""
+    def bulk_create_jobs(
+        self,
+        jobs_data: List[JobListing],
+        conflict_key: str = "id",
+        chunk_size: int = BULK_UPSERT_CHUNK_SIZE,
+        update_existing: bool = True,
+    ) -> BulkWriteResult:
+        """
+        Insert or update job listings in chunks of ``INSERT ... ON CONFLICT``.
+
+        Jobs are matched to stored rows on ``conflict_key`` ("id" or
+        "job_url"). Matches are overwritten, keeping their stored id and
+        created_at, or skipped when ``update_existing`` is False. When a key
+        repeats within ``jobs_data`` the last job wins and the earlier ones
+        count as skipped. Jobs without a job_url are always inserted. A job
+        whose job_url matches one stored job while its id is another's raises
+        ValueError. Dialects without ``ON CONFLICT`` write through the ORM.
+        """
+        if conflict_key not in JOB_UPSERT_KEYS:
+            raise ValueError(
+                f"conflict_key must be one of {JOB_UPSERT_KEYS}, got {conflict_key!r}"
+            )
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        result = BulkWriteResult()
+        keyed_rows: Dict[Any, Dict[str, Any]] = {}
+        unkeyed_rows = []
+        for job_data in jobs_data:
+            row = _job_row(job_data)
+            key = row[conflict_key]
+            if key is None:
+                unkeyed_rows.append(row)
+                continue
+            if key in keyed_rows:
+                result.skipped += 1
+            keyed_rows[key] = row
+        rows = list(keyed_rows.values()) + unkeyed_rows
+
         try:
             with self.db_manager.get_session() as session:
-                jobs_db = [
-                    pydantic_to_sqlalchemy(job_data, JobListingDB)
-                    for job_data in jobs_data
-                ]
-                session.add_all(jobs_db)
-                session.flush()
+                connection = session.connection()
+                statement = self._upsert_statement(
+                    connection.dialect.name, update_existing
+                )
 
-                count = len(jobs_db)
-                logger.info(f"Bulk created {count} jobs")
-                return count
+                for start in range(0, len(rows), chunk_size):
+                    chunk = rows[start : start + chunk_size]
+                    existing_ids = self._match_existing_rows(
+                        connection, chunk, conflict_key
+                    )
+
+                    if update_existing:
+                        result.updated += len(existing_ids)
+                        result.inserted += len(chunk) - len(existing_ids)
+                    else:
+                        result.skipped += len(existing_ids)
+                        chunk = [row for row in chunk if row["id"] not in existing_ids]
+                        result.inserted += len(chunk)
+
+                    if chunk:
+                        assign_dimension_ids(connection, chunk)
+                        if statement is None:
+                            self._write_rows_with_orm(session, chunk, existing_ids)
+                        else:
+                            connection.execute(statement, chunk)
+
+                logger.info(
+                    f"Bulk upserted jobs: {result.inserted} inserted, "
+                    f"{result.updated} updated, {result.skipped} skipped"
+                )
+                return result
 
         except Exception as e:
             logger.error(f"Error bulk creating jobs: {e}")
             raise
+        finally:
+            # job_url matches were pointed at their stored ids above
+            self.cache.invalidate_many(row["id"] for row in rows)
+            self.counts.clear()
+            mark_jobs_changed(self.db_manager.engine, (row["id"] for row in rows))
+
+    @staticmethod
+    def _upsert_statement(dialect_name: str, update_existing: bool):
+        """
+        ``INSERT ... ON CONFLICT (id)`` for job_listings on this dialect.
+
+        None on dialects without one; their rows go through the ORM instead.
+        """
+        dialect_insert = _UPSERT_INSERTS.get(dialect_name)
+        if dialect_insert is None:
+            return None
+
+        table = JobListingDB.__table__
+        statement = dialect_insert(table)
+        if not update_existing:
+            return statement.on_conflict_do_nothing(index_elements=[table.c.id])
+
+        updates = {
+            column.key: statement.excluded[column.key]
+            for column in table.columns
+            if column.key not in _UPSERT_PRESERVED_COLUMNS
+        }
+        updates["updated_at"] = datetime.utcnow()
+        return statement.on_conflict_do_update(
+            index_elements=[table.c.id], set_=updates
+        )
+
+    @staticmethod
+    def _write_rows_with_orm(session, rows, existing_ids: set):
+        """Insert or update rows one object at a time, for any dialect."""
+        stored = {}
+        if existing_ids:
+            stored = {
+                job_db.id: job_db
+                for job_db in session.query(JobListingDB).filter(
+                    JobListingDB.id.in_(existing_ids)
+                )
+            }
+
+        now = datetime.utcnow()
+        for row in rows:
+            job_db = stored.get(row["id"])
+            if job_db is None:
+                session.add(JobListingDB(**row))
+                continue
+            for key, value in row.items():
+                if key not in _UPSERT_PRESERVED_COLUMNS:
+                    setattr(job_db, key, value)
+            job_db.updated_at = now
+        session.flush()
+
+    @staticmethod
+    def _match_existing_rows(connection, rows, conflict_key: str) -> set:
+        """
+        Find which rows already exist, returning their stored ids.
+
+        job_url is not unique in the schema, so job_url matches are resolved
+        here by pointing the row at the stored id, and the upsert itself
+        always conflicts on the primary key. A row whose job_url matches one
+        stored job while its id is another's raises ValueError.
+        """
+        table = JobListingDB.__table__
+
+        if conflict_key == "job_url":
+            by_url = {row["job_url"]: row for row in rows if row["job_url"]}
+            if by_url:
+                stored_ids: Dict[str, List[str]] = {}
+                matches = connection.execute(
+                    select(table.c.job_url, table.c.id).where(
+                        table.c.job_url.in_(list(by_url))
+                    )
+                )
+                for job_url, job_id in matches:
+                    stored_ids.setdefault(job_url, []).append(job_id)
+
+                moved = {
+                    by_url[job_url]["id"]: job_ids[-1]
+                    for job_url, job_ids in stored_ids.items()
+                    if by_url[job_url]["id"] not in job_ids
+                }
+                if moved:
+                    taken = connection.execute(
+                        select(table.c.id).where(table.c.id.in_(list(moved))).limit(1)
+                    ).scalar()
+                    if taken is not None:
+                        raise ValueError(
+                            f"Job {taken} matches stored job {moved[taken]} on "
+                            f"job_url, but its id belongs to another stored job"
+                        )
+
+                for job_url, job_ids in stored_ids.items():
+                    if by_url[job_url]["id"] not in job_ids:
+                        by_url[job_url]["id"] = job_ids[-1]
+
+        return set(
+            connection.execute(
+                select(table.c.id).where(table.c.id.in_([row["id"] for row in rows]))
+            ).scalars()
+        )
 
     def update_job_status(self, job_id: str, status: JobStatus) -> bool:
         """Update job status."""
@@ -400,6 +982,10 @@ class JobRepository:
         except Exception as e:
             logger.error(f"Error updating job status {job_id}: {e}")
             return False
+        finally:
+            self.cache.invalidate(str(job_id))
+            self.counts.clear()
+            mark_jobs_changed(self.db_manager.engine, [job_id])
 
 
 class UserRepository:
@@ -408,6 +994,7 @@ class UserRepository:
     def __init__(self, db_manager: DatabaseManager):
         """Initialize user repository."""
         self.db_manager = db_manager
+        self.cache = get_record_cache(db_manager.engine, "users")
 
     def create_user(self, user_data: UserProfile) -> UserProfile:
         """Create a new user profile."""
@@ -426,6 +1013,10 @@ class UserRepository:
             raise
 
     def get_user(self, user_id: str) -> Optional[UserProfile]:
+        """Get user by ID, through the record cache."""
+        return self.cache.get_or_load(str(user_id), lambda: self._load_user(user_id))
+
+    def _load_user(self, user_id: str) -> Optional[UserProfile]:
         """Get user by ID."""
         try:
             with self.db_manager.get_session() as session:
@@ -441,6 +1032,33 @@ class UserRepository:
             logger.error(f"Error getting user {user_id}: {e}")
             return None
 
+    def get_users_by_ids(self, user_ids: Iterable[str]) -> Dict[str, UserProfile]:
+        """
+        Get several users with one query, keyed by ID.
+
+        Cached users come from the record cache; IDs that don't exist are
+        absent from the result.
+        """
+        return self.cache.get_many_or_load(
+            (str(user_id) for user_id in user_ids), self._load_users
+        )
+
+    def _load_users(self, user_ids: List[str]) -> Dict[str, UserProfile]:
+        try:
+            with self.db_manager.get_session() as session:
+                users_db = (
+                    session.query(UserProfileDB)
+                    .filter(UserProfileDB.id.in_(user_ids))
+                    .all()
+                )
+                return {
+                    user_db.id: sqlalchemy_to_pydantic(user_db, UserProfile)
+                    for user_db in users_db
+                }
+        except Exception as e:
+            logger.error(f"Error getting {len(user_ids)} users by ID: {e}")
+            return {}
+
     def get_user_by_email(self, email: str) -> Optional[UserProfile]:
         """Get user by email."""
         try:
@@ -486,6 +1104,8 @@ class UserRepository:
         except Exception as e:
             logger.error(f"Error updating user {user_id}: {e}")
             raise
+        finally:
+            self.cache.invalidate(str(user_id))
 
     def delete_user(self, user_id: str) -> bool:
         """Delete user profile."""
@@ -504,6 +1124,8 @@ class UserRepository:
         except Exception as e:
             logger.error(f"Error deleting user {user_id}: {e}")
             return False
+        finally:
+            self.cache.invalidate(str(user_id))
 
     def list_users(
         self, limit: int = 50, offset: int = 0
@@ -526,7 +1148,8 @@ class UserRepository:
 
                 # Convert to Pydantic models
                 users = [
-                    sqlalchemy_to_pydantic(user_db, UserProfile) for user_db in users_db
+                    sqlalchemy_to_pydantic(user_db, UserProfile, trusted=True)
+                    for user_db in users_db
                 ]
 
                 logger.info(f"Listed {len(users)} users out of {total_count} total")
@@ -554,18 +1177,9 @@ class SavedJobRepository:
         """Save a job for a user."""
         try:
             with self.db_manager.get_session() as session:
-                # Check if job is already saved
-                existing = (
-                    session.query(SavedJobDB)
-                    .filter(
-                        and_(
-                            SavedJobDB.job_id == job_id,
-                            SavedJobDB.user_profile_id == user_profile_id,
-                            SavedJobDB.status == SavedJobStatus.SAVED,
-                        )
-                    )
-                    .first()
-                )
+                existing = active_saved_job_query(
+                    session.query(SavedJobDB), job_id, user_profile_id
+                ).first()
 
                 if existing:
                     # Update existing saved job
@@ -601,17 +1215,9 @@ class SavedJobRepository:
         """Remove a job from saved jobs."""
         try:
             with self.db_manager.get_session() as session:
-                saved_job_db = (
-                    session.query(SavedJobDB)
-                    .filter(
-                        and_(
-                            SavedJobDB.job_id == job_id,
-                            SavedJobDB.user_profile_id == user_profile_id,
-                            SavedJobDB.status == SavedJobStatus.SAVED,
-                        )
-                    )
-                    .first()
-                )
+                saved_job_db = active_saved_job_query(
+                    session.query(SavedJobDB), job_id, user_profile_id
+                ).first()
 
                 if saved_job_db:
                     session.delete(saved_job_db)
@@ -632,32 +1238,52 @@ class SavedJobRepository:
         """Get saved jobs for a user with job details."""
         try:
             with self.db_manager.get_session() as session:
-                # Join SavedJobDB with JobListingDB to get complete job information
-                saved_jobs = (
-                    session.query(SavedJobDB, JobListingDB)
-                    .join(JobListingDB, SavedJobDB.job_id == JobListingDB.id)
-                    .filter(
-                        and_(
-                            SavedJobDB.user_profile_id == user_profile_id,
-                            SavedJobDB.status == status,
-                        )
+                rows = saved_jobs_query(
+                    session.query(SavedJobDB, JobListingDB),
+                    user_profile_id,
+                    status,
+                    limit,
+                ).all()
+
+                result = [
+                    to_saved_job_entry(
+                        saved_job_db,
+                        sqlalchemy_to_pydantic(job_db, JobListing, trusted=True),
                     )
-                    .order_by(desc(SavedJobDB.saved_date))
-                    .limit(limit)
-                    .all()
+                    for saved_job_db, job_db in rows
+                ]
+
+                logger.info(
+                    f"Retrieved {len(result)} saved jobs for user: {user_profile_id}"
                 )
+                return result
 
-                result = []
-                for saved_job_db, job_db in saved_jobs:
-                    job_data = sqlalchemy_to_pydantic(job_db, JobListing)
-                    saved_job_data = sqlalchemy_to_pydantic(saved_job_db, SavedJob)
+        except Exception as e:
+            logger.error(f"Error getting saved jobs for user {user_profile_id}: {e}")
+            return []
 
-                    result.append(
-                        {"saved_job": saved_job_data.dict(), "job": job_data.dict()}
-                    )
+    def get_saved_job_summaries(
+        self,
+        user_profile_id: str,
+        status: SavedJobStatus = SavedJobStatus.SAVED,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """Get saved jobs like get_saved_jobs, with JobSummary job details."""
+        try:
+            with self.db_manager.get_session() as session:
+                rows = saved_jobs_query(
+                    session.query(SavedJobDB, *JOB_SUMMARY_COLUMNS),
+                    user_profile_id,
+                    status,
+                    limit,
+                ).all()
+
+                result = [
+                    to_saved_job_entry(row[0], to_job_summary(row[1:])) for row in rows
+                ]
 
                 logger.info(
-                    f"Retrieved {len(result)} saved jobs for user: {user_profile_id}"
+                    f"Retrieved {len(result)} saved job summaries for user: {user_profile_id}"
                 )
                 return result
 
@@ -669,17 +1295,9 @@ class SavedJobRepository:
         """Check if a job is saved by a user."""
         try:
             with self.db_manager.get_session() as session:
-                saved_job = (
-                    session.query(SavedJobDB)
-                    .filter(
-                        and_(
-                            SavedJobDB.job_id == job_id,
-                            SavedJobDB.user_profile_id == user_profile_id,
-                            SavedJobDB.status == SavedJobStatus.SAVED,
-                        )
-                    )
-                    .first()
-                )
+                saved_job = active_saved_job_query(
+                    session.query(SavedJobDB), job_id, user_profile_id
+                ).first()
 
                 return saved_job is not None
 
@@ -691,17 +1309,9 @@ class SavedJobRepository:
         """Archive a saved job (change status to archived)."""
         try:
             with self.db_manager.get_session() as session:
-                saved_job_db = (
-                    session.query(SavedJobDB)
-                    .filter(
-                        and_(
-                            SavedJobDB.job_id == job_id,
-                            SavedJobDB.user_profile_id == user_profile_id,
-                            SavedJobDB.status == SavedJobStatus.SAVED,
-                        )
-                    )
-                    .first()
-                )
+                saved_job_db = active_saved_job_query(
+                    session.query(SavedJobDB), job_id, user_profile_id
+                ).first()
 
                 if saved_job_db:
                     saved_job_db.status = SavedJobStatus.ARCHIVED
@@ -726,17 +1336,9 @@ class SavedJobRepository:
         """Update notes and tags for a saved job."""
         try:
             with self.db_manager.get_session() as session:
-                saved_job_db = (
-                    session.query(SavedJobDB)
-                    .filter(
-                        and_(
-                            SavedJobDB.job_id == job_id,
-                            SavedJobDB.user_profile_id == user_profile_id,
-                            SavedJobDB.status == SavedJobStatus.SAVED,
-                        )
-                    )
-                    .first()
-                )
+                saved_job_db = active_saved_job_query(
+                    session.query(SavedJobDB), job_id, user_profile_id
+                ).first()
 
                 if saved_job_db:
                     if notes is not None:
@@ -763,6 +1365,7 @@ class ResumeRepository:
     def __init__(self, db_manager: DatabaseManager):
         """Initialize resume repository."""
         self.db_manager = db_manager
+        self.cache = get_record_cache(db_manager.engine, "resumes")
 
     @retry_db_write()
     def create_resume(self, resume_data: Resume) -> Resume:
@@ -782,6 +1385,12 @@ class ResumeRepository:
             raise
 
     def get_resume(self, resume_id: str) -> Optional[Resume]:
+        """Get resume by ID, through the record cache."""
+        return self.cache.get_or_load(
+            str(resume_id), lambda: self._load_resume(resume_id)
+        )
+
+    def _load_resume(self, resume_id: str) -> Optional[Resume]:
         """Get resume by ID."""
         try:
             with self.db_manager.get_session() as session:
@@ -805,11 +1414,7 @@ class ResumeRepository:
         """Get resumes for a user with filtering and pagination."""
         try:
             with self.db_manager.get_session() as session:
-                query_obj = session.query(ResumeDB).filter(ResumeDB.user_id == user_id)
-
-                # Filter by status if provided
-                if status:
-                    query_obj = query_obj.filter(ResumeDB.status == status)
+                query_obj = user_resumes_query(session.query(ResumeDB), user_id, status)
 
                 # Get total count
                 total_count = query_obj.count()
@@ -824,7 +1429,7 @@ class ResumeRepository:
 
                 # Convert to Pydantic models
                 resumes = [
-                    sqlalchemy_to_pydantic(resume_db, Resume)
+                    sqlalchemy_to_pydantic(resume_db, Resume, trusted=True)
                     for resume_db in resumes_db
                 ]
 
@@ -865,6 +1470,8 @@ class ResumeRepository:
         except Exception as e:
             logger.error(f"Error updating resume {resume_id}: {e}")
             raise
+        finally:
+            self.cache.invalidate(str(resume_id))
 
     def delete_resume(self, resume_id: str) -> bool:
         """Delete resume."""
@@ -881,6 +1488,8 @@ class ResumeRepository:
         except Exception as e:
             logger.error(f"Error deleting resume {resume_id}: {e}")
             return False
+        finally:
+            self.cache.invalidate(str(resume_id))
 
     def get_resumes_by_type(
         self, user_id: str, resume_type: str, limit: int = 20
@@ -888,21 +1497,12 @@ class ResumeRepository:
         """Get resumes by type for a user."""
         try:
             with self.db_manager.get_session() as session:
-                resumes_db = (
-                    session.query(ResumeDB)
-                    .filter(
-                        and_(
-                            ResumeDB.user_id == user_id,
-                            ResumeDB.resume_type == resume_type,
-                        )
-                    )
-                    .order_by(desc(ResumeDB.updated_at))
-                    .limit(limit)
-                    .all()
-                )
+                resumes_db = resumes_by_type_query(
+                    session.query(ResumeDB), user_id, resume_type, limit
+                ).all()
 
                 resumes = [
-                    sqlalchemy_to_pydantic(resume_db, Resume)
+                    sqlalchemy_to_pydantic(resume_db, Resume, trusted=True)
                     for resume_db in resumes_db
                 ]
                 logger.info(
@@ -932,6 +1532,11 @@ class ApplicationRepository:
     def __init__(self, db_manager: DatabaseManager):
         """Initialize application repository."""
         self.db_manager = db_manager
+        self.counts = get_record_cache(
+            db_manager.engine,
+            "application_counts",
+            ttl_seconds=COUNT_CACHE_TTL_SECONDS,
+        )
 
     @retry_db_write()
     def create_application(self, app_data: JobApplication) -> JobApplication:
@@ -949,6 +1554,8 @@ class ApplicationRepository:
         except Exception as e:
             logger.error(f"Error creating application: {e}")
             raise
+        finally:
+            self.counts.clear()
 
     def get_application(self, application_id: str) -> Optional[JobApplication]:
         """Get application by ID."""
@@ -972,16 +1579,9 @@ class ApplicationRepository:
         """Get application by job and user combination."""
         try:
             with self.db_manager.get_session() as session:
-                app_db = (
-                    session.query(JobApplicationDB)
-                    .filter(
-                        and_(
-                            JobApplicationDB.job_id == job_id,
-                            JobApplicationDB.user_profile_id == user_profile_id,
-                        )
-                    )
-                    .first()
-                )
+                app_db = application_by_job_and_user_query(
+                    session.query(JobApplicationDB), job_id, user_profile_id
+                ).first()
                 if app_db:
                     return sqlalchemy_to_pydantic(app_db, JobApplication)
                 return None
@@ -997,20 +1597,22 @@ class ApplicationRepository:
         status: Optional[ApplicationStatus] = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> Tuple[List[JobApplication], int]:
-        """Get user's applications with filtering."""
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Tuple[List[JobApplication], Optional[int]]:
+        """Get user's applications with filtering; the total uses ``count_strategy``."""
         try:
             with self.db_manager.get_session() as session:
-                query_obj = session.query(JobApplicationDB).filter(
-                    JobApplicationDB.user_profile_id == user_profile_id
+                query_obj = user_applications_query(
+                    session.query(JobApplicationDB), user_profile_id, status
                 )
 
-                # Filter by status
-                if status:
-                    query_obj = query_obj.filter(JobApplicationDB.status == status)
-
                 # Get total count
-                total = query_obj.count()
+                total = count_query(
+                    query_obj,
+                    count_strategy,
+                    self.counts,
+                    applications_count_signature(user_profile_id, status),
+                )
 
                 # Apply pagination and ordering
                 apps_db = (
@@ -1021,7 +1623,8 @@ class ApplicationRepository:
                 )
 
                 applications = [
-                    sqlalchemy_to_pydantic(app_db, JobApplication) for app_db in apps_db
+                    sqlalchemy_to_pydantic(app_db, JobApplication, trusted=True)
+                    for app_db in apps_db
                 ]
 
                 logger.info(
@@ -1031,7 +1634,128 @@ class ApplicationRepository:
 
         except Exception as e:
             logger.error(f"Error getting applications for user {user_profile_id}: {e}")
-            return [], 0
+            return [], 0 if count_strategy != CountStrategy.NONE else None
+
+    def get_applications_page(
+        self,
+        user_profile_id: str,
+        status: Optional[ApplicationStatus] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Page[JobApplication]:
+        """
+        Get user's applications with keyset pagination (newest first).
+
+        Raises:
+            InvalidCursorError: If ``cursor`` was not produced by this listing
+        """
+        try:
+            with self.db_manager.get_session() as session:
+                query_obj = user_applications_query(
+                    session.query(JobApplicationDB), user_profile_id, status
+                )
+
+                if not include_total:
+                    count_strategy = CountStrategy.NONE
+                total = count_query(
+                    query_obj,
+                    count_strategy,
+                    self.counts,
+                    applications_count_signature(user_profile_id, status),
+                )
+                apps_db, next_cursor = paginate(
+                    query_obj,
+                    APPLICATION_SORT_KEYS,
+                    limit,
+                    cursor,
+                )
+
+                applications = [
+                    sqlalchemy_to_pydantic(app_db, JobApplication, trusted=True)
+                    for app_db in apps_db
+                ]
+
+                logger.info(
+                    f"Retrieved {len(applications)} applications for user {user_profile_id}"
+                )
+                return Page(
+                    items=applications,
+                    next_cursor=next_cursor,
+                    total=total,
+                    total_strategy=page_total_strategy(count_strategy),
+                    total_is_lower_bound=total_is_lower_bound(count_strategy, total),
+                )
+
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting applications for user {user_profile_id}: {e}")
+            return Page(items=[], total=0 if include_total else None)
+
+    def get_applications_with_jobs(
+        self,
+        user_profile_id: str,
+        status: Optional[ApplicationStatus] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Page[Tuple[JobApplication, Optional[JobListing]]]:
+        """
+        get_applications_page with each application's job, in one JOIN query.
+
+        Items are ``(application, job)`` pairs; ``job`` is None when the
+        listing no longer exists.
+
+        Raises:
+            InvalidCursorError: If ``cursor`` was not produced by this listing
+        """
+        try:
+            with self.db_manager.get_session() as session:
+                query_obj = user_applications_query(
+                    session.query(JobApplicationDB, JobListingDB),
+                    user_profile_id,
+                    status,
+                    with_jobs=True,
+                )
+
+                if not include_total:
+                    count_strategy = CountStrategy.NONE
+                total = count_query(
+                    query_obj,
+                    count_strategy,
+                    self.counts,
+                    applications_count_signature(user_profile_id, status),
+                )
+                rows, next_cursor = paginate(
+                    query_obj,
+                    APPLICATION_SORT_KEYS,
+                    limit,
+                    cursor,
+                )
+
+                items = [
+                    to_application_with_job(app_db, job_db) for app_db, job_db in rows
+                ]
+
+                logger.info(
+                    f"Retrieved {len(items)} applications with jobs for user {user_profile_id}"
+                )
+                return Page(
+                    items=items,
+                    next_cursor=next_cursor,
+                    total=total,
+                    total_strategy=page_total_strategy(count_strategy),
+                    total_is_lower_bound=total_is_lower_bound(count_strategy, total),
+                )
+
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting applications for user {user_profile_id}: {e}")
+            return Page(items=[], total=0 if include_total else None)
 
     @retry_db_write()
     def update_application(
@@ -1063,6 +1787,8 @@ class ApplicationRepository:
         except Exception as e:
             logger.error(f"Error updating application {application_id}: {e}")
             raise
+        finally:
+            self.counts.clear()
 
     def delete_application(self, application_id: str) -> bool:
         """Delete application."""
@@ -1081,20 +1807,20 @@ class ApplicationRepository:
         except Exception as e:
             logger.error(f"Error deleting application {application_id}: {e}")
             return False
+        finally:
+            self.counts.clear()
 
     def get_applications_by_job(self, job_id: str) -> List[JobApplication]:
         """Get all applications for a specific job."""
         try:
             with self.db_manager.get_session() as session:
-                apps_db = (
-                    session.query(JobApplicationDB)
-                    .filter(JobApplicationDB.job_id == job_id)
-                    .order_by(desc(JobApplicationDB.created_at))
-                    .all()
-                )
+                apps_db = job_applications_query(
+                    session.query(JobApplicationDB), job_id
+                ).all()
 
                 return [
-                    sqlalchemy_to_pydantic(app_db, JobApplication) for app_db in apps_db
+                    sqlalchemy_to_pydantic(app_db, JobApplication, trusted=True)
+                    for app_db in apps_db
                 ]
 
         except Exception as e:
@@ -1122,6 +1848,11 @@ def initialize_database(database_url: str = None):
     application_repo = ApplicationRepository(db_manager)
     resume_repo = ResumeRepository(db_manager)
 
+    # Async repositories for async request handlers share the same database
+    from app.data.async_database import initialize_async_database
+
+    initialize_async_database(db_manager.database_url, db_manager.fulltext_enabled)
+
     logger.info("Database repositories initialized")
 
 
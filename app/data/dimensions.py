@@ -0,0 +1,306 @@
+"""
+JobPilot Company and Location Dimensions
+Normalized keys for job companies and locations, and the lookups that keep
+job_listings.company_id and location_id pointing at their canonical rows.
+"""
+
+import re
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, Iterable, List, Optional
+from uuid import uuid4
+
+from sqlalchemy import event, false, inspect, or_, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.data.models import JobCompanyDB, JobListingDB, JobLocationDB
+
+# Trailing words dropped from company keys ("Acme Corp." -> "acme")
+COMPANY_SUFFIXES = frozenset(
+    {
+        "ag",
+        "co",
+        "company",
+        "corp",
+        "corporation",
+        "gmbh",
+        "inc",
+        "incorporated",
+        "limited",
+        "llc",
+        "llp",
+        "lp",
+        "ltd",
+        "plc",
+        "sa",
+    }
+)
+REMOTE_LOCATIONS = frozenset({"anywhere", "remote", "work from home", "wfh"})
+
+# Countries dropped from location keys, like the ETL processor does for "us"
+DEFAULT_COUNTRIES = frozenset(
+    {"us", "usa", "u.s.", "u.s.a.", "united states", "united states of america"}
+)
+
+LOOKUP_CHUNK_SIZE = 500
+
+_CONFLICT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+_NON_WORD = re.compile(r"[^\w\s]")
+
+
+def _clean(value: str) -> str:
+    return " ".join(value.split())
+
+
+def company_key(name: Optional[str]) -> Optional[str]:
+    """Normalized company key: lower-cased words without legal suffixes."""
+    if not name:
+        return None
+    words = _NON_WORD.sub(" ", name.lower().replace("&", " and ")).split()
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words) or None
+
+
+@dataclass(frozen=True)
+class LocationParts:
+    """A location split into lower-cased key components."""
+
+    key: str
+    city: Optional[str] = None
+    region: Optional[str] = None
+    country: Optional[str] = None
+    is_remote: bool = False
+
+
+def parse_location(location: Optional[str]) -> Optional[LocationParts]:
+    """
+    Split "City, Region[, Country]" text into a LocationParts.
+
+    Remote-only locations ("Remote", "Anywhere") share the key "remote", and
+    a trailing United States country is dropped so "Austin, TX, US" and
+    "Austin, TX" are the same location.
+    """
+    if not location:
+        return None
+
+    parts = [_clean(part) for part in location.lower().split(",")]
+    parts = [part for part in parts if part]
+    if len(parts) > 1 and parts[-1] in DEFAULT_COUNTRIES:
+        parts.pop()
+    if not parts:
+        return None
+    if all(part in REMOTE_LOCATIONS for part in parts):
+        return LocationParts(key="remote", is_remote=True)
+
+    city, region, country = (parts + [None, None])[:3]
+    return LocationParts(
+        key=", ".join(parts),
+        city=city,
+        region=region,
+        country=country,
+        is_remote=any(part in REMOTE_LOCATIONS for part in parts),
+    )
+
+
+def format_location(
+    city: Optional[str], region: Optional[str], country: Optional[str]
+) -> str:
+    """Display text for location components, "Remote" when there are none."""
+    parts = [_clean(part) for part in (city, region, country) if part and part.strip()]
+    if parts and parts[-1].lower() in DEFAULT_COUNTRIES:
+        parts.pop()
+    return ", ".join(parts) if parts else "Remote"
+
+
+# ==================== Lookups ====================
+
+
+def _existing_ids(conn: Connection, table, keys: List[str]) -> Dict[str, str]:
+    ids = {}
+    for start in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+        chunk = keys[start : start + LOOKUP_CHUNK_SIZE]
+        rows = conn.execute(
+            select(table.c.key, table.c.id).where(table.c.key.in_(chunk))
+        )
+        ids.update((key, id_) for key, id_ in rows)
+    return ids
+
+
+def _insert_missing(
+    conn: Connection, table, new_rows: List[Dict], ids: Dict[str, str]
+) -> None:
+    """
+    Insert ``new_rows`` and add the ids of their keys to ``ids``.
+
+    Uses ``INSERT ... ON CONFLICT (key) DO NOTHING`` and re-reads the keys,
+    so a concurrent writer inserting the same key first is not an error:
+    its row's id is used.
+    """
+    dialect_insert = _CONFLICT_INSERTS.get(conn.dialect.name)
+    if dialect_insert is None:
+        conn.execute(table.insert(), new_rows)
+        ids.update((row["key"], row["id"]) for row in new_rows)
+        return
+
+    statement = dialect_insert(table).on_conflict_do_nothing(
+        index_elements=[table.c.key]
+    )
+    conn.execute(statement, new_rows)
+    ids.update(_existing_ids(conn, table, [row["key"] for row in new_rows]))
+
+
+def resolve_company_ids(
+    conn: Connection, names: Iterable[Optional[str]]
+) -> Dict[str, str]:
+    """
+    Get or create the job_companies rows for ``names``.
+
+    Returns ids keyed by company_key(); the first spelling seen becomes the
+    display name of a new company.
+    """
+    names_by_key = {}
+    for name in names:
+        key = company_key(name)
+        if key and key not in names_by_key:
+            names_by_key[key] = _clean(name)
+    if not names_by_key:
+        return {}
+
+    table = JobCompanyDB.__table__
+    ids = _existing_ids(conn, table, list(names_by_key))
+    new_rows = [
+        {"id": str(uuid4()), "key": key, "name": name}
+        for key, name in names_by_key.items()
+        if key not in ids
+    ]
+    if new_rows:
+        _insert_missing(conn, table, new_rows, ids)
+    return ids
+
+
+def resolve_location_ids(
+    conn: Connection, locations: Iterable[Optional[str]]
+) -> Dict[str, str]:
+    """Get or create the job_locations rows for ``locations``, keyed by parsed key."""
+    parsed_by_key = {}
+    for location in locations:
+        parts = parse_location(location)
+        if parts and parts.key not in parsed_by_key:
+            parsed_by_key[parts.key] = (_clean(location), parts)
+    if not parsed_by_key:
+        return {}
+
+    table = JobLocationDB.__table__
+    ids = _existing_ids(conn, table, list(parsed_by_key))
+    new_rows = [
+        {
+            "id": str(uuid4()),
+            "key": key,
+            "name": name,
+            "city": parts.city,
+            "region": parts.region,
+            "country": parts.country,
+            "is_remote": parts.is_remote,
+        }
+        for key, (name, parts) in parsed_by_key.items()
+        if key not in ids
+    ]
+    if new_rows:
+        _insert_missing(conn, table, new_rows, ids)
+    return ids
+
+
+def assign_dimension_ids(conn: Connection, rows: List[Dict]):
+    """Set company_id and location_id on job listing row dicts."""
+    company_ids = resolve_company_ids(conn, (row.get("company") for row in rows))
+    location_ids = resolve_location_ids(conn, (row.get("location") for row in rows))
+    for row in rows:
+        row["company_id"] = company_ids.get(company_key(row.get("company")))
+        parts = parse_location(row.get("location"))
+        row["location_id"] = location_ids.get(parts.key) if parts else None
+
+
+# ==================== Search Filters ====================
+
+
+def company_filter(companies: Iterable[str], column=JobListingDB.company_id):
+    """
+    Indexed filter matching job listings at any of ``companies``.
+
+    ``column`` is the company_id column to match, for tables other than
+    job_listings.
+    """
+    keys = {key for key in map(company_key, companies) if key}
+    return column.in_(select(JobCompanyDB.id).where(JobCompanyDB.key.in_(keys)))
+
+
+def location_filter(locations: Iterable[str]):
+    """
+    Indexed filter matching job listings in any of ``locations``.
+
+    A full location ("Austin, TX") matches that location; a single word
+    also matches it as a city, region or country ("Austin", "TX").
+    """
+    return JobListingDB.location_id.in_(matching_locations(locations))
+
+
+def matching_locations(locations: Iterable[str]):
+    """SELECT of the job_locations ids location_filter matches."""
+    conditions = []
+    for location in locations:
+        parts = parse_location(location)
+        if parts is None:
+            continue
+        if parts.is_remote and parts.city is None:
+            conditions.append(JobLocationDB.is_remote.is_(True))
+        elif parts.region is None:
+            conditions.extend(
+                [
+                    JobLocationDB.key == parts.key,
+                    JobLocationDB.city == parts.key,
+                    JobLocationDB.region == parts.key,
+                    JobLocationDB.country == parts.key,
+                ]
+            )
+        else:
+            conditions.append(JobLocationDB.key == parts.key)
+
+    return select(JobLocationDB.id).where(or_(false(), *conditions))
+
+
+# ==================== ORM Hook ====================
+
+
+def _dimensions_changed(job_db: JobListingDB) -> bool:
+    state = inspect(job_db)
+    if state.pending or state.transient:
+        return True
+    return (
+        state.attrs.company.history.has_changes()
+        or state.attrs.location.history.has_changes()
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _assign_job_dimensions(session, flush_context, instances):
+    """Point new and edited job listings at their company and location rows."""
+    jobs = [
+        obj
+        for obj in chain(session.new, session.dirty)
+        if isinstance(obj, JobListingDB) and _dimensions_changed(obj)
+    ]
+    if not jobs:
+        return
+
+    conn = session.connection()
+    company_ids = resolve_company_ids(conn, (job.company for job in jobs))
+    location_ids = resolve_location_ids(conn, (job.location for job in jobs))
+    for job in jobs:
+        job.company_id = company_ids.get(company_key(job.company))
+        parts = parse_location(job.location)
+        job.location_id = location_ids.get(parts.key) if parts else None
@@ -0,0 +1,627 @@
+"""
+JobPilot Embedding Index
+In-memory matrix of job embeddings for semantic search, with the filterable
+job columns kept alongside so search filters are masks over the matrix.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import numpy as np
+from sqlalchemy import LargeBinary, and_, delete, insert, select, type_coerce
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.data.dimensions import matching_locations
+from app.data.engine import database_key
+from app.data.models import (
+    JobEmbeddingDB,
+    JobListing,
+    JobListingDB,
+    JobStatus,
+    JobType,
+    RemoteType,
+)
+from app.data.vectors import stack_vectors
+from app.logger import logger
+
+# Everything is reloaded at least this often, which bounds drift from writes
+# the repositories do not report (other processes, the ETL loader)
+EMBEDDING_INDEX_TTL_SECONDS = 600.0
+
+# Job ids per IN (...) lookup while refreshing written jobs
+EMBEDDING_SYNC_CHUNK_SIZE = 500
+
+# content_type of the rows the index writes to job_embeddings; VectorStore
+# embeds a different text per job under its own content_type
+EMBEDDING_CONTENT_TYPE = "semantic_search"
+
+# Enum columns are kept as small integer codes; -1 is NULL
+_JOB_TYPE_CODES = {member: code for code, member in enumerate(JobType)}
+_REMOTE_TYPE_CODES = {member: code for code, member in enumerate(RemoteType)}
+
+_JOB_COLUMNS = (
+    JobListingDB.id,
+    JobListingDB.job_type,
+    JobListingDB.remote_type,
+    JobListingDB.location_id,
+    JobListingDB.salary_annual_min,
+    JobListingDB.salary_annual_max,
+)
+
+Encoder = Callable[[List[str]], Any]
+JobText = Callable[[JobListing], str]
+
+
+def content_hash(text: str) -> str:
+    """Hash of embedded text, stored to tell when a job must be re-embedded."""
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+def normalize_rows(vectors: Any) -> np.ndarray:
+    """L2-normalize the rows of ``vectors`` as a float32 matrix."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, np.finfo(np.float32).tiny)
+
+
+class JobEmbeddingIndex:
+    """
+    Normalized embeddings of every active job listing for one model.
+
+    The first sync loads the stored job_embeddings of active listings into
+    one float32 matrix. After that, only listings the repositories report
+    as written are re-read: they are replaced in place, or dropped once no
+    longer active. Listings without an embedding of their current text are
+    embedded in a background thread, so a sync never waits on the model;
+    until then a listing keeps its older embedding, if it has one. A search
+    is one matrix-vector product, with filters applied as boolean masks
+    over the rows. Everything is reloaded after ``ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        embedding_model: str,
+        ttl_seconds: float = EMBEDDING_INDEX_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.embedding_model = embedding_model
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._expires_at = 0.0
+        self._stale: Set[str] = set()
+        self._unembedded: Set[str] = set()
+        self._embedding: Optional[threading.Thread] = None
+
+        # Row i of every array belongs to _ids[i]; the first _size rows are live
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._size = 0
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._job_types = np.empty(0, dtype=np.int8)
+        self._remote_types = np.empty(0, dtype=np.int8)
+        self._locations = np.empty(0, dtype=np.int32)
+        self._salary_min = np.empty(0, dtype=np.float64)
+        self._salary_max = np.empty(0, dtype=np.float64)
+        self._location_codes: Dict[str, int] = {}
+
+        # Counters
+        self.full_loads = 0
+        self.refreshes = 0
+        self.embedded = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def mark_stale(self, job_ids: Iterable[str]):
+        """Re-read these jobs on the next sync."""
+        with self._lock:
+            self._stale.update(str(job_id) for job_id in job_ids)
+
+    def invalidate(self):
+        """Reload every job on the next sync."""
+        with self._lock:
+            self._expires_at = 0.0
+
+    # ==================== Sync ====================
+
+    def sync(self, job_repo, encode: Encoder, job_text: JobText) -> int:
+        """
+        Bring the matrix up to date with job_listings, without embedding.
+
+        ``job_repo`` is a JobRepository on the database, ``encode`` embeds a
+        list of texts as an ``(n, dimension)`` array and ``job_text`` gives
+        the text embedded for a job. Jobs needing an embedding are queued
+        for ``embed_in_background``, which is started here. Returns the
+        number of jobs queued.
+        """
+        with self._sync_lock:
+            with self._lock:
+                expired = self._clock() >= self._expires_at
+                stale, self._stale = self._stale, set()
+
+            engine = job_repo.db_manager.engine
+            if expired:
+                stale |= self._load_all(engine)
+            queued = self._refresh(job_repo, sorted(stale), job_text) if stale else 0
+
+        if self._unembedded:
+            self.embed_in_background(job_repo, encode, job_text)
+        return queued
+
+    def _load_all(self, engine: Engine) -> Set[str]:
+        """Load every active job; returns the jobs that need (re-)embedding."""
+        embeddings = JobEmbeddingDB.__table__
+        vector = type_coerce(embeddings.c.embedding_vector, LargeBinary)
+        statement = (
+            select(
+                *_JOB_COLUMNS,
+                vector,
+                JobListingDB.updated_at > embeddings.c.created_at,
+            )
+            .outerjoin(
+                embeddings,
+                and_(
+                    embeddings.c.job_id == JobListingDB.id,
+                    embeddings.c.embedding_model == self.embedding_model,
+                    embeddings.c.content_type == EMBEDDING_CONTENT_TYPE,
+                ),
+            )
+            .where(JobListingDB.status == JobStatus.ACTIVE)
+            .order_by(JobListingDB.id, embeddings.c.created_at)
+        )
+        with engine.connect() as conn:
+            rows = conn.execute(statement).all()
+
+        # Ordered by creation, so a job's latest embedding wins
+        latest: Dict[str, Tuple] = {}
+        for row in rows:
+            latest[row[0]] = row
+        outdated = {
+            job_id for job_id, row in latest.items() if row[6] is None or row[7]
+        }
+        stored = [row for row in latest.values() if row[6] is not None]
+        vectors = stack_vectors(
+            [row[6] for row in stored], embeddings.c.embedding_vector.type.dtype
+        )
+
+        with self._lock:
+            self._clear()
+            if stored:
+                self._put([row[:6] for row in stored], vectors)
+            self._expires_at = self._clock() + self.ttl_seconds
+            self.full_loads += 1
+
+        logger.info(
+            f"Loaded {len(stored)} {self.embedding_model} job embeddings, "
+            f"{len(outdated)} jobs to check"
+        )
+        return outdated
+
+    def _read(
+        self, job_repo, job_ids: List[str], job_text: JobText
+    ) -> Tuple[Dict[str, Tuple], Dict[str, str], Dict[str, Tuple[str, bytes]]]:
+        """
+        Current state of ``job_ids``: the _JOB_COLUMNS values of the active
+        ones, their text, and their latest stored embedding as
+        ``(content hash, vector)``.
+        """
+        engine = job_repo.db_manager.engine
+        embeddings = JobEmbeddingDB.__table__
+        active: Dict[str, Tuple] = {}
+        stored: Dict[str, Tuple[str, bytes]] = {}
+        with engine.connect() as conn:
+            for start in range(0, len(job_ids), EMBEDDING_SYNC_CHUNK_SIZE):
+                chunk = job_ids[start : start + EMBEDDING_SYNC_CHUNK_SIZE]
+                for row in conn.execute(
+                    select(*_JOB_COLUMNS).where(
+                        JobListingDB.id.in_(chunk),
+                        JobListingDB.status == JobStatus.ACTIVE,
+                    )
+                ):
+                    active[row[0]] = tuple(row)
+                for job_id, stored_hash, vector in conn.execute(
+                    select(
+                        embeddings.c.job_id,
+                        embeddings.c.content_hash,
+                        type_coerce(embeddings.c.embedding_vector, LargeBinary),
+                    )
+                    .where(
+                        embeddings.c.job_id.in_(chunk),
+                        embeddings.c.embedding_model == self.embedding_model,
+                        embeddings.c.content_type == EMBEDDING_CONTENT_TYPE,
+                    )
+                    .order_by(embeddings.c.created_at)
+                ):
+                    stored[job_id] = (stored_hash, vector)
+
+        jobs = job_repo.get_jobs_by_ids(active)
+        texts = {job_id: job_text(job) for job_id, job in jobs.items()}
+        active = {job_id: active[job_id] for job_id in texts}
+        return active, texts, stored
+
+    @staticmethod
+    def _outdated(
+        texts: Dict[str, str], stored: Dict[str, Tuple[str, bytes]]
+    ) -> Dict[str, str]:
+        """Hashes of the texts whose stored embedding is of other text."""
+        hashes = {job_id: content_hash(text) for job_id, text in texts.items()}
+        return {
+            job_id: text_hash
+            for job_id, text_hash in hashes.items()
+            if stored.get(job_id, (None,))[0] != text_hash
+        }
+
+    def _refresh(self, job_repo, job_ids: List[str], job_text: JobText) -> int:
+        """Re-read written jobs from their stored embeddings; queues the rest."""
+        active, texts, stored = self._read(job_repo, job_ids, job_text)
+        outdated = self._outdated(texts, stored)
+        # Outdated jobs keep their older vector until they are re-embedded
+        dtype = JobEmbeddingDB.__table__.c.embedding_vector.type.dtype
+        vectors = {
+            job_id: stack_vectors([stored[job_id][1]], dtype)[0]
+            for job_id in active
+            if job_id in stored
+        }
+
+        with self._lock:
+            self._remove(job_id for job_id in job_ids if job_id not in vectors)
+            if vectors:
+                self._put(
+                    [active[job_id] for job_id in vectors],
+                    np.stack(list(vectors.values())),
+                )
+            self._unembedded.update(outdated)
+            self.refreshes += 1
+        return len(outdated)
+
+    # ==================== Embedding ====================
+
+    def embed_pending(self, job_repo, encode: Encoder, job_text: JobText) -> int:
+        """
+        Embed the jobs queued by ``sync``, store the embeddings in
+        job_embeddings and put them in the matrix. Returns the number of
+        jobs embedded.
+        """
+        with self._lock:
+            job_ids, self._unembedded = sorted(self._unembedded), set()
+        if not job_ids:
+            return 0
+
+        try:
+            active, texts, stored = self._read(job_repo, job_ids, job_text)
+            missing = self._outdated(texts, stored)
+            vectors: Dict[str, np.ndarray] = {}
+            if missing:
+                encoded = np.asarray(
+                    encode([texts[job_id] for job_id in missing]), dtype=np.float32
+                )
+                self._store_embeddings(
+                    job_repo.db_manager.engine, list(missing), missing, encoded
+                )
+                vectors.update(zip(missing, encoded, strict=True))
+        except Exception:
+            with self._lock:
+                self._unembedded.update(job_ids)
+            raise
+
+        # Re-embedded elsewhere meanwhile: put the stored vector back
+        dtype = JobEmbeddingDB.__table__.c.embedding_vector.type.dtype
+        for job_id in active:
+            if job_id not in vectors and job_id in stored:
+                vectors[job_id] = stack_vectors([stored[job_id][1]], dtype)[0]
+
+        with self._lock:
+            self._remove(job_id for job_id in job_ids if job_id not in active)
+            if vectors:
+                self._put(
+                    [active[job_id] for job_id in vectors],
+                    np.stack(list(vectors.values())),
+                )
+            self.embedded += len(missing)
+
+        if missing:
+            logger.info(f"Embedded {len(missing)} jobs with {self.embedding_model}")
+        return len(missing)
+
+    def embed_in_background(self, job_repo, encode: Encoder, job_text: JobText) -> bool:
+        """Start ``embed_pending`` in a daemon thread unless one is running."""
+        with self._lock:
+            if self._embedding is not None:
+                return False
+            self._embedding = threading.Thread(
+                target=self._embed_until_done,
+                args=(job_repo, encode, job_text),
+                name="job-embedding",
+                daemon=True,
+            )
+            self._embedding.start()
+            return True
+
+    def _embed_until_done(self, job_repo, encode: Encoder, job_text: JobText):
+        try:
+            while True:
+                with self._lock:
+                    if not self._unembedded:
+                        self._embedding = None
+                        return
+                self.embed_pending(job_repo, encode, job_text)
+        except Exception as e:
+            logger.error(f"Failed to embed jobs with {self.embedding_model}: {e}")
+            with self._lock:
+                self._embedding = None
+
+    def wait_for_embedding(self, timeout: Optional[float] = None) -> None:
+        """Block until the running background embedding, if any, finishes."""
+        with self._lock:
+            embedding = self._embedding
+        if embedding is not None:
+            embedding.join(timeout)
+
+    def _store_embeddings(
+        self,
+        engine: Engine,
+        job_ids: List[str],
+        hashes: Dict[str, str],
+        vectors: np.ndarray,
+    ):
+        """Replace the index's stored embeddings of ``job_ids`` for this model."""
+        embeddings = JobEmbeddingDB.__table__
+        rows = [
+            {
+                "job_id": job_id,
+                "embedding_model": self.embedding_model,
+                "content_hash": hashes[job_id],
+                "embedding_vector": vector,
+                "embedding_dimension": vectors.shape[1],
+                "content_type": EMBEDDING_CONTENT_TYPE,
+            }
+            for job_id, vector in zip(job_ids, vectors, strict=True)
+        ]
+        with engine.begin() as conn:
+            for start in range(0, len(rows), EMBEDDING_SYNC_CHUNK_SIZE):
+                chunk = job_ids[start : start + EMBEDDING_SYNC_CHUNK_SIZE]
+                conn.execute(
+                    delete(embeddings).where(
+                        embeddings.c.job_id.in_(chunk),
+                        embeddings.c.embedding_model == self.embedding_model,
+                        embeddings.c.content_type == EMBEDDING_CONTENT_TYPE,
+                    )
+                )
+            conn.execute(insert(embeddings), rows)
+
+    # ==================== Rows ====================
+
+    def _clear(self):
+        self._ids, self._rows, self._size = [], {}, 0
+        self._location_codes = {}
+
+    def _reserve(self, rows: int, dimension: int):
+        """Grow the arrays (doubling) to hold ``rows`` rows."""
+        capacity = len(self._job_types)
+        if rows <= capacity and self._vectors.shape[1] == dimension:
+            return
+        capacity = max(rows, 2 * capacity, 1024)
+
+        def grow(array, shape, fill):
+            grown = np.full(shape, fill, dtype=array.dtype)
+            if self._size:
+                grown[: self._size] = array[: self._size]
+            return grown
+
+        self._vectors = grow(self._vectors, (capacity, dimension), 0.0)
+        self._job_types = grow(self._job_types, capacity, -1)
+        self._remote_types = grow(self._remote_types, capacity, -1)
+        self._locations = grow(self._locations, capacity, -1)
+        self._salary_min = grow(self._salary_min, capacity, np.nan)
+        self._salary_max = grow(self._salary_max, capacity, np.nan)
+
+    def _put(self, jobs: List[Tuple], vectors: np.ndarray):
+        """Insert or replace rows; ``jobs`` are _JOB_COLUMNS values."""
+        if self._size and vectors.shape[1] != self._vectors.shape[1]:
+            # Another model's vectors under this name; start over
+            self._clear()
+        self._reserve(self._size + len(jobs), vectors.shape[1])
+
+        positions = []
+        for job_id, *_ in jobs:
+            row = self._rows.get(job_id)
+            if row is None:
+                row = self._rows[job_id] = self._size
+                self._ids.append(job_id)
+                self._size += 1
+            positions.append(row)
+
+        rows = np.asarray(positions, dtype=np.intp)
+        self._vectors[rows] = normalize_rows(vectors)
+        self._job_types[rows] = [_JOB_TYPE_CODES.get(job[1], -1) for job in jobs]
+        self._remote_types[rows] = [_REMOTE_TYPE_CODES.get(job[2], -1) for job in jobs]
+        self._locations[rows] = [self._location_code(job[3]) for job in jobs]
+        self._salary_min[rows] = [_salary(job[4]) for job in jobs]
+        self._salary_max[rows] = [_salary(job[5]) for job in jobs]
+
+    def _remove(self, job_ids: Iterable[str]):
+        """Drop rows by moving the last live row into each hole."""
+        arrays = (
+            self._vectors,
+            self._job_types,
+            self._remote_types,
+            self._locations,
+            self._salary_min,
+            self._salary_max,
+        )
+        for job_id in job_ids:
+            row = self._rows.pop(job_id, None)
+            if row is None:
+                continue
+            last = self._size - 1
+            if row != last:
+                moved = self._ids[last]
+                self._ids[row] = moved
+                self._rows[moved] = row
+                for array in arrays:
+                    array[row] = array[last]
+            self._ids.pop()
+            self._size = last
+
+    def _location_code(self, location_id: Optional[str]) -> int:
+        if location_id is None:
+            return -1
+        return self._location_codes.setdefault(location_id, len(self._location_codes))
+
+    # ==================== Search ====================
+
+    def search(
+        self,
+        job_repo,
+        query_vector: Any,
+        limit: int = 20,
+        min_similarity: float = 0.0,
+        job_types: Optional[List[JobType]] = None,
+        remote_types: Optional[List[RemoteType]] = None,
+        locations: Optional[List[str]] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Most similar active jobs to ``query_vector``, as ``(job_id, score)``.
+
+        Scores are cosine similarities, highest first. Filters mean what
+        they do in JobRepository.search_jobs: salaries compare the annual
+        USD range and locations match through the location dimension.
+        """
+        location_ids = None
+        if locations:
+            with job_repo.db_manager.engine.connect() as conn:
+                location_ids = set(
+                    conn.execute(matching_locations(locations)).scalars()
+                )
+
+        query = normalize_rows(np.reshape(query_vector, (1, -1)))[0]
+        with self._lock:
+            size = self._size
+            if not size or limit < 1 or query.shape[0] != self._vectors.shape[1]:
+                return []
+
+            scores = self._vectors[:size] @ query
+            mask = self._mask(
+                size, job_types, remote_types, location_ids, min_salary, max_salary
+            )
+            if mask is not None:
+                scores[~mask] = -np.inf
+            scores[scores < min_similarity] = -np.inf
+
+            limit = min(limit, size)
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            return [
+                (self._ids[row], float(scores[row]))
+                for row in top
+                if scores[row] > -np.inf
+            ]
+
+    def _mask(
+        self,
+        size: int,
+        job_types: Optional[List[JobType]],
+        remote_types: Optional[List[RemoteType]],
+        location_ids: Optional[Set[str]],
+        min_salary: Optional[float],
+        max_salary: Optional[float],
+    ) -> Optional[np.ndarray]:
+        """Rows passing every filter, or None when there are no filters."""
+        masks = []
+        if job_types:
+            codes = [_JOB_TYPE_CODES[job_type] for job_type in job_types]
+            masks.append(np.isin(self._job_types[:size], codes))
+        if remote_types:
+            codes = [_REMOTE_TYPE_CODES[remote_type] for remote_type in remote_types]
+            masks.append(np.isin(self._remote_types[:size], codes))
+        if location_ids is not None:
+            codes = [
+                self._location_codes[location_id]
+                for location_id in location_ids
+                if location_id in self._location_codes
+            ]
+            masks.append(np.isin(self._locations[:size], codes))
+        # NaN (no salary) fails both comparisons, like NULL in SQL
+        if min_salary is not None:
+            masks.append(self._salary_max[:size] >= min_salary)
+        if max_salary is not None:
+            masks.append(self._salary_min[:size] <= max_salary)
+
+        if not masks:
+            return None
+        return np.logical_and.reduce(masks)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "embedding_model": self.embedding_model,
+                "jobs": self._size,
+                "dimension": self._vectors.shape[1],
+                "stale_jobs": len(self._stale),
+                "unembedded_jobs": len(self._unembedded),
+                "full_loads": self.full_loads,
+                "refreshes": self.refreshes,
+                "embedded": self.embedded,
+            }
+
+
+def _salary(value: Optional[float]) -> float:
+    return np.nan if value is None else value
+
+
+# ==================== Registry & Write Hooks ====================
+
+# One index per (database, embedding model); repositories report their
+# job writes to every index of the database
+_embedding_indexes: Dict[Tuple[str, str], JobEmbeddingIndex] = {}
+_registry_lock = threading.Lock()
+
+
+def get_embedding_index(
+    engine: Union[Engine, AsyncEngine], embedding_model: str, **options: Any
+) -> JobEmbeddingIndex:
+    """
+    Get the process-wide embedding index of ``engine``'s database and a model.
+
+    ``options`` (``ttl_seconds``) apply when the index is first created.
+    """
+    key = (database_key(engine), embedding_model)
+    with _registry_lock:
+        index = _embedding_indexes.get(key)
+        if index is None:
+            index = _embedding_indexes[key] = JobEmbeddingIndex(
+                embedding_model, **options
+            )
+        return index
+
+
+def _indexes_of(engine: Union[Engine, AsyncEngine]) -> List[JobEmbeddingIndex]:
+    if not _embedding_indexes:
+        return []
+    database = database_key(engine)
+    with _registry_lock:
+        return [
+            index for (key, _), index in _embedding_indexes.items() if key == database
+        ]
+
+
+def mark_jobs_changed(engine: Union[Engine, AsyncEngine], job_ids: Iterable[str]):
+    """Report written job listings to the embedding indexes of ``engine``'s database."""
+    indexes = _indexes_of(engine)
+    if indexes:
+        job_ids = [str(job_id) for job_id in job_ids]
+        for index in indexes:
+            index.mark_stale(job_ids)
+
+
+def invalidate_embedding_indexes(engine: Union[Engine, AsyncEngine]):
+    """Reload the embedding indexes of ``engine``'s database on their next sync."""
+    for index in _indexes_of(engine):
+        index.invalidate()
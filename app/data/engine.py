@@ -0,0 +1,287 @@
+"""
+JobPilot Engine Configuration
+Connection pool sizing, the SQLite performance profile applied to every
+engine created by DatabaseManager and AsyncDatabaseManager, and the
+process-wide engine registry.
+"""
+
+import itertools
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+
+def _env_int(name: str, default: Optional[int] = None) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """
+    Connection pragmas for SQLite databases.
+
+    The defaults trade a little durability for concurrency: WAL lets API
+    reads run alongside ETL writes, ``synchronous=NORMAL`` is safe under WAL
+    (only the last transactions can be lost on power failure) and
+    ``busy_timeout`` makes writers wait for the lock instead of failing with
+    ``database is locked``.
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 256 * 1024 * 1024  # bytes
+    cache_size: int = -64 * 1024  # negative = KiB, i.e. 64MB per connection
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 5000
+
+    @classmethod
+    def from_env(cls) -> Optional["SQLiteProfile"]:
+        """Profile from SQLITE_* environment variables; None if disabled."""
+        if os.getenv("SQLITE_PERFORMANCE_PROFILE", "on").lower() in (
+            "off",
+            "false",
+            "0",
+        ):
+            return None
+
+        defaults = cls()
+        return cls(
+            journal_mode=os.getenv("SQLITE_JOURNAL_MODE", defaults.journal_mode),
+            synchronous=os.getenv("SQLITE_SYNCHRONOUS", defaults.synchronous),
+            mmap_size=_env_int("SQLITE_MMAP_SIZE", defaults.mmap_size),
+            cache_size=_env_int("SQLITE_CACHE_SIZE", defaults.cache_size),
+            temp_store=os.getenv("SQLITE_TEMP_STORE", defaults.temp_store),
+            busy_timeout_ms=_env_int(
+                "SQLITE_BUSY_TIMEOUT_MS", defaults.busy_timeout_ms
+            ),
+        )
+
+    def pragmas(self) -> List[str]:
+        """PRAGMA statements run on every new connection."""
+        return [
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA mmap_size={self.mmap_size}",
+            f"PRAGMA cache_size={self.cache_size}",
+            f"PRAGMA temp_store={self.temp_store}",
+            f"PRAGMA busy_timeout={self.busy_timeout_ms}",
+        ]
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Explicit connection pool sizing; unset fields keep SQLAlchemy's defaults."""
+
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    pool_timeout: Optional[int] = None
+    pool_recycle: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        """Settings from DB_POOL_* environment variables."""
+        return cls(
+            pool_size=_env_int("DB_POOL_SIZE"),
+            max_overflow=_env_int("DB_MAX_OVERFLOW"),
+            pool_timeout=_env_int("DB_POOL_TIMEOUT"),
+            pool_recycle=_env_int("DB_POOL_RECYCLE"),
+        )
+
+    def engine_kwargs(self, database_url: str) -> Dict[str, Any]:
+        """Keyword arguments for create_engine / create_async_engine."""
+        if is_sqlite_memory(database_url):
+            # In-memory SQLite uses a singleton/static pool that takes no sizing
+            return {}
+        return {
+            name: value
+            for name, value in (
+                ("pool_size", self.pool_size),
+                ("max_overflow", self.max_overflow),
+                ("pool_timeout", self.pool_timeout),
+                ("pool_recycle", self.pool_recycle),
+            )
+            if value is not None
+        }
+
+
+# Process defaults, read once from the environment
+SQLITE_PROFILE = SQLiteProfile.from_env()
+POOL_SETTINGS = PoolSettings.from_env()
+
+
+def is_sqlite_memory(database_url: str) -> bool:
+    """True for SQLite URLs that point at an in-memory database."""
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def apply_sqlite_profile(engine: Engine, profile: Optional[SQLiteProfile]) -> bool:
+    """
+    Run ``profile``'s pragmas on every connection ``engine`` opens.
+
+    Accepts sync engines and the ``sync_engine`` of an AsyncEngine. No-op for
+    non-SQLite engines or a None profile; returns whether it was applied.
+    """
+    if profile is None or engine.dialect.name != "sqlite":
+        return False
+
+    pragmas = profile.pragmas()
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return True
+
+
+# ==================== Engine Registry ====================
+
+_EngineKey = Tuple[str, Optional[SQLiteProfile], PoolSettings]
+
+_engines: Dict[_EngineKey, Engine] = {}
+_async_engines: Dict[_EngineKey, AsyncEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def _engine_key(
+    database_url: str, sqlite_profile: Optional[SQLiteProfile], pool_settings
+) -> _EngineKey:
+    return (
+        make_url(database_url).render_as_string(hide_password=False),
+        sqlite_profile,
+        pool_settings,
+    )
+
+
+def get_engine(
+    database_url: str,
+    sqlite_profile: Optional[SQLiteProfile] = SQLITE_PROFILE,
+    pool_settings: PoolSettings = POOL_SETTINGS,
+) -> Engine:
+    """
+    Shared engine for ``database_url``.
+
+    Managers created for the same URL and settings reuse one engine and
+    connection pool. In-memory SQLite URLs always get a new engine, since
+    each engine there is a separate database.
+    """
+    if is_sqlite_memory(database_url):
+        return _create_engine(database_url, sqlite_profile, pool_settings)
+
+    key = _engine_key(database_url, sqlite_profile, pool_settings)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = _create_engine(database_url, sqlite_profile, pool_settings)
+            _engines[key] = engine
+        return engine
+
+
+def get_async_engine(
+    database_url: str,
+    sqlite_profile: Optional[SQLiteProfile] = SQLITE_PROFILE,
+    pool_settings: PoolSettings = POOL_SETTINGS,
+) -> AsyncEngine:
+    """
+    Shared async engine for ``database_url``, an async-driver URL.
+
+    Same sharing rules as get_engine, in a registry of its own.
+    """
+    if is_sqlite_memory(database_url):
+        return _create_async_engine(database_url, sqlite_profile, pool_settings)
+
+    key = _engine_key(database_url, sqlite_profile, pool_settings)
+    with _engines_lock:
+        engine = _async_engines.get(key)
+        if engine is None:
+            engine = _create_async_engine(database_url, sqlite_profile, pool_settings)
+            _async_engines[key] = engine
+        return engine
+
+
+def dispose_engines():
+    """Close the pooled connections of every registered engine and forget them."""
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+def _create_engine(
+    database_url: str,
+    sqlite_profile: Optional[SQLiteProfile],
+    pool_settings: PoolSettings,
+) -> Engine:
+    engine = create_engine(
+        database_url, echo=False, **pool_settings.engine_kwargs(database_url)
+    )
+    apply_sqlite_profile(engine, sqlite_profile)
+    return engine
+
+
+async def dispose_async_engines():
+    """dispose_engines for the registered async engines."""
+    with _engines_lock:
+        engines = list(_async_engines.values())
+        _async_engines.clear()
+    for engine in engines:
+        await engine.dispose()
+
+
+def _create_async_engine(
+    database_url: str,
+    sqlite_profile: Optional[SQLiteProfile],
+    pool_settings: PoolSettings,
+) -> AsyncEngine:
+    engine = create_async_engine(
+        database_url, echo=False, **pool_settings.engine_kwargs(database_url)
+    )
+    apply_sqlite_profile(engine.sync_engine, sqlite_profile)
+    return engine
+
+
+# ==================== Database Keys ====================
+
+_database_keys: "weakref.WeakKeyDictionary[Engine, str]" = weakref.WeakKeyDictionary()
+_memory_database_ids = itertools.count(1)
+
+
+def database_key(engine: Union[Engine, AsyncEngine]) -> str:
+    """
+    Identify the database behind ``engine``, whatever its driver.
+
+    Sync engines and the ``sync_engine`` of an AsyncEngine on the same
+    database get the same key. Every in-memory SQLite engine is a separate
+    database and gets a key of its own.
+    """
+    if isinstance(engine, AsyncEngine):
+        engine = engine.sync_engine
+    with _engines_lock:
+        key = _database_keys.get(engine)
+        if key is None:
+            url = engine.url
+            if is_sqlite_memory(url):
+                key = f"memory:{next(_memory_database_ids)}"
+            else:
+                key = url.set(drivername=url.get_backend_name()).render_as_string(
+                    hide_password=False
+                )
+            _database_keys[engine] = key
+        return key
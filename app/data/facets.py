@@ -0,0 +1,324 @@
+"""
+JobPilot Search Facets
+Counts of active job listings per job type, remote type, experience level,
+seniority, company and skill, for the filters of the job search UI.
+
+Unfiltered counts are kept in job_facet_counts by SQLite triggers on
+job_listings, like the full-text index; counts for a filtered search come
+from one grouped query over the matching listings.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    and_,
+    case,
+    func,
+    literal,
+    select,
+    text,
+    true,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+
+from app.data.models import (
+    ExperienceLevel,
+    JobCompanyDB,
+    JobListingDB,
+    JobStatus,
+    JobType,
+    RemoteType,
+    SeniorityLevel,
+)
+from app.logger import logger
+
+JOB_FACET_TABLE = "job_facet_counts"
+
+# Facet name -> job_listings column holding its value
+FACET_COLUMNS = {
+    "job_type": "job_type",
+    "remote_type": "remote_type",
+    "experience_level": "experience_level",
+    "seniority_level": "seniority_level",
+    "company": "company_id",
+}
+SKILL_FACET = "skill"
+FACETS = tuple(FACET_COLUMNS) + (SKILL_FACET,)
+
+# Enum columns store member names; facets report member values
+FACET_ENUMS = {
+    "job_type": JobType,
+    "remote_type": RemoteType,
+    "experience_level": ExperienceLevel,
+    "seniority_level": SeniorityLevel,
+}
+
+# Values returned per facet, most frequent first
+FACET_LIMIT = 20
+
+# Kept out of Base.metadata: written only by triggers, like the FTS index
+job_facet_counts = Table(
+    JOB_FACET_TABLE,
+    MetaData(),
+    Column("facet", String, primary_key=True),
+    Column("value", String, primary_key=True),
+    Column("job_count", Integer, nullable=False),
+)
+
+FacetCounts = Dict[str, List[Dict[str, Any]]]
+
+
+# ==================== Triggers ====================
+
+_ACTIVE = f"'{JobStatus.ACTIVE.name}'"
+
+
+def _facet_values(row: str) -> str:
+    """SELECT of the (facet, value) pairs of one job_listings trigger row."""
+    columns = "\n            UNION ALL ".join(
+        f"SELECT '{facet}' AS facet, {row}.{column} AS value"
+        for facet, column in FACET_COLUMNS.items()
+    )
+    return f"""
+        SELECT facet, value FROM (
+            {columns}
+            UNION ALL SELECT DISTINCT '{SKILL_FACET}', lower(trim(skill.value))
+            FROM json_each(
+                CASE WHEN json_valid({row}.skills_required)
+                THEN {row}.skills_required END
+            ) AS skill
+        )
+        WHERE value IS NOT NULL AND value != ''
+    """
+
+
+def _increment(row: str) -> str:
+    return f"""
+        INSERT INTO {JOB_FACET_TABLE} (facet, value, job_count)
+        SELECT facet, value, 1 FROM ({_facet_values(row)})
+        WHERE {row}.status = {_ACTIVE}
+        ON CONFLICT (facet, value) DO UPDATE SET job_count = job_count + 1;
+    """
+
+
+def _decrement(row: str) -> str:
+    return f"""
+        UPDATE {JOB_FACET_TABLE} SET job_count = job_count - 1
+        WHERE {row}.status = {_ACTIVE}
+        AND (facet, value) IN ({_facet_values(row)});
+    """
+
+
+_TRIGGER_COLUMNS = ["status", "skills_required"] + list(FACET_COLUMNS.values())
+
+# Upserts rewrite every column; only rows whose facet values changed recount
+_FACETS_CHANGED = " OR ".join(
+    f"old.{column} IS NOT new.{column}" for column in _TRIGGER_COLUMNS
+)
+
+_CREATE_FACET_TRIGGERS = {
+    f"{JOB_FACET_TABLE}_ai": f"""
+    CREATE TRIGGER IF NOT EXISTS {JOB_FACET_TABLE}_ai
+    AFTER INSERT ON job_listings BEGIN {_increment("new")} END
+    """,
+    f"{JOB_FACET_TABLE}_ad": f"""
+    CREATE TRIGGER IF NOT EXISTS {JOB_FACET_TABLE}_ad
+    AFTER DELETE ON job_listings BEGIN {_decrement("old")} END
+    """,
+    f"{JOB_FACET_TABLE}_au": f"""
+    CREATE TRIGGER IF NOT EXISTS {JOB_FACET_TABLE}_au
+    AFTER UPDATE OF {", ".join(_TRIGGER_COLUMNS)} ON job_listings
+    WHEN {_FACETS_CHANGED}
+    BEGIN {_decrement("old")} {_increment("new")} END
+    """,
+}
+
+
+def ensure_facet_counts(engine: Engine) -> bool:
+    """
+    Create job_facet_counts and its sync triggers if they don't exist.
+
+    The counts are rebuilt from job_listings whenever the triggers are
+    (re)created. Returns True when materialized counts are available.
+    """
+    with engine.begin() as conn:
+        return create_facet_counts(conn)
+
+
+def create_facet_counts(conn: Connection) -> bool:
+    """ensure_facet_counts on an open connection (e.g. via run_sync)."""
+    if conn.dialect.name != "sqlite":
+        return False
+
+    try:
+        existing = set(
+            conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+            ).scalars()
+        )
+        job_facet_counts.create(conn, checkfirst=True)
+        for trigger_sql in _CREATE_FACET_TRIGGERS.values():
+            conn.execute(text(trigger_sql))
+
+        if not set(_CREATE_FACET_TRIGGERS) <= existing:
+            _rebuild(conn)
+            logger.info(f"Created facet counts {JOB_FACET_TABLE}")
+        return True
+
+    except OperationalError as e:
+        # SQLite builds without JSON1 or older than 3.24 (upsert)
+        logger.warning(f"Facet counts unavailable, using grouped queries: {e}")
+        return False
+
+
+def rebuild_facet_counts(engine: Engine) -> None:
+    """Recount job_facet_counts from job_listings."""
+    with engine.begin() as conn:
+        _rebuild(conn)
+    logger.info(f"Rebuilt facet counts {JOB_FACET_TABLE}")
+
+
+def _rebuild(conn: Connection):
+    active = select(*_facet_source_columns()).where(
+        JobListingDB.status == JobStatus.ACTIVE
+    )
+    conn.execute(job_facet_counts.delete())
+    conn.execute(
+        job_facet_counts.insert().from_select(
+            ["facet", "value", "job_count"], facet_count_query(active)
+        )
+    )
+
+
+# ==================== Queries ====================
+
+
+def _facet_source_columns() -> list:
+    return [JobListingDB.id, JobListingDB.skills_required] + [
+        getattr(JobListingDB, column) for column in FACET_COLUMNS.values()
+    ]
+
+
+def facet_source(query_obj):
+    """Restrict a job search statement to the columns facet_count_query needs."""
+    return query_obj.with_only_columns(*_facet_source_columns())
+
+
+def facet_count_query(jobs_statement):
+    """
+    One grouped query counting every facet value over ``jobs_statement``.
+
+    ``jobs_statement`` selects the facet source columns (see facet_source)
+    of the listings to count; rows are ``(facet, value, job_count)``.
+    """
+    jobs = jobs_statement.subquery("facet_jobs")
+    counts = []
+    for facet, column in FACET_COLUMNS.items():
+        # Raw stored values, so enum names read back like the materialized rows
+        value = type_coerce(jobs.c[column], String)
+        counts.append(
+            select(literal(facet), value, func.count())
+            .where(value.isnot(None))
+            .group_by(value)
+        )
+
+    skills_json = case(
+        (func.json_valid(jobs.c.skills_required) == 1, jobs.c.skills_required)
+    )
+    skills = func.json_each(skills_json).table_valued("value")
+    job_skills = (
+        select(jobs.c.id, func.lower(func.trim(skills.c.value)).label("skill"))
+        .select_from(jobs)
+        .join(skills, true())
+        .distinct()
+        .subquery("facet_skills")
+    )
+    counts.append(
+        select(literal(SKILL_FACET), job_skills.c.skill, func.count())
+        .where(and_(job_skills.c.skill.isnot(None), job_skills.c.skill != ""))
+        .group_by(job_skills.c.skill)
+    )
+    return union_all(*counts)
+
+
+def materialized_facet_counts():
+    """SELECT of the stored ``(facet, value, job_count)`` rows."""
+    return select(
+        job_facet_counts.c.facet,
+        job_facet_counts.c.value,
+        job_facet_counts.c.job_count,
+    ).where(job_facet_counts.c.job_count > 0)
+
+
+def top_facet_counts(counts, limit: int = FACET_LIMIT):
+    """
+    Keep the ``limit`` most frequent values of each facet in ``counts``.
+
+    ``counts`` is a facet_count_query or materialized_facet_counts
+    statement; ranking happens in SQL so only returned rows are fetched.
+    """
+    counts = counts.subquery("facet_counts")
+    facet, value, job_count = counts.c
+    ranked = select(
+        facet,
+        value,
+        job_count,
+        func.row_number()
+        .over(partition_by=facet, order_by=(job_count.desc(), value))
+        .label("position"),
+    ).subquery("ranked_facets")
+    return select(ranked.c[0], ranked.c[1], ranked.c[2]).where(
+        ranked.c.position <= limit
+    )
+
+
+def group_facet_counts(rows: List[Tuple[str, Any, int]]) -> FacetCounts:
+    """
+    Shape ``(facet, value, job_count)`` rows as the facets response.
+
+    Each facet lists ``{"value", "count"}`` entries, most frequent first.
+    Enum facets report member values; companies are still ids until
+    name_companies is applied.
+    """
+    grouped: FacetCounts = {facet: [] for facet in FACETS}
+    for facet, value, count in rows:
+        enum = FACET_ENUMS.get(facet)
+        if enum is not None:
+            value = _enum_value(enum, value)
+        if value is not None and facet in grouped:
+            grouped[facet].append({"value": value, "count": count})
+
+    for entries in grouped.values():
+        entries.sort(key=lambda entry: (-entry["count"], str(entry["value"])))
+    return grouped
+
+
+def company_names_statement(facets: FacetCounts):
+    """SELECT of (id, name) for the companies in grouped facets."""
+    company_ids = [entry["value"] for entry in facets["company"]]
+    return select(JobCompanyDB.id, JobCompanyDB.name).where(
+        JobCompanyDB.id.in_(company_ids)
+    )
+
+
+def name_companies(facets: FacetCounts, names: Dict[str, str]) -> FacetCounts:
+    """Replace company ids with the names the company search filter accepts."""
+    facets["company"] = [
+        {"value": names[entry["value"]], "count": entry["count"]}
+        for entry in facets["company"]
+        if entry["value"] in names
+    ]
+    return facets
+
+
+def _enum_value(enum, name: str) -> Optional[str]:
+    member = enum.__members__.get(name)
+    return member.value if member is not None else None
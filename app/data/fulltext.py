@@ -0,0 +1,150 @@
+"""
+JobPilot Full-Text Search
+SQLite FTS5 index that shadows job_listings for ranked free-text search.
+"""
+
+import re
+from typing import Optional
+
+from sqlalchemy import Float, Integer, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+
+from app.logger import logger
+
+JOB_FTS_TABLE = "job_listings_fts"
+
+# Columns mirrored into the index, in the order used by bm25() weights
+JOB_FTS_COLUMNS = ("title", "company", "description", "requirements")
+JOB_FTS_WEIGHTS = (10.0, 5.0, 1.0, 1.0)
+
+# External-content table: the index stores only tokens, the text stays in
+# job_listings and is addressed through its implicit rowid.
+_CREATE_FTS_TABLE = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {JOB_FTS_TABLE} USING fts5(
+    {", ".join(JOB_FTS_COLUMNS)},
+    content='job_listings',
+    content_rowid='rowid',
+    prefix='2 3',
+    tokenize='unicode61 remove_diacritics 2'
+)
+"""
+
+_COLUMN_LIST = ", ".join(JOB_FTS_COLUMNS)
+_NEW_VALUES = ", ".join(f"new.{column}" for column in JOB_FTS_COLUMNS)
+_OLD_VALUES = ", ".join(f"old.{column}" for column in JOB_FTS_COLUMNS)
+
+_CREATE_FTS_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {JOB_FTS_TABLE}_ai AFTER INSERT ON job_listings BEGIN
+        INSERT INTO {JOB_FTS_TABLE}(rowid, {_COLUMN_LIST})
+        VALUES (new.rowid, {_NEW_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {JOB_FTS_TABLE}_ad AFTER DELETE ON job_listings BEGIN
+        INSERT INTO {JOB_FTS_TABLE}({JOB_FTS_TABLE}, rowid, {_COLUMN_LIST})
+        VALUES ('delete', old.rowid, {_OLD_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {JOB_FTS_TABLE}_au
+    AFTER UPDATE OF {_COLUMN_LIST} ON job_listings BEGIN
+        INSERT INTO {JOB_FTS_TABLE}({JOB_FTS_TABLE}, rowid, {_COLUMN_LIST})
+        VALUES ('delete', old.rowid, {_OLD_VALUES});
+        INSERT INTO {JOB_FTS_TABLE}(rowid, {_COLUMN_LIST})
+        VALUES (new.rowid, {_NEW_VALUES});
+    END
+    """,
+]
+
+_PHRASE_OR_WORD_RE = re.compile(r'"([^"]*)"|(\S+)')
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def ensure_job_search_index(engine: Engine) -> bool:
+    """
+    Create the FTS5 index and its sync triggers if they don't exist.
+
+    The index is backfilled from job_listings the first time it is created.
+    Returns True when full-text search is available on this engine.
+    """
+    with engine.begin() as conn:
+        return create_job_search_index(conn)
+
+
+def create_job_search_index(conn: Connection) -> bool:
+    """ensure_job_search_index on an open connection (e.g. via run_sync)."""
+    if conn.dialect.name != "sqlite":
+        return False
+
+    try:
+        existed = _table_exists(conn, JOB_FTS_TABLE)
+        conn.execute(text(_CREATE_FTS_TABLE))
+        for trigger_sql in _CREATE_FTS_TRIGGERS:
+            conn.execute(text(trigger_sql))
+
+        if not existed:
+            conn.execute(
+                text(f"INSERT INTO {JOB_FTS_TABLE}({JOB_FTS_TABLE}) VALUES('rebuild')")
+            )
+            logger.info(f"Created full-text index {JOB_FTS_TABLE}")
+        return True
+
+    except OperationalError as e:
+        # Most commonly "no such module: fts5" on SQLite builds without FTS5
+        logger.warning(f"Full-text search unavailable, using LIKE fallback: {e}")
+        return False
+
+
+def rebuild_job_search_index(engine: Engine) -> None:
+    """Rebuild the FTS5 index from job_listings (e.g. after VACUUM renumbers rowids)."""
+    with engine.begin() as conn:
+        conn.execute(
+            text(f"INSERT INTO {JOB_FTS_TABLE}({JOB_FTS_TABLE}) VALUES('rebuild')")
+        )
+    logger.info(f"Rebuilt full-text index {JOB_FTS_TABLE}")
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """
+    Translate user search text into a safe FTS5 MATCH expression.
+
+    Double-quoted text becomes a phrase query; every other word becomes a
+    prefix query so partially typed terms still match. All terms are ANDed.
+    Returns None if the input contains no searchable tokens.
+    """
+    terms = []
+    for phrase, word in _PHRASE_OR_WORD_RE.findall(query or ""):
+        if phrase:
+            tokens = _TOKEN_RE.findall(phrase)
+            if tokens:
+                terms.append('"' + " ".join(tokens) + '"')
+        else:
+            terms.extend(f'"{token}"*' for token in _TOKEN_RE.findall(word))
+
+    return " ".join(terms) or None
+
+
+def job_search_subquery(match_query: str):
+    """Selectable of (job_rowid, rank) for jobs matching an FTS5 expression."""
+    weights = ", ".join(str(weight) for weight in JOB_FTS_WEIGHTS)
+    return (
+        text(
+            f"SELECT rowid AS job_rowid, bm25({JOB_FTS_TABLE}, {weights}) AS rank "
+            f"FROM {JOB_FTS_TABLE} WHERE {JOB_FTS_TABLE} MATCH :match_query"
+        )
+        .bindparams(match_query=match_query)
+        .columns(job_rowid=Integer, rank=Float)
+        .subquery("job_search")
+    )
+
+
+def _table_exists(conn, table_name: str) -> bool:
+    return (
+        conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = :name"),
+            {"name": table_name},
+        ).first()
+        is not None
+    )
@@ -0,0 +1,422 @@
+"""
+JobPilot IVF Vector Index
+Approximate cosine-similarity search in pure NumPy: an inverted file over
+k-means cells, with optional product quantization of the stored vectors.
+"""
+
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.data.embedding_index import normalize_rows
+from app.data.vector_index import (
+    Accept,
+    ExactVectorIndex,
+    SearchHits,
+    select_hits,
+    top_k,
+)
+
+# Vectors buffered (and searched exactly) before the quantizers are trained
+IVF_MIN_TRAIN_POINTS = 1024
+# Vectors sampled to train the quantizers
+IVF_TRAIN_SAMPLE = 50_000
+IVF_DEFAULT_NPROBE = 8
+
+KMEANS_ITERATIONS = 20
+PQ_CENTROIDS = 256
+# Codebooks converge on far fewer points than the coarse quantizer needs
+PQ_TRAIN_SAMPLE = 64 * PQ_CENTROIDS
+PQ_KMEANS_ITERATIONS = 10
+
+# Rows scored per block while assigning vectors to centroids
+_ASSIGN_BLOCK = 16_384
+
+_FORMAT_VERSION = 1
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray, spherical: bool) -> np.ndarray:
+    """Nearest centroid of each vector: max inner product or min L2 distance."""
+    labels = np.empty(len(vectors), dtype=np.intp)
+    weights = np.ascontiguousarray(centroids.T, dtype=np.float32)
+    # argmin |x - c|^2 == argmax (x . c - |c|^2 / 2)
+    offsets = None if spherical else 0.5 * (weights**2).sum(axis=0)
+    for start in range(0, len(vectors), _ASSIGN_BLOCK):
+        block = vectors[start : start + _ASSIGN_BLOCK] @ weights
+        if offsets is not None:
+            block -= offsets
+        labels[start : start + len(block)] = block.argmax(axis=1)
+    return labels
+
+
+def kmeans(
+    vectors: np.ndarray,
+    k: int,
+    rng: np.random.Generator,
+    iterations: int = KMEANS_ITERATIONS,
+    spherical: bool = False,
+) -> np.ndarray:
+    """
+    Lloyd's k-means of ``vectors`` into ``k`` centroids.
+
+    Spherical k-means keeps unit-length centroids and assigns by inner
+    product, for the cosine coarse quantizer. Empty cells are reseeded with
+    random vectors.
+    """
+    centroids = vectors[rng.choice(len(vectors), k, replace=False)].copy()
+    for _ in range(iterations):
+        labels = _assign(vectors, centroids, spherical)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, vectors)
+
+        empty = counts == 0
+        sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()))]
+        if spherical:
+            centroids = normalize_rows(sums)
+        else:
+            centroids = sums / np.maximum(counts, 1)[:, None]
+            centroids[empty] = sums[empty]
+    return centroids.astype(np.float32)
+
+
+class _InvertedList:
+    """Ids and vectors (or PQ codes) of one cell, with O(1) swap removal."""
+
+    def __init__(self, width: int, dtype):
+        self.ids = np.empty(0, dtype=object)
+        self.data = np.empty((0, width), dtype=dtype)
+        self.size = 0
+
+    def append(self, ids: Sequence[str], data: np.ndarray) -> int:
+        """Append rows; returns the position of the first."""
+        start, end = self.size, self.size + len(ids)
+        if end > len(self.ids):
+            capacity = max(end, 2 * len(self.ids), 16)
+            grown_ids = np.empty(capacity, dtype=object)
+            grown_ids[:start] = self.ids[:start]
+            grown = np.empty((capacity, self.data.shape[1]), dtype=self.data.dtype)
+            grown[:start] = self.data[:start]
+            self.ids, self.data = grown_ids, grown
+        self.ids[start:end] = list(ids)
+        self.data[start:end] = data
+        self.size = end
+        return start
+
+    def remove(self, position: int) -> Optional[str]:
+        """Remove a row; returns the id moved into its position, if any."""
+        last = self.size - 1
+        moved = None
+        if position != last:
+            moved = self.ids[last]
+            self.ids[position] = moved
+            self.data[position] = self.data[last]
+        self.ids[last] = None
+        self.size = last
+        return moved
+
+
+class IVFVectorIndex:
+    """
+    Approximate cosine search over vectors keyed by id.
+
+    Vectors are L2-normalized and filed under their nearest of ``n_lists``
+    k-means centroids; a search scores the ``nprobe`` cells closest to the
+    query, so raising ``nprobe`` trades latency for recall (``nprobe ==
+    n_lists`` is exact without PQ). With ``pq_subvectors`` set, each
+    vector's residual from its centroid is stored as that many one-byte
+    product quantization codes and scored from per-query lookup tables.
+
+    Until ``min_train_points`` vectors are added the index searches them
+    exactly; the quantizers are then trained once on a sample, and later
+    adds are assigned to the trained cells. Adding an existing id replaces
+    its vector.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        n_lists: Optional[int] = None,
+        nprobe: int = IVF_DEFAULT_NPROBE,
+        pq_subvectors: Optional[int] = None,
+        min_train_points: int = IVF_MIN_TRAIN_POINTS,
+        train_sample: int = IVF_TRAIN_SAMPLE,
+        seed: int = 0,
+    ):
+        if pq_subvectors is not None and dimension % pq_subvectors:
+            raise ValueError(
+                f"pq_subvectors must divide the dimension {dimension}, "
+                f"got {pq_subvectors}"
+            )
+        self.dimension = dimension
+        self.n_lists = n_lists
+        self.nprobe = nprobe
+        self.pq_subvectors = pq_subvectors
+        self.min_train_points = max(
+            min_train_points, PQ_CENTROIDS if pq_subvectors else 1
+        )
+        self.train_sample = train_sample
+        self.seed = seed
+
+        self._buffer: Optional[ExactVectorIndex] = ExactVectorIndex(dimension)
+        self._centroids: Optional[np.ndarray] = None
+        self._codebooks: Optional[np.ndarray] = None
+        self._lists: List[_InvertedList] = []
+        self._where: Dict[str, Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        if self._buffer is not None:
+            return len(self._buffer)
+        return len(self._where)
+
+    def __contains__(self, vector_id: str) -> bool:
+        if self._buffer is not None:
+            return vector_id in self._buffer
+        return vector_id in self._where
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    # ==================== Training ====================
+
+    def train(self, vectors) -> None:
+        """
+        Train the coarse quantizer (and PQ codebooks) on ``vectors``.
+
+        Called automatically once enough vectors are added; buffered vectors
+        are then filed into the trained cells.
+        """
+        if self.is_trained:
+            raise ValueError("IVF index is already trained; rebuild it to retrain")
+        vectors = normalize_rows(vectors)
+        rng = np.random.default_rng(self.seed)
+        if len(vectors) > self.train_sample:
+            vectors = vectors[
+                rng.choice(len(vectors), self.train_sample, replace=False)
+            ]
+
+        n_lists = self.n_lists or int(np.clip(4 * np.sqrt(len(vectors)), 1, 65536))
+        n_lists = min(n_lists, len(vectors))
+        centroids = kmeans(vectors, n_lists, rng, spherical=True)
+
+        codebooks = None
+        if self.pq_subvectors:
+            sample = vectors[: min(len(vectors), PQ_TRAIN_SAMPLE)]
+            residuals = sample - centroids[_assign(sample, centroids, True)]
+            subspaces = residuals.reshape(len(sample), self.pq_subvectors, -1)
+            centroids_per_space = min(PQ_CENTROIDS, len(sample))
+            codebooks = np.stack(
+                [
+                    kmeans(
+                        np.ascontiguousarray(subspaces[:, space]),
+                        centroids_per_space,
+                        rng,
+                        iterations=PQ_KMEANS_ITERATIONS,
+                    )
+                    for space in range(self.pq_subvectors)
+                ]
+            )
+
+        self.n_lists = n_lists
+        self._centroids, self._codebooks = centroids, codebooks
+        width, dtype = (
+            (self.pq_subvectors, np.uint8)
+            if codebooks is not None
+            else (self.dimension, np.float32)
+        )
+        self._lists = [_InvertedList(width, dtype) for _ in range(n_lists)]
+        self._where = {}
+
+        buffer, self._buffer = self._buffer, None
+        if buffer is not None and len(buffer):
+            self._file(list(buffer.ids), buffer.vectors)
+
+    # ==================== Writes ====================
+
+    def add(self, ids: Sequence[str], vectors) -> None:
+        """Add or replace the vectors of ``ids``."""
+        vectors = normalize_rows(np.reshape(vectors, (len(ids), -1)))
+        if vectors.shape[1] != self.dimension:
+            raise ValueError(
+                f"Expected {self.dimension}-dim vectors, got {vectors.shape[1]}"
+            )
+
+        if self._buffer is not None:
+            self._buffer.add(ids, vectors)
+            if len(self._buffer) >= self.min_train_points:
+                self.train(self._buffer.vectors)
+            return
+
+        # The last vector of a repeated id wins, as in ExactVectorIndex
+        latest = {vector_id: row for row, vector_id in enumerate(ids)}
+        if len(latest) < len(ids):
+            ids, vectors = list(latest), vectors[list(latest.values())]
+        self.remove(vector_id for vector_id in ids if vector_id in self._where)
+        self._file(list(ids), vectors)
+
+    def _file(self, ids: List[str], vectors: np.ndarray):
+        """Append normalized vectors to their nearest cells."""
+        labels = _assign(vectors, self._centroids, spherical=True)
+        data = vectors
+        if self._codebooks is not None:
+            data = self._encode(vectors - self._centroids[labels])
+
+        order = np.argsort(labels, kind="stable")
+        cells, starts = np.unique(labels[order], return_index=True)
+        bounds = list(starts[1:]) + [len(order)]
+        for cell, start, end in zip(cells, starts, bounds, strict=True):
+            rows = order[start:end]
+            cell_ids = [ids[row] for row in rows]
+            first = self._lists[cell].append(cell_ids, data[rows])
+            for offset, vector_id in enumerate(cell_ids):
+                self._where[vector_id] = (int(cell), first + offset)
+
+    def _encode(self, residuals: np.ndarray) -> np.ndarray:
+        subspaces = residuals.reshape(len(residuals), self.pq_subvectors, -1)
+        codes = np.empty((len(residuals), self.pq_subvectors), dtype=np.uint8)
+        for space, codebook in enumerate(self._codebooks):
+            codes[:, space] = _assign(subspaces[:, space], codebook, spherical=False)
+        return codes
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """Remove the vectors of ``ids``; returns how many were stored."""
+        if self._buffer is not None:
+            return self._buffer.remove(ids)
+
+        removed = 0
+        for vector_id in list(ids):
+            location = self._where.pop(vector_id, None)
+            if location is None:
+                continue
+            cell, position = location
+            moved = self._lists[cell].remove(position)
+            if moved is not None:
+                self._where[moved] = (cell, position)
+            removed += 1
+        return removed
+
+    # ==================== Search ====================
+
+    def search(
+        self,
+        query,
+        k: int,
+        threshold: Optional[float] = None,
+        accept: Optional[Accept] = None,
+        nprobe: Optional[int] = None,
+    ) -> SearchHits:
+        """
+        Approximately the ``k`` stored vectors most similar to ``query``.
+
+        Same contract as ExactVectorIndex.search, over the vectors in the
+        ``nprobe`` cells (default ``self.nprobe``) nearest the query. With
+        PQ, similarities are estimates from the codes.
+        """
+        if self._buffer is not None:
+            return self._buffer.search(query, k, threshold, accept)
+        if k < 1 or not self._where:
+            return []
+
+        query = normalize_rows(np.reshape(query, (1, -1)))[0]
+        coarse = self._centroids @ query
+        probed = top_k(coarse, nprobe or self.nprobe)
+
+        tables = None
+        if self._codebooks is not None:
+            # Inner products of each query subvector with its codebook
+            tables = np.einsum(
+                "mcd,md->mc", self._codebooks, query.reshape(self.pq_subvectors, -1)
+            )
+            spaces = np.arange(self.pq_subvectors)
+
+        ids, scores = [], []
+        for cell in probed:
+            inverted = self._lists[cell]
+            if not inverted.size:
+                continue
+            data = inverted.data[: inverted.size]
+            if tables is None:
+                scores.append(data @ query)
+            else:
+                scores.append(coarse[cell] + tables[spaces, data].sum(axis=1))
+            ids.append(inverted.ids[: inverted.size])
+
+        if not ids:
+            return []
+        return select_hits(
+            np.concatenate(ids), np.concatenate(scores), k, threshold, accept
+        )
+
+    # ==================== Persistence ====================
+
+    def save(self, path: str) -> None:
+        """Write the index to ``path`` (an .npz file), replacing it atomically."""
+        config = {
+            "version": _FORMAT_VERSION,
+            "dimension": self.dimension,
+            "n_lists": self.n_lists,
+            "nprobe": self.nprobe,
+            "pq_subvectors": self.pq_subvectors,
+            "min_train_points": self.min_train_points,
+            "train_sample": self.train_sample,
+            "seed": self.seed,
+        }
+        arrays = {}
+        if self._buffer is not None:
+            arrays["ids"] = np.array(list(self._buffer.ids), dtype=str)
+            arrays["data"] = self._buffer.vectors
+        else:
+            arrays["ids"] = np.array(
+                [i for inverted in self._lists for i in inverted.ids[: inverted.size]],
+                dtype=str,
+            )
+            arrays["data"] = np.concatenate(
+                [inverted.data[: inverted.size] for inverted in self._lists]
+            )
+            arrays["list_sizes"] = np.array(
+                [inverted.size for inverted in self._lists], dtype=np.int64
+            )
+            arrays["centroids"] = self._centroids
+            if self._codebooks is not None:
+                arrays["codebooks"] = self._codebooks
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            np.savez(file, config=np.array(json.dumps(config)), **arrays)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "IVFVectorIndex":
+        """Read an index written by save."""
+        with np.load(path, allow_pickle=False) as stored:
+            config = json.loads(str(stored["config"]))
+            if config.pop("version") != _FORMAT_VERSION:
+                raise ValueError(f"Unsupported vector index format in {path}")
+            index = cls(**config)
+            ids = stored["ids"].tolist()
+            data = stored["data"]
+
+            if "centroids" not in stored:
+                if ids:
+                    index._buffer.add(ids, data)
+                return index
+
+            index._centroids = stored["centroids"]
+            index._codebooks = stored["codebooks"] if "codebooks" in stored else None
+            index._buffer = None
+            width, dtype = data.shape[1], data.dtype
+            index._lists = [_InvertedList(width, dtype) for _ in range(index.n_lists)]
+            start = 0
+            for cell, size in enumerate(stored["list_sizes"].tolist()):
+                if size:
+                    cell_ids = ids[start : start + size]
+                    index._lists[cell].append(cell_ids, data[start : start + size])
+                    for position, vector_id in enumerate(cell_ids):
+                        index._where[vector_id] = (cell, position)
+                start += size
+        return index
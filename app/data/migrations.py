@@ -0,0 +1,466 @@
+"""
+JobPilot Database Migrations
+Idempotent schema upgrades for databases created by an older version.
+"""
+
+import hashlib
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    and_,
+    bindparam,
+    func,
+    inspect,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.engine import Connection, Engine
+
+from app.data.base import Base
+from app.data.compression import CompressedJSON, compress_bytes
+from app.data.vectors import EmbeddingVector, encode_vector
+from app.logger import logger
+
+# Bump to rerun create_tables on existing databases when something the schema
+# fingerprint cannot see changes (FTS triggers, a data migration).
+SCHEMA_REVISION = 2
+
+# Kept out of Base.metadata so it is not part of its own fingerprint
+schema_version_table = Table(
+    "schema_version",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("version", String, nullable=False),
+    Column("fulltext_enabled", Boolean, nullable=False, default=False),
+    Column("updated_at", DateTime, nullable=False, default=datetime.utcnow),
+)
+
+
+@lru_cache(maxsize=1)
+def schema_version() -> str:
+    """
+    Version string for the declared schema.
+
+    A hash of every table, column and index in Base.metadata plus
+    SCHEMA_REVISION, so any model change produces a new version.
+    """
+    digest = hashlib.sha1(f"revision:{SCHEMA_REVISION}".encode())
+    for table in Base.metadata.sorted_tables:
+        digest.update(f"table:{table.name}".encode())
+        for column in table.columns:
+            digest.update(
+                f"column:{column.name}:{column.type!r}:{column.nullable}".encode()
+            )
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            columns = ",".join(str(expr) for expr in index.expressions)
+            digest.update(f"index:{index.name}:{columns}:{index.unique}".encode())
+    return f"{SCHEMA_REVISION}.{digest.hexdigest()[:12]}"
+
+
+def read_schema_version(conn: Connection) -> Optional[Tuple[str, bool]]:
+    """Stored ``(version, fulltext_enabled)``, or None for an unversioned database."""
+    if not inspect(conn).has_table(schema_version_table.name):
+        return None
+    row = conn.execute(
+        select(
+            schema_version_table.c.version, schema_version_table.c.fulltext_enabled
+        ).where(schema_version_table.c.id == 1)
+    ).first()
+    return (row.version, row.fulltext_enabled) if row else None
+
+
+def write_schema_version(conn: Connection, fulltext_enabled: bool):
+    """Record that the database matches the current schema_version()."""
+    schema_version_table.create(conn, checkfirst=True)
+    conn.execute(schema_version_table.delete())
+    conn.execute(
+        schema_version_table.insert().values(
+            id=1, version=schema_version(), fulltext_enabled=fulltext_enabled
+        )
+    )
+
+
+def drop_schema_version(conn: Connection):
+    """Forget the stored version so the next startup runs create_tables."""
+    schema_version_table.drop(conn, checkfirst=True)
+
+
+def ensure_indexes(engine: Engine) -> List[str]:
+    """
+    Create any declared index that is missing from an existing table.
+
+    ``create_all`` only emits indexes together with a new table, so databases
+    created before an index was declared never receive it. Safe to run on
+    every startup; returns the names of the indexes that were created.
+    """
+    with engine.begin() as conn:
+        return create_missing_indexes(conn)
+
+
+def create_missing_indexes(conn: Connection) -> List[str]:
+    """ensure_indexes on an open connection (e.g. via AsyncConnection.run_sync)."""
+    created = []
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables or not table.indexes:
+            continue
+
+        existing_indexes = {
+            index["name"] for index in inspector.get_indexes(table.name)
+        }
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                index.create(conn)
+                created.append(index.name)
+
+    if created:
+        logger.info(f"Created {len(created)} missing indexes: {', '.join(created)}")
+    return created
+
+
+def ensure_columns(engine: Engine) -> List[str]:
+    """
+    Add declared nullable columns missing from existing tables.
+
+    ``create_all`` never alters a table that already exists, so columns added
+    to a model reach older databases through ``ALTER TABLE ... ADD COLUMN``.
+    Run before ensure_indexes so indexes on new columns can be created.
+    Returns the added columns as "table.column".
+    """
+    with engine.begin() as conn:
+        return create_missing_columns(conn)
+
+
+def create_missing_columns(conn: Connection) -> List[str]:
+    """ensure_columns on an open connection (e.g. via AsyncConnection.run_sync)."""
+    added = []
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+    preparer = conn.dialect.identifier_preparer
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+
+        existing_columns = {
+            column["name"] for column in inspector.get_columns(table.name)
+        }
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            if not column.nullable:
+                logger.warning(
+                    f"Cannot add NOT NULL column {table.name}.{column.name}; "
+                    "recreate the table to upgrade it"
+                )
+                continue
+            column_type = column.type.compile(dialect=conn.dialect)
+            conn.exec_driver_sql(
+                f"ALTER TABLE {preparer.format_table(table)} "
+                f"ADD COLUMN {preparer.format_column(column)} {column_type}"
+            )
+            added.append(f"{table.name}.{column.name}")
+
+    if added:
+        logger.info(f"Added {len(added)} missing columns: {', '.join(added)}")
+    return added
+
+
+def migrate_job_dimensions(engine: Engine, chunk_size: int = 500) -> int:
+    """
+    Point job listings without company_id or location_id at their dimensions.
+
+    Backfills rows written before the job_companies and job_locations tables
+    existed, ``chunk_size`` rows per transaction. Safe to run on every
+    startup; returns the number of rows updated.
+    """
+    # Imported here: the dimensions module imports the models
+    from app.data.dimensions import assign_dimension_ids
+
+    jobs = Base.metadata.tables["job_listings"]
+    if not inspect(engine).has_table(jobs.name):
+        return 0
+
+    missing = or_(
+        and_(jobs.c.company_id.is_(None), jobs.c.company.isnot(None)),
+        and_(jobs.c.location_id.is_(None), jobs.c.location.isnot(None)),
+    )
+    updated, after = 0, ""
+    while True:
+        with engine.begin() as conn:
+            rows = [
+                dict(row._mapping)
+                for row in conn.execute(
+                    select(jobs.c.id, jobs.c.company, jobs.c.location)
+                    .where(missing, jobs.c.id > after)
+                    .order_by(jobs.c.id)
+                    .limit(chunk_size)
+                )
+            ]
+            if not rows:
+                break
+
+            assign_dimension_ids(conn, rows)
+            conn.execute(
+                jobs.update()
+                .where(jobs.c.id == bindparam("job_id"))
+                .values(
+                    company_id=bindparam("new_company_id"),
+                    location_id=bindparam("new_location_id"),
+                ),
+                [
+                    {
+                        "job_id": row["id"],
+                        "new_company_id": row["company_id"],
+                        "new_location_id": row["location_id"],
+                    }
+                    for row in rows
+                ],
+            )
+            updated += len(rows)
+            after = rows[-1]["id"]
+
+    if updated:
+        logger.info(f"Linked {updated} job listings to company and location rows")
+    return updated
+
+
+def migrate_annual_salaries(engine: Engine, chunk_size: int = 500) -> int:
+    """
+    Fill salary_annual_min/max for job listings written before they existed.
+
+    Processes ``chunk_size`` rows per transaction. Safe to run on every
+    startup; returns the number of rows updated.
+    """
+    from app.data.salary import USD_EXCHANGE_RATES, annual_salary_range
+
+    jobs = Base.metadata.tables["job_listings"]
+    if not inspect(engine).has_table(jobs.name):
+        return 0
+
+    # Rows in currencies without a rate can never be filled, so are not read;
+    # a missing currency is taken as USD, as annual_salary_range does
+    currency = func.upper(func.coalesce(func.nullif(jobs.c.salary_currency, ""), "USD"))
+    missing = and_(
+        jobs.c.salary_annual_max.is_(None),
+        or_(jobs.c.salary_min.isnot(None), jobs.c.salary_max.isnot(None)),
+        currency.in_(list(USD_EXCHANGE_RATES)),
+    )
+    updated, after = 0, ""
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select(
+                    jobs.c.id,
+                    jobs.c.salary_min,
+                    jobs.c.salary_max,
+                    jobs.c.salary_period,
+                    jobs.c.salary_currency,
+                )
+                .where(missing, jobs.c.id > after)
+                .order_by(jobs.c.id)
+                .limit(chunk_size)
+            ).all()
+            if not rows:
+                break
+
+            params = []
+            for row in rows:
+                annual_min, annual_max = annual_salary_range(
+                    row.salary_min,
+                    row.salary_max,
+                    row.salary_period,
+                    row.salary_currency,
+                )
+                if annual_max is not None:
+                    params.append(
+                        {
+                            "job_id": row.id,
+                            "new_annual_min": annual_min,
+                            "new_annual_max": annual_max,
+                        }
+                    )
+            if params:
+                conn.execute(
+                    jobs.update()
+                    .where(jobs.c.id == bindparam("job_id"))
+                    .values(
+                        salary_annual_min=bindparam("new_annual_min"),
+                        salary_annual_max=bindparam("new_annual_max"),
+                    ),
+                    params,
+                )
+            updated += len(params)
+            after = rows[-1].id
+
+    if updated:
+        logger.info(f"Computed annual salaries for {updated} job listings")
+    return updated
+
+
+def migrate_embedding_vectors(engine: Engine, chunk_size: int = 500) -> int:
+    """
+    Re-encode embedding vectors stored as JSON arrays into binary blobs.
+
+    Databases created before EmbeddingVector hold JSON text in the vector
+    columns. Rows are converted ``chunk_size`` at a time, one transaction
+    per chunk, so large tables never sit in memory at once. JSON ``null``
+    becomes SQL NULL, or deletes the row when the column is NOT NULL; text
+    that is not a list of numbers is logged and left as is. Safe to run on
+    every startup; returns the number of rows converted or deleted.
+    """
+    if engine.dialect.name != "sqlite":
+        return 0
+
+    existing_tables = set(inspect(engine).get_table_names())
+    converted = 0
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        for column in table.columns:
+            if isinstance(column.type, EmbeddingVector):
+                converted += _migrate_vector_column(
+                    engine,
+                    table.name,
+                    column.name,
+                    column.type.dtype,
+                    column.nullable,
+                    chunk_size,
+                )
+
+    if converted:
+        logger.info(f"Converted {converted} JSON embedding vectors to binary")
+    return converted
+
+
+def _migrate_vector_column(
+    engine: Engine,
+    table_name: str,
+    column_name: str,
+    dtype: str,
+    nullable: bool,
+    chunk_size: int,
+) -> int:
+    select_chunk = text(
+        f"SELECT rowid, {column_name} FROM {table_name} "
+        f"WHERE typeof({column_name}) = 'text' AND rowid > :after "
+        f"ORDER BY rowid LIMIT :limit"
+    )
+    update_row = text(
+        f"UPDATE {table_name} SET {column_name} = :vector WHERE rowid = :rowid"
+    )
+    delete_row = text(f"DELETE FROM {table_name} WHERE rowid = :rowid")
+
+    converted, after = 0, -1
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select_chunk, {"after": after, "limit": chunk_size}
+            ).all()
+            if not rows:
+                return converted
+
+            updates, deletes = [], []
+            for rowid, value in rows:
+                try:
+                    vector = encode_vector(value, dtype)
+                except (TypeError, ValueError) as e:
+                    logger.warning(
+                        f"Skipping unreadable vector in {table_name} row {rowid}: {e}"
+                    )
+                    continue
+                # JSON null: there is no vector to keep
+                if vector is None and not nullable:
+                    deletes.append({"rowid": rowid})
+                else:
+                    updates.append({"rowid": rowid, "vector": vector})
+            if updates:
+                conn.execute(update_row, updates)
+            if deletes:
+                conn.execute(delete_row, deletes)
+
+            converted += len(updates) + len(deletes)
+            after = rows[-1][0]
+
+
+def migrate_compressed_payloads(
+    engine: Engine, codec: str = "zlib", chunk_size: int = 100
+) -> Dict[str, int]:
+    """
+    Compress JSON documents stored as text in CompressedJSON columns.
+
+    Backfills rows written before the column was compressed, ``chunk_size``
+    rows per transaction. Safe to run repeatedly; returns the number of rows
+    converted and their total size before and after compression.
+    """
+    stats = {"rows": 0, "raw_bytes": 0, "stored_bytes": 0}
+    if engine.dialect.name != "sqlite":
+        return stats
+
+    existing_tables = set(inspect(engine).get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        for column in table.columns:
+            if isinstance(column.type, CompressedJSON):
+                _compress_payload_column(
+                    engine, table.name, column.name, codec, chunk_size, stats
+                )
+
+    if stats["rows"]:
+        logger.info(
+            f"Compressed {stats['rows']} JSON payloads with {codec}: "
+            f"{stats['raw_bytes']} -> {stats['stored_bytes']} bytes"
+        )
+    return stats
+
+
+def _compress_payload_column(
+    engine: Engine,
+    table_name: str,
+    column_name: str,
+    codec: str,
+    chunk_size: int,
+    stats: Dict[str, int],
+):
+    select_chunk = text(
+        f"SELECT rowid, {column_name} FROM {table_name} "
+        f"WHERE typeof({column_name}) = 'text' AND rowid > :after "
+        f"ORDER BY rowid LIMIT :limit"
+    )
+    update_row = text(
+        f"UPDATE {table_name} SET {column_name} = :payload WHERE rowid = :rowid"
+    )
+
+    after = -1
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select_chunk, {"after": after, "limit": chunk_size}
+            ).all()
+            if not rows:
+                return
+
+            updates = []
+            for rowid, value in rows:
+                raw = value.encode("utf-8")
+                payload = compress_bytes(raw, codec)
+                updates.append({"rowid": rowid, "payload": payload})
+                stats["raw_bytes"] += len(raw)
+                stats["stored_bytes"] += len(payload)
+            conn.execute(update_row, updates)
+
+            stats["rows"] += len(updates)
+            after = rows[-1][0]
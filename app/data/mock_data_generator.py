@@ -10,6 +10,7 @@ from uuid import uuid4
 
 from sqlalchemy.orm import Session
 
+from app.data.async_database import AsyncDatabaseManager
 from app.data.database import DatabaseManager
 from app.data.models import (
     ApplicationStatus,
@@ -67,7 +68,10 @@ class MockDataGenerator:
 
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
-        self.skill_bank_repo = SkillBankRepository(db_manager)
+        # SkillBankRepository is async-only; give it an async manager on the
+        # same database
+        self.async_db_manager = AsyncDatabaseManager(db_manager.database_url)
+        self.skill_bank_repo = SkillBankRepository(self.async_db_manager)
 
     def _get_session(self) -> Session:
         """Get database session."""
@@ -2245,6 +2249,9 @@ class MockDataGenerator:
             results["errors"].append(
                 {"operation": "comprehensive_data_creation", "error": str(e)}
             )
+        finally:
+            # Release the skill bank connections before the event loop closes
+            await self.async_db_manager.dispose()
 
         # Calculate summary
         results["summary"] = {
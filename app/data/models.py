@@ -5,7 +5,18 @@ Core data structures for job hunting functionality, migrated from original JobPi
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from operator import attrgetter, itemgetter, methodcaller
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, EmailStr, Field, validator
@@ -16,15 +27,22 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
+    Table,
     Text,
     create_engine,
+    event,
+    text,
 )
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import relationship, sessionmaker
 
 from .base import Base
+from .compression import CompressedJSON
+from .salary import annual_salary_range
+from .vectors import EmbeddingVector
 
 # Import enhanced skill bank models
 try:
@@ -64,6 +82,16 @@ class ExperienceLevel(str, Enum):
     EXECUTIVE = "executive"
 
 
+class SalaryPeriod(str, Enum):
+    """Pay period a posted salary refers to."""
+
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+
 class JobStatus(str, Enum):
     ACTIVE = "active"
     INACTIVE = "inactive"
@@ -247,6 +275,7 @@ class JobListingBase(BaseModel):
     salary_min: Optional[float] = None
     salary_max: Optional[float] = None
     salary_currency: str = "USD"
+    salary_period: Optional[SalaryPeriod] = None  # None: inferred from amount
 
     # Skills and qualifications
     skills_required: Optional[List[str]] = []
@@ -307,6 +336,29 @@ class JobListing(JobListingBase):
         from_attributes = True
 
 
+class JobSummary(BaseModel):
+    """Listing-card view of a job, as returned by list endpoints."""
+
+    id: UUID
+    title: str
+    company: str
+    location: Optional[str] = None
+    job_type: Optional[JobType] = None
+    remote_type: Optional[RemoteType] = None
+    experience_level: Optional[ExperienceLevel] = None
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
+    salary_currency: Optional[str] = "USD"
+    skills_required: List[str] = []  # First few skills only
+    posted_date: Optional[datetime] = None
+    job_url: Optional[str] = None
+    created_at: Optional[datetime] = None
+    description_snippet: Optional[str] = None  # Truncated with "..."
+
+    class Config:
+        from_attributes = True
+
+
 class UserProfile(BaseModel):
     """User profile for job matching."""
 
@@ -590,6 +642,7 @@ class JobSourceListingDB(Base):
     """SQLAlchemy model for job source listings."""
 
     __tablename__ = "job_source_listings"
+    __table_args__ = (Index("ix_job_source_listings_job_id", "job_id"),)
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     job_id = Column(String, ForeignKey("job_listings.id"), nullable=False)
@@ -609,12 +662,15 @@ class JobEmbeddingDB(Base):
     """SQLAlchemy model for job embeddings."""
 
     __tablename__ = "job_embeddings"
+    __table_args__ = (
+        Index("ix_job_embeddings_job_id_content_hash", "job_id", "content_hash"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     job_id = Column(String, ForeignKey("job_listings.id"), nullable=False)
     embedding_model = Column(String, nullable=False)
     content_hash = Column(String, nullable=False)
-    embedding_vector = Column(JSON, nullable=False)  # Store as JSON array
+    embedding_vector = Column(EmbeddingVector(), nullable=False)
     embedding_dimension = Column(Integer, nullable=False)
     content_type = Column(String, default="job_description")
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -642,10 +698,63 @@ class JobDeduplicationDB(Base):
     duplicate_job = relationship("JobListingDB", foreign_keys=[duplicate_job_id])
 
 
+class JobCompanyDB(Base):
+    """SQLAlchemy model for canonical companies referenced by job listings."""
+
+    __tablename__ = "job_companies"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid4()))
+    key = Column(String, nullable=False, unique=True)  # See app.data.dimensions
+    name = Column(String, nullable=False)  # Display name, as first seen
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class JobLocationDB(Base):
+    """SQLAlchemy model for canonical locations referenced by job listings."""
+
+    __tablename__ = "job_locations"
+    __table_args__ = (
+        Index("ix_job_locations_city", "city"),
+        Index("ix_job_locations_region", "region"),
+    )
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid4()))
+    key = Column(String, nullable=False, unique=True)  # See app.data.dimensions
+    name = Column(String, nullable=False)  # Display name, as first seen
+
+    # Lower-cased components of the key
+    city = Column(String)
+    region = Column(String)
+    country = Column(String)
+    is_remote = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
 class JobListingDB(Base):
     """SQLAlchemy model for job listings."""
 
     __tablename__ = "job_listings"
+    __table_args__ = (
+        Index("ix_job_listings_status_created_at", "status", text("created_at DESC")),
+        Index("ix_job_listings_job_type", "job_type"),
+        Index("ix_job_listings_remote_type", "remote_type"),
+        Index("ix_job_listings_experience_level", "experience_level"),
+        Index("ix_job_listings_company_status", "company", "status"),
+        Index("ix_job_listings_created_at", "created_at"),
+        Index("ix_job_listings_job_url", "job_url"),
+        Index("ix_job_listings_canonical_id", "canonical_id"),
+        Index("ix_job_listings_company_id_status", "company_id", "status"),
+        Index("ix_job_listings_location_id_status", "location_id", "status"),
+        Index(
+            "ix_job_listings_status_salary_annual_max",
+            "status",
+            "salary_annual_max",
+            "salary_annual_min",
+        ),
+        Index(
+            "ix_job_listings_status_salary_annual_min", "status", "salary_annual_min"
+        ),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
 
@@ -657,6 +766,10 @@ class JobListingDB(Base):
     requirements = Column(Text)
     responsibilities = Column(Text)
 
+    # Canonical dimensions, set from company and location on flush
+    company_id = Column(String, ForeignKey("job_companies.id"))
+    location_id = Column(String, ForeignKey("job_locations.id"))
+
     # Job details
     job_type = Column(SQLEnum(JobType))
     remote_type = Column(SQLEnum(RemoteType))
@@ -666,6 +779,11 @@ class JobListingDB(Base):
     salary_min = Column(Float)
     salary_max = Column(Float)
     salary_currency = Column(String, default="USD")
+    salary_period = Column(SQLEnum(SalaryPeriod))
+
+    # Annual USD salary range derived from the fields above on every write
+    salary_annual_min = Column(Float)
+    salary_annual_max = Column(Float)
 
     # Skills and qualifications (stored as JSON)
     skills_required = Column(JSON)
@@ -714,10 +832,46 @@ class JobListingDB(Base):
     # Relationships
     applications = relationship("JobApplicationDB", back_populates="job")
     source_listings = relationship("JobSourceListingDB", back_populates="job")
-    embeddings = relationship("JobEmbeddingDB", back_populates="job")
+    # Derived from the listing, so deleted with it
+    embeddings = relationship(
+        "JobEmbeddingDB", back_populates="job", cascade="all, delete-orphan"
+    )
     canonical_job = relationship("JobListingDB", remote_side=[id])
 
 
+@event.listens_for(JobListingDB, "before_insert")
+@event.listens_for(JobListingDB, "before_update")
+def _set_annual_salary(mapper, connection, target):
+    """Keep salary_annual_min/max in step with the posted salary."""
+    target.salary_annual_min, target.salary_annual_max = annual_salary_range(
+        target.salary_min,
+        target.salary_max,
+        target.salary_period,
+        target.salary_currency,
+    )
+
+
+class JobListingArchiveDB(Base):
+    """
+    Archived job listings (see app.data.archive).
+
+    Same columns as job_listings without its foreign keys, so rows can move
+    here unchanged, plus the time they were archived.
+    """
+
+    __table__ = Table(
+        "job_listings_archive",
+        Base.metadata,
+        *[
+            Column(column.name, column.type, primary_key=column.primary_key)
+            for column in JobListingDB.__table__.columns
+        ],
+        Column("archived_at", DateTime, default=datetime.utcnow),
+        Index("ix_job_listings_archive_archived_at", "archived_at"),
+        Index("ix_job_listings_archive_company_id", "company_id"),
+    )
+
+
 class UserProfileDB(Base):
     """SQLAlchemy model for user profiles."""
 
@@ -769,6 +923,14 @@ class JobApplicationDB(Base):
     """SQLAlchemy model for job applications."""
 
     __tablename__ = "applications"
+    __table_args__ = (
+        Index(
+            "ix_applications_user_created_at",
+            "user_profile_id",
+            text("created_at DESC"),
+        ),
+        Index("ix_applications_job_user", "job_id", "user_profile_id"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     job_id = Column(String, ForeignKey("job_listings.id"), nullable=False)
@@ -801,6 +963,15 @@ class SavedJobDB(Base):
     """SQLAlchemy model for saved jobs."""
 
     __tablename__ = "saved_jobs"
+    __table_args__ = (
+        Index(
+            "ix_saved_jobs_user_status_saved_date",
+            "user_profile_id",
+            "status",
+            text("saved_date DESC"),
+        ),
+        Index("ix_saved_jobs_job_user", "job_id", "user_profile_id"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     job_id = Column(String, ForeignKey("job_listings.id"), nullable=False)
@@ -847,6 +1018,11 @@ class TimelineEventDB(Base):
     """SQLAlchemy model for timeline events."""
 
     __tablename__ = "timeline_events"
+    __table_args__ = (
+        Index("ix_timeline_events_user_event_date", "user_profile_id", "event_date"),
+        Index("ix_timeline_events_job_event_date", "job_id", "event_date"),
+        Index("ix_timeline_events_application_id", "application_id"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     job_id = Column(
@@ -888,12 +1064,19 @@ class RawJobCollectionDB(Base):
     """SQLAlchemy model for raw job collections from external APIs."""
 
     __tablename__ = "raw_job_collections"
+    __table_args__ = (
+        Index(
+            "ix_raw_job_collections_status_created_at",
+            "processing_status",
+            "created_at",
+        ),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
     api_provider = Column(String, nullable=False)  # "jsearch", "indeed", etc.
     query_params = Column(JSON, nullable=False)  # Search parameters used
-    raw_response = Column(JSON, nullable=False)  # Complete API response
+    raw_response = Column(CompressedJSON(), nullable=False)  # Complete API response
     response_metadata = Column(JSON)  # Response metadata (renamed from metadata)
     processing_status = Column(
         SQLEnum(ETLProcessingStatus), default=ETLProcessingStatus.PENDING
@@ -911,6 +1094,7 @@ class JobProcessingLogDB(Base):
     """SQLAlchemy model for job processing operations."""
 
     __tablename__ = "job_processing_logs"
+    __table_args__ = (Index("ix_job_processing_logs_collection_id", "collection_id"),)
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     collection_id = Column(String, ForeignKey("raw_job_collections.id"), nullable=False)
@@ -941,7 +1125,7 @@ class ProcessedJobDataDB(Base):
     )
     job_index = Column(Integer, primary_key=True)  # Index in the processing batch
     processed_data = Column(JSON, nullable=False)  # Transformed job data
-    embedding_vector = Column(JSON)  # Generated embeddings as JSON array
+    embedding_vector = Column(EmbeddingVector())  # Generated embeddings
     duplicate_of = Column(String)  # If duplicate, reference to canonical job UUID
     load_status = Column(
         SQLEnum(ETLProcessingStatus), default=ETLProcessingStatus.PENDING
@@ -958,6 +1142,7 @@ class ETLOperationLogDB(Base):
     """SQLAlchemy model for comprehensive ETL operation logging."""
 
     __tablename__ = "etl_operation_logs"
+    __table_args__ = (Index("ix_etl_operation_logs_started_at", "started_at"),)
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     operation_type = Column(SQLEnum(ETLOperationType), nullable=False)
@@ -1023,57 +1208,222 @@ def pydantic_to_sqlalchemy(pydantic_obj: BaseModel, sqlalchemy_class):
     return sqlalchemy_class(**data)
 
 
-def sqlalchemy_to_pydantic(sqlalchemy_obj, pydantic_class):
-    """Convert SQLAlchemy model to Pydantic model."""
-    data = {}
-    for column in sqlalchemy_obj.__table__.columns:
-        value = getattr(sqlalchemy_obj, column.name)
-        column_name = column.name
-
-        # Handle field name mappings for renamed fields
-        if (
-            sqlalchemy_obj.__class__.__name__ == "RawJobCollectionDB"
-            and column_name == "response_metadata"
-        ):
-            column_name = "metadata"
-        elif (
-            sqlalchemy_obj.__class__.__name__ == "ETLOperationLogDB"
-            and column_name == "operation_metadata"
-        ):
-            column_name = "metadata"
-
-        # Handle None values for list fields
-        if value is None and column_name in [
-            "skills",
-            "preferred_locations",
-            "preferred_job_types",
-            "preferred_remote_types",
-            "skills_required",
-            "skills_preferred",
-            "benefits",
-            "values",
-            "tags",
-            "tech_stack",
-            "matching_fields",
-        ]:
-            value = []
-        # Handle None values for event_data dict field
-        elif value is None and column_name == "event_data":
-            value = {}
-        # Handle None values for metadata dict fields
-        elif value is None and column_name in [
-            "scraping_rules",
-            "rate_limit_config",
-            "source_metadata",
-            "benefits_parsed",
-            "metadata",
-            "operation_metadata",
-            "response_metadata",
-        ]:
-            value = {}
-        # Skip None values for required fields - let Pydantic handle defaults
-        elif value is None and column_name in ["id", "created_at", "updated_at"]:
+# Columns renamed on the Pydantic side (attribute names reserved by SQLAlchemy)
+_COLUMN_RENAMES = {
+    "RawJobCollectionDB": {"response_metadata": "metadata"},
+    "ETLOperationLogDB": {"operation_metadata": "metadata"},
+}
+
+# Defaults substituted for NULL columns, by Pydantic field name
+_NULL_AS_LIST_FIELDS = frozenset(
+    [
+        "skills",
+        "preferred_locations",
+        "preferred_job_types",
+        "preferred_remote_types",
+        "skills_required",
+        "skills_preferred",
+        "benefits",
+        "values",
+        "tags",
+        "tech_stack",
+        "matching_fields",
+    ]
+)
+_NULL_AS_DICT_FIELDS = frozenset(
+    [
+        "event_data",
+        "scraping_rules",
+        "rate_limit_config",
+        "source_metadata",
+        "benefits_parsed",
+        "metadata",
+        "operation_metadata",
+        "response_metadata",
+    ]
+)
+# NULLs skipped so the Pydantic default applies
+_NULL_AS_DEFAULT_FIELDS = frozenset(["id", "created_at", "updated_at"])
+
+_SKIP = object()
+_vector_to_list = methodcaller("tolist")
+
+_row_mappers: Dict[tuple, Callable[[Any], BaseModel]] = {}
+
+
+def _null_value(field_name: str):
+    """What a NULL column becomes: a factory, _SKIP, or None to keep it."""
+    if field_name in _NULL_AS_LIST_FIELDS:
+        return list
+    if field_name in _NULL_AS_DICT_FIELDS:
+        return dict
+    if field_name in _NULL_AS_DEFAULT_FIELDS:
+        return _SKIP
+    return None
+
+
+def _scalar_coercer(annotation) -> Tuple[bool, Optional[Callable]]:
+    """
+    How a trusted column value is coerced to a field's type without validation.
+
+    Returns ``(supported, coercer)``: UUID and Enum fields get a cheap
+    conversion from their stored form, plain scalars and JSON containers of
+    scalars need none, and anything else (nested models, containers of
+    UUIDs/enums) is unsupported and requires full validation.
+    """
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    if get_origin(annotation) is Union:
+        if len(args) != 1:
+            return False, None
+        annotation = args[0]
+        args = list(get_args(annotation))
+
+    if annotation is UUID:
+        return True, lambda v: v if isinstance(v, UUID) else UUID(str(v))
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return True, lambda v: v if isinstance(v, annotation) else annotation(v)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return False, None
+    if get_origin(annotation) in (list, dict):
+        nested = [_scalar_coercer(arg) for arg in args if arg is not Any]
+        return all(ok and coerce is None for ok, coerce in nested), None
+    return True, None
+
+
+def _as_tuple(getter):
+    """Make a single-key itemgetter/attrgetter return a 1-tuple like multi-key ones."""
+    return lambda obj: (getter(obj),)
+
+
+def _model_builder(pydantic_class) -> Callable[..., BaseModel]:
+    """
+    Unvalidated constructor for trusted data, a leaner ``model_construct``.
+
+    Missing fields get their defaults; models with extra fields or private
+    attributes use ``model_construct`` itself. It sets the instance slots of
+    ``BaseModel`` directly, which test_row_mappers pins to what
+    ``model_construct`` sets.
+    """
+    if (
+        pydantic_class.model_config.get("extra") == "allow"
+        or pydantic_class.__private_attributes__
+    ):
+        return pydantic_class.model_construct
+
+    fields = list(pydantic_class.model_fields.items())
+    new_instance = pydantic_class.__new__
+    set_attribute = object.__setattr__
+
+    def build(**data):
+        fields_set = set(data)
+        if len(fields_set) < len(fields):
+            for name, field in fields:
+                if name not in data:
+                    data[name] = field.get_default(call_default_factory=True)
+
+        instance = new_instance(pydantic_class)
+        set_attribute(instance, "__dict__", data)
+        set_attribute(instance, "__pydantic_fields_set__", fields_set)
+        set_attribute(instance, "__pydantic_extra__", None)
+        set_attribute(instance, "__pydantic_private__", None)
+        return instance
+
+    return build
+
+
+def get_row_mapper(
+    sqlalchemy_class, pydantic_class, trusted: bool = False
+) -> Callable[[Any], BaseModel]:
+    """
+    Get the cached row converter for an (ORM class, Pydantic class) pair.
+
+    Column renames and NULL defaults are resolved once when the converter is
+    built. With ``trusted`` set, rows read back from the database are built
+    with ``model_construct`` (no validation, UUID/enum values still coerced);
+    pairs whose fields need real validation fall back to the validating path.
+    """
+    key = (sqlalchemy_class, pydantic_class, trusted)
+    mapper = _row_mappers.get(key)
+    if mapper is not None:
+        return mapper
+
+    renames = _COLUMN_RENAMES.get(sqlalchemy_class.__name__, {})
+    model_fields = pydantic_class.model_fields
+    keep_extra = pydantic_class.model_config.get("extra") == "allow"
+
+    columns, field_names, null_values, coercers = [], [], [], []
+    for column in sqlalchemy_class.__table__.columns:
+        field_name = renames.get(column.name, column.name)
+        if field_name not in model_fields and column.name in model_fields:
+            # Model still uses the column's own name
+            field_name = column.name
+        if field_name not in model_fields and not keep_extra:
             continue
 
-        data[column_name] = value
-    return pydantic_class(**data)
+        coerce = None
+        if trusted and field_name in model_fields:
+            supported, coerce = _scalar_coercer(model_fields[field_name].annotation)
+            trusted = trusted and supported
+
+        columns.append(column)
+        field_names.append(field_name)
+        null_values.append(_null_value(field_name))
+        coercers.append(coerce)
+
+    if not trusted:
+        coercers = [None] * len(coercers)
+    # Vector columns load as NumPy arrays; the Pydantic fields hold lists
+    coercers = [
+        _vector_to_list if isinstance(column.type, EmbeddingVector) else coerce
+        for column, coerce in zip(columns, coercers, strict=True)
+    ]
+    build = _model_builder(pydantic_class) if trusted else pydantic_class
+
+    # Loaded column values live in the instance __dict__; reading them there
+    # skips the instrumented attribute descriptors. Expired or deferred
+    # attributes are missing from it and go through normal attribute access.
+    attribute_keys = [
+        sqlalchemy_class.__mapper__.get_property_by_column(column).key
+        for column in columns
+    ]
+    read_state = itemgetter(*attribute_keys)
+    read_attributes = attrgetter(*attribute_keys)
+    if len(attribute_keys) == 1:
+        read_state = _as_tuple(read_state)
+        read_attributes = _as_tuple(read_attributes)
+
+    def fetch(sqlalchemy_obj):
+        try:
+            return read_state(sqlalchemy_obj.__dict__)
+        except KeyError:
+            return read_attributes(sqlalchemy_obj)
+
+    steps = list(zip(field_names, null_values, coercers, strict=True))
+
+    def mapper(sqlalchemy_obj):
+        data = {}
+        for (field_name, on_null, coerce), value in zip(
+            steps, fetch(sqlalchemy_obj), strict=True
+        ):
+            if value is None:
+                if on_null is _SKIP:
+                    continue
+                if on_null is not None:
+                    value = on_null()
+            elif coerce is not None:
+                value = coerce(value)
+            data[field_name] = value
+        return build(**data)
+
+    _row_mappers[key] = mapper
+    return mapper
+
+
+def sqlalchemy_to_pydantic(sqlalchemy_obj, pydantic_class, trusted: bool = False):
+    """
+    Convert SQLAlchemy model to Pydantic model.
+
+    Uses the cached converter from get_row_mapper; pass ``trusted=True`` for
+    rows just read from the database to skip Pydantic validation.
+    """
+    return get_row_mapper(type(sqlalchemy_obj), pydantic_class, trusted)(sqlalchemy_obj)
@@ -0,0 +1,141 @@
+"""
+JobPilot Keyset Pagination
+Opaque cursors and seek predicates for stable, constant-cost paging.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import DateTime, and_, asc, desc, or_
+
+T = TypeVar("T")
+
+# (column expression, descending) pairs; the last key must be unique per row
+SortKeys = Sequence[Tuple[Any, bool]]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results plus the cursor for the page after it."""
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    total_strategy: Optional[str] = None  # CountStrategy that produced ``total``
+    total_is_lower_bound: bool = False  # More than ``total`` rows may match
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort-key values of the last row on a page as an opaque token."""
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_keys: SortKeys) -> List[Any]:
+    """Decode a cursor produced by encode_cursor for the given sort keys."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Malformed cursor: {cursor!r}") from e
+
+    if not isinstance(values, list) or len(values) != len(sort_keys):
+        raise InvalidCursorError(f"Cursor does not match sort order: {cursor!r}")
+
+    decoded = []
+    for value, (column, _) in zip(values, sort_keys, strict=True):
+        if value is not None and isinstance(column.type, DateTime):
+            try:
+                value = datetime.fromisoformat(value)
+            except (TypeError, ValueError) as e:
+                raise InvalidCursorError(f"Malformed cursor: {cursor!r}") from e
+        decoded.append(value)
+    return decoded
+
+
+def order_by_keys(sort_keys: SortKeys) -> list:
+    """ORDER BY clauses for the sort keys."""
+    return [
+        desc(column) if descending else asc(column) for column, descending in sort_keys
+    ]
+
+
+def seek_after(sort_keys: SortKeys, values: Sequence[Any]):
+    """
+    WHERE clause selecting rows strictly after ``values`` in sort-key order.
+
+    Expands to ``k1 <= v1 AND (k1 < v1 OR (k1 = v1 AND k2 < v2) ...)`` for
+    descending keys, so the leading bound stays usable as an index range.
+    """
+    branches = []
+    for position, (column, descending) in enumerate(sort_keys):
+        value = values[position]
+        equal_prefix = [
+            prior_column == values[prior]
+            for prior, (prior_column, _) in enumerate(sort_keys[:position])
+        ]
+        after = column < value if descending else column > value
+        branches.append(and_(*equal_prefix, after))
+
+    leading_column, leading_descending = sort_keys[0]
+    leading_bound = (
+        leading_column <= values[0]
+        if leading_descending
+        else leading_column >= values[0]
+    )
+    return and_(leading_bound, or_(*branches))
+
+
+def keyset_query(query_obj, sort_keys: SortKeys, limit: int, cursor: Optional[str]):
+    """
+    Apply the seek predicate, ordering and limit for one page.
+
+    Works on both ORM ``Query`` objects and ``select()`` statements. The sort
+    columns are appended to the result rows so the next cursor can be built;
+    returns ``(query_obj, keys_start)`` where ``keys_start`` is their offset.
+    """
+    if cursor:
+        query_obj = query_obj.filter(
+            seek_after(sort_keys, decode_cursor(cursor, sort_keys))
+        )
+
+    keys_start = len(query_obj.column_descriptions)
+    query_obj = (
+        query_obj.add_columns(*[column for column, _ in sort_keys])
+        .order_by(*order_by_keys(sort_keys))
+        .limit(limit + 1)
+    )
+    return query_obj, keys_start
+
+
+def split_page(rows: Sequence[Any], keys_start: int, limit: int):
+    """
+    Split rows fetched by a keyset_query into ``(results, next_cursor)``.
+
+    ``next_cursor`` is None on the last page; one extra row is fetched to
+    detect whether another page exists.
+    """
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][keys_start:])
+
+    entities = [row[0] if keys_start == 1 else tuple(row[:keys_start]) for row in rows]
+    return entities, next_cursor
+
+
+def paginate(query_obj, sort_keys: SortKeys, limit: int, cursor: Optional[str] = None):
+    """Apply keyset pagination to an ORM query; returns ``(results, next_cursor)``."""
+    query_obj, keys_start = keyset_query(query_obj, sort_keys, limit, cursor)
+    return split_page(query_obj.all(), keys_start, limit)
@@ -0,0 +1,376 @@
+"""
+JobPilot Repository Queries
+Statement builders shared by the sync and async repositories.
+
+Each builder takes a base query, either ``session.query(...)`` or
+``select(...)``, and returns it filtered and ordered, so JobRepository and
+AsyncJobRepository (and the other repository pairs) run the same SQL.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+from sqlalchemy import and_, desc, func, literal_column, or_, select
+
+from app.data.counts import filter_signature
+from app.data.dimensions import company_filter, location_filter
+from app.data.facets import (
+    FACET_LIMIT,
+    facet_count_query,
+    facet_source,
+    materialized_facet_counts,
+    top_facet_counts,
+)
+from app.data.fulltext import build_match_query, job_search_subquery
+from app.data.models import (
+    ApplicationStatus,
+    ExperienceLevel,
+    JobApplication,
+    JobApplicationDB,
+    JobListing,
+    JobListingArchiveDB,
+    JobListingDB,
+    JobStatus,
+    JobSummary,
+    JobType,
+    RemoteType,
+    SavedJob,
+    SavedJobDB,
+    SavedJobStatus,
+    sqlalchemy_to_pydantic,
+)
+from app.data.pagination import SortKeys
+from app.data.resume_models import ResumeDB
+
+# ==================== Jobs ====================
+
+# Orders a job search can be sorted in: newest first, or highest annual
+# salary first (see app.data.salary)
+JOB_SORT_ORDERS = ("recent", "salary")
+
+
+def build_job_search_query(
+    query_obj,
+    fulltext_enabled: bool,
+    query: Optional[str] = None,
+    job_types: Optional[List[JobType]] = None,
+    remote_types: Optional[List[RemoteType]] = None,
+    experience_levels: Optional[List[ExperienceLevel]] = None,
+    locations: Optional[List[str]] = None,
+    companies: Optional[List[str]] = None,
+    min_salary: Optional[float] = None,
+    max_salary: Optional[float] = None,
+    max_age_days: Optional[int] = None,
+    sort_by: str = "recent",
+):
+    """
+    Apply job search filters to a base query and return it with its sort keys.
+
+    ``query_obj`` is either ``session.query(JobListingDB)`` or
+    ``select(JobListingDB)``, so sync and async repositories share one
+    definition of the search. ``sort_by`` is one of JOB_SORT_ORDERS; sorting
+    by salary leaves out listings without one.
+    """
+    if sort_by not in JOB_SORT_ORDERS:
+        raise ValueError(f"sort_by must be one of {JOB_SORT_ORDERS}, got {sort_by!r}")
+
+    query_obj = query_obj.filter(JobListingDB.status == JobStatus.ACTIVE)
+
+    if sort_by == "salary":
+        sort_keys = [(JobListingDB.salary_annual_max, True), (JobListingDB.id, True)]
+        query_obj = query_obj.filter(JobListingDB.salary_annual_max.isnot(None))
+    else:
+        sort_keys = [(JobListingDB.created_at, True), (JobListingDB.id, True)]
+
+    # Ranked full-text search when the FTS5 index is available,
+    # otherwise a LIKE scan across title, company and description
+    match_query = build_match_query(query) if query and fulltext_enabled else None
+    if match_query:
+        matches = job_search_subquery(match_query)
+        query_obj = query_obj.join(
+            matches,
+            literal_column("job_listings.rowid") == matches.c.job_rowid,
+        )
+        if sort_by == "recent":
+            sort_keys = [(matches.c.rank, False)] + sort_keys
+    elif query:
+        search_filter = or_(
+            JobListingDB.title.ilike(f"%{query}%"),
+            JobListingDB.company.ilike(f"%{query}%"),
+            JobListingDB.description.ilike(f"%{query}%"),
+            JobListingDB.requirements.ilike(f"%{query}%"),
+        )
+        query_obj = query_obj.filter(search_filter)
+
+    # Filter by job types
+    if job_types:
+        query_obj = query_obj.filter(JobListingDB.job_type.in_(job_types))
+
+    # Filter by remote types
+    if remote_types:
+        query_obj = query_obj.filter(JobListingDB.remote_type.in_(remote_types))
+
+    # Filter by experience levels
+    if experience_levels:
+        query_obj = query_obj.filter(
+            JobListingDB.experience_level.in_(experience_levels)
+        )
+
+    # Filter by locations and companies through their dimension tables
+    if locations:
+        query_obj = query_obj.filter(location_filter(locations))
+
+    if companies:
+        query_obj = query_obj.filter(company_filter(companies))
+
+    # Salary filters on the annual USD range, so ranges posted per hour or
+    # in other currencies compare correctly and use the status/salary index
+    if min_salary is not None:
+        query_obj = query_obj.filter(JobListingDB.salary_annual_max >= min_salary)
+
+    if max_salary is not None:
+        query_obj = query_obj.filter(JobListingDB.salary_annual_min <= max_salary)
+
+    # Age filter
+    if max_age_days is not None:
+        cutoff_date = datetime.utcnow() - timedelta(days=max_age_days)
+        query_obj = query_obj.filter(JobListingDB.created_at >= cutoff_date)
+
+    return query_obj, sort_keys
+
+
+# Listing-card columns behind JobSummary. The description is cut down in SQL
+# so the full Text column is never read for list pages.
+JOB_SUMMARY_SNIPPET_LENGTH = 200
+JOB_SUMMARY_SKILLS = 5
+JOB_SUMMARY_COLUMNS = (
+    JobListingDB.id,
+    JobListingDB.title,
+    JobListingDB.company,
+    JobListingDB.location,
+    JobListingDB.job_type,
+    JobListingDB.remote_type,
+    JobListingDB.experience_level,
+    JobListingDB.salary_min,
+    JobListingDB.salary_max,
+    JobListingDB.salary_currency,
+    JobListingDB.skills_required,
+    JobListingDB.posted_date,
+    JobListingDB.job_url,
+    JobListingDB.created_at,
+    func.substr(JobListingDB.description, 1, JOB_SUMMARY_SNIPPET_LENGTH + 1).label(
+        "description_snippet"
+    ),
+)
+_JOB_SUMMARY_FIELDS = tuple(column.key for column in JOB_SUMMARY_COLUMNS)
+
+
+def to_job_summary(values: Sequence[Any]) -> JobSummary:
+    """Build a JobSummary from a row of JOB_SUMMARY_COLUMNS values."""
+    data = dict(zip(_JOB_SUMMARY_FIELDS, values, strict=True))
+
+    snippet = data["description_snippet"]
+    if snippet and len(snippet) > JOB_SUMMARY_SNIPPET_LENGTH:
+        data["description_snippet"] = snippet[:JOB_SUMMARY_SNIPPET_LENGTH] + "..."
+    data["skills_required"] = (data["skills_required"] or [])[:JOB_SUMMARY_SKILLS]
+    data["salary_currency"] = data["salary_currency"] or "USD"
+
+    return JobSummary(**data)
+
+
+def build_job_facet_query(
+    dialect_name: str,
+    fulltext_enabled: bool,
+    limit: int = FACET_LIMIT,
+    **filters,
+):
+    """
+    Statement of the top ``limit`` ``(facet, value, job_count)`` rows.
+
+    Without filters, SQLite reads the trigger-maintained job_facet_counts;
+    otherwise every facet is counted in one grouped query over the listings
+    matching ``filters`` (see build_job_search_query).
+    """
+    if dialect_name == "sqlite" and not any(filters.values()):
+        return top_facet_counts(materialized_facet_counts(), limit)
+
+    query_obj, _ = build_job_search_query(
+        select(JobListingDB), fulltext_enabled, **filters
+    )
+    return top_facet_counts(facet_count_query(facet_source(query_obj)), limit)
+
+
+def recent_jobs_query(query_obj, limit: int):
+    """Active listings, newest first."""
+    return (
+        query_obj.filter(JobListingDB.status == JobStatus.ACTIVE)
+        .order_by(desc(JobListingDB.created_at))
+        .limit(limit)
+    )
+
+
+def company_jobs_query(query_obj, company: str, limit: int):
+    """A company's active listings, newest first."""
+    return (
+        query_obj.filter(
+            and_(
+                company_filter([company]),
+                JobListingDB.status == JobStatus.ACTIVE,
+            )
+        )
+        .order_by(desc(JobListingDB.created_at))
+        .limit(limit)
+    )
+
+
+def archived_jobs_query(query_obj, company: Optional[str], limit: int, offset: int):
+    """Archived listings, optionally of one company, most recently archived first."""
+    if company:
+        query_obj = query_obj.filter(
+            company_filter([company], JobListingArchiveDB.company_id)
+        )
+    return (
+        query_obj.order_by(desc(JobListingArchiveDB.archived_at))
+        .offset(offset)
+        .limit(limit)
+    )
+
+
+# ==================== Saved Jobs ====================
+
+
+def active_saved_job_query(query_obj, job_id: str, user_profile_id: str):
+    """The user's currently saved entry for a job."""
+    return query_obj.filter(
+        and_(
+            SavedJobDB.job_id == job_id,
+            SavedJobDB.user_profile_id == user_profile_id,
+            SavedJobDB.status == SavedJobStatus.SAVED,
+        )
+    ).limit(1)
+
+
+def saved_jobs_query(
+    query_obj, user_profile_id: str, status: SavedJobStatus, limit: int
+):
+    """
+    A user's saved jobs joined to their listings, most recently saved first.
+
+    ``query_obj`` selects SavedJobDB followed by JobListingDB or
+    JOB_SUMMARY_COLUMNS.
+    """
+    return (
+        query_obj.join(JobListingDB, SavedJobDB.job_id == JobListingDB.id)
+        .filter(
+            and_(
+                SavedJobDB.user_profile_id == user_profile_id,
+                SavedJobDB.status == status,
+            )
+        )
+        .order_by(desc(SavedJobDB.saved_date))
+        .limit(limit)
+    )
+
+
+def to_saved_job_entry(saved_job_db: SavedJobDB, job: BaseModel) -> Dict[str, Any]:
+    """Entry of get_saved_jobs / get_saved_job_summaries."""
+    saved_job = sqlalchemy_to_pydantic(saved_job_db, SavedJob, trusted=True)
+    return {"saved_job": saved_job.dict(), "job": job.dict()}
+
+
+# ==================== Resumes ====================
+
+
+def user_resumes_query(query_obj, user_id: str, status: Optional[str] = None):
+    """A user's resumes, optionally with one status (unordered, for counting)."""
+    query_obj = query_obj.filter(ResumeDB.user_id == user_id)
+    if status:
+        query_obj = query_obj.filter(ResumeDB.status == status)
+    return query_obj
+
+
+def resumes_by_type_query(query_obj, user_id: str, resume_type: str, limit: int):
+    """A user's resumes of one type, most recently updated first."""
+    return (
+        query_obj.filter(
+            and_(
+                ResumeDB.user_id == user_id,
+                ResumeDB.resume_type == resume_type,
+            )
+        )
+        .order_by(desc(ResumeDB.updated_at))
+        .limit(limit)
+    )
+
+
+# ==================== Applications ====================
+
+# Newest applications first; the id breaks created_at ties
+APPLICATION_SORT_KEYS: SortKeys = [
+    (JobApplicationDB.created_at, True),
+    (JobApplicationDB.id, True),
+]
+
+
+def application_by_job_and_user_query(query_obj, job_id: str, user_profile_id: str):
+    """A user's application to a job."""
+    return query_obj.filter(
+        and_(
+            JobApplicationDB.job_id == job_id,
+            JobApplicationDB.user_profile_id == user_profile_id,
+        )
+    ).limit(1)
+
+
+def user_applications_query(
+    query_obj,
+    user_profile_id: str,
+    status: Optional[ApplicationStatus] = None,
+    with_jobs: bool = False,
+):
+    """
+    A user's applications, optionally with one status (unordered).
+
+    With ``with_jobs``, ``query_obj`` selects JobApplicationDB and
+    JobListingDB, and listings are outer-joined so applications to deleted
+    jobs are kept.
+    """
+    if with_jobs:
+        query_obj = query_obj.outerjoin(
+            JobListingDB, JobApplicationDB.job_id == JobListingDB.id
+        )
+    query_obj = query_obj.filter(JobApplicationDB.user_profile_id == user_profile_id)
+    if status:
+        query_obj = query_obj.filter(JobApplicationDB.status == status)
+    return query_obj
+
+
+def applications_count_signature(
+    user_profile_id: str, status: Optional[ApplicationStatus]
+) -> str:
+    """Count-cache key of user_applications_query."""
+    return filter_signature(
+        "applications", user_profile_id=str(user_profile_id), status=status
+    )
+
+
+def job_applications_query(query_obj, job_id: str):
+    """All applications to a job, newest first."""
+    return query_obj.filter(JobApplicationDB.job_id == job_id).order_by(
+        desc(JobApplicationDB.created_at)
+    )
+
+
+def to_application_with_job(
+    app_db: JobApplicationDB, job_db: Optional[JobListingDB]
+) -> Tuple[JobApplication, Optional[JobListing]]:
+    """Item of get_applications_with_jobs; the job is None once deleted."""
+    return (
+        sqlalchemy_to_pydantic(app_db, JobApplication, trusted=True),
+        (
+            sqlalchemy_to_pydantic(job_db, JobListing, trusted=True)
+            if job_db is not None
+            else None
+        ),
+    )
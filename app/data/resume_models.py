@@ -14,9 +14,11 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -282,6 +284,9 @@ class ResumeDB(Base):
     """Resume database model"""
 
     __tablename__ = "resumes"
+    __table_args__ = (
+        Index("ix_resumes_user_updated_at", "user_id", text("updated_at DESC")),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String, ForeignKey("user_profiles.id"), nullable=False)
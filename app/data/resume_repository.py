@@ -10,6 +10,7 @@ from uuid import uuid4
 from sqlalchemy import and_, desc, or_
 from sqlalchemy.orm import Session
 
+from app.data.cache import get_record_cache
 from app.data.models import JobListingDB, UserProfileDB
 from app.data.resume_models import (
     ATSScore,
@@ -143,6 +144,7 @@ class ResumeRepository:
             resume_db.version += 1  # Increment version
 
             self.session.commit()
+            self._invalidate_cached_resume(resume_id)
 
             logger.info(f"Updated resume: {resume_id}")
             return self._db_to_pydantic(resume_db)
@@ -166,6 +168,7 @@ class ResumeRepository:
 
             self.session.delete(resume_db)
             self.session.commit()
+            self._invalidate_cached_resume(resume_id)
 
             logger.info(f"Deleted resume: {resume_id}")
             return True
@@ -614,6 +617,11 @@ class ResumeRepository:
     # Utility Methods
     # =====================================
 
+    def _invalidate_cached_resume(self, resume_id: str):
+        """Drop a resume from the record cache behind ResumeRepository.get_resume."""
+        engine = self.session.get_bind().engine
+        get_record_cache(engine, "resumes").invalidate(str(resume_id))
+
     def _serialize_dates_in_dict(self, data: Any) -> Any:
         """Recursively convert date objects to ISO format strings for JSON serialization."""
         if isinstance(data, dict):
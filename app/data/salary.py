@@ -0,0 +1,106 @@
+"""
+JobPilot Salary Normalization
+Conversion of posted salaries in any pay period and currency to annual USD,
+stored in job_listings.salary_annual_min / salary_annual_max for filtering
+and sorting.
+"""
+
+from typing import Any, Optional, Tuple
+
+# Pay periods per year, for a full-time schedule
+PERIODS_PER_YEAR = {
+    "hour": 2080.0,  # 40 hours x 52 weeks
+    "day": 260.0,
+    "week": 52.0,
+    "month": 12.0,
+    "year": 1.0,
+}
+
+# Spellings used by job boards for each pay period
+PERIOD_ALIASES = {
+    "hourly": "hour",
+    "hr": "hour",
+    "daily": "day",
+    "weekly": "week",
+    "monthly": "month",
+    "yearly": "year",
+    "annual": "year",
+    "annually": "year",
+    "annum": "year",
+}
+
+# Approximate USD value of one unit of each currency. Refresh occasionally;
+# annual figures only need to rank and filter salaries sensibly.
+USD_EXCHANGE_RATES = {
+    "USD": 1.0,
+    "EUR": 1.08,
+    "GBP": 1.27,
+    "CHF": 1.13,
+    "CAD": 0.73,
+    "AUD": 0.66,
+    "NZD": 0.60,
+    "SGD": 0.74,
+    "JPY": 0.0067,
+    "INR": 0.012,
+    "MXN": 0.058,
+    "BRL": 0.19,
+    "PLN": 0.25,
+    "SEK": 0.095,
+    "NOK": 0.094,
+    "DKK": 0.145,
+}
+
+# With no posted period, amounts up to this are taken as hourly rates
+HOURLY_AMOUNT_CEILING = 500.0
+
+
+def normalize_period(period: Any) -> Optional[str]:
+    """Canonical pay period ("hour" ... "year") for a SalaryPeriod or string."""
+    if period is None:
+        return None
+    value = str(getattr(period, "value", period)).strip().lower()
+    value = PERIOD_ALIASES.get(value, value)
+    return value if value in PERIODS_PER_YEAR else None
+
+
+def annualize(
+    amount: Optional[float], period: Any = None, currency: Optional[str] = "USD"
+) -> Optional[float]:
+    """
+    ``amount`` per ``period`` in ``currency`` as annual USD.
+
+    Returns None for a missing amount or an unknown currency.
+    """
+    if amount is None:
+        return None
+    rate = USD_EXCHANGE_RATES.get((currency or "USD").upper())
+    if rate is None:
+        return None
+
+    period = normalize_period(period)
+    if period is None:
+        period = "hour" if amount <= HOURLY_AMOUNT_CEILING else "year"
+    return round(amount * PERIODS_PER_YEAR[period] * rate, 2)
+
+
+def annual_salary_range(
+    salary_min: Optional[float],
+    salary_max: Optional[float],
+    period: Any = None,
+    currency: Optional[str] = "USD",
+) -> Tuple[Optional[float], Optional[float]]:
+    """
+    ``(salary_annual_min, salary_annual_max)`` for a posted salary range.
+
+    A one-sided range fills both ends, so "at least X" filters compare
+    against salary_annual_max and "at most X" against salary_annual_min.
+    """
+    values = [
+        annualize(amount, period, currency)
+        for amount in (salary_min, salary_max)
+        if amount is not None
+    ]
+    values = [value for value in values if value is not None]
+    if not values:
+        return None, None
+    return min(values), max(values)
@@ -0,0 +1,459 @@
+"""
+JobPilot Segment Vector Index
+Exact cosine search over append-only segment files opened with np.memmap,
+so vectors open without being read and are shared by every worker process
+through the OS page cache.
+"""
+
+import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.data.embedding_index import normalize_rows
+from app.data.vector_index import Accept, ExactVectorIndex, SearchHits, select_hits
+
+try:
+    import fcntl
+except ImportError:  # Windows: manifest updates are not locked across processes
+    fcntl = None
+
+# Pending vectors kept in memory before they are written out as a segment
+SEGMENT_FLUSH_ROWS = 10_000
+# Segments (or deleted-row fraction) above which compaction is worthwhile
+SEGMENT_MAX_SEGMENTS = 8
+SEGMENT_MAX_DELETED_FRACTION = 0.2
+# Rows copied per block while compaction merges segments
+_COMPACT_BLOCK = 65_536
+
+MANIFEST_NAME = "manifest.json"
+_LOCK_NAME = "manifest.lock"
+_FORMAT_VERSION = 1
+
+# Cosine similarities are >= -1, so this threshold only drops deleted rows
+_LIVE_THRESHOLD = -2.0
+
+
+class _Segment:
+    """
+    One immutable segment: a float32 matrix, an id table and a tombstone bitmap.
+
+    ``<name>.vectors.npy`` and ``<name>.ids.npy`` are never written after
+    the segment is created; ``<name>.tombstones`` holds one bit per row and
+    is updated in place, so deletes are visible to every process mapping it.
+    """
+
+    def __init__(self, directory: str, name: str, writable: bool):
+        base = os.path.join(directory, name)
+        self.name = name
+        self.vectors = np.load(f"{base}.vectors.npy", mmap_mode="r")
+        self.ids = np.load(f"{base}.ids.npy", mmap_mode="r")
+        self.tombstones = np.memmap(
+            f"{base}.tombstones", dtype=np.uint8, mode="r+" if writable else "r"
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def deleted(self) -> np.ndarray:
+        """Boolean mask of the deleted rows."""
+        return np.unpackbits(self.tombstones, count=len(self), bitorder="little").view(
+            bool
+        )
+
+    def delete(self, row: int):
+        self.tombstones[row >> 3] |= np.uint8(1 << (row & 7))
+
+    @staticmethod
+    def files(directory: str, name: str) -> List[str]:
+        base = os.path.join(directory, name)
+        return [f"{base}.vectors.npy", f"{base}.ids.npy", f"{base}.tombstones"]
+
+    @staticmethod
+    def create(directory: str, name: str, ids: np.ndarray, vectors) -> None:
+        """
+        Write a segment from ``ids`` and normalized ``vectors``.
+
+        ``vectors`` is either a matrix or a callable filling the open
+        output matrix, so compaction can copy rows without holding them all.
+        """
+        vectors_path, ids_path, tombstones_path = _Segment.files(directory, name)
+        output = np.lib.format.open_memmap(
+            vectors_path, mode="w+", dtype=np.float32, shape=(len(ids), _width(vectors))
+        )
+        if callable(vectors):
+            vectors(output)
+        else:
+            output[:] = vectors
+        output.flush()
+        del output
+        np.save(ids_path, np.asarray(ids, dtype=str))
+        with open(tombstones_path, "wb") as file:
+            file.write(bytes((len(ids) + 7) // 8))
+
+
+def _width(vectors) -> int:
+    return vectors.width if callable(vectors) else vectors.shape[1]
+
+
+class _Rows:
+    """Ids of the rows of several segments and the pending buffer, by global row."""
+
+    def __init__(self, parts: List[np.ndarray]):
+        self._parts = parts
+        self._starts = np.cumsum([0] + [len(part) for part in parts])
+
+    def __getitem__(self, row: int) -> str:
+        part = int(np.searchsorted(self._starts, row, side="right")) - 1
+        return str(self._parts[part][row - self._starts[part]])
+
+
+class SegmentVectorIndex:
+    """
+    Exact cosine search over vectors keyed by id, persisted as segments.
+
+    New vectors collect in an in-memory buffer until ``flush`` (or
+    ``flush_rows`` pending vectors) writes them out as an immutable
+    segment. Replacing or removing a vector that is already on disk sets
+    its tombstone bit. ``manifest.json`` lists the live segments and is
+    replaced atomically, so opening the index only maps files: startup is
+    O(1) in the number of vectors, and every process that opens the same
+    directory shares one copy of the vectors in the page cache.
+
+    ``compact`` merges the segments into one, dropping deleted rows; it can
+    run in a background thread while the index is searched and written.
+    Any number of processes may search an index. Writes should come from
+    one process at a time: flushes and compactions from other processes
+    are picked up on the next call, but deletes racing a compaction in
+    another process can be lost.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        dimension: int,
+        flush_rows: int = SEGMENT_FLUSH_ROWS,
+        max_segments: int = SEGMENT_MAX_SEGMENTS,
+        writable: bool = True,
+    ):
+        self.directory = directory
+        self.dimension = dimension
+        self.flush_rows = flush_rows
+        self.max_segments = max_segments
+        self.writable = writable
+
+        self._pending = ExactVectorIndex(dimension)
+        self._segments: List[_Segment] = []
+        # id -> (segment, row) of live rows on disk, built on the first write
+        self._locations: Optional[Dict[str, Tuple[_Segment, int]]] = None
+        self._manifest_stamp = None
+        self._lock = threading.RLock()
+        self._compaction: Optional[threading.Thread] = None
+
+        if writable:
+            os.makedirs(directory, exist_ok=True)
+        self.refresh()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.refresh()
+            deleted = sum(int(segment.deleted().sum()) for segment in self._segments)
+            stored = sum(len(segment) for segment in self._segments)
+            return stored - deleted + len(self._pending)
+
+    def __contains__(self, vector_id: str) -> bool:
+        with self._lock:
+            self.refresh()
+            return vector_id in self._pending or vector_id in self._on_disk()
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    # ==================== Manifest ====================
+
+    @property
+    def _manifest_path(self) -> str:
+        return os.path.join(self.directory, MANIFEST_NAME)
+
+    def _stamp(self):
+        try:
+            stat = os.stat(self._manifest_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _read_manifest(self) -> List[str]:
+        try:
+            with open(self._manifest_path) as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            return []
+        if manifest["version"] != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported vector segment format in {self.directory}")
+        if manifest["dimension"] != self.dimension:
+            raise ValueError(
+                f"Vector segments in {self.directory} hold "
+                f"{manifest['dimension']}-dim vectors, expected {self.dimension}"
+            )
+        return manifest["segments"]
+
+    def _write_manifest(self, names: List[str]):
+        manifest = {
+            "version": _FORMAT_VERSION,
+            "dimension": self.dimension,
+            "segments": names,
+        }
+        temp_path = f"{self._manifest_path}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(manifest, file)
+        os.replace(temp_path, self._manifest_path)
+
+    @contextmanager
+    def _manifest_lock(self):
+        """Serialize manifest updates between processes (where fcntl exists)."""
+        with open(os.path.join(self.directory, _LOCK_NAME), "a") as file:
+            if fcntl is not None:
+                fcntl.flock(file, fcntl.LOCK_EX)
+            yield
+
+    def refresh(self) -> bool:
+        """Reopen the segments if another writer changed the manifest."""
+        with self._lock:
+            stamp = self._stamp()
+            if stamp == self._manifest_stamp:
+                return False
+            self._open(self._read_manifest())
+            self._manifest_stamp = stamp
+            return True
+
+    def _open(self, names: List[str]):
+        opened = {segment.name: segment for segment in self._segments}
+        self._segments = [
+            opened.get(name) or _Segment(self.directory, name, self.writable)
+            for name in names
+        ]
+        self._locations = None
+
+    def _on_disk(self) -> Dict[str, Tuple[_Segment, int]]:
+        if self._locations is None:
+            locations = {}
+            for segment in self._segments:
+                deleted = segment.deleted()
+                for row in np.flatnonzero(~deleted).tolist():
+                    locations[str(segment.ids[row])] = (segment, row)
+            self._locations = locations
+        return self._locations
+
+    # ==================== Writes ====================
+
+    def add(self, ids: Sequence[str], vectors) -> None:
+        """Add or replace the vectors of ``ids``; they are searchable at once."""
+        with self._lock:
+            self.refresh()
+            self._delete_on_disk(ids)
+            self._pending.add(ids, vectors)
+            if len(self._pending) >= self.flush_rows:
+                self.flush()
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """Remove the vectors of ``ids``; returns how many were stored."""
+        ids = list(ids)
+        with self._lock:
+            self.refresh()
+            return self._pending.remove(ids) + self._delete_on_disk(ids)
+
+    def _delete_on_disk(self, ids: Iterable[str]) -> int:
+        if not self._segments:
+            return 0
+        locations = self._on_disk()
+        removed = 0
+        for vector_id in ids:
+            location = locations.pop(vector_id, None)
+            if location is not None:
+                segment, row = location
+                segment.delete(row)
+                removed += 1
+        return removed
+
+    def flush(self) -> None:
+        """Write the pending vectors out as a new segment, and any deletes."""
+        with self._lock:
+            if not self.writable and not len(self._pending):
+                return
+            self._check_writable()
+            for segment in self._segments:
+                segment.tombstones.flush()
+            if not len(self._pending):
+                return
+            name = f"seg-{uuid.uuid4().hex}"
+            ids = np.array(list(self._pending.ids), dtype=str)
+            _Segment.create(self.directory, name, ids, self._pending.vectors)
+
+            with self._manifest_lock():
+                self._open(self._read_manifest() + [name])
+                self._write_manifest([segment.name for segment in self._segments])
+                self._manifest_stamp = self._stamp()
+            self._pending = ExactVectorIndex(self.dimension)
+
+    def _check_writable(self):
+        if not self.writable:
+            raise PermissionError(f"Vector segments in {self.directory} are read-only")
+
+    # ==================== Compaction ====================
+
+    def needs_compaction(self) -> bool:
+        """Whether there are enough segments or deleted rows to merge."""
+        with self._lock:
+            if len(self._segments) > self.max_segments:
+                return True
+            stored = sum(len(segment) for segment in self._segments)
+            if not stored:
+                return False
+            deleted = sum(int(segment.deleted().sum()) for segment in self._segments)
+            return deleted > SEGMENT_MAX_DELETED_FRACTION * stored
+
+    def compact(self) -> bool:
+        """
+        Merge every segment into one without the deleted rows.
+
+        The merge reads the segments outside the lock, so searches and
+        writes continue meanwhile; rows deleted during the merge are carried
+        over to the merged segment when it replaces the old ones.
+        """
+        self._check_writable()
+        with self._lock:
+            self.refresh()
+            merging = list(self._segments)
+            if not merging:
+                return False
+            kept = [np.flatnonzero(~segment.deleted()) for segment in merging]
+
+        total = sum(len(rows) for rows in kept)
+        name = None
+        if total:
+            name = f"seg-{uuid.uuid4().hex}"
+            ids = np.concatenate(
+                [segment.ids[rows] for segment, rows in zip(merging, kept, strict=True)]
+            )
+            _Segment.create(self.directory, name, ids, _Copier(merging, kept))
+
+        with self._lock:
+            with self._manifest_lock():
+                current = self._read_manifest()
+                merged = {segment.name for segment in merging}
+                names = ([name] if name else []) + [
+                    other for other in current if other not in merged
+                ]
+                if name:
+                    merged_segment = _Segment(self.directory, name, True)
+                    offset = 0
+                    for segment, rows in zip(merging, kept, strict=True):
+                        for row in np.flatnonzero(segment.deleted()[rows]).tolist():
+                            merged_segment.delete(offset + row)
+                        offset += len(rows)
+                    merged_segment.tombstones.flush()
+                    del merged_segment
+                self._open(names)
+                self._write_manifest(names)
+                self._manifest_stamp = self._stamp()
+
+        for segment in merging:
+            for path in _Segment.files(self.directory, segment.name):
+                try:
+                    os.remove(path)
+                except OSError:  # Still mapped on Windows; left as garbage
+                    pass
+        return True
+
+    def compact_in_background(self) -> bool:
+        """Start ``compact`` in a daemon thread if worthwhile and not running."""
+        with self._lock:
+            if self._compaction is not None and self._compaction.is_alive():
+                return False
+            if not self.needs_compaction():
+                return False
+            self._compaction = threading.Thread(
+                target=self.compact, name="vector-segment-compaction", daemon=True
+            )
+            self._compaction.start()
+            return True
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join(timeout)
+
+    # ==================== Search ====================
+
+    def search(
+        self,
+        query,
+        k: int,
+        threshold: Optional[float] = None,
+        accept: Optional[Accept] = None,
+    ) -> SearchHits:
+        """
+        The ``k`` stored vectors most similar to ``query``.
+
+        Same contract as ExactVectorIndex.search; each segment is scored
+        with one matrix-vector product straight from the mapped file.
+        """
+        if k < 1:
+            return []
+        query = normalize_rows(np.reshape(query, (1, -1)))[0]
+
+        with self._lock:
+            self.refresh()
+            parts, scores = [], []
+            for segment in self._segments:
+                segment_scores = np.asarray(segment.vectors @ query)
+                segment_scores[segment.deleted()] = -np.inf
+                parts.append(segment.ids)
+                scores.append(segment_scores)
+            if len(self._pending):
+                parts.append(self._pending.ids)
+                scores.append(self._pending.vectors @ query)
+
+        if not scores:
+            return []
+        if threshold is None:
+            threshold = _LIVE_THRESHOLD
+        return select_hits(_Rows(parts), np.concatenate(scores), k, threshold, accept)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self.refresh()
+            return {
+                "segments": len(self._segments),
+                "stored_rows": sum(len(segment) for segment in self._segments),
+                "deleted_rows": sum(
+                    int(segment.deleted().sum()) for segment in self._segments
+                ),
+                "pending": len(self._pending),
+            }
+
+
+class _Copier:
+    """Fills a merged segment's matrix with the kept rows, a block at a time."""
+
+    def __init__(self, segments: List[_Segment], kept: List[np.ndarray]):
+        self.segments = segments
+        self.kept = kept
+        self.width = segments[0].vectors.shape[1]
+
+    def __call__(self, output: np.ndarray):
+        offset = 0
+        for segment, rows in zip(self.segments, self.kept, strict=True):
+            for start in range(0, len(rows), _COMPACT_BLOCK):
+                block = rows[start : start + _COMPACT_BLOCK]
+                output[offset : offset + len(block)] = segment.vectors[block]
+                offset += len(block)
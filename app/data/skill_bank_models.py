@@ -14,6 +14,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     String,
     Text,
 )
@@ -391,6 +392,7 @@ class EnhancedSkillBankDB(Base):
     """Enhanced skills bank database model."""
 
     __tablename__ = "skill_banks"
+    __table_args__ = (Index("ix_skill_banks_user_id", "user_id"),)
 
     id = Column(String, primary_key=True, default=lambda: str(uuid4()))
     user_id = Column(String, ForeignKey("user_profiles.id"), nullable=False)
@@ -18,9 +18,9 @@ class DateTimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 
-from app.data.database import DatabaseManager
+from app.data.async_database import AsyncDatabaseManager
 from app.data.models import UserProfileDB
 from app.data.skill_bank_models import (
     Certification,
@@ -40,25 +40,30 @@ from app.data.skill_bank_models import (
 class SkillBankRepository:
     """Repository for skill bank operations."""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: AsyncDatabaseManager):
         self.db_manager = db_manager
 
-    def _get_session(self) -> Session:
-        """Get database session."""
+    def _get_session(self):
+        """Get async database session."""
         return self.db_manager.get_session()
 
+    @staticmethod
+    def _skill_bank_query(user_id: str):
+        """Select the skill bank row for a user."""
+        return (
+            select(EnhancedSkillBankDB)
+            .filter(EnhancedSkillBankDB.user_id == user_id)
+            .limit(1)
+        )
+
     # ===========================================
     # MAIN SKILL BANK OPERATIONS
     # ===========================================
 
     async def get_skill_bank(self, user_id: str) -> Optional[SkillBank]:
         """Get user's skill bank."""
-        with self._get_session() as session:
-            skill_bank_db = (
-                session.query(EnhancedSkillBankDB)
-                .filter(EnhancedSkillBankDB.user_id == user_id)
-                .first()
-            )
+        async with self._get_session() as session:
+            skill_bank_db = await session.scalar(self._skill_bank_query(user_id))
 
             if not skill_bank_db:
                 return None
@@ -67,13 +72,9 @@ class SkillBankRepository:
 
     async def create_skill_bank(self, user_id: str) -> SkillBank:
         """Create a new skill bank for user."""
-        with self._get_session() as session:
+        async with self._get_session() as session:
             # Check if skill bank already exists
-            existing = (
-                session.query(EnhancedSkillBankDB)
-                .filter(EnhancedSkillBankDB.user_id == user_id)
-                .first()
-            )
+            existing = await session.scalar(self._skill_bank_query(user_id))
 
             if existing:
                 return self._db_to_pydantic(existing)
@@ -85,8 +86,8 @@ class SkillBankRepository:
             skill_bank_db = self._pydantic_to_db(skill_bank)
 
             session.add(skill_bank_db)
-            session.commit()
-            session.refresh(skill_bank_db)
+            await session.flush()
+            await session.refresh(skill_bank_db)
 
             return self._db_to_pydantic(skill_bank_db)
 
@@ -101,12 +102,8 @@ class SkillBankRepository:
         self, user_id: str, updates: Dict[str, Any]
     ) -> SkillBank:
         """Update skill bank fields."""
-        with self._get_session() as session:
-            skill_bank_db = (
-                session.query(EnhancedSkillBankDB)
-                .filter(EnhancedSkillBankDB.user_id == user_id)
-                .first()
-            )
+        async with self._get_session() as session:
+            skill_bank_db = await session.scalar(self._skill_bank_query(user_id))
 
             if not skill_bank_db:
                 # Create new skill bank if it doesn't exist
@@ -129,8 +126,8 @@ class SkillBankRepository:
                         setattr(skill_bank_db, field, value)
 
             skill_bank_db.updated_at = datetime.utcnow()
-            session.commit()
-            session.refresh(skill_bank_db)
+            await session.flush()
+            await session.refresh(skill_bank_db)
 
             return self._db_to_pydantic(skill_bank_db)
 
@@ -510,10 +507,8 @@ class SkillBankRepository:
 
     async def migrate_from_user_profile(self, user_id: str) -> SkillBank:
         """Migrate skills data from UserProfile to SkillBank."""
-        with self._get_session() as session:
-            user_profile = (
-                session.query(UserProfileDB).filter(UserProfileDB.id == user_id).first()
-            )
+        async with self._get_session() as session:
+            user_profile = await session.get(UserProfileDB, user_id)
             if not user_profile:
                 raise ValueError(f"User profile with ID '{user_id}' not found")
 
@@ -0,0 +1,215 @@
+"""
+JobPilot Table Statistics
+Row counts of every table, loaded with one UNION ALL query and kept current
+from the inserts and deletes this process commits.
+"""
+
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+from sqlalchemy import event, func, inspect, literal, select, union_all
+from sqlalchemy.engine import Connection, Engine
+
+from app.data.base import Base
+from app.data.engine import database_key
+
+# Counts are recomputed at least this often, which bounds drift from writes
+# the hooks cannot see (other processes, statements with unknown row counts)
+TABLE_STATS_TTL_SECONDS = 60.0
+
+_DML_PATTERN = re.compile(
+    r"""^\s*(INSERT|REPLACE|DELETE)\b(?:\s+OR\s+(\w+))?\s+(?:INTO|FROM)\s+[`"\[]?(\w+)""",
+    re.IGNORECASE,
+)
+_UNKNOWN_ROWCOUNT_PATTERN = re.compile(
+    r"\bDO\s+UPDATE\b|\bRETURNING\b|\bON\s+DUPLICATE\b", re.IGNORECASE
+)
+_PENDING_KEY = "table_stats_pending"
+
+
+def count_rows(conn: Connection, table_names: Iterable[str]) -> Dict[str, int]:
+    """Row counts of ``table_names`` with a single UNION ALL query."""
+    tables = [Base.metadata.tables[name] for name in table_names]
+    if not tables:
+        return {}
+
+    counts = [
+        select(
+            literal(table.name).label("table_name"), func.count().label("row_count")
+        ).select_from(table)
+        for table in tables
+    ]
+    statement = union_all(*counts) if len(counts) > 1 else counts[0]
+    return {name: count for name, count in conn.execute(statement)}
+
+
+class TableStats:
+    """
+    Row counts for the tables of one database.
+
+    The first read counts every table with :func:`count_rows`. After that,
+    INSERT and DELETE statements committed through this process's engines
+    adjust the counts by their row counts, so dashboard polling does not
+    touch the tables. Statements whose effect is unknown (upserts, REPLACE)
+    mark their table for a recount on the next read, and everything is
+    recounted after ``ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = TABLE_STATS_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        self._stale: Set[str] = set()
+        self._expires_at = 0.0
+        self._generation = 0
+
+        # Counters
+        self.reads = 0
+        self.full_refreshes = 0
+        self.table_refreshes = 0
+
+    def tracks(self, table_name: str) -> bool:
+        return table_name in self._counts
+
+    def apply(self, deltas: Dict[str, Optional[int]]):
+        """Apply committed row-count changes; None marks a table for recount."""
+        with self._lock:
+            self._generation += 1
+            for table_name, delta in deltas.items():
+                if table_name not in self._counts:
+                    continue
+                if delta is None:
+                    self._stale.add(table_name)
+                else:
+                    self._counts[table_name] += delta
+
+    def invalidate(self):
+        """Recount every table on the next read."""
+        with self._lock:
+            self._expires_at = 0.0
+
+    def counts(self, engine: Engine) -> Dict[str, int]:
+        """Row count of every existing table, recounting only what is stale."""
+        with self._lock:
+            self.reads += 1
+            expired = self._clock() >= self._expires_at
+            stale = set(self._stale)
+            generation = self._generation
+            if not expired and not stale:
+                return dict(self._counts)
+
+        with engine.connect() as conn:
+            if expired:
+                existing = set(inspect(conn).get_table_names())
+                names = [name for name in Base.metadata.tables if name in existing]
+            else:
+                names = sorted(stale)
+            counted = count_rows(conn, names)
+
+        with self._lock:
+            if expired:
+                self._counts = counted
+                self._stale.clear()
+                self._expires_at = self._clock() + self.ttl_seconds
+                self.full_refreshes += 1
+            else:
+                self._counts.update(counted)
+                self._stale.difference_update(counted)
+                self.table_refreshes += 1
+
+            # A commit landed while counting; its delta may be counted twice
+            if generation != self._generation:
+                self._stale.update(counted)
+            return dict(self._counts)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "tables": len(self._counts),
+                "stale_tables": len(self._stale),
+                "reads": self.reads,
+                "full_refreshes": self.full_refreshes,
+                "table_refreshes": self.table_refreshes,
+            }
+
+
+# ==================== Registry & Write Hooks ====================
+
+_table_stats: Dict[str, TableStats] = {}
+_registry_lock = threading.Lock()
+
+
+def get_table_stats(engine: Engine) -> TableStats:
+    """
+    Get the process-wide table statistics of ``engine``'s database.
+
+    Sync engines and the ``sync_engine`` of an AsyncEngine on the same
+    database share one instance, so writes through either are counted.
+    """
+    key = database_key(engine)
+    with _registry_lock:
+        table_stats = _table_stats.get(key)
+        if table_stats is None:
+            table_stats = _table_stats[key] = TableStats()
+        return table_stats
+
+
+def _tracking(engine: Engine) -> Optional[TableStats]:
+    if not _table_stats:
+        return None
+    return _table_stats.get(database_key(engine))
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_row_changes(conn, cursor, statement, parameters, context, executemany):
+    table_stats = _tracking(conn.engine)
+    if table_stats is None:
+        return
+
+    match = _DML_PATTERN.match(statement)
+    if not match or not table_stats.tracks(match.group(3)):
+        return
+
+    verb, conflict, table_name = match.groups()
+    verb = verb.upper()
+    rowcount = cursor.rowcount
+    unknown = (
+        rowcount is None
+        or rowcount < 0
+        or verb == "REPLACE"
+        or (conflict or "").upper() == "REPLACE"
+        or _UNKNOWN_ROWCOUNT_PATTERN.search(statement) is not None
+    )
+
+    pending = conn.info.setdefault(_PENDING_KEY, {})
+    if unknown or pending.get(table_name, 0) is None:
+        pending[table_name] = None
+    else:
+        delta = -rowcount if verb == "DELETE" else rowcount
+        pending[table_name] = pending.get(table_name, 0) + delta
+
+
+@event.listens_for(Engine, "begin")
+def _reset_row_changes(conn):
+    conn.info.pop(_PENDING_KEY, None)
+
+
+@event.listens_for(Engine, "rollback")
+def _discard_row_changes(conn):
+    conn.info.pop(_PENDING_KEY, None)
+
+
+@event.listens_for(Engine, "commit")
+def _apply_row_changes(conn):
+    pending = conn.info.pop(_PENDING_KEY, None)
+    if pending:
+        table_stats = _tracking(conn.engine)
+        if table_stats is not None:
+            table_stats.apply(pending)
@@ -0,0 +1,173 @@
+"""
+JobPilot Vector Index
+Exact cosine-similarity search over an L2-normalized float32 matrix, for
+the in-process vector store backends.
+"""
+
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.data.embedding_index import normalize_rows
+
+# Candidates examined per accepted result before widening a filtered search
+FILTER_OVERFETCH = 4
+
+SearchHits = List[Tuple[str, float]]
+# Filter over a batch of candidate ids, returning one keep flag per id
+Accept = Callable[[List[str]], Sequence[bool]]
+
+
+def top_k(scores: np.ndarray, k: int, threshold: Optional[float] = None) -> np.ndarray:
+    """
+    Positions of the ``k`` highest ``scores``, highest first.
+
+    Uses ``np.argpartition`` so only the selected scores are sorted.
+    Scores below ``threshold`` are never returned.
+    """
+    if threshold is not None:
+        k = min(k, int(np.count_nonzero(scores >= threshold)))
+    k = min(k, len(scores))
+    if k < 1:
+        return np.empty(0, dtype=np.intp)
+
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+class ExactVectorIndex:
+    """
+    Brute-force cosine search over vectors keyed by id.
+
+    Vectors are L2-normalized into one contiguous float32 matrix with a
+    parallel id array, so scoring a query is a single matrix-vector
+    product. Adding an existing id replaces its vector; removing moves the
+    last row into the hole, so both are O(1) per vector apart from
+    occasional growth of the matrix.
+    """
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self._vectors = np.empty((0, dimension), dtype=np.float32)
+        self._ids = np.empty(0, dtype=object)
+        self._rows = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, vector_id: str) -> bool:
+        return vector_id in self._rows
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Ids of the stored vectors, in row order."""
+        return self._ids[: self._size]
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """The normalized matrix, row ``i`` belonging to ``ids[i]``."""
+        return self._vectors[: self._size]
+
+    def add(self, ids: Sequence[str], vectors) -> None:
+        """Add or replace the vectors of ``ids``."""
+        vectors = normalize_rows(np.reshape(vectors, (len(ids), -1)))
+        if vectors.shape[1] != self.dimension:
+            raise ValueError(
+                f"Expected {self.dimension}-dim vectors, got {vectors.shape[1]}"
+            )
+
+        self._reserve(self._size + len(ids))
+        rows = np.empty(len(ids), dtype=np.intp)
+        for position, vector_id in enumerate(ids):
+            row = self._rows.get(vector_id)
+            if row is None:
+                row = self._rows[vector_id] = self._size
+                self._ids[row] = vector_id
+                self._size += 1
+            rows[position] = row
+        self._vectors[rows] = vectors
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """Remove the vectors of ``ids``; returns how many were stored."""
+        removed = 0
+        for vector_id in ids:
+            row = self._rows.pop(vector_id, None)
+            if row is None:
+                continue
+            last = self._size - 1
+            if row != last:
+                moved = self._ids[last]
+                self._ids[row] = moved
+                self._rows[moved] = row
+                self._vectors[row] = self._vectors[last]
+            self._ids[last] = None
+            self._size = last
+            removed += 1
+        return removed
+
+    def search(
+        self,
+        query,
+        k: int,
+        threshold: Optional[float] = None,
+        accept: Optional[Accept] = None,
+    ) -> SearchHits:
+        """
+        The ``k`` stored vectors most similar to ``query``.
+
+        Returns ``(id, cosine similarity)`` pairs, highest first, leaving
+        out similarities below ``threshold`` and ids ``accept`` rejects.
+        ``accept`` is called with batches of the best-scoring candidates,
+        each candidate once, widening the candidate set until ``k`` are
+        accepted.
+        """
+        if not self._size or k < 1:
+            return []
+        scores = self.vectors @ normalize_rows(np.reshape(query, (1, -1)))[0]
+        return select_hits(self.ids, scores, k, threshold, accept)
+
+    def _reserve(self, rows: int):
+        capacity = len(self._ids)
+        if rows <= capacity:
+            return
+        capacity = max(rows, 2 * capacity, 1024)
+
+        vectors = np.empty((capacity, self.dimension), dtype=np.float32)
+        vectors[: self._size] = self._vectors[: self._size]
+        ids = np.empty(capacity, dtype=object)
+        ids[: self._size] = self._ids[: self._size]
+        self._vectors, self._ids = vectors, ids
+
+
+def select_hits(
+    ids: np.ndarray,
+    scores: np.ndarray,
+    k: int,
+    threshold: Optional[float] = None,
+    accept: Optional[Accept] = None,
+) -> SearchHits:
+    """Best ``k`` ``(id, score)`` pairs of scored candidates (see ExactVectorIndex.search)."""
+    if accept is None:
+        top = top_k(scores, k, threshold)
+        return [(ids[row], float(scores[row])) for row in top]
+
+    hits = []
+    checked = np.zeros(len(scores), dtype=bool)
+    fetch = k * FILTER_OVERFETCH
+    while True:
+        top = top_k(scores, fetch, threshold)
+        # Only the candidates the last round did not reach
+        rows = top[~checked[top]]
+        checked[rows] = True
+        candidates = [ids[row] for row in rows]
+        hits.extend(
+            (candidate, float(scores[row]))
+            for candidate, row, keep in zip(
+                candidates, rows, accept(candidates), strict=True
+            )
+            if keep
+        )
+        if len(hits) >= k or len(top) < fetch:
+            return hits[:k]
+        fetch *= FILTER_OVERFETCH
@@ -0,0 +1,139 @@
+"""
+JobPilot Vector Storage
+Compact binary column type for embedding vectors and bulk matrix loading.
+"""
+
+import json
+from numbers import Real
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import LargeBinary, select, type_coerce
+from sqlalchemy.types import TypeDecorator
+
+# Little-endian on disk regardless of the host byte order
+VECTOR_DTYPES = {"float32": np.dtype("<f4"), "float16": np.dtype("<f2")}
+
+
+def _as_array(values: Any, dtype: str) -> np.ndarray:
+    """Convert a 1-D list (or array) of numbers, rejecting anything else."""
+    if isinstance(values, np.ndarray):
+        valid = values.ndim == 1 and values.dtype.kind in "fiu"
+    else:
+        valid = isinstance(values, (list, tuple)) and all(
+            isinstance(item, Real) and not isinstance(item, bool) for item in values
+        )
+    if not valid:
+        raise ValueError(
+            f"Expected a 1-D list of numbers, got {type(values).__name__}: "
+            f"{str(values)[:50]}"
+        )
+    return np.asarray(values, dtype=VECTOR_DTYPES[dtype])
+
+
+def encode_vector(vector: Any, dtype: str = "float32") -> Optional[bytes]:
+    """
+    Pack a vector (list, array or legacy JSON text) as raw little-endian floats.
+
+    JSON ``null`` encodes to None, i.e. SQL NULL.
+
+    Raises:
+        ValueError: If the vector is not a 1-D list of numbers
+    """
+    if isinstance(vector, (bytes, bytearray, memoryview)):
+        return bytes(vector)
+    if isinstance(vector, str):
+        vector = json.loads(vector)
+        if vector is None:
+            return None
+    return _as_array(vector, dtype).tobytes()
+
+
+def decode_vector(value: Any, dtype: str = "float32") -> Optional[np.ndarray]:
+    """
+    Unpack a stored vector as a 1-D array.
+
+    Binary values are wrapped without copying, so the array is read-only.
+    JSON text from before the binary migration is parsed as a fallback;
+    JSON ``null`` decodes to None.
+
+    Raises:
+        ValueError: If the JSON text is not a 1-D list of numbers
+    """
+    if isinstance(value, str):
+        value = json.loads(value)
+        if value is None:
+            return None
+        return _as_array(value, dtype)
+    if isinstance(value, list):
+        return _as_array(value, dtype)
+    return np.frombuffer(value, dtype=VECTOR_DTYPES[dtype])
+
+
+class EmbeddingVector(TypeDecorator):
+    """
+    Embedding vector stored as a BLOB of float32 (or float16) values.
+
+    Binds lists or arrays and loads read-only NumPy arrays. A 384-dim vector
+    takes 1.5KB as float32 (768 bytes as float16) instead of ~7KB of JSON.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, dtype: str = "float32"):
+        if dtype not in VECTOR_DTYPES:
+            raise ValueError(
+                f"dtype must be one of {sorted(VECTOR_DTYPES)}, got {dtype!r}"
+            )
+        super().__init__()
+        self.dtype = dtype
+
+    def process_bind_param(self, value, dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        return encode_vector(value, self.dtype)
+
+    def process_result_value(self, value, dialect) -> Optional[np.ndarray]:
+        if value is None:
+            return None
+        return decode_vector(value, self.dtype)
+
+
+def stack_vectors(blobs: Sequence[Any], dtype: str = "float32") -> np.ndarray:
+    """
+    Build an ``(n, dimension)`` float32 matrix from stored vector values.
+
+    Binary values are joined into one buffer and decoded in a single
+    ``np.frombuffer`` call; all vectors must have the same dimension.
+    """
+    if not blobs:
+        return np.empty((0, 0), dtype=np.float32)
+
+    buffer = b"".join(
+        value if isinstance(value, bytes) else encode_vector(value, dtype)
+        for value in blobs
+    )
+    flat = np.frombuffer(buffer, dtype=VECTOR_DTYPES[dtype])
+    if flat.size % len(blobs):
+        raise ValueError("Stored vectors do not all have the same dimension")
+    return flat.reshape(len(blobs), -1).astype(np.float32, copy=False)
+
+
+def load_vector_matrix(
+    session, id_column, vector_column, *criteria
+) -> Tuple[List[Any], np.ndarray]:
+    """
+    Load ``vector_column`` for every row matching ``criteria`` as one matrix.
+
+    Returns ``(ids, matrix)`` with row ``i`` of the matrix belonging to
+    ``ids[i]``. Rows with a NULL vector are skipped.
+    """
+    rows = session.execute(
+        select(id_column, type_coerce(vector_column, LargeBinary))
+        .where(vector_column.isnot(None), *criteria)
+        .order_by(id_column)
+    ).all()
+
+    ids = [row[0] for row in rows]
+    return ids, stack_vectors([row[1] for row in rows], vector_column.type.dtype)
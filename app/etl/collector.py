@@ -4,13 +4,15 @@ Handles extraction of job data from JSearch API with robust error handling and r
 """
 
 import asyncio
-import json
+import gzip
+import lzma
 import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import aiohttp
 
+from app.data.compression import compress_bytes, dumps_json
 from app.data.database import get_database_manager
 from app.data.models import (
     ETLOperationLog,
@@ -94,6 +96,7 @@ class JSearchDataCollector:
             List of collection IDs for the collected data
         """
         collection_ids = []
+        raw_bytes = stored_bytes = 0
 
         operation_log = await self._start_operation_log(
             "jsearch_collection",
@@ -120,6 +123,8 @@ class JSearchDataCollector:
                             collection_data
                         )
                         collection_ids.append(collection_id)
+                        raw_bytes += collection_data["metadata"]["raw_bytes"]
+                        stored_bytes += collection_data["metadata"]["stored_bytes"]
                         logger.info(
                             f"Collected page {page_num} for '{query}' in {location}: {collection_id}"
                         )
@@ -139,6 +144,12 @@ class JSearchDataCollector:
                 {
                     "collections_created": len(collection_ids),
                     "collection_ids": collection_ids,
+                    "raw_compression": self.config.raw_compression,
+                    "raw_bytes": raw_bytes,
+                    "stored_bytes": stored_bytes,
+                    "compression_ratio": (
+                        round(raw_bytes / stored_bytes, 2) if stored_bytes else None
+                    ),
                 },
             )
 
@@ -223,6 +234,12 @@ class JSearchDataCollector:
 
     async def _store_raw_collection(self, collection_data: Dict[str, Any]) -> str:
         """Store raw collection data in database and file system."""
+        # Compress the API response once; sizes go into the collection metadata
+        payload = dumps_json(collection_data["raw_response"])
+        stored_response = compress_bytes(payload, self.config.raw_compression)
+        collection_data["metadata"]["raw_bytes"] = len(payload)
+        collection_data["metadata"]["stored_bytes"] = len(stored_response)
+
         # Create RawJobCollection object
         collection = RawJobCollection(**collection_data)
 
@@ -230,6 +247,7 @@ class JSearchDataCollector:
             # Store in database
             with self.db_manager.get_session() as session:
                 collection_db = pydantic_to_sqlalchemy(collection, RawJobCollectionDB)
+                collection_db.raw_response = stored_response
                 session.add(collection_db)
                 session.flush()
 
@@ -260,15 +278,21 @@ class JSearchDataCollector:
             date_dir = self.config.raw_data_dir / timestamp.strftime("%Y/%m/%d")
             date_dir.mkdir(parents=True, exist_ok=True)
 
-            # Store file
+            # Store file, compressed like the database copy
             filename = f"{collection_data['api_provider']}_{collection_id}.json"
+            if self.config.raw_compression == "zlib":
+                filename, open_file = f"{filename}.gz", gzip.open
+            elif self.config.raw_compression == "lzma":
+                filename, open_file = f"{filename}.xz", lzma.open
+            else:
+                open_file = open
             filepath = date_dir / filename
 
             # Serialize datetime objects for JSON storage
             serializable_data = self._make_json_serializable(collection_data)
 
-            with open(filepath, "w") as f:
-                json.dump(serializable_data, f, indent=2)
+            with open_file(filepath, "wb") as f:
+                f.write(dumps_json(serializable_data))
 
             logger.debug(f"Stored backup file: {filepath}")
 
@@ -8,6 +8,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List
 
+from app.data.compression import CODECS
+
 
 @dataclass
 class ETLConfig:
@@ -44,6 +46,9 @@ class ETLConfig:
         default_factory=lambda: Path("data/failed_processing")
     )
     logs_dir: Path = field(default_factory=lambda: Path("data/logs"))
+    raw_compression: str = field(
+        default_factory=lambda: os.getenv("ETL_RAW_COMPRESSION", "zlib")
+    )  # Codec for stored API responses: "zlib", "lzma" or "none"
 
     # Processing Configuration
     batch_size: int = 50  # Jobs to process in one batch
@@ -120,6 +125,9 @@ class ETLConfig:
         if self.batch_size <= 0:
             errors.append("Batch size must be positive")
 
+        if self.raw_compression not in CODECS:
+            errors.append(f"Raw compression must be one of {', '.join(CODECS)}")
+
         return errors
 
     def get_jsearch_headers(self) -> Dict[str, str]:
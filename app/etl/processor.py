@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.data.database import get_database_manager
+from app.data.dimensions import format_location
 from app.data.models import (
     CompanySizeCategory,
     ETLOperationType,
@@ -22,10 +23,12 @@ from app.data.models import (
     RawJobCollection,
     RawJobCollectionDB,
     RemoteType,
+    SalaryPeriod,
     SeniorityLevel,
     VerificationStatus,
     pydantic_to_sqlalchemy,
 )
+from app.data.salary import normalize_period
 from app.logger import logger
 
 from .config import ETLConfig
@@ -256,10 +259,11 @@ class JobDataProcessor:
         )
 
         # Salary information
-        salary_min, salary_max, currency = self._extract_salary_info(raw_job)
+        salary_min, salary_max, currency, period = self._extract_salary_info(raw_job)
         transformed["salary_min"] = salary_min
         transformed["salary_max"] = salary_max
         transformed["salary_currency"] = currency
+        transformed["salary_period"] = period
 
         # Skills and qualifications
         transformed["skills_required"] = self._extract_skills(
@@ -325,17 +329,15 @@ class JobDataProcessor:
         return text
 
     def _normalize_location(self, city: str, state: str, country: str) -> str:
-        """Normalize location information."""
-        parts = []
-
-        if city:
-            parts.append(self._clean_text(city))
-        if state:
-            parts.append(self._clean_text(state))
-        if country and country.lower() != "us":
-            parts.append(self._clean_text(country))
+        """
+        Normalize location information.
 
-        return ", ".join(parts) if parts else "Remote"
+        Uses the same format the job_locations dimension keys are parsed
+        from, so the loader links every job to one canonical location.
+        """
+        return format_location(
+            self._clean_text(city), self._clean_text(state), self._clean_text(country)
+        )
 
     def _normalize_job_type(self, employment_type: str) -> Optional[JobType]:
         """Normalize job employment type."""
@@ -414,24 +416,32 @@ class JobDataProcessor:
 
     def _extract_salary_info(
         self, raw_job: Dict[str, Any]
-    ) -> Tuple[Optional[float], Optional[float], str]:
-        """Extract salary information."""
+    ) -> Tuple[Optional[float], Optional[float], str, Optional[SalaryPeriod]]:
+        """Extract salary information, with the pay period when it is posted."""
         salary_min = None
         salary_max = None
-        currency = "USD"
+        currency = (raw_job.get("job_salary_currency") or "USD").upper()
+        period = None
 
         # Check structured salary fields
         if raw_job.get("job_min_salary"):
             salary_min = float(raw_job["job_min_salary"])
         if raw_job.get("job_max_salary"):
             salary_max = float(raw_job["job_max_salary"])
+        if salary_min or salary_max:
+            period = normalize_period(raw_job.get("job_salary_period"))
 
         # If no structured data, try to parse from description
         if not salary_min and not salary_max:
             description = raw_job.get("job_description", "")
             salary_min, salary_max = self._parse_salary_from_text(description)
 
-        return salary_min, salary_max, currency
+        return (
+            salary_min,
+            salary_max,
+            currency,
+            SalaryPeriod(period) if period else None,
+        )
 
     def _parse_salary_from_text(
         self, text: str
@@ -15,6 +15,8 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
+from ..data.archive import ARCHIVE_AFTER_DAYS
+from ..data.database import JobRepository
 from ..data.models import ETLOperationLogDB, ETLProcessingStatus, RawJobCollection
 from ..database.manager import DatabaseManager
 from .collector import JSearchDataCollector
@@ -35,6 +37,7 @@ class ETLPhase(str, Enum):
     LOADING = "loading"
     CLEANUP = "cleanup"
     MAINTENANCE = "maintenance"
+    ARCHIVE = "archive"
 
 
 @dataclass
@@ -384,6 +387,14 @@ class ETLOrchestrator:
 
         return result
 
+    async def run_job_archive(
+        self, older_than_days: int = ARCHIVE_AFTER_DAYS
+    ) -> Dict[str, Any]:
+        """Move non-active job listings older than ``older_than_days`` to the archive."""
+        job_repo = JobRepository(self.db_manager)
+        moved = await asyncio.to_thread(job_repo.archive_jobs, older_than_days)
+        return {"status": "completed", "jobs_archived": moved}
+
     async def _generate_etl_statistics(self) -> Dict[str, Any]:
         """Generate comprehensive ETL statistics."""
         stats = {}
@@ -463,6 +474,9 @@ class ETLOrchestrator:
                             "Check collection schedule and API connectivity"
                         )
 
+            # Row counts are maintained in memory, so polling here is cheap
+            health["table_counts"] = self.db_manager.get_table_stats()
+
         except Exception as e:
             health["status"] = "error"
             health["issues"].append(f"Health assessment failed: {str(e)}")
@@ -516,6 +530,10 @@ class ETLOrchestrator:
                     session.execute("VACUUM")
                     maintenance_result["tasks"].append("VACUUM completed")
 
+                    # VACUUM may renumber job_listings rowids used by the FTS index
+                    self.db_manager.rebuild_search_index()
+                    maintenance_result["tasks"].append("Search index rebuilt")
+
                     session.execute("ANALYZE")
                     maintenance_result["tasks"].append("ANALYZE completed")
 
@@ -564,6 +582,13 @@ class ETLScheduler:
                 timeout_minutes=60,
                 parameters={},
             ),
+            ETLJobConfig(
+                name="job_archive",
+                phase=ETLPhase.ARCHIVE,
+                schedule="0 3 * * *",  # Daily at 3 AM
+                timeout_minutes=60,
+                parameters={"older_than_days": ARCHIVE_AFTER_DAYS},
+            ),
         ]
 
         # Load custom jobs from settings
@@ -664,6 +689,8 @@ class ETLScheduler:
             return self._run_loading_job
         elif phase == ETLPhase.MAINTENANCE:
             return self._run_maintenance_job
+        elif phase == ETLPhase.ARCHIVE:
+            return self._run_archive_job
         else:
             return self._run_full_pipeline_job
 
@@ -734,6 +761,25 @@ class ETLScheduler:
             logger.error(f"Maintenance job {job_config.name} failed: {e}")
             raise
 
+    async def _run_archive_job(
+        self, job_config: ETLJobConfig, parameters: Dict[str, Any]
+    ):
+        """Execute a job archive run."""
+        logger.info(f"Executing archive job: {job_config.name}")
+
+        try:
+            result = await self.orchestrator.run_job_archive(
+                parameters.get("older_than_days", ARCHIVE_AFTER_DAYS)
+            )
+            logger.info(
+                f"Archive job {job_config.name} completed: {result['jobs_archived']} jobs archived"
+            )
+            return result
+
+        except Exception as e:
+            logger.error(f"Archive job {job_config.name} failed: {e}")
+            raise
+
     async def _run_full_pipeline_job(
         self, job_config: ETLJobConfig, parameters: Dict[str, Any]
     ):
@@ -22,6 +22,7 @@ from app.data.models import (
     pydantic_to_sqlalchemy,
     sqlalchemy_to_pydantic,
 )
+from app.data.pagination import InvalidCursorError, Page, paginate
 
 logger = logging.getLogger(__name__)
 
@@ -111,7 +112,7 @@ class TimelineService:
 
             # Convert to Pydantic models
             return [
-                sqlalchemy_to_pydantic(event_db, TimelineEvent)
+                sqlalchemy_to_pydantic(event_db, TimelineEvent, trusted=True)
                 for event_db in events_db
             ]
 
@@ -119,6 +120,53 @@ class TimelineService:
             logger.error(f"Error retrieving user timeline: {e}")
             raise
 
+    def get_user_timeline_page(
+        self,
+        user_profile_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        job_id: Optional[str] = None,
+        event_types: Optional[List[TimelineEventType]] = None,
+        days_back: Optional[int] = None,
+        include_total: bool = False,
+    ) -> Page[TimelineEvent]:
+        """Get timeline events for a user with keyset pagination (most recent first)."""
+
+        try:
+            query = self.db.query(TimelineEventDB).filter(
+                TimelineEventDB.user_profile_id == user_profile_id
+            )
+
+            if job_id:
+                query = query.filter(TimelineEventDB.job_id == job_id)
+
+            if event_types:
+                query = query.filter(TimelineEventDB.event_type.in_(event_types))
+
+            if days_back:
+                cutoff_date = datetime.utcnow() - timedelta(days=days_back)
+                query = query.filter(TimelineEventDB.event_date >= cutoff_date)
+
+            total = query.count() if include_total else None
+            events_db, next_cursor = paginate(
+                query,
+                [(TimelineEventDB.event_date, True), (TimelineEventDB.id, True)],
+                limit,
+                cursor,
+            )
+
+            events = [
+                sqlalchemy_to_pydantic(event_db, TimelineEvent, trusted=True)
+                for event_db in events_db
+            ]
+            return Page(items=events, next_cursor=next_cursor, total=total)
+
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            logger.error(f"Error retrieving user timeline: {e}")
+            raise
+
     def get_job_timeline(
         self, job_id: str, user_profile_id: Optional[str] = None, limit: int = 50
     ) -> List[TimelineEvent]:
@@ -140,7 +188,7 @@ class TimelineService:
 
             # Convert to Pydantic models
             return [
-                sqlalchemy_to_pydantic(event_db, TimelineEvent)
+                sqlalchemy_to_pydantic(event_db, TimelineEvent, trusted=True)
                 for event_db in events_db
             ]
 
@@ -179,7 +227,7 @@ class TimelineService:
 
             # Convert to Pydantic models
             return [
-                sqlalchemy_to_pydantic(event_db, TimelineEvent)
+                sqlalchemy_to_pydantic(event_db, TimelineEvent, trusted=True)
                 for event_db in events_db
             ]
 
@@ -439,7 +487,7 @@ class TimelineService:
             )
 
             return [
-                sqlalchemy_to_pydantic(event_db, TimelineEvent)
+                sqlalchemy_to_pydantic(event_db, TimelineEvent, trusted=True)
                 for event_db in events_db
             ]
 
@@ -8,11 +8,16 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 from pydantic import Field
 
+from app.data.counts import CountStrategy
 from app.data.database import get_job_repository
+from app.data.embedding_index import get_embedding_index
 from app.data.models import JobListing, JobType, RemoteType
 from app.logger import logger
 from app.tool.base import BaseTool
 
+# Texts per model forward pass when embedding written jobs
+ENCODE_BATCH_SIZE = 64
+
 
 class SemanticSearchTool(BaseTool):
     """Tool for semantic job search using AI embeddings."""
@@ -204,53 +209,55 @@ class SemanticSearchTool(BaseTool):
         max_salary: Optional[float],
         max_results: int,
     ) -> List[Dict]:
-        """Perform semantic search using embeddings."""
+        """
+        Perform semantic search using embeddings.
+
+        Written jobs are embedded once, by the shared embedding index in a
+        background thread; a query only refreshes the index from the
+        database, then costs one encode and one matrix-vector product.
+        """
         try:
-            # Get all jobs with filters
-            jobs, _ = self.job_repo.search_jobs(
+            index = get_embedding_index(
+                self.job_repo.db_manager.engine, self.model_name
+            )
+            index.sync(self.job_repo, self._encode, self._create_job_text)
+
+            query_embedding = self._encode([query])[0]
+            hits = index.search(
+                self.job_repo,
+                query_embedding,
+                limit=max_results,
+                min_similarity=self.min_similarity,
                 job_types=job_types,
                 remote_types=remote_types,
                 locations=locations,
                 min_salary=min_salary,
                 max_salary=max_salary,
-                limit=500,  # Get more for semantic filtering
             )
-
-            if not jobs:
+            if not hits:
                 return []
 
-            # Generate query embedding
-            query_embedding = self._embedding_service.encode([query])[0]
-
-            # Calculate similarities
-            matches = []
-            for job in jobs:
-                # Create job text for embedding
-                job_text = self._create_job_text(job)
-                job_embedding = self._embedding_service.encode([job_text])[0]
-
-                # Calculate cosine similarity
-                similarity = np.dot(query_embedding, job_embedding) / (
-                    np.linalg.norm(query_embedding) * np.linalg.norm(job_embedding)
-                )
-
-                if similarity >= self.min_similarity:
-                    matches.append(
-                        {
-                            "job": job,
-                            "similarity": float(similarity),
-                            "job_text": job_text,
-                        }
-                    )
-
-            # Sort by similarity
-            matches.sort(key=lambda x: x["similarity"], reverse=True)
-            return matches[:max_results]
+            jobs = self.job_repo.get_jobs_by_ids(job_id for job_id, _ in hits)
+            return [
+                {
+                    "job": jobs[job_id],
+                    "similarity": similarity,
+                    "job_text": self._create_job_text(jobs[job_id]),
+                }
+                for job_id, similarity in hits
+                if job_id in jobs
+            ]
 
         except Exception as e:
             logger.error(f"Error in semantic search with embeddings: {e}")
             return []
 
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Embed ``texts`` with the embedding model in batches."""
+        return self._embedding_service.encode(
+            texts, batch_size=ENCODE_BATCH_SIZE, show_progress_bar=False
+        )
+
     async def _fallback_keyword_search(
         self,
         query: str,
@@ -271,6 +278,7 @@ class SemanticSearchTool(BaseTool):
                 min_salary=min_salary,
                 max_salary=max_salary,
                 limit=max_results,
+                count_strategy=CountStrategy.NONE,
             )
 
             logger.info(f"Fallback search found {len(jobs)} jobs")
@@ -3,18 +3,19 @@ Enhanced Vector Store for JobPilot-OpenManus
 Production-ready vector storage and retrieval for semantic job search.
 """
 
-import asyncio
 import hashlib
 import logging
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+from sqlalchemy import insert
 
-from app.data.database import DatabaseManager
+from app.data.database import DatabaseManager, JobRepository
+from app.data.embedding_index import EMBEDDING_SYNC_CHUNK_SIZE
+from app.data.ivf_index import IVFVectorIndex
 from app.data.models import (
     JobEmbedding,
     JobEmbeddingDB,
@@ -23,9 +24,25 @@ from app.data.models import (
     pydantic_to_sqlalchemy,
     sqlalchemy_to_pydantic,
 )
+from app.data.segment_index import SegmentVectorIndex
+from app.data.vector_index import ExactVectorIndex
 
 logger = logging.getLogger(__name__)
 
+# Where the ivf and mmap backends keep their indexes between runs
+IVF_INDEX_PATH = "data/vector_index/ivf.npz"
+SEGMENT_INDEX_PATH = "data/vector_index/segments"
+
+# Texts per forward pass when batch_store_embeddings encodes many jobs
+ENCODE_BATCH_SIZE = 64
+
+# content_type of the job_embeddings rows the store writes and reads
+CONTENT_TYPE = "job_description"
+
+# Single writes the 'ivf' index takes before it is saved again; batches and
+# close() save it at once
+INDEX_SAVE_INTERVAL = 100
+
 
 class VectorStore:
     """Production-ready vector storage and retrieval system."""
@@ -35,17 +52,31 @@ class VectorStore:
         embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2",
         storage_backend: str = "chroma",
         db_manager: Optional[DatabaseManager] = None,
+        index_path: Optional[str] = None,
+        index_options: Optional[Dict[str, Any]] = None,
     ):
         """Initialize the vector store.
 
         Args:
             embedding_model: Name of the sentence transformer model
-            storage_backend: 'chroma', 'simple', or 'pinecone' (future)
+            storage_backend: 'chroma', 'simple', 'ivf', 'mmap', or 'pinecone'
+                (future)
             db_manager: Database manager for storing embeddings
+            index_path: File the 'ivf' index is saved to, or directory of the
+                'mmap' segment files
+            index_options: IVFVectorIndex settings for 'ivf' (n_lists,
+                nprobe, pq_subvectors, ...) or SegmentVectorIndex settings
+                for 'mmap' (flush_rows, max_segments, writable)
         """
         self.embedding_model_name = embedding_model
         self.storage_backend = storage_backend
         self.db_manager = db_manager
+        self.job_repo = JobRepository(db_manager) if db_manager else None
+        self.index_path = index_path or (
+            SEGMENT_INDEX_PATH if storage_backend == "mmap" else IVF_INDEX_PATH
+        )
+        self.index_options = index_options or {}
+        self._unsaved_writes = 0
 
         # Initialize embedding model
         logger.info(f"Loading embedding model: {embedding_model}")
@@ -62,6 +93,10 @@ class VectorStore:
             return self._initialize_chroma()
         elif backend == "simple":
             return self._initialize_simple_storage()
+        elif backend == "ivf":
+            return self._initialize_ivf_storage()
+        elif backend == "mmap":
+            return self._initialize_segment_storage()
         elif backend == "pinecone":
             # Future implementation
             raise NotImplementedError("Pinecone backend not yet implemented")
@@ -98,7 +133,80 @@ class VectorStore:
     def _initialize_simple_storage(self):
         """Initialize simple in-memory storage (fallback)."""
         logger.info("Initialized simple in-memory vector storage")
-        return {"embeddings": {}, "metadata": {}}
+        return {"index": ExactVectorIndex(self.dimension), "metadata": {}}
+
+    def _initialize_ivf_storage(self):
+        """Initialize the approximate IVF index, loading it if it was saved."""
+        if os.path.exists(self.index_path):
+            index = IVFVectorIndex.load(self.index_path)
+            if index.dimension != self.dimension:
+                raise ValueError(
+                    f"Vector index {self.index_path} holds {index.dimension}-dim "
+                    f"vectors, model produces {self.dimension}"
+                )
+            if "nprobe" in self.index_options:
+                index.nprobe = self.index_options["nprobe"]
+            logger.info(
+                f"Loaded IVF vector index with {len(index)} vectors "
+                f"from {self.index_path}"
+            )
+        else:
+            index = IVFVectorIndex(self.dimension, **self.index_options)
+            logger.info("Initialized IVF vector index")
+        return {"index": index, "metadata": {}}
+
+    def _initialize_segment_storage(self):
+        """Map the on-disk vector segments, shared with other worker processes."""
+        index = SegmentVectorIndex(
+            self.index_path, self.dimension, **self.index_options
+        )
+        logger.info(
+            f"Opened {index.segment_count} vector segments from {self.index_path}"
+        )
+        return {"index": index, "metadata": {}}
+
+    def save_index(self):
+        """
+        Save the 'ivf' index, or flush pending 'mmap' vectors to a segment.
+
+        Segment compaction is started in the background when worthwhile;
+        other backends persist themselves.
+        """
+        if self.storage_backend == "ivf":
+            self.storage["index"].save(self.index_path)
+            self._unsaved_writes = 0
+            logger.info(f"Saved IVF vector index to {self.index_path}")
+        elif self.storage_backend == "mmap":
+            index = self.storage["index"]
+            if not index.writable:
+                return
+            index.flush()
+            if index.compact_in_background():
+                logger.info(f"Compacting vector segments in {self.index_path}")
+
+    def close(self):
+        """Persist writes not saved yet; call on shutdown."""
+        self.save_index()
+
+    def _index_written(self):
+        """
+        Count a single write, saving the 'ivf' index every INDEX_SAVE_INTERVAL.
+
+        'mmap' needs nothing here: adds are flushed every ``flush_rows``
+        vectors and deletes set tombstones in the mapped files.
+        """
+        if self.storage_backend != "ivf":
+            return
+        self._unsaved_writes += 1
+        if self._unsaved_writes >= INDEX_SAVE_INTERVAL:
+            self.save_index()
+
+    def _own_embeddings(self) -> tuple:
+        """Filters for the job_embeddings rows this store wrote."""
+        return (
+            JobEmbeddingDB.embedding_model == self.embedding_model_name,
+            JobEmbeddingDB.content_type == CONTENT_TYPE,
+        )
 
     def _create_content_hash(self, content: str) -> str:
         """Create a hash of content for change detection."""
@@ -142,6 +250,7 @@ class VectorStore:
                         .filter(
                             JobEmbeddingDB.job_id == str(job.id),
                             JobEmbeddingDB.content_hash == content_hash,
+                            *self._own_embeddings(),
                         )
                         .first()
                     )
@@ -161,11 +270,12 @@ class VectorStore:
                 content_hash=content_hash,
                 embedding_vector=embedding_vector,
                 embedding_dimension=self.dimension,
-                content_type="job_description",
+                content_type=CONTENT_TYPE,
             )
 
             # Store in vector database
             await self._store_embedding_in_backend(job_embedding, job, content)
+            self._index_written()
 
             # Store in SQL database if available
             if self.db_manager:
@@ -185,58 +295,172 @@ class VectorStore:
         self, embedding: JobEmbedding, job: JobListing, content: str
     ):
         """Store embedding in the chosen backend."""
+        await self._store_embeddings_in_backend(
+            [embedding], [job], [content], np.asarray([embedding.embedding_vector])
+        )
+
+    async def _store_embeddings_in_backend(
+        self,
+        embeddings: List[JobEmbedding],
+        jobs: List[JobListing],
+        contents: List[str],
+        vectors: np.ndarray,
+    ):
+        """Store embeddings in the chosen backend, replacing existing ones."""
+        ids = [str(embedding.job_id) for embedding in embeddings]
         if self.storage_backend == "chroma":
-            collection = self.storage["collection"]
-            collection.add(
-                embeddings=[embedding.embedding_vector],
-                documents=[content],
-                metadatas=[
-                    {
-                        "job_id": str(embedding.job_id),
-                        "title": job.title,
-                        "company": job.company,
-                        "location": job.location or "",
-                        "job_type": job.job_type.value if job.job_type else "",
-                        "remote_type": job.remote_type.value if job.remote_type else "",
-                        "salary_min": job.salary_min or 0,
-                        "salary_max": job.salary_max or 0,
-                        "content_hash": embedding.content_hash,
-                        "created_at": embedding.created_at.isoformat(),
-                    }
-                ],
-                ids=[str(embedding.job_id)],
-            )
+            client, collection = self.storage["client"], self.storage["collection"]
+            get_max_batch_size = getattr(client, "get_max_batch_size", None)
+            chunk_size = get_max_batch_size() if get_max_batch_size else len(ids)
+            metadatas = [
+                {
+                    "job_id": str(embedding.job_id),
+                    "title": job.title,
+                    "company": job.company,
+                    "location": job.location or "",
+                    "job_type": job.job_type.value if job.job_type else "",
+                    "remote_type": job.remote_type.value if job.remote_type else "",
+                    "salary_min": job.salary_min or 0,
+                    "salary_max": job.salary_max or 0,
+                    "content_hash": embedding.content_hash,
+                    "created_at": embedding.created_at.isoformat(),
+                }
+                for embedding, job in zip(embeddings, jobs, strict=True)
+            ]
+            for start in range(0, len(ids), chunk_size):
+                end = start + chunk_size
+                collection.upsert(
+                    embeddings=vectors[start:end].tolist(),
+                    documents=contents[start:end],
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end],
+                )
         else:  # Simple storage
-            self.storage["embeddings"][
-                str(embedding.job_id)
-            ] = embedding.embedding_vector
-            self.storage["metadata"][str(embedding.job_id)] = {
-                "job": job,
-                "content": content,
-                "embedding": embedding,
-            }
+            self.storage["index"].add(ids, vectors)
+            for job_id, embedding, job, content in zip(
+                ids, embeddings, jobs, contents, strict=True
+            ):
+                self.storage["metadata"][job_id] = {
+                    "job": job,
+                    "content": content,
+                    "embedding": embedding,
+                }
 
     async def batch_store_embeddings(
-        self, jobs: List[JobListing]
+        self, jobs: List[JobListing], encode_batch_size: int = ENCODE_BATCH_SIZE
     ) -> List[JobEmbedding]:
-        """Efficiently embed and store multiple jobs."""
-        embeddings = []
-
-        # Process jobs in batches for efficiency
-        batch_size = 10
-        for i in range(0, len(jobs), batch_size):
-            batch = jobs[i : i + batch_size]
-            batch_embeddings = await asyncio.gather(
-                *[self.store_job_embedding(job) for job in batch]
-            )
-            embeddings.extend(batch_embeddings)
+        """
+        Efficiently embed and store multiple jobs.
+
+        Stored embeddings are looked up for all jobs at once; the rest are
+        encoded in one model call (each distinct text once), written to the
+        backend in one upsert and to the database in one bulk insert.
+        Returns one embedding per job, in order.
+        """
+        if not jobs:
+            return []
+        try:
+            contents = [self._extract_searchable_content(job) for job in jobs]
+            keys = [
+                (str(job.id), self._create_content_hash(content))
+                for job, content in zip(jobs, contents, strict=True)
+            ]
+            found = self._find_stored_embeddings(keys)
+
+            # First position of each (job, content) pair that needs embedding
+            missing: Dict[Tuple[str, str], int] = {}
+            for position, key in enumerate(keys):
+                if key not in found:
+                    missing.setdefault(key, position)
+
+            if missing:
+                texts: Dict[str, str] = {}
+                for (_, content_hash), position in missing.items():
+                    texts.setdefault(content_hash, contents[position])
+                logger.info(
+                    f"Encoding {len(texts)} texts for {len(missing)} of "
+                    f"{len(jobs)} jobs"
+                )
+                encoded = np.asarray(
+                    self.embedding_model.encode(
+                        list(texts.values()), batch_size=encode_batch_size
+                    ),
+                    dtype=np.float32,
+                )
+                rows = {content_hash: row for row, content_hash in enumerate(texts)}
+
+                positions = list(missing.values())
+                vectors = encoded[[rows[keys[position][1]] for position in positions]]
+                created = [
+                    JobEmbedding(
+                        job_id=jobs[position].id,
+                        embedding_model=self.embedding_model_name,
+                        content_hash=keys[position][1],
+                        embedding_vector=vector.tolist(),
+                        embedding_dimension=self.dimension,
+                        content_type=CONTENT_TYPE,
+                    )
+                    for position, vector in zip(positions, vectors, strict=True)
+                ]
+                await self._store_embeddings_in_backend(
+                    created,
+                    [jobs[position] for position in positions],
+                    [contents[position] for position in positions],
+                    vectors,
+                )
+                if self.db_manager:
+                    self._insert_embeddings(created, vectors)
+                found.update(zip(missing, created, strict=True))
+
+        except Exception as e:
+            logger.error(f"Failed to store embeddings for {len(jobs)} jobs: {e}")
+            raise
 
-            # Log progress
-            if len(embeddings) % 50 == 0:
-                logger.info(f"Processed {len(embeddings)}/{len(jobs)} job embeddings")
+        self.save_index()
+        logger.info(
+            f"Completed batch embedding of {len(jobs)} jobs "
+            f"({len(missing)} embedded, {len(jobs) - len(missing)} reused)"
+        )
+        return [found[key] for key in keys]
 
-        logger.info(f"Completed batch embedding of {len(jobs)} jobs")
-        return embeddings
+    def _find_stored_embeddings(
+        self, keys: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], JobEmbedding]:
+        """Stored embeddings of the given (job id, content hash) pairs."""
+        found: Dict[Tuple[str, str], JobEmbedding] = {}
+        if not self.db_manager:
+            return found
+
+        wanted = set(keys)
+        job_ids = sorted({job_id for job_id, _ in wanted})
+        with self.db_manager.get_session() as session:
+            for start in range(0, len(job_ids), EMBEDDING_SYNC_CHUNK_SIZE):
+                chunk = job_ids[start : start + EMBEDDING_SYNC_CHUNK_SIZE]
+                for embedding_db in session.query(JobEmbeddingDB).filter(
+                    JobEmbeddingDB.job_id.in_(chunk), *self._own_embeddings()
+                ):
+                    key = (embedding_db.job_id, embedding_db.content_hash)
+                    if key in wanted and key not in found:
+                        found[key] = sqlalchemy_to_pydantic(embedding_db, JobEmbedding)
+        return found
+
+    def _insert_embeddings(self, embeddings: List[JobEmbedding], vectors: np.ndarray):
+        """Insert embedding rows in one executemany."""
+        rows = [
+            {
+                "id": str(embedding.id),
+                "job_id": str(embedding.job_id),
+                "embedding_model": embedding.embedding_model,
+                "content_hash": embedding.content_hash,
+                "embedding_vector": vector,
+                "embedding_dimension": embedding.embedding_dimension,
+                "content_type": embedding.content_type,
+                "created_at": embedding.created_at,
+            }
+            for embedding, vector in zip(embeddings, vectors, strict=True)
+        ]
+        with self.db_manager.engine.begin() as conn:
+            conn.execute(insert(JobEmbeddingDB.__table__), rows)
 
     async def find_similar_jobs(
         self,
@@ -324,42 +548,57 @@ class VectorStore:
         limit: int,
         similarity_threshold: float,
     ) -> List[JobMatch]:
-        """Search using simple in-memory storage."""
-        if not self.storage["embeddings"]:
-            return []
+        """
+        Search using in-process storage (the simple, ivf or mmap index).
 
-        job_matches = []
+        One scoring pass ranks the stored jobs; filters are only checked,
+        and JobMatch objects only built, for the best candidates.
+        """
+        index = self.storage["index"]
+        if not len(index):
+            return []
 
-        for job_id, embedding_vector in self.storage["embeddings"].items():
-            # Calculate cosine similarity
-            similarity = cosine_similarity(
-                [query_embedding], [np.array(embedding_vector)]
-            )[0][0]
-
-            if similarity >= similarity_threshold:
-                metadata = self.storage["metadata"][job_id]
-                job = metadata["job"]
-
-                # Apply filters if provided
-                if filters and not self._job_matches_filters(job, filters):
-                    continue
-
-                job_match = JobMatch(
-                    job_id=job_id,
-                    user_profile_id="",  # Will be set by caller
-                    overall_score=float(similarity),
-                    skills_match_score=float(similarity),
-                    experience_match_score=0.5,
-                    location_match_score=0.5,
-                    salary_match_score=0.5,
-                    match_reasons=[f"Semantic similarity: {similarity:.2f}"],
-                    calculated_at=datetime.utcnow(),
-                )
-                job_matches.append(job_match)
+        accept = None
+        if filters:
 
-        # Sort by similarity score and limit results
-        job_matches.sort(key=lambda x: x.overall_score, reverse=True)
-        return job_matches[:limit]
+            def accept(job_ids: List[str]) -> List[bool]:
+                jobs = self._stored_jobs(job_ids)
+                return [
+                    job_id in jobs and self._job_matches_filters(jobs[job_id], filters)
+                    for job_id in job_ids
+                ]
+
+        hits = index.search(query_embedding, limit, similarity_threshold, accept)
+
+        calculated_at = datetime.utcnow()
+        return [
+            JobMatch(
+                job_id=job_id,
+                user_profile_id="",  # Will be set by caller
+                overall_score=similarity,
+                skills_match_score=similarity,
+                experience_match_score=0.5,
+                location_match_score=0.5,
+                salary_match_score=0.5,
+                match_reasons=[f"Semantic similarity: {similarity:.2f}"],
+                calculated_at=calculated_at,
+            )
+            for job_id, similarity in hits
+        ]
+
+    def _stored_jobs(self, job_ids: List[str]) -> Dict[str, JobListing]:
+        """The jobs behind stored vectors, keyed by ID, for filtering."""
+        jobs, missing = {}, []
+        for job_id in job_ids:
+            metadata = self.storage["metadata"].get(job_id)
+            if metadata is not None:
+                jobs[job_id] = metadata["job"]
+            else:
+                missing.append(job_id)
+        # Vectors loaded from disk carry no metadata
+        if missing and self.job_repo:
+            jobs.update(self.job_repo.get_jobs_by_ids(missing))
+        return jobs
 
     def _job_matches_filters(self, job: JobListing, filters: Dict[str, Any]) -> bool:
         """Check if a job matches the provided filters."""
@@ -444,8 +683,9 @@ class VectorStore:
                 except Exception as e:
                     logger.warning(f"Could not delete from Chroma: {e}")
             else:
-                self.storage["embeddings"].pop(job_id, None)
+                self.storage["index"].remove([job_id])
                 self.storage["metadata"].pop(job_id, None)
+                self._index_written()
 
             # Remove from SQL database
             if self.db_manager:
@@ -453,7 +693,7 @@ class VectorStore:
                     from app.data.models import JobEmbeddingDB
 
                     session.query(JobEmbeddingDB).filter(
-                        JobEmbeddingDB.job_id == job_id
+                        JobEmbeddingDB.job_id == job_id, *self._own_embeddings()
                     ).delete()
                     session.commit()
 
@@ -477,7 +717,17 @@ class VectorStore:
             collection = self.storage["collection"]
             stats["total_embeddings"] = collection.count()
         else:
-            stats["total_embeddings"] = len(self.storage["embeddings"])
+            stats["total_embeddings"] = len(self.storage["index"])
+        if self.storage_backend == "ivf":
+            index = self.storage["index"]
+            stats["ivf"] = {
+                "trained": index.is_trained,
+                "n_lists": index.n_lists,
+                "nprobe": index.nprobe,
+                "pq_subvectors": index.pq_subvectors,
+            }
+        if self.storage_backend == "mmap":
+            stats["segments"] = self.storage["index"].stats()
 
         return stats
 
@@ -505,10 +755,14 @@ def create_vector_store(
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2",
     storage_backend: str = "chroma",
     db_manager: Optional[DatabaseManager] = None,
+    index_path: Optional[str] = None,
+    index_options: Optional[Dict[str, Any]] = None,
 ) -> VectorStore:
     """Factory function to create a vector store instance."""
     return VectorStore(
         embedding_model=embedding_model,
         storage_backend=storage_backend,
         db_manager=db_manager,
+        index_path=index_path,
+        index_options=index_options,
     )
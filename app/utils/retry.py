@@ -2,10 +2,14 @@
 Retry utilities for handling transient failures in database operations.
 """
 
+import asyncio
+import inspect
 import random
+import threading
 import time
+from collections import deque
 from functools import wraps
-from typing import Any, Callable, Tuple, Type
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 
 from sqlalchemy.exc import DisconnectionError, OperationalError, StatementError
 from sqlalchemy.exc import TimeoutError as SQLTimeoutError
@@ -20,6 +24,291 @@ RETRYABLE_DB_EXCEPTIONS = (
     StatementError,  # Statement execution issues (some cases)
 )
 
+# Error messages of transient failures (locks, lost connections, timeouts)
+TRANSIENT_ERROR_MESSAGES = (
+    "connection refused",
+    "connection reset",
+    "connection timed out",
+    "timeout",
+    "temporary failure",
+    "database is locked",
+    "connection lost",
+    "server has gone away",
+)
+
+# Network-level failures worth retrying for outbound HTTP calls
+RETRYABLE_HTTP_EXCEPTIONS = (asyncio.TimeoutError, OSError)
+
+# Longest a synchronous retry may sleep when it runs on an event loop thread
+MAX_EVENT_LOOP_BLOCKING_DELAY = 0.1
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an operation while its circuit breaker is open."""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(
+            f"Circuit breaker '{name}' is open; retry after {retry_after:.1f}s"
+        )
+        self.name = name
+        self.retry_after = retry_after
+
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of recent calls.
+
+    Every call deposits ``ratio`` of a retry and every retry spends one, over
+    a sliding ``window_seconds`` window, plus ``min_retries_per_second`` so a
+    quiet process can still retry. During an error storm retries stop
+    instead of multiplying the load on an already struggling database.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        window_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._calls = deque()
+        self._retries = deque()
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def record_call(self):
+        """Count a first attempt."""
+        with self._lock:
+            self._calls.append(self._clock())
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; False if it is exhausted."""
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            allowed = (
+                self.min_retries_per_second * self.window_seconds
+                + self.ratio * len(self._calls)
+            )
+            if len(self._retries) >= allowed:
+                self._rejected += 1
+                return False
+            self._retries.append(now)
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._prune(self._clock())
+            return {
+                "calls": len(self._calls),
+                "retries": len(self._retries),
+                "rejected": self._rejected,
+            }
+
+    def _prune(self, now: float):
+        cutoff = now - self.window_seconds
+        for timestamps in (self._calls, self._retries):
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
+
+
+class CircuitBreaker:
+    """
+    Fails fast after repeated failures of a shared dependency.
+
+    ``failure_threshold`` consecutive failures open the circuit; calls then
+    raise CircuitOpenError without running until ``reset_timeout`` seconds
+    have passed. One trial call is then let through (half-open): success
+    closes the circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if (
+                self._state == self.OPEN
+                and self._clock() - self._opened_at >= self.reset_timeout
+            ):
+                return self.HALF_OPEN
+            return self._state
+
+    def before_call(self) -> bool:
+        """
+        Raise CircuitOpenError unless a call may go ahead.
+
+        Returns True when the call is the half-open trial; its caller must
+        end it with record_success, record_failure or release_trial.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return False
+
+            elapsed = self._clock() - self._opened_at
+            if self._state == self.OPEN and elapsed >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            if self._state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+
+            raise CircuitOpenError(self.name, max(self.reset_timeout - elapsed, 0.0))
+
+    def record_success(self):
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"Circuit breaker '{self.name}' closed")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        """Give back a trial slot whose call ended without reaching the dependency."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                logger.warning(
+                    f"Circuit breaker '{self.name}' opened after "
+                    f"{self._failures} consecutive failures"
+                )
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._trial_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        state = self.state
+        with self._lock:
+            return {"state": state, "consecutive_failures": self._failures}
+
+
+# Shared by every database retry decorator in the process
+DB_RETRY_BUDGET = RetryBudget()
+DB_CIRCUIT_BREAKER = CircuitBreaker("database")
+
+
+def get_retry_stats() -> Dict[str, Any]:
+    """Budget and breaker state of the shared database retry policy."""
+    return {
+        "database": {
+            "budget": DB_RETRY_BUDGET.stats(),
+            "circuit": DB_CIRCUIT_BREAKER.stats(),
+        }
+    }
+
+
+class _RetryState:
+    """Attempt bookkeeping shared by the sync and async retry wrappers."""
+
+    def __init__(self, func: Callable, policy: Dict[str, Any]):
+        self.func = func
+        self.policy = policy
+        self.attempt = 0
+        self.holds_trial = False
+
+    def before_attempt(self):
+        breaker = self.policy["breaker"]
+        if breaker:
+            self.holds_trial = breaker.before_call()
+        if self.attempt == 0 and self.policy["budget"]:
+            self.policy["budget"].record_call()
+
+    def on_success(self):
+        if self.policy["breaker"]:
+            self.policy["breaker"].record_success()
+
+    def on_retryable(self, error: Exception) -> float:
+        """Delay before the next attempt; re-raises ``error`` if none is allowed."""
+        policy = self.policy
+        if policy["breaker"]:
+            if policy["is_failure"](error):
+                policy["breaker"].record_failure()
+            else:
+                policy["breaker"].record_success()  # the dependency answered
+
+        if self.attempt == policy["max_retries"]:
+            logger.error(
+                f"Function {self.func.__name__} failed after {policy['max_retries'] + 1} attempts. "
+                f"Final error: {error}"
+            )
+            raise error
+
+        if policy["budget"] and not policy["budget"].try_spend():
+            logger.error(
+                f"Function {self.func.__name__} failed and the retry budget is "
+                f"exhausted; not retrying. Error: {error}"
+            )
+            raise error
+
+        # Calculate delay with exponential backoff
+        delay = min(
+            policy["base_delay"] * (policy["exponential_base"] ** self.attempt),
+            policy["max_delay"],
+        )
+
+        # Add jitter to prevent thundering herd
+        if policy["jitter"]:
+            delay = delay * (0.5 + random.random() * 0.5)
+
+        logger.warning(
+            f"Function {self.func.__name__} failed on attempt {self.attempt + 1}/{policy['max_retries'] + 1}. "
+            f"Error: {error}. Retrying in {delay:.2f} seconds..."
+        )
+        self.attempt += 1
+        return delay
+
+    def on_error(self, error: Exception):
+        # Non-retryable exception
+        breaker = self.policy["breaker"]
+        if breaker:
+            if not isinstance(error, CircuitOpenError):
+                breaker.record_success()
+            elif self.holds_trial:
+                # A nested guarded call was refused; nothing was learned
+                breaker.release_trial()
+        logger.error(
+            f"Function {self.func.__name__} failed with non-retryable error: {error}"
+        )
+
+
+def _on_event_loop_thread() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
 
 def with_retry(
     max_retries: int = 3,
@@ -28,10 +317,18 @@ def with_retry(
     exponential_base: float = 2.0,
     jitter: bool = True,
     retryable_exceptions: Tuple[Type[Exception], ...] = RETRYABLE_DB_EXCEPTIONS,
+    budget: Optional[RetryBudget] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    is_failure: Optional[Callable[[Exception], bool]] = None,
 ) -> Callable:
     """
     Decorator that adds retry logic with exponential backoff to functions.
 
+    Coroutine functions wait with ``asyncio.sleep`` so other tasks keep
+    running. Synchronous functions sleep with ``time.sleep``; when they are
+    called on an event loop thread the sleep is capped at
+    MAX_EVENT_LOOP_BLOCKING_DELAY so a retry cannot stall the loop.
+
     Args:
         max_retries: Maximum number of retry attempts (default: 3)
         base_delay: Initial delay between retries in seconds (default: 1.0)
@@ -39,49 +336,62 @@ def with_retry(
         exponential_base: Base for exponential backoff (default: 2.0)
         jitter: Add random jitter to delay (default: True)
         retryable_exceptions: Tuple of exceptions that should trigger retry
+        budget: Shared RetryBudget that retries are drawn from
+        breaker: Shared CircuitBreaker checked before every attempt
+        is_failure: Whether a retryable error counts as a breaker failure
+            (default: is_transient_error, so e.g. constraint violations and
+            missing tables do not open the circuit)
     """
+    policy = {
+        "max_retries": max_retries,
+        "base_delay": base_delay,
+        "max_delay": max_delay,
+        "exponential_base": exponential_base,
+        "jitter": jitter,
+        "budget": budget,
+        "breaker": breaker,
+        "is_failure": is_failure or is_transient_error,
+    }
 
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                state = _RetryState(func, policy)
+                while True:
+                    state.before_attempt()
+                    try:
+                        result = await func(*args, **kwargs)
+                    except retryable_exceptions as e:
+                        await asyncio.sleep(state.on_retryable(e))
+                    except Exception as e:
+                        state.on_error(e)
+                        raise
+                    else:
+                        state.on_success()
+                        return result
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            last_exception = None
-
-            for attempt in range(max_retries + 1):  # +1 to include initial attempt
+            state = _RetryState(func, policy)
+            while True:
+                state.before_attempt()
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
                 except retryable_exceptions as e:
-                    last_exception = e
-
-                    # Don't retry on the last attempt
-                    if attempt == max_retries:
-                        logger.error(
-                            f"Function {func.__name__} failed after {max_retries + 1} attempts. "
-                            f"Final error: {e}"
-                        )
-                        raise
-
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (exponential_base**attempt), max_delay)
-
-                    # Add jitter to prevent thundering herd
-                    if jitter:
-                        delay = delay * (0.5 + random.random() * 0.5)
-
-                    logger.warning(
-                        f"Function {func.__name__} failed on attempt {attempt + 1}/{max_retries + 1}. "
-                        f"Error: {e}. Retrying in {delay:.2f} seconds..."
-                    )
-
+                    delay = state.on_retryable(e)
+                    if _on_event_loop_thread():
+                        delay = min(delay, MAX_EVENT_LOOP_BLOCKING_DELAY)
                     time.sleep(delay)
                 except Exception as e:
-                    # Non-retryable exception
-                    logger.error(
-                        f"Function {func.__name__} failed with non-retryable error: {e}"
-                    )
+                    state.on_error(e)
                     raise
-
-            # This should never be reached, but just in case
-            raise last_exception
+                else:
+                    state.on_success()
+                    return result
 
         return wrapper
 
@@ -168,20 +478,24 @@ def is_retryable_error(exception: Exception) -> bool:
         return True
 
     # Check specific error messages for additional retryable cases
-    error_message = str(exception).lower()
+    return is_transient_error(exception)
 
-    retryable_messages = [
-        "connection refused",
-        "connection reset",
-        "connection timed out",
-        "timeout",
-        "temporary failure",
-        "database is locked",
-        "connection lost",
-        "server has gone away",
-    ]
 
-    return any(message in error_message for message in retryable_messages)
+def is_transient_error(exception: Exception) -> bool:
+    """
+    Check if an exception reports a transient failure of the dependency.
+
+    Lost connections, timeouts and lock contention are transient; errors in
+    the operation itself (bad SQL, missing tables, constraint violations)
+    are not, even when they share an exception type.
+    """
+    if isinstance(exception, (DisconnectionError, SQLTimeoutError)):
+        return True
+    if getattr(exception, "connection_invalidated", False):
+        return True
+
+    error_message = str(exception).lower()
+    return any(message in error_message for message in TRANSIENT_ERROR_MESSAGES)
 
 
 # Specific retry configurations for different types of operations
@@ -193,6 +507,8 @@ def retry_db_read(max_retries: int = 3, base_delay: float = 0.5):
         max_delay=30.0,
         exponential_base=1.5,
         jitter=True,
+        budget=DB_RETRY_BUDGET,
+        breaker=DB_CIRCUIT_BREAKER,
     )
 
 
@@ -204,6 +520,8 @@ def retry_db_write(max_retries: int = 2, base_delay: float = 1.0):
         max_delay=45.0,
         exponential_base=2.0,
         jitter=True,
+        budget=DB_RETRY_BUDGET,
+        breaker=DB_CIRCUIT_BREAKER,
     )
 
 
@@ -215,4 +533,26 @@ def retry_db_critical(max_retries: int = 5, base_delay: float = 2.0):
         max_delay=120.0,
         exponential_base=2.0,
         jitter=True,
+        budget=DB_RETRY_BUDGET,
+        breaker=DB_CIRCUIT_BREAKER,
+    )
+
+
+def retry_http(
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    budget: Optional[RetryBudget] = None,
+    breaker: Optional[CircuitBreaker] = None,
+):
+    """Retry configuration for outbound HTTP calls (network errors, timeouts)."""
+    return with_retry(
+        max_retries=max_retries,
+        base_delay=base_delay,
+        max_delay=30.0,
+        exponential_base=2.0,
+        jitter=True,
+        retryable_exceptions=RETRYABLE_HTTP_EXCEPTIONS + (RetryableError,),
+        budget=budget,
+        breaker=breaker,
+        is_failure=lambda error: True,
     )
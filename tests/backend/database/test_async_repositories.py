@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Async Repository Tests
+
+Tests the AsyncEngine-backed repositories used by async API routes,
+including parity with the sync repositories on the same database.
+"""
+
+import asyncio
+import os
+import tempfile
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.data.async_database import (
+    AsyncApplicationRepository,
+    AsyncDatabaseManager,
+    AsyncJobRepository,
+    AsyncSavedJobRepository,
+    AsyncUserRepository,
+    to_async_url,
+)
+from app.data.database import DatabaseManager, JobRepository
+from app.data.migrations import read_schema_version, schema_version
+from app.data.models import JobApplication, JobListing, JobType, UserProfile
+from app.data.skill_bank_repository import SkillBankRepository
+
+# ==================== Fixtures ====================
+
+
+@pytest_asyncio.fixture
+async def db_manager():
+    """Async database manager backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = AsyncDatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        await manager.create_tables()
+        yield manager
+        await manager.dispose()
+
+
+@pytest_asyncio.fixture
+async def sample_jobs(db_manager):
+    job_repo = AsyncJobRepository(db_manager)
+    jobs = [
+        JobListing(
+            title="Senior Python Developer",
+            company="Acme Corp",
+            description="Build data pipelines with Python.",
+            job_type=JobType.FULL_TIME,
+        ),
+        JobListing(
+            title="Frontend Engineer",
+            company="Globex",
+            description="React and TypeScript.",
+            job_type=JobType.CONTRACT,
+        ),
+    ]
+    return [await job_repo.create_job(job) for job in jobs]
+
+
+# ==================== Manager ====================
+
+
+def test_to_async_url_swaps_driver():
+    assert to_async_url("sqlite:///data/jobs.db") == "sqlite+aiosqlite:///data/jobs.db"
+    assert to_async_url("sqlite+aiosqlite:///x.db") == "sqlite+aiosqlite:///x.db"
+
+
+@pytest.mark.asyncio
+async def test_create_tables_enables_fulltext(db_manager):
+    assert db_manager.fulltext_enabled
+    assert await db_manager.health_check()
+
+
+@pytest.mark.asyncio
+async def test_create_tables_migrates_rows_and_stamps_version(db_manager):
+    job = await AsyncJobRepository(db_manager).create_job(
+        JobListing(title="Analyst", company="Initech", salary_min=50, salary_max=60)
+    )
+    async with db_manager.engine.begin() as conn:
+        # A row written before salary_annual_* existed
+        await conn.execute(
+            text(
+                "UPDATE job_listings "
+                "SET salary_annual_min = NULL, salary_annual_max = NULL"
+            )
+        )
+
+    await db_manager.create_tables()
+
+    async with db_manager.engine.connect() as conn:
+        stored = await conn.run_sync(read_schema_version)
+        annual_max = await conn.scalar(
+            text("SELECT salary_annual_max FROM job_listings WHERE id = :id"),
+            {"id": str(job.id)},
+        )
+    assert stored == (schema_version(), True)
+    assert annual_max is not None
+
+
+# ==================== Jobs ====================
+
+
+@pytest.mark.asyncio
+async def test_job_crud(db_manager, sample_jobs):
+    job_repo = AsyncJobRepository(db_manager)
+    job_id = str(sample_jobs[0].id)
+
+    assert (await job_repo.get_job(job_id)).title == "Senior Python Developer"
+
+    updated = await job_repo.update_job(job_id, {"title": "Staff Python Developer"})
+    assert updated.title == "Staff Python Developer"
+
+    assert await job_repo.delete_job(job_id)
+    assert await job_repo.get_job(job_id) is None
+
+
+@pytest.mark.asyncio
+async def test_search_matches_sync_repository(db_manager, sample_jobs):
+    job_repo = AsyncJobRepository(db_manager)
+    sync_repo = JobRepository(DatabaseManager(db_manager.database_url))
+
+    for filters in ({"query": "python"}, {"job_types": [JobType.CONTRACT]}, {}):
+        jobs, total = await job_repo.search_jobs(**filters)
+        sync_jobs, sync_total = sync_repo.search_jobs(**filters)
+
+        assert total == sync_total
+        assert [job.id for job in jobs] == [job.id for job in sync_jobs]
+
+    sync_repo.db_manager.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_search_page_follows_cursor(db_manager, sample_jobs):
+    job_repo = AsyncJobRepository(db_manager)
+
+    first = await job_repo.search_jobs_page(limit=1, include_total=True)
+    second = await job_repo.search_jobs_page(limit=1, cursor=first.next_cursor)
+
+    assert first.total == 2
+    assert second.next_cursor is None
+    assert {first.items[0].id, second.items[0].id} == {job.id for job in sample_jobs}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads(db_manager, sample_jobs):
+    job_repo = AsyncJobRepository(db_manager)
+
+    results = await asyncio.gather(
+        *[job_repo.get_job(str(sample_jobs[i % 2].id)) for i in range(20)]
+    )
+
+    assert all(job is not None for job in results)
+
+
+# ==================== Users, Saved Jobs, Applications ====================
+
+
+@pytest.mark.asyncio
+async def test_user_and_saved_jobs(db_manager, sample_jobs):
+    user_repo = AsyncUserRepository(db_manager)
+    saved_repo = AsyncSavedJobRepository(db_manager)
+    user = await user_repo.create_user(
+        UserProfile(first_name="Ada", email="ada@example.com")
+    )
+    job_id, user_id = str(sample_jobs[0].id), str(user.id)
+
+    assert (await user_repo.get_user_by_email("ada@example.com")).id == user.id
+
+    await saved_repo.save_job(job_id, user_id, notes="apply soon")
+    assert await saved_repo.is_job_saved(job_id, user_id)
+
+    saved = await saved_repo.get_saved_jobs(user_id)
+    assert saved[0]["job"]["title"] == "Senior Python Developer"
+    assert saved[0]["saved_job"]["notes"] == "apply soon"
+
+    assert await saved_repo.unsave_job(job_id, user_id)
+    assert not await saved_repo.is_job_saved(job_id, user_id)
+
+
+@pytest.mark.asyncio
+async def test_applications(db_manager, sample_jobs):
+    app_repo = AsyncApplicationRepository(db_manager)
+    user_id = uuid4()
+    for job in sample_jobs:
+        await app_repo.create_application(
+            JobApplication(job_id=job.id, user_profile_id=user_id)
+        )
+
+    applications, total = await app_repo.get_applications(str(user_id))
+    page = await app_repo.get_applications_page(str(user_id), limit=1)
+
+    assert total == len(applications) == 2
+    assert len(page.items) == 1 and page.next_cursor
+
+
+# ==================== Skill Bank ====================
+
+
+@pytest.mark.asyncio
+async def test_skill_bank_get_or_create(db_manager):
+    user = await AsyncUserRepository(db_manager).create_user(
+        UserProfile(first_name="Grace")
+    )
+    skill_bank_repo = SkillBankRepository(db_manager)
+
+    created = await skill_bank_repo.get_or_create_skill_bank(str(user.id))
+    updated = await skill_bank_repo.update_skill_bank(
+        str(user.id), {"default_summary": "Compiler engineer"}
+    )
+
+    assert created.user_id == str(user.id)
+    assert updated.default_summary == "Compiler engineer"
+    assert (await skill_bank_repo.get_skill_bank(str(user.id))).id == created.id
+
+
+@pytest.mark.asyncio
+async def test_mock_data_generator_builds_skill_bank(db_manager):
+    from app.data.mock_data_generator import MockDataGenerator
+
+    generator = MockDataGenerator(DatabaseManager(db_manager.database_url))
+    user_id = generator.create_user_profile(MockDataGenerator.SAMPLE_USERS[0])
+
+    skill_bank = await generator.create_comprehensive_skill_bank(user_id)
+
+    assert skill_bank.user_id == user_id
+    assert skill_bank.skills and skill_bank.work_experiences
+    await generator.async_db_manager.dispose()
+    generator.db_manager.engine.dispose()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Batch Fetch Tests
+
+Tests the batch repository lookups (get_jobs_by_ids, get_users_by_ids,
+get_applications_with_jobs) that keep application views at a constant
+number of queries.
+"""
+
+import os
+import tempfile
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+from app.data.async_database import (
+    AsyncApplicationRepository,
+    AsyncDatabaseManager,
+    AsyncJobRepository,
+)
+from app.data.database import (
+    ApplicationRepository,
+    DatabaseManager,
+    JobRepository,
+    UserRepository,
+)
+from app.data.models import JobApplication, JobListing, JobListingDB, UserProfile
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def db_manager():
+    """Database manager backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield manager
+        manager.engine.dispose()
+
+
+@pytest.fixture
+def jobs(db_manager):
+    job_repo = JobRepository(db_manager)
+    return [
+        job_repo.create_job(JobListing(title=f"Engineer {i}", company="Acme Corp"))
+        for i in range(20)
+    ]
+
+
+@pytest.fixture
+def user_id(db_manager, jobs):
+    """A user who applied to every job."""
+    user_id = uuid4()
+    app_repo = ApplicationRepository(db_manager)
+    for job in jobs:
+        app_repo.create_application(
+            JobApplication(job_id=job.id, user_profile_id=user_id)
+        )
+    return str(user_id)
+
+
+def count_queries(engine):
+    """Count SELECT statements executed on ``engine``."""
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+# ==================== Jobs & Users ====================
+
+
+def test_get_jobs_by_ids_uses_one_query(db_manager, jobs):
+    job_repo = JobRepository(db_manager)
+    job_ids = [str(job.id) for job in jobs[:10]]
+    queries = count_queries(db_manager.engine)
+
+    found = job_repo.get_jobs_by_ids(job_ids + [str(uuid4())])
+
+    assert set(found) == set(job_ids)
+    assert found[job_ids[0]].title == "Engineer 0"
+    assert len(queries) == 1
+
+
+def test_get_jobs_by_ids_only_loads_cache_misses(db_manager, jobs):
+    job_repo = JobRepository(db_manager)
+    job_repo.get_jobs_by_ids(str(job.id) for job in jobs[:5])
+    queries = count_queries(db_manager.engine)
+
+    job_repo.get_jobs_by_ids(str(job.id) for job in jobs[:5])
+    assert queries == []
+
+    assert len(job_repo.get_jobs_by_ids(str(job.id) for job in jobs[:8])) == 8
+    assert len(queries) == 1
+
+
+def test_get_users_by_ids(db_manager):
+    user_repo = UserRepository(db_manager)
+    users = [user_repo.create_user(UserProfile(first_name=n)) for n in ("Ada", "Bo")]
+
+    found = user_repo.get_users_by_ids([str(users[1].id), str(users[1].id)])
+
+    assert list(found) == [str(users[1].id)]
+    assert found[str(users[1].id)].first_name == "Bo"
+
+
+# ==================== Applications ====================
+
+
+@pytest.mark.parametrize("limit", [5, 20])
+def test_applications_with_jobs_query_count_is_constant(db_manager, user_id, limit):
+    app_repo = ApplicationRepository(db_manager)
+    queries = count_queries(db_manager.engine)
+
+    page = app_repo.get_applications_with_jobs(user_id, limit=limit)
+
+    assert len(page.items) == limit
+    assert len(queries) == 1
+    for application, job in page.items:
+        assert job.id == application.job_id
+
+
+def test_applications_with_jobs_matches_page_order(db_manager, user_id):
+    app_repo = ApplicationRepository(db_manager)
+
+    page = app_repo.get_applications_with_jobs(user_id, limit=7, include_total=True)
+    plain = app_repo.get_applications_page(user_id, limit=7)
+    rest = app_repo.get_applications_with_jobs(user_id, cursor=page.next_cursor)
+
+    assert page.total == 20
+    assert [app.id for app, _ in page.items] == [app.id for app in plain.items]
+    assert len(rest.items) == 13
+
+
+def test_applications_with_missing_job(db_manager, user_id, jobs):
+    with db_manager.get_session() as session:
+        session.query(JobListingDB).filter(JobListingDB.id == str(jobs[0].id)).delete()
+
+    page = ApplicationRepository(db_manager).get_applications_with_jobs(user_id)
+
+    assert len(page.items) == 20
+    assert sum(job is None for _, job in page.items) == 1
+
+
+# ==================== Async ====================
+
+
+@pytest_asyncio.fixture
+async def async_db_manager(db_manager):
+    manager = AsyncDatabaseManager(db_manager.database_url)
+    yield manager
+    await manager.dispose()
+
+
+@pytest.mark.asyncio
+async def test_async_batch_lookups(async_db_manager, user_id, jobs):
+    job_ids = [str(job.id) for job in jobs[:3]]
+
+    found = await AsyncJobRepository(async_db_manager).get_jobs_by_ids(job_ids)
+    page = await AsyncApplicationRepository(
+        async_db_manager
+    ).get_applications_with_jobs(user_id, limit=4)
+
+    assert set(found) == set(job_ids)
+    assert len(page.items) == 4
+    assert all(job.id == app.job_id for app, job in page.items)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Bulk Upsert Tests
+
+Tests JobRepository.bulk_create_jobs: chunked INSERT ... ON CONFLICT keyed
+on id or job_url, and the inserted/updated/skipped counts it reports.
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from app.data import database
+from app.data.database import DatabaseManager, JobRepository
+from app.data.models import JobListing
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def job_repo():
+    """Job repository backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield JobRepository(manager)
+        manager.engine.dispose()
+
+
+def make_jobs(count, title="Python Developer", **overrides):
+    return [
+        JobListing(
+            title=f"{title} {i}",
+            company="Acme Corp",
+            description="Python services",
+            job_url=f"https://example.com/jobs/{i}",
+            **overrides,
+        )
+        for i in range(count)
+    ]
+
+
+# ==================== Tests ====================
+
+
+def test_inserts_in_chunks(job_repo):
+    result = job_repo.bulk_create_jobs(make_jobs(25), chunk_size=10)
+
+    assert (result.inserted, result.updated, result.skipped) == (25, 0, 0)
+    assert job_repo.search_jobs_page(include_total=True).total == 25
+
+
+def test_updates_existing_ids(job_repo):
+    jobs = make_jobs(5)
+    job_repo.bulk_create_jobs(jobs)
+    original_created_at = job_repo.get_job(str(jobs[0].id)).created_at
+
+    renamed = [job.copy(update={"title": "Staff Engineer"}) for job in jobs]
+    result = job_repo.bulk_create_jobs(renamed + make_jobs(2, title="Data Engineer"))
+
+    assert (result.inserted, result.updated) == (2, 5)
+    stored = job_repo.get_job(str(jobs[0].id))
+    assert stored.title == "Staff Engineer"
+    assert stored.created_at == original_created_at
+
+
+def test_matches_on_job_url(job_repo):
+    first = make_jobs(3)
+    job_repo.bulk_create_jobs(first)
+
+    result = job_repo.bulk_create_jobs(
+        make_jobs(3, title="Senior Python Developer"), conflict_key="job_url"
+    )
+
+    assert (result.inserted, result.updated) == (0, 3)
+    stored = job_repo.get_job(str(first[1].id))
+    assert stored.title == "Senior Python Developer 1"
+
+
+def test_skips_existing_when_not_updating(job_repo):
+    jobs = make_jobs(4)
+    job_repo.bulk_create_jobs(jobs[:2])
+
+    result = job_repo.bulk_create_jobs(jobs, update_existing=False)
+
+    assert (result.inserted, result.updated, result.skipped) == (2, 0, 2)
+
+
+def test_repeated_keys_keep_last(job_repo):
+    jobs = make_jobs(2)
+    jobs.append(jobs[0].copy(update={"title": "Renamed"}))
+
+    result = job_repo.bulk_create_jobs(jobs)
+
+    assert (result.inserted, result.skipped) == (2, 1)
+    assert job_repo.get_job(str(jobs[0].id)).title == "Renamed"
+
+
+def test_updates_refresh_fulltext_index(job_repo):
+    jobs = make_jobs(3)
+    job_repo.bulk_create_jobs(jobs)
+    job_repo.bulk_create_jobs(
+        [job.copy(update={"description": "Rust compilers"}) for job in jobs]
+    )
+
+    assert job_repo.search_jobs_page(query="rust", include_total=True).total == 3
+    assert job_repo.search_jobs_page(query="services", include_total=True).total == 0
+
+
+def test_rejects_unknown_conflict_key(job_repo):
+    with pytest.raises(ValueError):
+        job_repo.bulk_create_jobs(make_jobs(1), conflict_key="title")
+
+
+def test_rejects_job_url_match_whose_id_is_another_stored_job(job_repo):
+    first, second = make_jobs(2)
+    job_repo.bulk_create_jobs([first, second])
+    clash = second.copy(update={"job_url": first.job_url, "title": "Clash"})
+
+    with pytest.raises(ValueError):
+        job_repo.bulk_create_jobs([clash], conflict_key="job_url")
+
+    assert job_repo.get_job(str(first.id)).title == first.title
+    assert job_repo.get_job(str(second.id)).title == second.title
+
+
+def test_dialects_without_upsert_write_through_orm(job_repo, monkeypatch):
+    monkeypatch.setattr(database, "_UPSERT_INSERTS", {})
+    jobs = make_jobs(4)
+    job_repo.bulk_create_jobs(jobs[:2])
+    original_created_at = job_repo.get_job(str(jobs[0].id)).created_at
+
+    renamed = [job.copy(update={"title": "Staff Engineer"}) for job in jobs]
+    result = job_repo.bulk_create_jobs(renamed, chunk_size=3)
+
+    assert (result.inserted, result.updated) == (2, 2)
+    stored = job_repo.get_job(str(jobs[0].id))
+    assert stored.title == "Staff Engineer"
+    assert stored.created_at == original_created_at
+    assert job_repo.search_jobs_page(query="staff", include_total=True).total == 4
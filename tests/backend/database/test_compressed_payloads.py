@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Compressed Payload Tests
+
+Tests the CompressedJSON column behind raw_job_collections.raw_response,
+the backfill of uncompressed rows and the collector's size metrics.
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from app.data.compression import compress_json, decompress_json
+from app.data.database import DatabaseManager
+from app.data.migrations import migrate_compressed_payloads
+from app.data.models import ETLOperationLogDB, RawJobCollectionDB
+
+RESPONSE = {
+    "status": "OK",
+    "data": [
+        {
+            "job_id": f"job-{i}",
+            "job_title": "Senior Python Developer",
+            "employer_name": "Acme Corp",
+            "job_description": "Build and maintain data pipelines. " * 20,
+        }
+        for i in range(10)
+    ],
+}
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+@pytest.fixture
+def db_manager(temp_dir):
+    """Database manager backed by a temporary SQLite database."""
+    manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+    yield manager
+    manager.engine.dispose()
+
+
+def make_collector(db_manager, temp_dir, codec):
+    # app.etl pulls in the scheduler's dependencies
+    pytest.importorskip("apscheduler")
+    collector_module = pytest.importorskip("app.etl.collector")
+    config = collector_module.ETLConfig(
+        raw_data_dir=temp_dir / "raw",
+        processed_data_dir=temp_dir / "processed",
+        failed_data_dir=temp_dir / "failed",
+        logs_dir=temp_dir / "logs",
+        raw_compression=codec,
+    )
+    collector = collector_module.JSearchDataCollector(config)
+    collector.db_manager = db_manager
+    return collector
+
+
+def collection_data():
+    return {
+        "timestamp": datetime(2024, 1, 15),
+        "api_provider": "jsearch",
+        "query_params": {"query": "python developer"},
+        "raw_response": RESPONSE,
+        "metadata": {"job_count": len(RESPONSE["data"])},
+    }
+
+
+# ==================== Encoding ====================
+
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma", "none"])
+def test_codecs_round_trip(codec):
+    blob = compress_json(RESPONSE, codec)
+
+    assert decompress_json(blob) == RESPONSE
+    if codec != "none":
+        assert len(blob) * 5 < len(json.dumps(RESPONSE))
+
+
+def test_legacy_json_text_still_decodes():
+    assert decompress_json(json.dumps(RESPONSE)) == RESPONSE
+
+
+def test_rejects_unknown_codec():
+    with pytest.raises(ValueError):
+        compress_json(RESPONSE, "brotli")
+
+
+# ==================== Database ====================
+
+
+def test_column_stores_compressed_blob(db_manager):
+    with db_manager.get_session() as session:
+        session.add(
+            RawJobCollectionDB(
+                id="c1", api_provider="jsearch", query_params={}, raw_response=RESPONSE
+            )
+        )
+
+    with db_manager.get_session() as session:
+        stored_type, size = session.execute(
+            text(
+                "SELECT typeof(raw_response), length(raw_response) "
+                "FROM raw_job_collections"
+            )
+        ).one()
+        loaded = session.get(RawJobCollectionDB, "c1").raw_response
+
+    assert stored_type == "blob"
+    assert size < len(json.dumps(RESPONSE)) / 5
+    assert loaded == RESPONSE
+
+
+def test_backfill_compresses_text_rows(db_manager):
+    with db_manager.engine.begin() as conn:
+        for i in range(5):
+            conn.execute(
+                text(
+                    "INSERT INTO raw_job_collections "
+                    "(id, timestamp, api_provider, query_params, raw_response) "
+                    "VALUES (:id, '2024-01-15 00:00:00', 'jsearch', '{}', :raw)"
+                ),
+                {"id": f"c{i}", "raw": json.dumps(RESPONSE)},
+            )
+
+    stats = migrate_compressed_payloads(db_manager.engine, chunk_size=2)
+
+    assert stats["rows"] == 5
+    assert stats["raw_bytes"] > 5 * stats["stored_bytes"]
+    assert migrate_compressed_payloads(db_manager.engine)["rows"] == 0
+    with db_manager.get_session() as session:
+        assert session.get(RawJobCollectionDB, "c4").raw_response == RESPONSE
+
+
+# ==================== Collector ====================
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("codec", ["lzma", "none"])
+async def test_collector_logs_compression_metrics(db_manager, temp_dir, codec):
+    collector = make_collector(db_manager, temp_dir, codec)
+
+    async def fetch_page(query, location, page):
+        return collection_data()
+
+    collector._fetch_page = fetch_page
+    collector.rate_limiter.max_calls = 100
+
+    collection_ids = await collector.collect_jobs("python developer", num_pages=2)
+
+    with db_manager.get_session() as session:
+        output = (
+            session.query(ETLOperationLogDB)
+            .filter(ETLOperationLogDB.operation_name == "jsearch_collection")
+            .one()
+            .output_data
+        )
+        collection = session.get(RawJobCollectionDB, collection_ids[0])
+        assert collection.raw_response == RESPONSE
+        assert collection.response_metadata["stored_bytes"] > 0
+
+    assert output["raw_compression"] == codec
+    assert output["raw_bytes"] == 2 * len(json.dumps(RESPONSE, separators=(",", ":")))
+    if codec == "none":
+        assert output["compression_ratio"] <= 1
+    else:
+        assert output["compression_ratio"] > 5
+    assert len(list((temp_dir / "raw").rglob("*.json*"))) == 2
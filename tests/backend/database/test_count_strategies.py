@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Count Strategy Tests
+
+Tests the exact, cached, estimated and skipped totals reported by job search
+and application listings.
+"""
+
+import os
+import tempfile
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+
+from app.data import counts as counts_module
+from app.data.async_database import AsyncDatabaseManager, AsyncJobRepository
+from app.data.counts import CountStrategy, filter_signature, total_is_lower_bound
+from app.data.database import ApplicationRepository, DatabaseManager, JobRepository
+from app.data.models import JobApplication, JobListing, JobStatus, JobType
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def db_manager():
+    """Database manager backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield manager
+        manager.engine.dispose()
+
+
+@pytest.fixture
+def job_repo(db_manager):
+    return JobRepository(db_manager)
+
+
+def make_job(i, **overrides):
+    fields = dict(
+        title=f"Python Developer {i}",
+        company="Acme Corp",
+        description="Python services",
+        job_type=JobType.FULL_TIME,
+        salary_min=100000.0 + i,
+    )
+    fields.update(overrides)
+    return JobListing(**fields)
+
+
+@pytest.fixture
+def jobs(job_repo):
+    return [job_repo.create_job(make_job(i)) for i in range(12)]
+
+
+# ==================== Filter Signature ====================
+
+
+def test_signature_normalizes_equivalent_filters():
+    first = filter_signature(
+        "jobs", query="  Python   Developer", job_types=[JobType.CONTRACT, "full_time"]
+    )
+    second = filter_signature(
+        "jobs",
+        query="python developer",
+        job_types=["full_time", JobType.CONTRACT],
+        locations=None,
+        companies=[],
+    )
+
+    assert first == second
+    assert first != filter_signature("applications", query="python developer")
+
+
+# ==================== Job Search ====================
+
+
+def test_exact_and_none(job_repo, jobs):
+    assert job_repo.search_jobs(limit=5)[1] == 12
+    found, total = job_repo.search_jobs(limit=5, count_strategy=CountStrategy.NONE)
+
+    assert len(found) == 5 and total is None
+
+
+def test_estimate_is_capped(job_repo, jobs, monkeypatch):
+    monkeypatch.setattr(counts_module, "ESTIMATE_COUNT_CAP", 10)
+
+    # Above the cap the total only says "more than 10"
+    total = job_repo.search_jobs(count_strategy=CountStrategy.ESTIMATE)[1]
+    assert total == 11
+    assert total_is_lower_bound(CountStrategy.ESTIMATE, total)
+    assert (
+        job_repo.search_jobs(min_salary=100010, count_strategy=CountStrategy.ESTIMATE)[
+            1
+        ]
+        == 2
+    )
+    assert not total_is_lower_bound(CountStrategy.ESTIMATE, 10)
+    assert not total_is_lower_bound(CountStrategy.EXACT, 12)
+
+
+def test_cached_count_survives_until_a_write(job_repo, jobs):
+    assert job_repo.search_jobs(count_strategy=CountStrategy.CACHED)[1] == 12
+
+    # Rows written behind the repository's back are not seen...
+    with job_repo.db_manager.get_session() as session:
+        session.execute(text("DELETE FROM job_listings WHERE salary_min >= 100010"))
+    assert job_repo.search_jobs(count_strategy=CountStrategy.CACHED)[1] == 12
+
+    # ...until a repository write clears the cached counts
+    job_repo.create_job(make_job(100))
+    assert job_repo.search_jobs(count_strategy=CountStrategy.CACHED)[1] == 11
+
+    job_repo.update_job_status(str(jobs[0].id), JobStatus.FILLED)
+    assert job_repo.search_jobs(count_strategy=CountStrategy.CACHED)[1] == 10
+
+
+def test_page_reports_strategy(job_repo, jobs):
+    page = job_repo.search_job_summaries_page(
+        limit=5, include_total=True, count_strategy=CountStrategy.CACHED
+    )
+    assert (page.total, page.total_strategy) == (12, "cached")
+    assert not page.total_is_lower_bound
+
+    page = job_repo.search_jobs_page(limit=5, count_strategy=CountStrategy.CACHED)
+    assert (page.total, page.total_strategy) == (None, None)
+
+
+# ==================== Applications ====================
+
+
+def test_cached_application_count_invalidated_on_write(db_manager, jobs):
+    app_repo = ApplicationRepository(db_manager)
+    user_id = uuid4()
+    for job in jobs[:3]:
+        app_repo.create_application(
+            JobApplication(job_id=job.id, user_profile_id=user_id)
+        )
+
+    page = app_repo.get_applications_with_jobs(
+        str(user_id), include_total=True, count_strategy=CountStrategy.CACHED
+    )
+    assert (page.total, page.total_strategy) == (3, "cached")
+
+    app_repo.create_application(
+        JobApplication(job_id=jobs[3].id, user_profile_id=user_id)
+    )
+
+    assert (
+        app_repo.get_applications(str(user_id), count_strategy=CountStrategy.CACHED)[1]
+        == 4
+    )
+
+
+# ==================== Async ====================
+
+
+@pytest_asyncio.fixture
+async def async_db_manager():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = AsyncDatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        await manager.create_tables()
+        yield manager
+        await manager.dispose()
+
+
+@pytest.mark.asyncio
+async def test_async_strategies(async_db_manager, monkeypatch):
+    monkeypatch.setattr(counts_module, "ESTIMATE_COUNT_CAP", 3)
+    job_repo = AsyncJobRepository(async_db_manager)
+    for i in range(5):
+        await job_repo.create_job(make_job(i))
+
+    page = await job_repo.search_job_summaries_page(
+        limit=2, include_total=True, count_strategy=CountStrategy.ESTIMATE
+    )
+    assert (page.total, page.total_strategy) == (4, "estimate")
+    assert page.total_is_lower_bound
+
+    assert (await job_repo.search_jobs(count_strategy=CountStrategy.CACHED))[1] == 5
+    await job_repo.create_job(make_job(5))
+    assert (await job_repo.search_jobs(count_strategy=CountStrategy.CACHED))[1] == 6
+    assert (await job_repo.search_jobs(count_strategy=CountStrategy.NONE))[1] is None
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Embedding Index Tests
+
+Tests the in-memory job embedding matrix behind semantic search: jobs are
+embedded once, in the background, and stored, repository writes refresh
+only the jobs written, and search filters are masks over the matrix.
+"""
+
+import os
+import tempfile
+import threading
+import zlib
+
+import numpy as np
+import pytest
+from sqlalchemy import insert
+
+from app.data.database import DatabaseManager, JobRepository
+from app.data.embedding_index import JobEmbeddingIndex, get_embedding_index
+from app.data.models import (
+    JobEmbeddingDB,
+    JobListing,
+    JobStatus,
+    JobType,
+    RemoteType,
+)
+
+MODEL = "test-model"
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def db_manager():
+    """Database manager backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield manager
+        manager.engine.dispose()
+
+
+@pytest.fixture
+def job_repo(db_manager):
+    return JobRepository(db_manager)
+
+
+class BagOfWordsEncoder:
+    """Deterministic stand-in for a sentence transformer."""
+
+    def __init__(self, dimension=64):
+        self.dimension = dimension
+        self.encoded = []
+
+    def __call__(self, texts):
+        self.encoded.extend(texts)
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                vectors[row, zlib.crc32(word.encode()) % self.dimension] += 1.0
+        return vectors
+
+
+def job_text(job):
+    return " ".join(filter(None, [job.title, job.description]))
+
+
+@pytest.fixture
+def encoder():
+    return BagOfWordsEncoder()
+
+
+@pytest.fixture
+def index(db_manager):
+    return get_embedding_index(db_manager.engine, MODEL)
+
+
+def make_job(title, description, **fields):
+    return JobListing(
+        title=title, company="Acme Corp", description=description, **fields
+    )
+
+
+@pytest.fixture
+def jobs(job_repo):
+    return [
+        job_repo.create_job(
+            make_job(
+                "Python Engineer",
+                "python django backend",
+                job_type=JobType.FULL_TIME,
+                remote_type=RemoteType.REMOTE,
+                location="Austin, TX",
+                salary_min=120000,
+                salary_max=150000,
+            )
+        ),
+        job_repo.create_job(
+            make_job(
+                "Data Engineer",
+                "python spark pipelines",
+                job_type=JobType.CONTRACT,
+                location="Boston, MA",
+                salary_min=60,
+                salary_max=80,
+                salary_period="hour",
+            )
+        ),
+        job_repo.create_job(
+            make_job("iOS Developer", "swift mobile apps", job_type=JobType.FULL_TIME)
+        ),
+    ]
+
+
+def search(index, job_repo, encoder, query, **filters):
+    return [
+        job_id for job_id, _ in index.search(job_repo, encoder([query])[0], **filters)
+    ]
+
+
+def sync(index, job_repo, encoder):
+    """Sync, then wait for the background embedding it started."""
+    queued = index.sync(job_repo, encoder, job_text)
+    index.wait_for_embedding(5)
+    return queued
+
+
+def stored_embeddings(db_manager):
+    with db_manager.get_session() as session:
+        return session.query(JobEmbeddingDB).count()
+
+
+# ==================== Sync ====================
+
+
+def test_jobs_are_embedded_once_and_stored(db_manager, job_repo, index, encoder, jobs):
+    assert sync(index, job_repo, encoder) == 3
+    assert len(index) == 3 and stored_embeddings(db_manager) == 3
+
+    assert sync(index, job_repo, encoder) == 0
+    assert len(encoder.encoded) == 3
+
+    # A fresh index loads the stored vectors instead of encoding again
+    reloaded = JobEmbeddingIndex(MODEL)
+    assert reloaded.sync(job_repo, encoder, job_text) == 0
+    assert len(reloaded) == 3
+
+
+def test_sync_does_not_wait_for_embedding(job_repo, index, encoder, jobs):
+    python, data, ios = jobs
+    sync(index, job_repo, encoder)
+    release = threading.Event()
+
+    def blocked(texts):
+        release.wait(5)
+        return encoder(texts)
+
+    job_repo.update_job(str(ios.id), {"description": "kotlin android apps"})
+    added = job_repo.create_job(make_job("Rust Engineer", "rust systems"))
+    assert index.sync(job_repo, blocked, job_text) == 2
+
+    # Until re-embedded, the changed job is searched with its old vector
+    assert len(index) == 3
+    assert search(index, job_repo, encoder, "swift mobile")[0] == str(ios.id)
+
+    release.set()
+    index.wait_for_embedding(5)
+    assert len(index) == 4
+    assert search(index, job_repo, encoder, "kotlin android")[0] == str(ios.id)
+    assert search(index, job_repo, encoder, "rust systems")[0] == str(added.id)
+
+
+def test_writes_refresh_only_written_jobs(db_manager, job_repo, index, encoder, jobs):
+    python, data, ios = jobs
+    sync(index, job_repo, encoder)
+    encoder.encoded.clear()
+
+    job_repo.update_job(str(ios.id), {"description": "kotlin android apps"})
+    job_repo.update_job(str(data.id), {"salary_max": 90})
+    job_repo.update_job_status(str(python.id), JobStatus.FILLED)
+    added = job_repo.create_job(make_job("Rust Engineer", "rust systems"))
+
+    assert sync(index, job_repo, encoder) == 2
+    assert sorted(encoder.encoded) == [
+        "Rust Engineer rust systems",
+        "iOS Developer kotlin android apps",
+    ]
+    assert len(index) == 3
+    assert search(index, job_repo, encoder, "kotlin android")[0] == str(ios.id)
+    assert str(python.id) not in search(index, job_repo, encoder, "python django")
+
+    assert job_repo.delete_job(str(added.id))
+    sync(index, job_repo, encoder)
+    assert len(index) == 2 and stored_embeddings(db_manager) == 3
+
+
+def test_bulk_upserts_and_archiving(job_repo, index, encoder, jobs):
+    sync(index, job_repo, encoder)
+    job_repo.bulk_create_jobs(
+        [make_job(f"Go Engineer {i}", "go services") for i in range(3)]
+    )
+    assert sync(index, job_repo, encoder) == 3
+    assert len(index) == 6
+
+    job_repo.update_job_status(str(jobs[0].id), JobStatus.EXPIRED)
+    job_repo.archive_jobs(older_than_days=0)
+    sync(index, job_repo, encoder)
+    assert len(index) == 5
+
+
+def test_rows_of_other_content_types_are_left_alone(
+    db_manager, job_repo, index, encoder, jobs
+):
+    # VectorStore embeds other text for the same job under the same model
+    job_id = str(jobs[0].id)
+    with db_manager.engine.begin() as conn:
+        conn.execute(
+            insert(JobEmbeddingDB.__table__),
+            {
+                "id": "vector-store-row",
+                "job_id": job_id,
+                "embedding_model": MODEL,
+                "content_hash": "other-text",
+                "embedding_vector": np.ones(8, dtype=np.float32),
+                "embedding_dimension": 8,
+                "content_type": "job_description",
+            },
+        )
+
+    assert sync(index, job_repo, encoder) == 3
+    job_repo.update_job(job_id, {"description": "python fastapi backend"})
+    assert sync(index, job_repo, encoder) == 1
+
+    assert stored_embeddings(db_manager) == 4
+    with db_manager.get_session() as session:
+        assert session.get(JobEmbeddingDB, "vector-store-row") is not None
+
+
+# ==================== Search ====================
+
+
+def test_search_ranks_by_similarity(job_repo, index, encoder, jobs):
+    sync(index, job_repo, encoder)
+
+    hits = index.search(job_repo, encoder(["swift mobile"])[0], limit=2)
+    assert [job_id for job_id, _ in hits][0] == str(jobs[2].id)
+    assert hits[0][1] > hits[1][1] and len(hits) == 2
+
+    assert index.search(job_repo, encoder(["swift"])[0], min_similarity=0.99) == []
+
+
+def test_filters_are_masks(job_repo, index, encoder, jobs):
+    python, data, ios = (str(job.id) for job in jobs)
+    sync(index, job_repo, encoder)
+
+    def find(**filters):
+        return set(search(index, job_repo, encoder, "python", **filters))
+
+    assert find(job_types=[JobType.FULL_TIME]) == {python, ios}
+    assert find(remote_types=[RemoteType.REMOTE]) == {python}
+    assert find(locations=["Boston"]) == {data}
+    assert find(locations=["Chicago"]) == set()
+    # The hourly range annualizes to about 125k-166k USD
+    assert find(min_salary=155000) == {data}
+    assert find(max_salary=100000) == set()
+    assert find(job_types=[JobType.FULL_TIME], min_salary=100000) == {python}
+
+
+def test_in_memory_databases_get_separate_indexes():
+    first, second = DatabaseManager("sqlite://"), DatabaseManager("sqlite://")
+
+    assert get_embedding_index(first.engine, MODEL) is get_embedding_index(
+        first.engine, MODEL
+    )
+    assert get_embedding_index(first.engine, MODEL) is not get_embedding_index(
+        second.engine, MODEL
+    )
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Embedding Vector Storage Tests
+
+Tests the binary EmbeddingVector column type, bulk matrix loading and the
+migration of JSON-array vectors from older databases.
+"""
+
+import json
+import os
+import tempfile
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from sqlalchemy import text
+
+from app.data.database import DatabaseManager
+from app.data.migrations import migrate_embedding_vectors
+from app.data.models import (
+    JobEmbedding,
+    JobEmbeddingDB,
+    sqlalchemy_to_pydantic,
+)
+from app.data.vectors import (
+    EmbeddingVector,
+    decode_vector,
+    encode_vector,
+    load_vector_matrix,
+)
+
+DIMENSION = 384
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def db_manager():
+    """Database manager backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield manager
+        manager.engine.dispose()
+
+
+def make_vector(seed):
+    return np.random.default_rng(seed).random(DIMENSION, dtype=np.float32)
+
+
+def add_embedding(session, vector, job_id=None):
+    row = JobEmbeddingDB(
+        id=str(uuid4()),
+        job_id=job_id or str(uuid4()),
+        embedding_model="all-MiniLM-L6-v2",
+        content_hash="hash",
+        embedding_vector=vector,
+        embedding_dimension=len(vector),
+    )
+    session.add(row)
+    return row
+
+
+# ==================== Encoding ====================
+
+
+def test_float32_round_trip_is_zero_copy():
+    vector = make_vector(0)
+    blob = encode_vector(vector.tolist())
+
+    decoded = decode_vector(blob)
+
+    assert len(blob) == DIMENSION * 4
+    assert len(blob) * 4 < len(json.dumps(vector.tolist()))
+    np.testing.assert_array_equal(decoded, vector)
+    assert not decoded.flags.writeable
+
+
+def test_float16_halves_storage():
+    vector = make_vector(1)
+
+    decoded = decode_vector(encode_vector(vector, "float16"), "float16")
+
+    assert decoded.nbytes == DIMENSION * 2
+    np.testing.assert_allclose(decoded, vector, atol=1e-3)
+
+
+def test_legacy_json_text_still_decodes():
+    np.testing.assert_array_equal(decode_vector("[0.5, 1.5]"), [0.5, 1.5])
+
+
+def test_json_null_decodes_to_none():
+    assert decode_vector("null") is None
+    assert encode_vector("null") is None
+
+
+@pytest.mark.parametrize(
+    "value", ["5", '"text"', '{"a": 1}', "[[1, 2]]", '[1, "x"]', "[true]"]
+)
+def test_rejects_json_that_is_not_a_numeric_list(value):
+    with pytest.raises(ValueError):
+        decode_vector(value)
+    with pytest.raises(ValueError):
+        encode_vector(value)
+
+
+def test_rejects_unknown_dtype():
+    with pytest.raises(ValueError):
+        EmbeddingVector("float64")
+
+
+# ==================== Database ====================
+
+
+def test_column_stores_blob_and_maps_to_lists(db_manager):
+    vector = make_vector(2)
+    with db_manager.get_session() as session:
+        embedding_id = add_embedding(session, vector.tolist()).id
+
+    with db_manager.get_session() as session:
+        stored_type = session.execute(
+            text("SELECT typeof(embedding_vector) FROM job_embeddings")
+        ).scalar()
+        row = session.get(JobEmbeddingDB, embedding_id)
+        loaded = row.embedding_vector
+        embedding = sqlalchemy_to_pydantic(row, JobEmbedding, trusted=True)
+
+    assert stored_type == "blob"
+    assert isinstance(loaded, np.ndarray)
+    assert embedding.embedding_vector == vector.tolist()
+
+
+def test_load_vector_matrix(db_manager):
+    vectors = {}
+    with db_manager.get_session() as session:
+        for seed in range(5):
+            row = add_embedding(session, make_vector(seed))
+            vectors[row.id] = make_vector(seed)
+
+    with db_manager.get_session() as session:
+        ids, matrix = load_vector_matrix(
+            session, JobEmbeddingDB.id, JobEmbeddingDB.embedding_vector
+        )
+
+    assert matrix.shape == (5, DIMENSION) and matrix.dtype == np.float32
+    for i, embedding_id in enumerate(ids):
+        np.testing.assert_array_equal(matrix[i], vectors[embedding_id])
+
+
+def test_migration_converts_json_rows_in_chunks(db_manager):
+    vectors = [make_vector(seed).tolist() for seed in range(7)]
+    with db_manager.engine.begin() as conn:
+        for vector in vectors:
+            conn.execute(
+                text(
+                    "INSERT INTO job_embeddings (id, job_id, embedding_model, "
+                    "content_hash, embedding_vector, embedding_dimension) "
+                    "VALUES (:id, :job_id, 'model', 'hash', :vector, :dimension)"
+                ),
+                {
+                    "id": str(uuid4()),
+                    "job_id": str(uuid4()),
+                    "vector": json.dumps(vector),
+                    "dimension": DIMENSION,
+                },
+            )
+
+    assert migrate_embedding_vectors(db_manager.engine, chunk_size=3) == 7
+    assert migrate_embedding_vectors(db_manager.engine) == 0
+
+    with db_manager.get_session() as session:
+        types = (
+            session.execute(
+                text("SELECT DISTINCT typeof(embedding_vector) FROM job_embeddings")
+            )
+            .scalars()
+            .all()
+        )
+        _, matrix = load_vector_matrix(
+            session, JobEmbeddingDB.id, JobEmbeddingDB.embedding_vector
+        )
+
+    assert types == ["blob"]
+    assert matrix.shape == (7, DIMENSION)
+
+
+def test_migration_drops_json_null_and_skips_non_numeric_rows(db_manager):
+    rows = {"null": "null", "scalar": "5", "nested": "[[1, 2]]", "text": '["a"]'}
+    with db_manager.engine.begin() as conn:
+        for job_id, vector in rows.items():
+            conn.execute(
+                text(
+                    "INSERT INTO job_embeddings (id, job_id, embedding_model, "
+                    "content_hash, embedding_vector, embedding_dimension) "
+                    "VALUES (:id, :job_id, 'model', 'hash', :vector, 0)"
+                ),
+                {"id": str(uuid4()), "job_id": job_id, "vector": vector},
+            )
+
+    # embedding_vector is NOT NULL, so the null row is deleted, not nulled
+    assert migrate_embedding_vectors(db_manager.engine) == 1
+
+    with db_manager.engine.connect() as conn:
+        types = dict(
+            conn.execute(
+                text("SELECT job_id, typeof(embedding_vector) FROM job_embeddings")
+            ).all()
+        )
+    assert types == {"scalar": "text", "nested": "text", "text": "text"}
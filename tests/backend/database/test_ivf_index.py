@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+IVF Vector Index Tests
+
+Tests the approximate vector store backend: exact search until trained,
+recall against ExactVectorIndex as nprobe grows, product quantization,
+incremental add and delete, and saving to disk.
+"""
+
+import numpy as np
+import pytest
+
+from app.data.ivf_index import IVFVectorIndex
+from app.data.vector_index import ExactVectorIndex
+
+DIMENSION = 32
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    """Vectors clustered around 50 centers, with ids and queries."""
+    rng = np.random.default_rng(5)
+    centers = rng.standard_normal((50, DIMENSION))
+    vectors = centers[rng.integers(0, 50, 4000)]
+    vectors = (vectors + 0.4 * rng.standard_normal(vectors.shape)).astype(np.float32)
+    queries = vectors[rng.integers(0, 4000, 30)] + 0.2 * rng.standard_normal(
+        (30, DIMENSION)
+    )
+    return [f"job-{i}" for i in range(len(vectors))], vectors, queries
+
+
+@pytest.fixture(scope="module")
+def exact(dataset):
+    ids, vectors, _ = dataset
+    index = ExactVectorIndex(DIMENSION)
+    index.add(ids, vectors)
+    return index
+
+
+def build(dataset, **options):
+    ids, vectors, _ = dataset
+    index = IVFVectorIndex(DIMENSION, **options)
+    for start in range(0, len(ids), 1000):
+        index.add(ids[start : start + 1000], vectors[start : start + 1000])
+    return index
+
+
+def recall(index, exact, queries, k=10, **options):
+    found = 0
+    for query in queries:
+        truth = {job_id for job_id, _ in exact.search(query, k)}
+        found += len(
+            truth & {job_id for job_id, _ in index.search(query, k, **options)}
+        )
+    return found / (k * len(queries))
+
+
+# ==================== Training & Recall ====================
+
+
+def test_exact_until_trained(dataset, exact):
+    ids, vectors, queries = dataset
+    index = IVFVectorIndex(DIMENSION, min_train_points=1000)
+    index.add(ids[:999], vectors[:999])
+    assert not index.is_trained
+    assert index.search(vectors[5], 1)[0][0] == "job-5"
+
+    index.add(ids[999:2000], vectors[999:2000])
+    assert index.is_trained and len(index) == 2000
+    assert index.search(vectors[5], 1)[0][0] == "job-5"
+
+
+def test_recall_grows_with_nprobe(dataset, exact):
+    index = build(dataset, n_lists=64)
+    queries = dataset[2]
+
+    low = recall(index, exact, queries, nprobe=1)
+    high = recall(index, exact, queries, nprobe=16)
+    assert low <= high and high >= 0.9
+    # Probing every cell without PQ is an exact search
+    assert recall(index, exact, queries, nprobe=64) == 1.0
+
+
+def test_product_quantization(dataset, exact):
+    index = build(dataset, n_lists=32, pq_subvectors=8)
+    assert index.search(dataset[1][0], 1, nprobe=32)[0][0] == "job-0"
+    assert recall(index, exact, dataset[2], nprobe=32) >= 0.5
+
+    with pytest.raises(ValueError):
+        IVFVectorIndex(DIMENSION, pq_subvectors=5)
+
+
+# ==================== Writes & Persistence ====================
+
+
+def test_incremental_add_and_delete(dataset):
+    ids, vectors, _ = dataset
+    index = build(dataset, n_lists=32)
+
+    index.add(["job-new", "job-1"], [vectors[7], vectors[9]])
+    assert len(index) == len(ids) + 1
+    hits = index.search(vectors[9], 2, nprobe=32)
+    assert {job_id for job_id, _ in hits} == {"job-1", "job-9"}
+
+    assert index.remove(["job-9", "job-7", "missing"]) == 2
+    assert "job-9" not in index and len(index) == len(ids) - 1
+    assert index.search(vectors[7], 1, nprobe=32)[0][0] == "job-new"
+    assert index.search(
+        vectors[7], 3, threshold=0.5, accept=lambda ids: [i != "job-new" for i in ids]
+    )
+
+
+@pytest.mark.parametrize("pq_subvectors", [None, 8])
+def test_save_and_load(tmp_path, dataset, pq_subvectors):
+    index = build(dataset, n_lists=16, nprobe=4, pq_subvectors=pq_subvectors)
+    index.remove(["job-3"])
+    path = str(tmp_path / "ivf.npz")
+    index.save(path)
+
+    loaded = IVFVectorIndex.load(path)
+    assert len(loaded) == len(index) and loaded.nprobe == 4
+    for query in dataset[2][:5]:
+        assert loaded.search(query, 5) == index.search(query, 5)
+
+    loaded.add(["job-3"], [dataset[1][3]])
+    assert loaded.search(dataset[1][3], 1, nprobe=16)[0][0] == "job-3"
+
+
+def test_save_untrained(tmp_path, dataset):
+    ids, vectors, _ = dataset
+    index = IVFVectorIndex(DIMENSION)
+    index.add(ids[:10], vectors[:10])
+    path = str(tmp_path / "ivf.npz")
+    index.save(path)
+
+    loaded = IVFVectorIndex.load(path)
+    assert not loaded.is_trained and len(loaded) == 10
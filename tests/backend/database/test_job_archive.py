@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Job Archive Tests
+
+Tests moving non-active job listings to job_listings_archive: which
+listings qualify, chunked moves, and the read paths that only look in the
+archive when history is requested.
+"""
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.data.archive import archive_jobs
+from app.data.async_database import AsyncDatabaseManager, AsyncJobRepository
+from app.data.database import DatabaseManager, JobRepository
+from app.data.models import JobListing, JobListingArchiveDB, JobListingDB, JobStatus
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def db_manager():
+    """Database manager backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield manager
+        manager.engine.dispose()
+
+
+@pytest.fixture
+def job_repo(db_manager):
+    return JobRepository(db_manager)
+
+
+def make_job(title, status=JobStatus.ACTIVE, **fields):
+    return JobListing(title=title, company="Acme Corp", status=status, **fields)
+
+
+def table_ids(db_manager, model):
+    with db_manager.get_session() as session:
+        return {row.id for row in session.query(model.id)}
+
+
+# ==================== Mover ====================
+
+
+def test_only_old_non_active_jobs_are_archived(db_manager, job_repo):
+    active = job_repo.create_job(make_job("Active"))
+    expired = job_repo.create_job(make_job("Expired", JobStatus.EXPIRED))
+    filled = job_repo.create_job(make_job("Filled", JobStatus.FILLED))
+
+    assert archive_jobs(db_manager.engine, older_than_days=30) == 0
+
+    later = datetime.utcnow() + timedelta(days=31)
+    assert archive_jobs(db_manager.engine, older_than_days=30, now=later) == 2
+
+    assert table_ids(db_manager, JobListingDB) == {str(active.id)}
+    assert table_ids(db_manager, JobListingArchiveDB) == {
+        str(expired.id),
+        str(filled.id),
+    }
+
+
+def test_archives_in_chunks(db_manager, job_repo):
+    for i in range(5):
+        job_repo.create_job(make_job(f"Expired {i}", JobStatus.EXPIRED))
+
+    assert job_repo.archive_jobs(older_than_days=0, chunk_size=2) == 5
+    assert table_ids(db_manager, JobListingDB) == set()
+
+
+def test_referenced_jobs_stay(db_manager, job_repo):
+    canonical = job_repo.create_job(make_job("Canonical", JobStatus.EXPIRED))
+    job_repo.create_job(make_job("Duplicate", canonical_id=canonical.id))
+
+    assert job_repo.archive_jobs(older_than_days=0) == 0
+    assert str(canonical.id) in table_ids(db_manager, JobListingDB)
+
+
+# ==================== Read Paths ====================
+
+
+def test_archived_jobs_only_read_with_history(job_repo):
+    job = job_repo.create_job(make_job("Filled", JobStatus.FILLED, location="Remote"))
+    assert job_repo.get_job(str(job.id)).title == "Filled"
+
+    job_repo.archive_jobs(older_than_days=0)
+
+    assert job_repo.get_job(str(job.id)) is None
+    archived = job_repo.get_job(str(job.id), include_archived=True)
+    assert archived.title == "Filled" and archived.status == JobStatus.FILLED
+    assert [j.title for j in job_repo.get_archived_jobs(company="ACME")] == ["Filled"]
+    assert job_repo.get_archived_jobs(company="Globex") == []
+
+
+@pytest.mark.asyncio
+async def test_async_archive_reads(db_manager, job_repo):
+    job = job_repo.create_job(make_job("Expired", JobStatus.EXPIRED))
+    job_repo.archive_jobs(older_than_days=0)
+
+    async_manager = AsyncDatabaseManager(db_manager.database_url)
+    async_repo = AsyncJobRepository(async_manager)
+    try:
+        assert await async_repo.get_job(str(job.id)) is None
+        archived = await async_repo.get_job(str(job.id), include_archived=True)
+        assert archived.title == "Expired"
+        assert len(await async_repo.get_archived_jobs()) == 1
+    finally:
+        await async_manager.dispose()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Job Dimension Tests
+
+Tests the normalized company and location tables behind job listings: key
+normalization, how listings are linked on every write path, the indexed
+search filters and the migration of existing databases.
+"""
+
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import MetaData, Table, create_engine, inspect, text
+
+from app.data import dimensions
+from app.data.database import DatabaseManager, JobRepository
+from app.data.dimensions import company_key, format_location, parse_location
+from app.data.migrations import ensure_columns, migrate_job_dimensions
+from app.data.models import Base, JobCompanyDB, JobListing, JobListingDB, JobLocationDB
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def db_manager():
+    """Database manager backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield manager
+        manager.engine.dispose()
+
+
+@pytest.fixture
+def job_repo(db_manager):
+    return JobRepository(db_manager)
+
+
+def make_job(title, company, location, **fields):
+    return JobListing(title=title, company=company, location=location, **fields)
+
+
+def titles(jobs):
+    return sorted(job.title for job in jobs)
+
+
+# ==================== Normalization ====================
+
+
+def test_company_keys():
+    assert company_key("Acme Corp") == company_key("ACME corp.") == "acme"
+    assert company_key("Acme Corporation, Inc.") == "acme"
+    assert company_key("Smith & Sons Ltd") == "smith and sons"
+    assert company_key("Co") == "co"
+    assert company_key("") is None
+
+
+def test_location_parsing():
+    austin = parse_location("Austin, TX, United States")
+    assert (austin.key, austin.city, austin.region) == ("austin, tx", "austin", "tx")
+    assert parse_location("  austin,tx ") == austin
+    assert parse_location("Remote").key == parse_location("Anywhere, US").key
+    assert parse_location("Remote").is_remote
+    assert parse_location(None) is None
+
+
+def test_format_location_matches_etl_output():
+    assert format_location("Austin", "TX", "US") == "Austin, TX"
+    assert format_location("Berlin", None, "DE") == "Berlin, DE"
+    assert format_location(None, "", None) == "Remote"
+
+
+# ==================== Write Paths ====================
+
+
+def test_create_and_update_link_dimensions(db_manager, job_repo):
+    first = job_repo.create_job(make_job("Backend", "Acme Corp", "Austin, TX"))
+    job_repo.create_job(make_job("Frontend", "ACME Inc.", "austin, tx"))
+    job_repo.update_job(str(first.id), {"company": "Globex", "location": "Remote"})
+
+    with db_manager.get_session() as session:
+        companies = {row.key for row in session.query(JobCompanyDB)}
+        locations = {row.key for row in session.query(JobLocationDB)}
+        moved = session.get(JobListingDB, str(first.id))
+        moved_company = session.get(JobCompanyDB, moved.company_id).key
+
+    assert companies == {"acme", "globex"}
+    assert locations == {"austin, tx", "remote"}
+    assert moved_company == "globex"
+
+
+def test_bulk_create_links_dimensions(db_manager, job_repo):
+    job_repo.bulk_create_jobs(
+        [make_job(f"Engineer {i}", "Initech LLC", "Denver, CO") for i in range(3)]
+    )
+
+    with db_manager.get_session() as session:
+        linked = session.query(JobListingDB).filter(
+            JobListingDB.company_id.isnot(None), JobListingDB.location_id.isnot(None)
+        )
+        assert linked.count() == 3
+        assert session.query(JobCompanyDB).count() == 1
+
+
+def test_concurrent_inserts_reuse_the_winning_row(monkeypatch, db_manager, job_repo):
+    job_repo.create_job(make_job("Backend", "Acme Corp", "Austin, TX"))
+    with db_manager.get_session() as session:
+        company_id = session.query(JobCompanyDB.id).scalar()
+        location_id = session.query(JobLocationDB.id).scalar()
+
+    # Another writer inserts the keys between the lookup and the insert
+    existing_ids = dimensions._existing_ids
+    lookups = []
+
+    def racing_lookup(conn, table, keys):
+        lookups.append(keys)
+        return {} if len(lookups) % 2 else existing_ids(conn, table, keys)
+
+    monkeypatch.setattr(dimensions, "_existing_ids", racing_lookup)
+    with db_manager.engine.begin() as conn:
+        companies = dimensions.resolve_company_ids(conn, ["ACME Inc."])
+        locations = dimensions.resolve_location_ids(conn, ["austin, tx"])
+
+    assert companies == {"acme": company_id}
+    assert locations == {"austin, tx": location_id}
+
+
+# ==================== Search Filters ====================
+
+
+@pytest.fixture
+def jobs(job_repo):
+    return [
+        job_repo.create_job(make_job("Backend", "Acme Corp", "Austin, TX")),
+        job_repo.create_job(make_job("Data", "Globex", "Austin, TX, US")),
+        job_repo.create_job(make_job("Mobile", "Initech", "Denver, CO")),
+        job_repo.create_job(make_job("Support", "Acme Corp", "Remote")),
+    ]
+
+
+def test_company_filter(job_repo, jobs):
+    found, total = job_repo.search_jobs(companies=["acme corporation"])
+    assert titles(found) == ["Backend", "Support"] and total == 2
+
+    assert titles(job_repo.get_jobs_by_company("ACME")) == ["Backend", "Support"]
+
+
+def test_location_filter(job_repo, jobs):
+    assert titles(job_repo.search_jobs(locations=["Austin, TX"])[0]) == [
+        "Backend",
+        "Data",
+    ]
+    assert titles(job_repo.search_jobs(locations=["co"])[0]) == ["Mobile"]
+    assert titles(job_repo.search_jobs(locations=["remote", "denver"])[0]) == [
+        "Mobile",
+        "Support",
+    ]
+
+
+# ==================== Migration ====================
+
+
+def test_existing_database_is_upgraded():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(temp_dir, 'old.db')}")
+        # job_listings as declared before the dimension columns existed
+        old_metadata = MetaData()
+        Table(
+            "job_listings",
+            old_metadata,
+            *[
+                column._copy()
+                for column in JobListingDB.__table__.columns
+                if column.name not in ("company_id", "location_id")
+            ],
+        )
+        old_metadata.create_all(engine)
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO job_listings (id, title, company, location) "
+                    "VALUES ('j1', 'Backend', 'Acme Corp', 'Austin, TX')"
+                )
+            )
+
+        assert set(ensure_columns(engine)) == {
+            "job_listings.company_id",
+            "job_listings.location_id",
+        }
+        assert migrate_job_dimensions(engine) == 1
+        assert migrate_job_dimensions(engine) == 0
+
+        columns = {c["name"] for c in inspect(engine).get_columns("job_listings")}
+        with engine.connect() as conn:
+            company = conn.exec_driver_sql(
+                "SELECT c.key FROM job_listings j "
+                "JOIN job_companies c ON c.id = j.company_id"
+            ).scalar()
+        assert {"company_id", "location_id"} <= columns
+        assert company == "acme"
+        engine.dispose()
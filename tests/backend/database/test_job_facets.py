@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Job Facet Tests
+
+Tests the facet counts behind the job search filters: the trigger-maintained
+job_facet_counts table, the single grouped query used for filtered searches,
+and that both agree.
+"""
+
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import event, text
+
+from app.data.async_database import AsyncDatabaseManager, AsyncJobRepository
+from app.data.database import DatabaseManager, JobRepository
+from app.data.facets import rebuild_facet_counts
+from app.data.models import (
+    ExperienceLevel,
+    JobListing,
+    JobStatus,
+    JobType,
+    RemoteType,
+)
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def db_manager():
+    """Database manager backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield manager
+        manager.engine.dispose()
+
+
+@pytest.fixture
+def job_repo(db_manager):
+    return JobRepository(db_manager)
+
+
+def make_job(title, company="Acme Corp", **fields):
+    return JobListing(title=title, company=company, **fields)
+
+
+@pytest.fixture
+def jobs(job_repo):
+    return [
+        job_repo.create_job(
+            make_job(
+                "Backend",
+                job_type=JobType.FULL_TIME,
+                remote_type=RemoteType.REMOTE,
+                skills_required=["Python", "SQL", "python"],
+            )
+        ),
+        job_repo.create_job(
+            make_job(
+                "Data",
+                company="Globex",
+                job_type=JobType.FULL_TIME,
+                experience_level=ExperienceLevel.SENIOR_LEVEL,
+                skills_required=["python"],
+            )
+        ),
+        job_repo.create_job(
+            make_job("Mobile", job_type=JobType.CONTRACT, skills_required=["swift"])
+        ),
+        job_repo.create_job(
+            make_job("Closed", job_type=JobType.CONTRACT, status=JobStatus.FILLED)
+        ),
+    ]
+
+
+def counts(facets, facet):
+    return {entry["value"]: entry["count"] for entry in facets[facet]}
+
+
+def record_selects(engine):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append(statement)
+
+    return statements
+
+
+# ==================== Unfiltered Counts ====================
+
+
+def test_unfiltered_facets_read_materialized_counts(db_manager, job_repo, jobs):
+    statements = record_selects(db_manager.engine)
+
+    facets = job_repo.get_job_facets()
+
+    assert counts(facets, "job_type") == {"Full-time": 2, "Contract": 1}
+    assert counts(facets, "remote_type") == {"Remote": 1}
+    assert counts(facets, "experience_level") == {"senior_level": 1}
+    assert counts(facets, "company") == {"Acme Corp": 2, "Globex": 1}
+    assert counts(facets, "skill") == {"python": 2, "sql": 1, "swift": 1}
+    assert all("job_listings" not in statement for statement in statements)
+
+
+def test_counts_follow_updates_and_deletes(job_repo, jobs):
+    backend, data, mobile, closed = jobs
+
+    job_repo.update_job(str(backend.id), {"status": JobStatus.EXPIRED})
+    job_repo.update_job(str(closed.id), {"status": JobStatus.ACTIVE})
+    job_repo.update_job(str(mobile.id), {"skills_required": ["kotlin"]})
+    job_repo.delete_job(str(data.id))
+
+    facets = job_repo.get_job_facets()
+    assert counts(facets, "job_type") == {"Contract": 2}
+    assert counts(facets, "skill") == {"kotlin": 1}
+    assert counts(facets, "company") == {"Acme Corp": 2}
+
+
+def test_bulk_upserts_are_counted(job_repo):
+    batch = [make_job(f"Job {i}", job_type=JobType.PART_TIME) for i in range(3)]
+    job_repo.bulk_create_jobs(batch)
+    job_repo.bulk_create_jobs(
+        [job.model_copy(update={"job_type": JobType.INTERNSHIP}) for job in batch]
+    )
+
+    assert counts(job_repo.get_job_facets(), "job_type") == {"Internship": 3}
+
+
+def test_materialized_counts_match_grouped_query(db_manager, job_repo, jobs):
+    stored = job_repo.get_job_facets()
+    # Counting over the filtered path with a filter every active job passes
+    grouped = job_repo.get_job_facets(max_age_days=365)
+
+    assert stored == grouped
+
+    with db_manager.engine.begin() as conn:
+        conn.execute(text("DELETE FROM job_facet_counts"))
+    rebuild_facet_counts(db_manager.engine)
+    assert job_repo.get_job_facets() == stored
+
+
+# ==================== Filtered Counts ====================
+
+
+def test_filtered_facets_in_one_query(db_manager, job_repo, jobs):
+    statements = record_selects(db_manager.engine)
+
+    facets = job_repo.get_job_facets(job_types=[JobType.FULL_TIME])
+
+    assert counts(facets, "job_type") == {"Full-time": 2}
+    assert counts(facets, "skill") == {"python": 2, "sql": 1}
+    facet_queries = [s for s in statements if "job_listings" in s]
+    assert len(facet_queries) == 1 and "GROUP BY" in facet_queries[0]
+
+
+def test_limit_keeps_most_frequent_values(job_repo, jobs):
+    facets = job_repo.get_job_facets(limit=1)
+    assert facets["skill"] == [{"value": "python", "count": 2}]
+    assert facets["company"] == [{"value": "Acme Corp", "count": 2}]
+
+
+@pytest.mark.asyncio
+async def test_async_facets(db_manager, jobs):
+    async_manager = AsyncDatabaseManager(db_manager.database_url)
+    try:
+        facets = await AsyncJobRepository(async_manager).get_job_facets(
+            companies=["globex"]
+        )
+        assert counts(facets, "job_type") == {"Full-time": 1}
+        assert counts(facets, "company") == {"Globex": 1}
+    finally:
+        await async_manager.dispose()
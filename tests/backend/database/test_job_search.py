@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Job Search Tests
+
+Tests the FTS5-backed free-text search in JobRepository.search_jobs and
+its LIKE fallback.
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from app.data.database import DatabaseManager, JobRepository
+from app.data.fulltext import build_match_query
+from app.data.models import JobListing, JobStatus
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def job_repo():
+    """Job repository backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield JobRepository(db_manager)
+        db_manager.engine.dispose()
+
+
+@pytest.fixture
+def sample_jobs(job_repo):
+    """A handful of jobs with distinct searchable text."""
+    jobs = [
+        JobListing(
+            title="Senior Python Developer",
+            company="Acme Corp",
+            description="Build data pipelines with Python and SQL.",
+            requirements="5+ years of machine learning experience",
+        ),
+        JobListing(
+            title="Frontend Engineer",
+            company="Pythonic Labs",
+            description="React and TypeScript user interfaces.",
+        ),
+        JobListing(
+            title="Data Scientist",
+            company="Globex",
+            description="Statistics, learning systems and machine vision.",
+        ),
+    ]
+    return [job_repo.create_job(job) for job in jobs]
+
+
+# ==================== Query Builder ====================
+
+
+def test_build_match_query_prefixes_words():
+    assert build_match_query("pyth dev") == '"pyth"* "dev"*'
+
+
+def test_build_match_query_keeps_phrases():
+    assert build_match_query('"machine learning" senior') == (
+        '"machine learning" "senior"*'
+    )
+
+
+def test_build_match_query_strips_fts_syntax():
+    assert build_match_query('NEAR(a b) OR -x "') == '"NEAR"* "a"* "b"* "OR"* "x"*'
+    assert build_match_query("  ** ") is None
+
+
+# ==================== Repository Search ====================
+
+
+def test_fulltext_enabled_on_sqlite(job_repo):
+    assert job_repo.db_manager.fulltext_enabled
+
+
+def test_search_ranks_title_matches_first(job_repo, sample_jobs):
+    jobs, total = job_repo.search_jobs(query="python")
+
+    assert total == 2
+    assert jobs[0].title == "Senior Python Developer"
+
+
+def test_search_prefix_query(job_repo, sample_jobs):
+    jobs, total = job_repo.search_jobs(query="front")
+
+    assert total == 1
+    assert jobs[0].title == "Frontend Engineer"
+
+
+def test_search_phrase_query(job_repo, sample_jobs):
+    jobs, total = job_repo.search_jobs(query='"machine learning"')
+
+    assert total == 1
+    assert jobs[0].title == "Senior Python Developer"
+
+
+def test_search_combines_with_filters(job_repo, sample_jobs):
+    job_repo.update_job_status(str(sample_jobs[0].id), JobStatus.FILLED)
+
+    jobs, total = job_repo.search_jobs(query="python")
+
+    assert total == 1
+    assert jobs[0].title == "Frontend Engineer"
+
+
+def test_index_follows_updates_and_deletes(job_repo, sample_jobs):
+    job_id = str(sample_jobs[2].id)
+
+    job_repo.update_job(job_id, {"title": "Rust Systems Engineer"})
+    assert job_repo.search_jobs(query="rust")[1] == 1
+    assert job_repo.search_jobs(query="scientist")[1] == 0
+
+    job_repo.delete_job(job_id)
+    assert job_repo.search_jobs(query="rust")[1] == 0
+
+
+def test_index_backfilled_for_existing_rows(job_repo, sample_jobs):
+    db_manager = job_repo.db_manager
+    with db_manager.engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE job_listings_fts")
+
+    db_manager.create_tables()
+
+    assert job_repo.search_jobs(query="globex")[1] == 1
+
+
+def test_like_fallback_without_fulltext(job_repo, sample_jobs):
+    job_repo.db_manager.fulltext_enabled = False
+
+    jobs, total = job_repo.search_jobs(query="ython")
+
+    assert total == 2
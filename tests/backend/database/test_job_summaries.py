@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Job Summary Tests
+
+Tests the column-projected JobSummary queries behind the job list endpoints.
+"""
+
+import os
+import tempfile
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from app.data.database import DatabaseManager, JobRepository, SavedJobRepository
+from app.data.models import JobListing, JobSummary
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def db_manager():
+    """Database manager backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield manager
+        manager.engine.dispose()
+
+
+@pytest.fixture
+def job_repo(db_manager):
+    return JobRepository(db_manager)
+
+
+@pytest.fixture
+def sample_jobs(job_repo):
+    return [
+        job_repo.create_job(
+            JobListing(
+                title=f"Python Developer {i}",
+                company="Acme Corp",
+                description="Build Python services. " * 20,
+                requirements="Five years of Python.",
+                skills_required=["python", "sql", "aws", "docker", "k8s", "go"],
+            )
+        )
+        for i in range(3)
+    ]
+
+
+def capture_statements(engine):
+    """Record every SQL statement executed on ``engine``."""
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+
+# ==================== Tests ====================
+
+
+def test_summary_truncates_description_and_skills(job_repo, sample_jobs):
+    summaries = job_repo.get_recent_job_summaries()
+
+    assert len(summaries) == 3
+    summary = summaries[0]
+    assert isinstance(summary, JobSummary)
+    assert len(summary.description_snippet) == 203
+    assert summary.description_snippet.endswith("...")
+    assert summary.skills_required == ["python", "sql", "aws", "docker", "k8s"]
+
+
+def test_summary_page_matches_full_page(job_repo, sample_jobs):
+    page = job_repo.search_job_summaries_page(query="python", include_total=True)
+    full_page = job_repo.search_jobs_page(query="python", include_total=True)
+
+    assert page.total == full_page.total == 3
+    assert [job.id for job in page.items] == [job.id for job in full_page.items]
+
+
+def test_summary_queries_skip_heavy_columns(db_manager, job_repo, sample_jobs):
+    statements = capture_statements(db_manager.engine)
+
+    job_repo.get_recent_job_summaries()
+    job_repo.search_job_summaries_page(limit=2)
+
+    assert statements
+    for statement in statements:
+        assert "AS job_listings_requirements" not in statement
+        assert "AS job_listings_description" not in statement
+
+
+def test_saved_job_summaries(db_manager, sample_jobs):
+    saved_repo = SavedJobRepository(db_manager)
+    user_id = str(uuid4())
+    saved_repo.save_job(str(sample_jobs[0].id), user_id, notes="apply soon")
+
+    saved = saved_repo.get_saved_job_summaries(user_id)
+
+    assert saved[0]["job"]["id"] == sample_jobs[0].id
+    assert saved[0]["job"]["description_snippet"].endswith("...")
+    assert saved[0]["saved_job"]["notes"] == "apply soon"
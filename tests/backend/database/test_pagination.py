@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Keyset Pagination Tests
+
+Tests cursor encoding and the cursor-paginated listings for job search,
+applications and user timelines.
+"""
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.data.database import ApplicationRepository, DatabaseManager, JobRepository
+from app.data.models import (
+    JobApplication,
+    JobListing,
+    JobListingDB,
+    TimelineEventType,
+)
+from app.data.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.services.timeline_service import TimelineService
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def db_manager():
+    """Database manager backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield manager
+        manager.engine.dispose()
+
+
+@pytest.fixture
+def job_repo(db_manager):
+    return JobRepository(db_manager)
+
+
+@pytest.fixture
+def many_jobs(job_repo):
+    """25 jobs, several sharing a created_at so ties must be broken by id."""
+    base = datetime(2024, 1, 1)
+    jobs = []
+    for i in range(25):
+        jobs.append(
+            job_repo.create_job(
+                JobListing(
+                    title=f"Python Developer {i}",
+                    company="Acme Corp",
+                    description="Python services",
+                    created_at=base + timedelta(hours=i // 3),
+                )
+            )
+        )
+    return jobs
+
+
+def collect_pages(fetch_page):
+    """Follow next_cursor until exhausted, returning every page."""
+    pages = [fetch_page(None)]
+    while pages[-1].next_cursor:
+        pages.append(fetch_page(pages[-1].next_cursor))
+    return pages
+
+
+# ==================== Cursor Encoding ====================
+
+
+def test_cursor_round_trip():
+    sort_keys = [(JobListingDB.created_at, True), (JobListingDB.id, True)]
+    created_at = datetime(2024, 5, 1, 12, 30)
+
+    cursor = encode_cursor([created_at, "abc"])
+
+    assert decode_cursor(cursor, sort_keys) == [created_at, "abc"]
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "bm90IGpzb24", "WzFd"])
+def test_decode_cursor_rejects_invalid_tokens(cursor):
+    sort_keys = [(JobListingDB.created_at, True), (JobListingDB.id, True)]
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, sort_keys)
+
+
+# ==================== Job Search ====================
+
+
+def test_search_pages_cover_all_jobs_once(job_repo, many_jobs):
+    pages = collect_pages(
+        lambda cursor: job_repo.search_jobs_page(limit=10, cursor=cursor)
+    )
+
+    assert [len(page.items) for page in pages] == [10, 10, 5]
+    ids = [job.id for page in pages for job in page.items]
+    assert len(set(ids)) == 25
+
+    # Same order as the offset-based listing
+    jobs, _ = job_repo.search_jobs(limit=25)
+    assert ids == [job.id for job in jobs]
+
+
+def test_search_pages_with_fulltext_rank(job_repo, many_jobs):
+    job_repo.create_job(
+        JobListing(title="Java Engineer", company="Globex", description="JVM")
+    )
+
+    pages = collect_pages(
+        lambda cursor: job_repo.search_jobs_page(query="python", limit=7, cursor=cursor)
+    )
+
+    ids = [job.id for page in pages for job in page.items]
+    assert len(ids) == len(set(ids)) == 25
+
+
+def test_search_page_total_is_optional(job_repo, many_jobs):
+    assert job_repo.search_jobs_page(limit=5).total is None
+    assert job_repo.search_jobs_page(limit=5, include_total=True).total == 25
+
+
+def test_search_page_invalid_cursor_raises(job_repo, many_jobs):
+    with pytest.raises(InvalidCursorError):
+        job_repo.search_jobs_page(cursor="garbage")
+
+
+# ==================== Applications & Timeline ====================
+
+
+def test_application_pages_cover_all_rows(db_manager, many_jobs):
+    app_repo = ApplicationRepository(db_manager)
+    user_id = uuid4()
+    created_at = datetime(2024, 2, 1)
+    for job in many_jobs[:12]:
+        app_repo.create_application(
+            JobApplication(
+                job_id=job.id, user_profile_id=user_id, created_at=created_at
+            )
+        )
+
+    pages = collect_pages(
+        lambda cursor: app_repo.get_applications_page(
+            str(user_id), limit=5, cursor=cursor
+        )
+    )
+
+    ids = [app.id for page in pages for app in page.items]
+    assert len(ids) == len(set(ids)) == 12
+
+
+def test_timeline_pages_cover_all_events(db_manager):
+    user_id = str(uuid4())
+    with db_manager.get_session() as session:
+        service = TimelineService(session)
+        for i in range(9):
+            service.create_event(
+                user_profile_id=user_id,
+                event_type=TimelineEventType.CUSTOM_EVENT,
+                title=f"Event {i}",
+            )
+
+        pages = collect_pages(
+            lambda cursor: service.get_user_timeline_page(
+                user_id, limit=4, cursor=cursor
+            )
+        )
+
+    assert [len(page.items) for page in pages] == [4, 4, 1]
+    ids = [event.id for page in pages for event in page.items]
+    assert len(set(ids)) == 9
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Query Index Tests
+
+Verifies that declared indexes are migrated onto existing databases and
+that the main repository queries are planned as index lookups rather than
+full table scans (via SQLite EXPLAIN QUERY PLAN).
+"""
+
+import os
+import tempfile
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event, inspect
+
+from app.data.database import (
+    ApplicationRepository,
+    DatabaseManager,
+    JobRepository,
+    SavedJobRepository,
+)
+from app.data.migrations import ensure_indexes
+from app.data.models import Base, JobEmbeddingDB, JobType, RemoteType
+from app.services.timeline_service import TimelineService
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def db_manager():
+    """Database manager backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield manager
+        manager.engine.dispose()
+
+
+@pytest.fixture
+def captured_selects(db_manager):
+    """Record every SELECT statement executed against the engine."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(db_manager.engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(db_manager.engine, "before_cursor_execute", capture)
+
+
+def query_plans(engine, statements, table_name):
+    """Return EXPLAIN QUERY PLAN details that touch the given table."""
+    details = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).fetchall()
+            details.extend(row[-1] for row in plan if table_name in row[-1])
+    return details
+
+
+def assert_no_full_scan(details):
+    assert details, "expected at least one plan step for the table"
+    for detail in details:
+        assert "USING" in detail, f"full table scan: {detail}"
+
+
+# ==================== Migration ====================
+
+
+def test_ensure_indexes_adds_missing_indexes():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(temp_dir, 'old.db')}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DROP INDEX ix_job_listings_status_created_at")
+            conn.exec_driver_sql("DROP INDEX ix_timeline_events_user_event_date")
+
+        created = ensure_indexes(engine)
+
+        assert set(created) == {
+            "ix_job_listings_status_created_at",
+            "ix_timeline_events_user_event_date",
+        }
+        index_names = {
+            index["name"] for index in inspect(engine).get_indexes("job_listings")
+        }
+        assert "ix_job_listings_status_created_at" in index_names
+
+        # Second run is a no-op
+        assert ensure_indexes(engine) == []
+        engine.dispose()
+
+
+# ==================== Query Plans ====================
+
+
+def test_recent_jobs_uses_status_created_index(db_manager, captured_selects):
+    JobRepository(db_manager).get_recent_jobs(limit=20)
+
+    details = query_plans(db_manager.engine, captured_selects, "job_listings")
+    assert_no_full_scan(details)
+    assert any("ix_job_listings_status_created_at" in d for d in details)
+
+
+def test_filtered_search_uses_indexes(db_manager, captured_selects):
+    JobRepository(db_manager).search_jobs(
+        job_types=[JobType.FULL_TIME], remote_types=[RemoteType.REMOTE]
+    )
+
+    assert_no_full_scan(
+        query_plans(db_manager.engine, captured_selects, "job_listings")
+    )
+
+
+def test_jobs_by_company_uses_indexes(db_manager, captured_selects):
+    JobRepository(db_manager).search_jobs(companies=["Acme Corp"])
+
+    details = query_plans(db_manager.engine, captured_selects, "job_listings")
+    assert_no_full_scan(details)
+    assert any("ix_job_listings_company_id_status" in d for d in details)
+
+
+def test_jobs_by_location_uses_indexes(db_manager, captured_selects):
+    JobRepository(db_manager).search_jobs(locations=["Austin, TX"])
+
+    details = query_plans(db_manager.engine, captured_selects, "job_listings")
+    assert_no_full_scan(details)
+    assert any("ix_job_listings_location_id_status" in d for d in details)
+
+
+def test_salary_search_uses_annual_salary_index(db_manager, captured_selects):
+    JobRepository(db_manager).search_jobs(
+        min_salary=100000, max_salary=200000, sort_by="salary"
+    )
+
+    details = query_plans(db_manager.engine, captured_selects, "job_listings")
+    assert_no_full_scan(details)
+    assert any("ix_job_listings_status_salary_annual_max" in d for d in details)
+
+
+def test_applications_use_user_index(db_manager, captured_selects):
+    ApplicationRepository(db_manager).get_applications(str(uuid4()))
+
+    details = query_plans(db_manager.engine, captured_selects, "applications")
+    assert_no_full_scan(details)
+    assert any("ix_applications_user_created_at" in d for d in details)
+
+
+def test_saved_jobs_use_user_index(db_manager, captured_selects):
+    SavedJobRepository(db_manager).get_saved_jobs(str(uuid4()))
+
+    assert_no_full_scan(query_plans(db_manager.engine, captured_selects, "saved_jobs"))
+
+
+def test_user_timeline_uses_user_event_date_index(db_manager, captured_selects):
+    with db_manager.get_session() as session:
+        TimelineService(session).get_user_timeline(str(uuid4()))
+
+    details = query_plans(db_manager.engine, captured_selects, "timeline_events")
+    assert_no_full_scan(details)
+    assert any("ix_timeline_events_user_event_date" in d for d in details)
+
+
+def test_embedding_lookup_uses_job_hash_index(db_manager, captured_selects):
+    with db_manager.get_session() as session:
+        session.query(JobEmbeddingDB).filter(
+            JobEmbeddingDB.job_id == str(uuid4()),
+            JobEmbeddingDB.content_hash == "abc123",
+        ).first()
+
+    details = query_plans(db_manager.engine, captured_selects, "job_embeddings")
+    assert_no_full_scan(details)
+    assert any("ix_job_embeddings_job_id_content_hash" in d for d in details)
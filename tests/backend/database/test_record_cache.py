@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Record Cache Tests
+
+Tests the LRU + TTL read-through cache behind get_job, get_user and
+get_resume, and its invalidation from repository writes.
+"""
+
+import os
+import tempfile
+
+import pytest
+import pytest_asyncio
+
+from app.data.async_database import AsyncDatabaseManager, AsyncJobRepository
+from app.data.cache import RecordCache
+from app.data.database import DatabaseManager, JobRepository, UserRepository
+from app.data.models import JobListing, JobStatus, UserProfile
+
+# ==================== Fixtures ====================
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def db_manager():
+    """Database manager backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield manager
+        manager.engine.dispose()
+
+
+@pytest.fixture
+def job_repo(db_manager):
+    return JobRepository(db_manager)
+
+
+@pytest.fixture
+def job(job_repo):
+    return job_repo.create_job(
+        JobListing(title="Python Developer", company="Acme Corp")
+    )
+
+
+def make_user(name="Ada"):
+    return UserProfile(first_name=name)
+
+
+# ==================== RecordCache ====================
+
+
+def test_lru_eviction():
+    cache = RecordCache("users", max_entries=2)
+    users = [make_user(name) for name in ("Ada", "Grace", "Linus")]
+
+    cache.put("a", users[0])
+    cache.put("b", users[1])
+    cache.get("a")
+    cache.put("c", users[2])
+
+    assert cache.get("b") is None
+    assert cache.get("a").first_name == "Ada"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = RecordCache("users", ttl_seconds=10, clock=clock)
+    cache.put("a", make_user())
+
+    clock.now = 9
+    assert cache.get("a") is not None
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_hits_return_copies():
+    cache = RecordCache("users")
+    cache.put("a", make_user())
+
+    cache.get("a").first_name = "Changed"
+
+    assert cache.get("a").first_name == "Ada"
+
+
+def test_load_racing_an_invalidation_is_not_stored():
+    cache = RecordCache("users")
+
+    def load():
+        cache.invalidate("a")  # a write commits while the row is being read
+        return make_user()
+
+    assert cache.get_or_load("a", load).first_name == "Ada"
+    assert cache.get("a") is None
+
+
+# ==================== Repositories ====================
+
+
+def test_get_job_is_served_from_cache(job_repo, job):
+    job_repo.get_job(str(job.id))
+    job_repo.get_job(str(job.id))
+
+    stats = job_repo.cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda repo, job_id: repo.update_job(job_id, {"title": "Staff Engineer"}),
+        lambda repo, job_id: repo.update_job_status(job_id, JobStatus.FILLED),
+        lambda repo, job_id: repo.bulk_create_jobs(
+            [repo.get_job(job_id).copy(update={"title": "Staff Engineer"})]
+        ),
+    ],
+)
+def test_job_writes_invalidate(job_repo, job, write):
+    job_id = str(job.id)
+    cached = job_repo.get_job(job_id)
+
+    write(job_repo, job_id)
+
+    assert job_repo.get_job(job_id) != cached
+
+
+def test_delete_invalidates(job_repo, job):
+    job_repo.get_job(str(job.id))
+    job_repo.delete_job(str(job.id))
+
+    assert job_repo.get_job(str(job.id)) is None
+
+
+def test_user_update_invalidates(db_manager):
+    user_repo = UserRepository(db_manager)
+    user = user_repo.create_user(make_user())
+    user_repo.get_user(str(user.id))
+
+    user_repo.update_user(str(user.id), {"first_name": "Grace"})
+
+    assert user_repo.get_user(str(user.id)).first_name == "Grace"
+
+
+@pytest_asyncio.fixture
+async def async_job_repo(db_manager):
+    manager = AsyncDatabaseManager(db_manager.database_url)
+    yield AsyncJobRepository(manager)
+    await manager.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sync_and_async_repositories_share_cache(job_repo, async_job_repo, job):
+    job_id = str(job.id)
+    await async_job_repo.get_job(job_id)
+
+    job_repo.update_job(job_id, {"title": "Staff Engineer"})
+
+    assert async_job_repo.cache is job_repo.cache
+    assert (await async_job_repo.get_job(job_id)).title == "Staff Engineer"
+
+
+def test_in_memory_databases_do_not_share_caches():
+    first, second = DatabaseManager("sqlite://"), DatabaseManager("sqlite://")
+    first_repo, second_repo = JobRepository(first), JobRepository(second)
+    job = first_repo.create_job(JobListing(title="Python Developer", company="Acme"))
+    first_repo.get_job(str(job.id))
+
+    assert first_repo.cache is not second_repo.cache
+    assert second_repo.get_job(str(job.id)) is None
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Retry Policy Tests
+
+Tests the async-aware with_retry decorator, the shared retry budget and the
+circuit breaker in app.utils.retry.
+"""
+
+import time
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.utils import retry as retry_module
+from app.utils.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+    with_retry,
+)
+
+# ==================== Fixtures ====================
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def locked_error():
+    return OperationalError("UPDATE job_listings", {}, Exception("database is locked"))
+
+
+def flaky(failures, error_factory=locked_error):
+    """Function failing ``failures`` times before it succeeds."""
+    calls = []
+
+    def operation():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error_factory()
+        return "ok"
+
+    return operation, calls
+
+
+@pytest.fixture
+def no_blocking_sleep(monkeypatch):
+    def fail(delay):
+        raise AssertionError("time.sleep called from an async retry")
+
+    monkeypatch.setattr(retry_module.time, "sleep", fail)
+
+
+# ==================== with_retry ====================
+
+
+@pytest.mark.asyncio
+async def test_coroutines_retry_with_asyncio_sleep(no_blocking_sleep):
+    attempts = []
+
+    @with_retry(max_retries=3, base_delay=0.01)
+    async def operation():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise locked_error()
+        return "ok"
+
+    assert await operation() == "ok"
+    assert len(attempts) == 3
+
+
+@pytest.mark.asyncio
+async def test_sync_retry_on_event_loop_caps_sleep():
+    operation, calls = flaky(1)
+
+    start = time.perf_counter()
+    result = with_retry(max_retries=1, base_delay=5.0, jitter=False)(operation)()
+
+    assert result == "ok" and len(calls) == 2
+    assert time.perf_counter() - start < 1.0
+
+
+def test_gives_up_after_max_retries():
+    operation, calls = flaky(5)
+
+    with pytest.raises(OperationalError):
+        with_retry(max_retries=2, base_delay=0)(operation)()
+
+    assert len(calls) == 3
+
+
+# ==================== Retry Budget ====================
+
+
+def test_budget_limits_retries():
+    budget = RetryBudget(ratio=0.0, min_retries_per_second=0.1, window_seconds=10)
+    operation, calls = flaky(5)
+
+    with pytest.raises(OperationalError):
+        with_retry(max_retries=5, base_delay=0, budget=budget)(operation)()
+
+    assert len(calls) == 2  # one retry in the budget
+    assert budget.stats()["rejected"] == 1
+
+
+def test_budget_refills_from_calls_and_window():
+    clock = FakeClock()
+    budget = RetryBudget(
+        ratio=0.5, min_retries_per_second=0, window_seconds=10, clock=clock
+    )
+
+    assert not budget.try_spend()
+    budget.record_call()
+    budget.record_call()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+    clock.now = 11
+    budget.record_call()
+    budget.record_call()
+    assert budget.try_spend()
+
+
+# ==================== Circuit Breaker ====================
+
+
+def test_breaker_opens_and_fails_fast():
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30)
+    operation, calls = flaky(10)
+    guarded = with_retry(max_retries=5, base_delay=0, breaker=breaker)(operation)
+
+    with pytest.raises(CircuitOpenError):
+        guarded()
+
+    assert len(calls) == 2
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        guarded()
+    assert len(calls) == 2
+
+
+def test_breaker_half_open_trial():
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 30
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # only one trial call
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_trial_released_when_nested_call_is_refused():
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30, clock=clock)
+    guard = with_retry(max_retries=0, base_delay=0, breaker=breaker)
+    calls = []
+
+    @guard
+    def inner():
+        calls.append(1)
+        return "ok"
+
+    @guard
+    def outer():
+        return inner()
+
+    breaker.record_failure()
+    clock.now = 30
+    # outer takes the trial slot, so the nested inner call is refused
+    with pytest.raises(CircuitOpenError):
+        outer()
+    assert calls == []
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    # The slot was released without counting a success: a flat call probes
+    assert inner() == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_non_transient_errors_do_not_open_breaker():
+    breaker = CircuitBreaker("test", failure_threshold=1)
+    operation, calls = flaky(
+        3,
+        lambda: OperationalError("SELECT", {}, Exception("no such table: jobs")),
+    )
+
+    assert with_retry(max_retries=3, base_delay=0, breaker=breaker)(operation)() == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
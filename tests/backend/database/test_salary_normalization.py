@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Salary Normalization Tests
+
+Tests the annual USD salary range stored with every job listing: the
+conversion table, how it is kept current on each write path, and the
+salary filters and sort order of job search.
+"""
+
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import MetaData, Table, create_engine, event, text
+
+from app.data.database import DatabaseManager, JobRepository
+from app.data.migrations import ensure_columns, migrate_annual_salaries
+from app.data.models import Base, JobListing, JobListingDB, SalaryPeriod
+from app.data.salary import annual_salary_range, annualize
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def db_manager():
+    """Database manager backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield manager
+        manager.engine.dispose()
+
+
+@pytest.fixture
+def job_repo(db_manager):
+    return JobRepository(db_manager)
+
+
+def make_job(title, **fields):
+    return JobListing(title=title, company="Acme Corp", **fields)
+
+
+def titles(jobs):
+    return [job.title for job in jobs]
+
+
+# ==================== Conversion ====================
+
+
+def test_annualize_periods_and_currencies():
+    assert annualize(50, SalaryPeriod.HOUR) == 104000
+    assert annualize(8000, "monthly") == 96000
+    assert annualize(120000, "YEAR") == 120000
+    assert annualize(100000, "year", "EUR") == 108000
+    assert annualize(100000, "year", "XYZ") is None
+    assert annualize(None, "year") is None
+
+
+def test_missing_period_is_inferred_from_amount():
+    assert annualize(45) == 93600
+    assert annualize(90000) == 90000
+
+
+def test_one_sided_ranges_fill_both_ends():
+    assert annual_salary_range(40, 60, "hour") == (83200, 124800)
+    assert annual_salary_range(None, 150000) == (150000, 150000)
+    assert annual_salary_range(None, None) == (None, None)
+
+
+# ==================== Write Paths ====================
+
+
+def stored_range(db_manager, job_id):
+    with db_manager.get_session() as session:
+        job_db = session.get(JobListingDB, str(job_id))
+        return job_db.salary_annual_min, job_db.salary_annual_max
+
+
+def test_create_and_update_store_annual_range(db_manager, job_repo):
+    job = job_repo.create_job(
+        make_job("Contractor", salary_min=50, salary_max=75, salary_period="hour")
+    )
+    assert stored_range(db_manager, job.id) == (104000, 156000)
+
+    job_repo.update_job(str(job.id), {"salary_period": SalaryPeriod.MONTH})
+    assert stored_range(db_manager, job.id) == (600, 900)
+
+
+def test_bulk_create_stores_annual_range(db_manager, job_repo):
+    job_repo.bulk_create_jobs(
+        [make_job("Berlin", salary_min=70000, salary_currency="EUR")]
+    )
+
+    with db_manager.get_session() as session:
+        job_db = session.query(JobListingDB).one()
+        assert (job_db.salary_annual_min, job_db.salary_annual_max) == (75600, 75600)
+
+
+# ==================== Search ====================
+
+
+@pytest.fixture
+def jobs(job_repo):
+    return [
+        job_repo.create_job(make_job("Hourly", salary_min=60, salary_max=80)),
+        job_repo.create_job(
+            make_job("Monthly", salary_min=5000, salary_period="month")
+        ),
+        job_repo.create_job(make_job("Yearly", salary_min=90000, salary_max=110000)),
+        job_repo.create_job(make_job("Unpaid")),
+    ]
+
+
+def test_salary_filters_compare_annual_amounts(job_repo, jobs):
+    found, total = job_repo.search_jobs(min_salary=100000)
+    assert sorted(titles(found)) == ["Hourly", "Yearly"] and total == 2
+
+    found, _ = job_repo.search_jobs(max_salary=100000)
+    assert sorted(titles(found)) == ["Monthly", "Yearly"]
+
+
+def test_sort_by_salary(job_repo, jobs):
+    found, total = job_repo.search_jobs(sort_by="salary")
+    assert titles(found) == ["Hourly", "Yearly", "Monthly"] and total == 3
+
+    first = job_repo.search_jobs_page(sort_by="salary", limit=2)
+    rest = job_repo.search_jobs_page(sort_by="salary", cursor=first.next_cursor)
+    assert titles(first.items + rest.items) == titles(found)
+
+
+# ==================== Migration ====================
+
+
+def test_existing_rows_are_backfilled():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(temp_dir, 'old.db')}")
+        # job_listings as declared before the annual salary columns existed
+        new_columns = ("salary_period", "salary_annual_min", "salary_annual_max")
+        old_metadata = MetaData()
+        Table(
+            "job_listings",
+            old_metadata,
+            *[
+                column._copy()
+                for column in JobListingDB.__table__.columns
+                if column.name not in new_columns
+            ],
+        )
+        old_metadata.create_all(engine)
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO job_listings (id, title, company, salary_min) "
+                    "VALUES ('j1', 'Backend', 'Acme', 120000), "
+                    "('j2', 'Support', 'Acme', NULL)"
+                )
+            )
+
+        assert set(ensure_columns(engine)) >= {
+            f"job_listings.{name}" for name in new_columns
+        }
+        assert migrate_annual_salaries(engine) == 1
+        assert migrate_annual_salaries(engine) == 0
+
+        with engine.connect() as conn:
+            annual_max = conn.exec_driver_sql(
+                "SELECT salary_annual_max FROM job_listings WHERE id = 'j1'"
+            ).scalar()
+        assert annual_max == 120000
+        engine.dispose()
+
+
+def test_unknown_currencies_are_not_reread():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO job_listings "
+                "(id, title, company, salary_min, salary_currency) "
+                "VALUES ('j1', 'Backend', 'Acme', 120000, 'XYZ'), "
+                "('j2', 'Frontend', 'Acme', 90000, 'eur')"
+            )
+        )
+    assert migrate_annual_salaries(engine) == 1
+
+    selects = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record_selects(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    # One SELECT finds nothing left to fill and the run ends
+    assert migrate_annual_salaries(engine) == 0
+    assert len([sql for sql in selects if "job_listings" in sql]) == 1
+    engine.dispose()
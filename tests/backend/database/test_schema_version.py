@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Schema Version Tests
+
+Tests that DatabaseManager only runs create_tables when the stored schema
+version is out of date, and that managers share engines per URL.
+"""
+
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import event, inspect, text
+
+from app.data.async_database import AsyncDatabaseManager
+from app.data.database import DatabaseManager
+from app.data.engine import SQLiteProfile
+from app.data.migrations import schema_version
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def database_url():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        database_url = f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}"
+        yield database_url
+        DatabaseManager(database_url).engine.dispose()
+
+
+def record_statements(engine):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+
+# ==================== Schema Version ====================
+
+
+def test_version_is_recorded(database_url):
+    manager = DatabaseManager(database_url)
+
+    with manager.engine.connect() as conn:
+        stored = conn.execute(
+            text("SELECT version, fulltext_enabled FROM schema_version")
+        ).one()
+
+    assert stored == (schema_version(), manager.fulltext_enabled)
+
+
+def test_current_schema_is_not_recreated(database_url):
+    first = DatabaseManager(database_url)
+    statements = record_statements(first.engine)
+
+    second = DatabaseManager(database_url)
+
+    assert not [s for s in statements if "CREATE" in s.upper()]
+    assert len(statements) <= 3
+    assert second.fulltext_enabled == first.fulltext_enabled
+
+
+def test_outdated_version_reruns_migrations(database_url):
+    manager = DatabaseManager(database_url)
+    with manager.engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_job_listings_job_type")
+        conn.exec_driver_sql("UPDATE schema_version SET version = 'old'")
+
+    DatabaseManager(database_url)
+
+    with manager.engine.connect() as conn:
+        indexes = {index["name"] for index in inspect(conn).get_indexes("job_listings")}
+        version = conn.exec_driver_sql("SELECT version FROM schema_version").scalar()
+    assert "ix_job_listings_job_type" in indexes
+    assert version == schema_version()
+
+
+def test_drop_all_tables_forgets_version(database_url):
+    DatabaseManager(database_url).drop_all_tables()
+
+    manager = DatabaseManager(database_url)
+
+    assert inspect(manager.engine).has_table("job_listings")
+
+
+# ==================== Engine Registry ====================
+
+
+def test_managers_share_engine_per_url(database_url):
+    assert DatabaseManager(database_url).engine is DatabaseManager(database_url).engine
+
+
+def test_different_settings_get_separate_engines(database_url):
+    default = DatabaseManager(database_url).engine
+    custom = DatabaseManager(
+        database_url, sqlite_profile=SQLiteProfile(busy_timeout_ms=100)
+    ).engine
+
+    assert default is not custom
+    custom.dispose()
+
+
+def test_memory_databases_are_not_shared():
+    first, second = DatabaseManager("sqlite://"), DatabaseManager("sqlite://")
+
+    assert first.engine is not second.engine
+    assert inspect(second.engine).has_table("job_listings")
+
+
+@pytest.mark.asyncio
+async def test_async_managers_share_engine_per_url(database_url):
+    first = AsyncDatabaseManager(database_url)
+    second = AsyncDatabaseManager(database_url)
+    assert first.engine is second.engine
+    assert first.engine.sync_engine is not DatabaseManager(database_url).engine
+
+    memory = AsyncDatabaseManager("sqlite://"), AsyncDatabaseManager("sqlite://")
+    assert memory[0].engine is not memory[1].engine
+    await first.dispose()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Segment Vector Index Tests
+
+Tests the memory-mapped segment files behind the mmap vector store
+backend: search across flushed and pending vectors, tombstoned replaces
+and removes, reopening from disk, sharing between open instances and
+compaction.
+"""
+
+import numpy as np
+import pytest
+
+from app.data.segment_index import SegmentVectorIndex
+from app.data.vector_index import ExactVectorIndex
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(5).standard_normal((600, 16)).astype(np.float32)
+
+
+@pytest.fixture
+def ids(vectors):
+    return [f"job-{i}" for i in range(len(vectors))]
+
+
+def build(directory, ids, vectors, chunk=200):
+    """An index with one segment per ``chunk`` vectors."""
+    index = SegmentVectorIndex(str(directory), 16)
+    for start in range(0, len(ids), chunk):
+        index.add(ids[start : start + chunk], vectors[start : start + chunk])
+        index.flush()
+    return index
+
+
+def exact(ids, vectors):
+    index = ExactVectorIndex(16)
+    index.add(ids, vectors)
+    return index
+
+
+def test_search_matches_exact_index(tmp_path, ids, vectors):
+    index = build(tmp_path, ids[:500], vectors[:500])
+    index.add(ids[500:], vectors[500:])  # pending, not flushed
+    reference = exact(ids, vectors)
+    query = np.random.default_rng(6).standard_normal(16)
+
+    assert index.segment_count == 3
+    assert index.pending_count == 100
+    assert len(index) == 600
+    hits = index.search(query, 15)
+    expected = reference.search(query, 15)
+    assert [i for i, _ in hits] == [i for i, _ in expected]
+    assert np.allclose([s for _, s in hits], [s for _, s in expected], atol=1e-5)
+
+
+def test_reopen_maps_flushed_segments(tmp_path, ids, vectors):
+    build(tmp_path, ids, vectors)
+    reopened = SegmentVectorIndex(str(tmp_path), 16)
+    query = vectors[42]
+
+    assert len(reopened) == 600
+    assert isinstance(reopened._segments[0].vectors, np.memmap)
+    assert reopened.search(query, 1)[0][0] == "job-42"
+
+
+def test_remove_and_replace_set_tombstones(tmp_path, ids, vectors):
+    index = build(tmp_path, ids, vectors)
+    assert index.remove(["job-1", "job-2", "missing"]) == 2
+    index.add(["job-3"], [-vectors[3]])
+
+    assert "job-1" not in index
+    assert len(index) == 598
+    hits = index.search(vectors[3], 600)
+    assert "job-1" not in [i for i, _ in hits]
+    assert [i for i, _ in hits].count("job-3") == 1
+    assert dict(hits)["job-3"] == pytest.approx(-1.0, abs=1e-5)
+
+    reopened = SegmentVectorIndex(str(tmp_path), 16)
+    assert len(reopened) == 597  # the replacement was not flushed
+
+
+def test_other_instances_see_writes(tmp_path, ids, vectors):
+    writer = build(tmp_path, ids[:300], vectors[:300])
+    reader = SegmentVectorIndex(str(tmp_path), 16, writable=False)
+
+    writer.remove(["job-7"])
+    writer.add(ids[300:], vectors[300:])
+    writer.flush()
+
+    assert len(reader) == 599
+    assert reader.search(vectors[450], 1)[0][0] == "job-450"
+    assert "job-7" not in [i for i, _ in reader.search(vectors[7], 5)]
+    with pytest.raises(PermissionError):
+        reader.add(["job-x"], vectors[:1])
+        reader.flush()
+
+
+def test_compaction_drops_deleted_rows(tmp_path, ids, vectors):
+    index = build(tmp_path, ids, vectors, chunk=50)
+    index.remove(ids[:100])
+    query = np.random.default_rng(7).standard_normal(16)
+    before = index.search(query, 10)
+
+    assert index.needs_compaction()
+    assert index.compact()
+    assert index.segment_count == 1
+    assert index.stats() == {
+        "segments": 1,
+        "stored_rows": 500,
+        "deleted_rows": 0,
+        "pending": 0,
+    }
+    assert index.search(query, 10) == pytest.approx(before)
+    assert sorted(p.name for p in tmp_path.glob("*.vectors.npy")) == [
+        f"{index._segments[0].name}.vectors.npy"
+    ]
+    assert len(SegmentVectorIndex(str(tmp_path), 16)) == 500
+
+
+def test_background_compaction(tmp_path, ids, vectors):
+    index = build(tmp_path, ids, vectors, chunk=60)
+    assert index.compact_in_background()
+    index.remove(["job-599"])
+    index.wait_for_compaction()
+
+    assert index.segment_count == 1
+    assert len(index) == 599
+    assert "job-599" not in [i for i, _ in index.search(vectors[599], 3)]
+
+
+def test_dimension_mismatch(tmp_path, ids, vectors):
+    build(tmp_path, ids[:10], vectors[:10])
+    with pytest.raises(ValueError):
+        SegmentVectorIndex(str(tmp_path), 32)
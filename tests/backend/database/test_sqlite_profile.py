@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+SQLite Performance Profile Tests
+
+Tests the connection pragmas and pool sizing that DatabaseManager and
+AsyncDatabaseManager apply to their engines.
+"""
+
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import text
+
+from app.data.async_database import AsyncDatabaseManager
+from app.data.database import DatabaseManager
+from app.data.engine import PoolSettings, SQLiteProfile
+
+PRAGMAS = ("journal_mode", "synchronous", "busy_timeout", "temp_store", "mmap_size")
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def database_url():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}"
+
+
+def read_pragmas(conn):
+    return {name: conn.execute(text(f"PRAGMA {name}")).scalar() for name in PRAGMAS}
+
+
+# ==================== Tests ====================
+
+
+def test_profile_pragmas_are_applied(database_url):
+    manager = DatabaseManager(database_url, sqlite_profile=SQLiteProfile())
+
+    with manager.engine.connect() as conn:
+        pragmas = read_pragmas(conn)
+    manager.engine.dispose()
+
+    assert pragmas == {
+        "journal_mode": "wal",
+        "synchronous": 1,  # NORMAL
+        "busy_timeout": 5000,
+        "temp_store": 2,  # MEMORY
+        "mmap_size": 256 * 1024 * 1024,
+    }
+
+
+def test_profile_can_be_disabled(database_url):
+    manager = DatabaseManager(database_url, sqlite_profile=None)
+
+    with manager.engine.connect() as conn:
+        pragmas = read_pragmas(conn)
+    manager.engine.dispose()
+
+    assert pragmas["journal_mode"] == "delete"
+    assert pragmas["synchronous"] == 2  # FULL
+
+
+def test_custom_profile(database_url):
+    profile = SQLiteProfile(synchronous="FULL", busy_timeout_ms=250)
+    manager = DatabaseManager(database_url, sqlite_profile=profile)
+
+    with manager.engine.connect() as conn:
+        pragmas = read_pragmas(conn)
+    manager.engine.dispose()
+
+    assert (pragmas["synchronous"], pragmas["busy_timeout"]) == (2, 250)
+
+
+def test_reads_do_not_block_writes(database_url):
+    manager = DatabaseManager(database_url, sqlite_profile=SQLiteProfile())
+
+    with manager.engine.connect() as reader:
+        reader.exec_driver_sql("BEGIN")
+        reader.exec_driver_sql("SELECT count(*) FROM job_listings").scalar()
+        with manager.engine.begin() as writer:
+            writer.exec_driver_sql(
+                "INSERT INTO companies (id, name) VALUES ('c1', 'Acme Corp')"
+            )
+        reader.exec_driver_sql("ROLLBACK")
+    manager.engine.dispose()
+
+
+def test_pool_settings(database_url):
+    manager = DatabaseManager(
+        database_url, pool_settings=PoolSettings(pool_size=3, max_overflow=1)
+    )
+
+    assert manager.engine.pool.size() == 3
+    assert manager.engine.pool._max_overflow == 1
+    manager.engine.dispose()
+
+
+def test_pool_settings_ignored_for_memory_database():
+    assert PoolSettings(pool_size=3).engine_kwargs("sqlite://") == {}
+    assert PoolSettings(pool_size=3).engine_kwargs("sqlite:///:memory:") == {}
+
+
+def test_profile_from_env(monkeypatch):
+    monkeypatch.setenv("SQLITE_BUSY_TIMEOUT_MS", "100")
+    assert SQLiteProfile.from_env().busy_timeout_ms == 100
+
+    monkeypatch.setenv("SQLITE_PERFORMANCE_PROFILE", "off")
+    assert SQLiteProfile.from_env() is None
+
+
+@pytest.mark.asyncio
+async def test_async_engine_uses_profile(database_url):
+    DatabaseManager(database_url).engine.dispose()
+    manager = AsyncDatabaseManager(database_url, sqlite_profile=SQLiteProfile())
+
+    async with manager.engine.connect() as conn:
+        pragmas = await conn.run_sync(read_pragmas)
+    await manager.dispose()
+
+    assert pragmas["journal_mode"] == "wal"
+    assert pragmas["busy_timeout"] == 5000
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Table Statistics Tests
+
+Tests DatabaseManager.get_table_stats: one UNION ALL query for every table,
+then counts kept current from committed inserts and deletes.
+"""
+
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import event, text
+
+from app.data.async_database import AsyncDatabaseManager, AsyncJobRepository
+from app.data.database import DatabaseManager, JobRepository
+from app.data.models import JobListing
+from app.data.table_stats import TableStats
+
+# ==================== Fixtures ====================
+
+
+@pytest.fixture
+def db_manager():
+    """Database manager backed by a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield manager
+        manager.engine.dispose()
+
+
+def record_counts(engine):
+    """COUNT queries run on ``engine`` from now on."""
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "count(" in statement.lower():
+            statements.append(statement)
+
+    return statements
+
+
+def make_job(i):
+    return JobListing(title=f"Python Developer {i}", company="Acme Corp")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# ==================== Tests ====================
+
+
+def test_all_tables_in_one_query(db_manager):
+    statements = record_counts(db_manager.engine)
+
+    stats = db_manager.get_table_stats()
+
+    assert len(statements) == 1 and "UNION ALL" in statements[0]
+    for table_name in (
+        "job_listings",
+        "applications",
+        "job_embeddings",
+        "raw_job_collections",
+        "etl_operation_logs",
+    ):
+        assert stats[table_name] == 0
+
+
+def test_committed_writes_update_counts_without_queries(db_manager):
+    job_repo = JobRepository(db_manager)
+    job_repo.create_job(make_job(0))
+    db_manager.get_table_stats()
+    statements = record_counts(db_manager.engine)
+
+    jobs = [job_repo.create_job(make_job(i)) for i in range(1, 4)]
+    job_repo.delete_job(str(jobs[0].id))
+
+    assert db_manager.get_table_stats()["job_listings"] == 3
+    assert statements == []
+
+
+def test_rolled_back_writes_are_ignored(db_manager):
+    db_manager.get_table_stats()
+
+    with pytest.raises(RuntimeError):
+        with db_manager.get_session() as session:
+            session.execute(
+                text("INSERT INTO companies (id, name) VALUES ('c1', 'Acme Corp')")
+            )
+            raise RuntimeError("abort")
+
+    assert db_manager.get_table_stats()["companies"] == 0
+
+
+def test_unknown_row_changes_recount_one_table(db_manager):
+    db_manager.get_table_stats()
+    statements = record_counts(db_manager.engine)
+
+    with db_manager.engine.begin() as conn:
+        conn.execute(
+            text("REPLACE INTO companies (id, name) VALUES ('c1', 'Acme Corp')")
+        )
+
+    assert db_manager.get_table_stats()["companies"] == 1
+    assert len(statements) == 1 and "UNION" not in statements[0]
+    assert "FROM companies" in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_async_writes_are_counted(db_manager):
+    db_manager.get_table_stats()
+    async_manager = AsyncDatabaseManager(db_manager.database_url)
+
+    await AsyncJobRepository(async_manager).create_job(make_job(0))
+    await async_manager.dispose()
+
+    assert db_manager.get_table_stats()["job_listings"] == 1
+
+
+def test_counts_expire_after_ttl(db_manager):
+    clock = FakeClock()
+    table_stats = TableStats(ttl_seconds=60, clock=clock)
+    table_stats.counts(db_manager.engine)
+
+    # Not a write this instance can see
+    with db_manager.engine.begin() as conn:
+        conn.execute(text("INSERT INTO companies (id, name) VALUES ('c1', 'Acme')"))
+
+    assert table_stats.counts(db_manager.engine)["companies"] == 0
+    clock.now = 60
+    assert table_stats.counts(db_manager.engine)["companies"] == 1
+    assert table_stats.stats()["full_refreshes"] == 2
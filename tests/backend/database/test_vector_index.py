@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Vector Index Tests
+
+Tests exact cosine search over the normalized matrix behind the simple
+vector store backend: ranking against a brute-force reference, replacing
+and removing vectors, thresholds and filtered searches.
+"""
+
+import numpy as np
+import pytest
+
+from app.data.vector_index import ExactVectorIndex, top_k
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(3).standard_normal((500, 16)).astype(np.float32)
+
+
+@pytest.fixture
+def index(vectors):
+    index = ExactVectorIndex(16)
+    index.add([f"job-{i}" for i in range(len(vectors))], vectors)
+    return index
+
+
+def reference(vectors, query, k):
+    """Cosine similarity ranking computed one vector at a time."""
+    scores = [
+        float(np.dot(v, query) / (np.linalg.norm(v) * np.linalg.norm(query)))
+        for v in vectors
+    ]
+    ranked = sorted(range(len(scores)), key=lambda i: -scores[i])[:k]
+    return [(f"job-{i}", scores[i]) for i in ranked]
+
+
+def keep(predicate, batches=None):
+    """A batch ``accept`` filter from a per-id predicate, recording batches."""
+
+    def accept(job_ids):
+        if batches is not None:
+            batches.append(list(job_ids))
+        return [predicate(job_id) for job_id in job_ids]
+
+    return accept
+
+
+def test_top_k_orders_and_thresholds():
+    scores = np.array([0.1, 0.9, 0.5, 0.7, -0.2], dtype=np.float32)
+    assert top_k(scores, 3).tolist() == [1, 3, 2]
+    assert top_k(scores, 10, threshold=0.6).tolist() == [1, 3]
+    assert top_k(scores, 0).tolist() == []
+
+
+def test_search_matches_brute_force(index, vectors):
+    query = np.random.default_rng(4).standard_normal(16)
+    hits = index.search(query, 10)
+    expected = reference(vectors, query, 10)
+
+    assert [job_id for job_id, _ in hits] == [job_id for job_id, _ in expected]
+    np.testing.assert_allclose(
+        [score for _, score in hits], [score for _, score in expected], rtol=1e-5
+    )
+
+
+def test_replace_and_remove(index, vectors):
+    index.add(["job-1"], [vectors[2]])
+    assert len(index) == 500
+    assert index.search(vectors[2], 2)[1][1] == pytest.approx(1.0)
+
+    assert index.remove(["job-2", "job-7", "missing"]) == 2
+    assert len(index) == 498 and "job-2" not in index
+    assert index.search(vectors[2], 1)[0][0] == "job-1"
+    # The row moved into the hole keeps its own vector
+    assert index.search(vectors[499], 1)[0][0] == "job-499"
+
+
+def test_threshold_and_filters(index, vectors):
+    query = vectors[0]
+    assert [hit[0] for hit in index.search(query, 5, threshold=0.999)] == ["job-0"]
+
+    even = index.search(query, 5, accept=keep(lambda job_id: int(job_id[4:]) % 2 == 0))
+    assert len(even) == 5
+    assert all(int(job_id[4:]) % 2 == 0 for job_id, _ in even)
+
+    # Rare matches widen the candidate set until enough are accepted
+    batches = []
+    rare = index.search(
+        query, 3, accept=keep(lambda job_id: job_id.endswith("99"), batches)
+    )
+    ranked = reference(vectors, query, len(vectors))
+    expected = [hit for hit in ranked if hit[0].endswith("99")][:3]
+    assert [job_id for job_id, _ in rare] == [job_id for job_id, _ in expected]
+    # Each widening round only checks the candidates it adds
+    checked = [job_id for batch in batches for job_id in batch]
+    assert len(batches) > 1
+    assert len(checked) == len(set(checked))
+
+
+def test_rejects_other_dimensions(index):
+    with pytest.raises(ValueError):
+        index.add(["job-x"], np.ones((1, 8)))
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Vector Store Batch Embedding Tests
+
+Tests VectorStore.batch_store_embeddings: stored embeddings are reused,
+the rest are encoded in one model call with each distinct text once, and
+written to the backend and the database in bulk. Single writes and deletes
+on the on-disk backends are saved in batches and survive a restart.
+"""
+
+import os
+import tempfile
+import zlib
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from app.data.database import DatabaseManager, JobRepository  # noqa: E402
+from app.data.models import JobEmbeddingDB, JobListing  # noqa: E402
+from app.tool.semantic_search import vector_store  # noqa: E402
+
+
+class FakeSentenceTransformer:
+    """Deterministic bag-of-words model recording its encode calls."""
+
+    def __init__(self, model_name, dimension=32):
+        self.dimension = dimension
+        self.calls = []
+
+    def get_sentence_embedding_dimension(self):
+        return self.dimension
+
+    def encode(self, texts, batch_size=32):
+        self.calls.append(list(texts))
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                vectors[row, zlib.crc32(word.encode()) % self.dimension] += 1.0
+        return vectors
+
+
+@pytest.fixture
+def db_manager():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        yield manager
+        manager.engine.dispose()
+
+
+@pytest.fixture
+def jobs(db_manager):
+    repo = JobRepository(db_manager)
+    created = [
+        repo.create_job(
+            JobListing(
+                title=f"Engineer {i % 5}",
+                company="Acme",
+                description=f"Build systems with Python {i % 5}",
+            )
+        )
+        for i in range(20)
+    ]
+    return created
+
+
+@pytest.fixture
+def store(monkeypatch, db_manager):
+    monkeypatch.setattr(vector_store, "SentenceTransformer", FakeSentenceTransformer)
+    return vector_store.VectorStore(storage_backend="simple", db_manager=db_manager)
+
+
+def stored_rows(db_manager):
+    with db_manager.get_session() as session:
+        return session.query(JobEmbeddingDB).count()
+
+
+@pytest.mark.asyncio
+async def test_batch_encodes_once_and_inserts_in_bulk(store, db_manager, jobs):
+    embeddings = await store.batch_store_embeddings(jobs)
+
+    assert [str(e.job_id) for e in embeddings] == [str(job.id) for job in jobs]
+    # 20 jobs share 5 distinct texts
+    assert len(store.embedding_model.calls) == 1
+    assert len(store.embedding_model.calls[0]) == 5
+    assert stored_rows(db_manager) == 20
+    assert len(store.storage["index"]) == 20
+    assert embeddings[0].embedding_vector == embeddings[5].embedding_vector
+
+    query = store.embedding_model.encode([store._extract_searchable_content(jobs[3])])
+    hits = store.storage["index"].search(query[0], 4)
+    assert str(jobs[3].id) in [job_id for job_id, _ in hits]
+
+
+@pytest.mark.asyncio
+async def test_batch_reuses_stored_embeddings(store, db_manager, jobs):
+    first = await store.batch_store_embeddings(jobs[:10])
+    store.embedding_model.calls.clear()
+
+    again = await store.batch_store_embeddings(jobs)
+
+    assert [e.id for e in again[:10]] == [e.id for e in first]
+    assert store.embedding_model.calls == [
+        [store._extract_searchable_content(job) for job in jobs[10:15]]
+    ]
+    assert stored_rows(db_manager) == 20
+
+
+@pytest.mark.asyncio
+async def test_batch_of_nothing(store):
+    assert await store.batch_store_embeddings([]) == []
+    assert store.embedding_model.calls == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend, index_file", [("ivf", "jobs.npz"), ("mmap", "seg")])
+async def test_single_writes_are_saved_in_batches(
+    monkeypatch, tmp_path, db_manager, jobs, backend, index_file
+):
+    monkeypatch.setattr(vector_store, "SentenceTransformer", FakeSentenceTransformer)
+    monkeypatch.setattr(vector_store, "INDEX_SAVE_INTERVAL", 3)
+
+    def open_store():
+        return vector_store.VectorStore(
+            storage_backend=backend,
+            db_manager=db_manager,
+            index_path=str(tmp_path / index_file),
+        )
+
+    store = open_store()
+    await store.batch_store_embeddings(jobs[:3])
+    saves = []
+    save_index = store.save_index
+    monkeypatch.setattr(store, "save_index", lambda: saves.append(1) or save_index())
+    await store.store_job_embedding(jobs[3])
+    assert await store.delete_job_embedding(str(jobs[0].id))
+    # Single writes do not rewrite the index each time
+    assert saves == []
+    await store.store_job_embedding(jobs[4])
+    assert saves == ([1] if backend == "ivf" else [])
+    if backend == "mmap":
+        assert store.storage["index"].segment_count == 1
+
+    store.close()
+    index = open_store().storage["index"]
+    assert len(index) == 4
+    assert str(jobs[0].id) not in index
+    assert str(jobs[3].id) in index
+
+
+@pytest.mark.asyncio
+async def test_filters_load_jobs_in_one_batch(monkeypatch, tmp_path, db_manager, jobs):
+    monkeypatch.setattr(vector_store, "SentenceTransformer", FakeSentenceTransformer)
+    index_path = str(tmp_path / "seg")
+    store = vector_store.VectorStore(
+        storage_backend="mmap", db_manager=db_manager, index_path=index_path
+    )
+    await store.batch_store_embeddings(jobs)
+
+    # A reopened store has no metadata, so filters look the jobs up
+    store = vector_store.VectorStore(
+        storage_backend="mmap", db_manager=db_manager, index_path=index_path
+    )
+    lookups = []
+    get_jobs_by_ids = store.job_repo.get_jobs_by_ids
+    monkeypatch.setattr(
+        store.job_repo,
+        "get_jobs_by_ids",
+        lambda job_ids: lookups.append(list(job_ids)) or get_jobs_by_ids(job_ids),
+    )
+
+    job_ids = [str(job.id) for job in jobs] + ["missing"]
+    found = store._stored_jobs(job_ids)
+
+    assert lookups == [job_ids]
+    assert set(found) == set(job_ids[:-1])
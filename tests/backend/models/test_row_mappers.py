@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Row Mapper Tests
+
+Tests the cached ORM-to-Pydantic converters behind sqlalchemy_to_pydantic,
+including the trusted (model_construct) path.
+"""
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.data.models import (
+    ApplicationStatus,
+    Base,
+    ETLOperationLog,
+    ETLOperationLogDB,
+    JobApplication,
+    JobApplicationDB,
+    JobListing,
+    JobListingDB,
+    JobType,
+    RemoteType,
+    SavedJob,
+    SavedJobDB,
+    UserProfile,
+    UserProfileDB,
+    _model_builder,
+    get_row_mapper,
+    sqlalchemy_to_pydantic,
+)
+
+
+@pytest.fixture
+def session():
+    """Session on an in-memory database, so rows carry their column defaults."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def stored(session, row):
+    """Insert a row and read it back as the repositories would see it."""
+    session.add(row)
+    session.commit()
+    session.expire_all()
+    return session.get(type(row), row.id)
+
+
+def make_job_row(**overrides):
+    values = dict(
+        id=str(uuid4()),
+        title="Senior Python Developer",
+        company="Acme Corp",
+        job_type=JobType.FULL_TIME,
+        remote_type=RemoteType.REMOTE,
+        salary_min=120000.0,
+        skills_required=["python", "sql"],
+        skills_preferred=None,
+        canonical_id=str(uuid4()),
+        source_count=2,
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 2),
+    )
+    values.update(overrides)
+    return JobListingDB(**values)
+
+
+def test_mapper_is_cached_per_class_pair():
+    first = get_row_mapper(JobListingDB, JobListing)
+
+    assert get_row_mapper(JobListingDB, JobListing) is first
+    assert get_row_mapper(JobListingDB, JobListing, trusted=True) is not first
+
+
+def test_null_columns_use_defaults(session):
+    job = sqlalchemy_to_pydantic(stored(session, make_job_row()), JobListing)
+
+    assert job.skills_preferred == []
+    assert job.benefits == []
+
+
+def test_null_id_falls_back_to_model_default():
+    row = UserProfileDB(first_name="Ada")
+
+    assert isinstance(sqlalchemy_to_pydantic(row, UserProfile).id, UUID)
+
+
+def test_trusted_mapping_matches_validated_mapping(session):
+    row = stored(session, make_job_row())
+
+    validated = sqlalchemy_to_pydantic(row, JobListing)
+    trusted = sqlalchemy_to_pydantic(row, JobListing, trusted=True)
+
+    assert trusted == validated
+    assert isinstance(trusted.id, UUID)
+    assert isinstance(trusted.canonical_id, UUID)
+
+
+def test_trusted_builder_sets_the_slots_model_construct_sets():
+    # The builder writes these slots itself; a Pydantic upgrade that changes
+    # them must fail here rather than produce half-initialised models
+    assert BaseModel.__slots__ == (
+        "__dict__",
+        "__pydantic_fields_set__",
+        "__pydantic_extra__",
+        "__pydantic_private__",
+    )
+    data = dict(JobListing(title="Python Developer", company="Acme Corp"))
+
+    built = _model_builder(JobListing)(**data)
+    constructed = JobListing.model_construct(**data)
+
+    for slot in BaseModel.__slots__:
+        assert getattr(built, slot) == getattr(constructed, slot)
+    assert built.model_dump() == constructed.model_dump()
+
+
+def test_trusted_mapping_coerces_uuid_and_enum_columns():
+    row = SavedJobDB(
+        id=str(uuid4()),
+        job_id=str(uuid4()),
+        user_profile_id=str(uuid4()),
+        tags=None,
+    )
+    app_row = JobApplicationDB(
+        id=str(uuid4()),
+        job_id=str(uuid4()),
+        user_profile_id=str(uuid4()),
+        status="applied",
+    )
+
+    saved = sqlalchemy_to_pydantic(row, SavedJob, trusted=True)
+    application = sqlalchemy_to_pydantic(app_row, JobApplication, trusted=True)
+
+    assert isinstance(saved.job_id, UUID)
+    assert saved.tags == []
+    assert application.status is ApplicationStatus.APPLIED
+
+
+def test_trusted_mapping_falls_back_to_validation_for_nested_types():
+    row = UserProfileDB(
+        id=str(uuid4()), first_name="Ada", preferred_job_types=["Full-time"]
+    )
+
+    user = sqlalchemy_to_pydantic(row, UserProfile, trusted=True)
+
+    assert user.preferred_job_types == [JobType.FULL_TIME]
+
+
+def test_renamed_columns_are_mapped(session):
+    row = ETLOperationLogDB(
+        id=str(uuid4()),
+        operation_type="collection",
+        operation_name="jsearch_collection",
+        status="completed",
+        operation_metadata={"jobs": 3},
+    )
+
+    log = sqlalchemy_to_pydantic(stored(session, row), ETLOperationLog)
+
+    assert log.operation_metadata == {"jobs": 3}
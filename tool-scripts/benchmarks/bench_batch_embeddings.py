@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Batch Embedding Benchmark
+
+Throughput of VectorStore.batch_store_embeddings against the per-job path
+it replaced (store_job_embedding for each job, gathered ten at a time) on
+a temporary SQLite database. Each job has distinct text.
+
+By default the real sentence transformer is used. --fake swaps in a
+hashing encoder, which leaves only the lookup, backend and database
+costs of each path.
+
+Usage (from the project root):
+    python tool-scripts/benchmarks/bench_batch_embeddings.py [--jobs 10000] [--fake]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+import numpy as np  # noqa: E402
+
+from app.data.database import DatabaseManager, JobRepository  # noqa: E402
+from app.data.models import JobListing  # noqa: E402
+from app.tool.semantic_search import vector_store  # noqa: E402
+
+
+class HashingEncoder:
+    """Cheap stand-in for SentenceTransformer (384 dims)."""
+
+    def __init__(self, model_name):
+        pass
+
+    def get_sentence_embedding_dimension(self):
+        return 384
+
+    def encode(self, texts, batch_size=32):
+        vectors = np.zeros((len(texts), 384), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.split():
+                vectors[row, zlib.crc32(word.encode()) % 384] += 1.0
+        return vectors
+
+
+async def per_job(store, jobs):
+    for start in range(0, len(jobs), 10):
+        await asyncio.gather(
+            *[store.store_job_embedding(job) for job in jobs[start : start + 10]]
+        )
+
+
+def make_jobs(db_manager, count: int):
+    jobs = [
+        JobListing(
+            title=f"Software Engineer {i}",
+            company=f"Company {i % 500}",
+            description=f"Build and operate service {i} in Python and SQL",
+            skills_required=["Python", "SQL", f"skill-{i % 97}"],
+        )
+        for i in range(count)
+    ]
+    JobRepository(db_manager).bulk_create_jobs(jobs)
+    return jobs
+
+
+def run(label: str, count: int, batched: bool) -> float:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        jobs = make_jobs(db_manager, count)
+        store = vector_store.VectorStore(
+            storage_backend="simple", db_manager=db_manager
+        )
+
+        start = time.perf_counter()
+        if batched:
+            asyncio.run(store.batch_store_embeddings(jobs))
+        else:
+            asyncio.run(per_job(store, jobs))
+        elapsed = time.perf_counter() - start
+        db_manager.engine.dispose()
+
+    print(f"  {label:10s} {elapsed:8.2f} s  {len(jobs) / elapsed:9.0f} jobs/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs", type=int, default=10_000)
+    parser.add_argument("--fake", action="store_true", help="use a hashing encoder")
+    args = parser.parse_args()
+
+    if args.fake:
+        vector_store.SentenceTransformer = HashingEncoder
+
+    print(f"{args.jobs:,} jobs, {'hashing encoder' if args.fake else 'real model'}")
+    baseline = run("per-job", args.jobs, batched=False)
+    batched = run("batched", args.jobs, batched=True)
+    print(f"  speedup    {baseline / batched:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Bulk Upsert Benchmark
+
+Measures job load throughput into a file-backed SQLite database: the
+original ORM add_all path versus JobRepository.bulk_create_jobs, for a fresh
+load and for re-loading the same jobs (all updates).
+
+Usage (from the project root):
+    python tool-scripts/benchmarks/bench_bulk_upsert.py [--rows 20000] [--chunk-size 1000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from app.data.database import DatabaseManager, JobRepository  # noqa: E402
+from app.data.models import (  # noqa: E402
+    JobListing,
+    JobListingDB,
+    JobType,
+    RemoteType,
+    pydantic_to_sqlalchemy,
+)
+
+
+def make_jobs(count: int):
+    return [
+        JobListing(
+            title=f"Python Developer {i}",
+            company=f"Company {i % 50}",
+            location="Remote",
+            description="Build services. " * 20,
+            job_type=JobType.FULL_TIME,
+            remote_type=RemoteType.REMOTE,
+            salary_min=100000.0 + i,
+            salary_max=150000.0 + i,
+            skills_required=["python", "sql", "aws"],
+            job_url=f"https://example.com/jobs/{i}",
+        )
+        for i in range(count)
+    ]
+
+
+def add_all(db_manager: DatabaseManager, jobs):
+    """The ORM path bulk_create_jobs used before, kept as the baseline."""
+    with db_manager.get_session() as session:
+        session.add_all(pydantic_to_sqlalchemy(job, JobListingDB) for job in jobs)
+
+
+def timed(label: str, rows: int, action):
+    start = time.perf_counter()
+    outcome = action()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:34s} {elapsed * 1000:9.1f} ms  {rows / elapsed:10,.0f} rows/s")
+    return outcome
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.rows)
+    print(f"Loading {args.rows:,} jobs (chunk size {args.chunk_size})")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        baseline = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'orm.db')}")
+        timed("ORM add_all (insert)", args.rows, lambda: add_all(baseline, jobs))
+        baseline.engine.dispose()
+
+        db_manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'upsert.db')}")
+        job_repo = JobRepository(db_manager)
+        for label, key in (("insert", "id"), ("update by id", "id")):
+            result = timed(
+                f"bulk_create_jobs ({label})",
+                args.rows,
+                lambda key=key: job_repo.bulk_create_jobs(
+                    jobs, conflict_key=key, chunk_size=args.chunk_size
+                ),
+            )
+            print(f"    {result}")
+        result = timed(
+            "bulk_create_jobs (update by job_url)",
+            args.rows,
+            lambda: job_repo.bulk_create_jobs(
+                make_jobs(args.rows),
+                conflict_key="job_url",
+                chunk_size=args.chunk_size,
+            ),
+        )
+        print(f"    {result}")
+        db_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
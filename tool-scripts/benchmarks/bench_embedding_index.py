@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Embedding Index Benchmark
+
+Measures semantic search over JobEmbeddingIndex on a file-backed SQLite
+database: loading the stored job embeddings into the matrix, then search
+latency (one matrix-vector product plus filter masks) with and without
+filters. Vectors are random, so no embedding model is needed; query
+encoding time is not included.
+
+Usage (from the project root):
+    python tool-scripts/benchmarks/bench_embedding_index.py [--rows 100000] [--repeat 50]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+import numpy as np  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.data.database import DatabaseManager, JobRepository  # noqa: E402
+from app.data.embedding_index import JobEmbeddingIndex  # noqa: E402
+from app.data.models import (  # noqa: E402
+    JobEmbeddingDB,
+    JobListing,
+    JobListingDB,
+    JobType,
+    RemoteType,
+)
+
+MODEL = "all-MiniLM-L6-v2"
+CITIES = ["Austin, TX", "Boston, MA", "Remote", "Denver, CO", "Seattle, WA"]
+
+
+def make_jobs(start: int, count: int):
+    job_types, remote_types = list(JobType), list(RemoteType)
+    return [
+        JobListing(
+            title=f"Engineer {i}",
+            company=f"Company {i % 2000}",
+            location=CITIES[i % len(CITIES)],
+            job_type=job_types[i % len(job_types)],
+            remote_type=remote_types[i % len(remote_types)],
+            salary_min=60_000 + (i % 100) * 1_000,
+            salary_max=90_000 + (i % 100) * 1_500,
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def store_random_embeddings(db_manager: DatabaseManager, dimension: int):
+    rng = np.random.default_rng(7)
+    with db_manager.engine.begin() as conn:
+        job_ids = conn.execute(select(JobListingDB.id)).scalars().all()
+        for start in range(0, len(job_ids), 10_000):
+            chunk = job_ids[start : start + 10_000]
+            vectors = rng.standard_normal((len(chunk), dimension), dtype=np.float32)
+            conn.execute(
+                insert(JobEmbeddingDB.__table__),
+                [
+                    {
+                        "job_id": job_id,
+                        "embedding_model": MODEL,
+                        "content_hash": "benchmark",
+                        "embedding_vector": vector,
+                        "embedding_dimension": dimension,
+                    }
+                    for job_id, vector in zip(chunk, vectors, strict=True)
+                ],
+            )
+
+
+def timed(label: str, repeat: int, action):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - start) * 1000)
+    print(
+        f"  {label:38s} median {statistics.median(samples):8.2f} ms"
+        f"  p95 {sorted(samples)[int(len(samples) * 0.95) - 1]:8.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        job_repo = JobRepository(db_manager)
+
+        print(f"Loading {args.rows:,} jobs with {args.dimension}-dim embeddings")
+        for offset in range(0, args.rows, 10_000):
+            job_repo.bulk_create_jobs(
+                make_jobs(offset, min(10_000, args.rows - offset))
+            )
+        store_random_embeddings(db_manager, args.dimension)
+
+        index = JobEmbeddingIndex(MODEL)
+        start = time.perf_counter()
+        index.sync(job_repo, encode=None, job_text=None)
+        print(
+            f"  matrix loaded in {time.perf_counter() - start:.2f} s"
+            f" ({len(index):,} rows)"
+        )
+
+        rng = np.random.default_rng(11)
+        queries = rng.standard_normal((args.repeat, args.dimension), dtype=np.float32)
+        queries = iter(np.concatenate([queries] * 5))
+
+        def search(**filters):
+            return lambda: index.search(job_repo, next(queries), limit=20, **filters)
+
+        print(f"Search latency ({args.repeat} queries)")
+        timed("no filters", args.repeat, search())
+        timed("job_types filter", args.repeat, search(job_types=[JobType.CONTRACT]))
+        timed(
+            "job_types + remote_types + salary",
+            args.repeat,
+            search(
+                job_types=[JobType.FULL_TIME, JobType.CONTRACT],
+                remote_types=[RemoteType.REMOTE],
+                min_salary=120_000,
+            ),
+        )
+        timed("locations filter", args.repeat, search(locations=["Austin"]))
+        db_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
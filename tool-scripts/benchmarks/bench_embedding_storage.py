@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Embedding Storage Benchmark
+
+Compares embedding vectors stored as JSON arrays (the old column type) with
+the binary EmbeddingVector column (float32 and float16): bytes per vector
+and time to load every vector into one NumPy matrix.
+
+Usage (from the project root):
+    python tool-scripts/benchmarks/bench_embedding_storage.py [--rows 10000] [--dimension 384]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from sqlalchemy import (  # noqa: E402
+    JSON,
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    create_engine,
+    func,
+    select,
+)
+
+from app.data.vectors import EmbeddingVector, load_vector_matrix  # noqa: E402
+
+
+def build_table(engine, name, column_type, vectors):
+    table = Table(
+        name,
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("vector", column_type),
+    )
+    table.create(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            table.insert(),
+            [{"id": i, "vector": vector} for i, vector in enumerate(vectors)],
+        )
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    vectors = (
+        np.random.default_rng(0)
+        .standard_normal((args.rows, args.dimension), dtype=np.float32)
+        .tolist()
+    )
+
+    print(f"{args.rows:,} vectors x {args.dimension} dims")
+    with engine.connect() as conn:
+        json_table = build_table(engine, "json_vectors", JSON, vectors)
+        size = conn.execute(select(func.avg(func.length(json_table.c.vector)))).scalar()
+        start = time.perf_counter()
+        rows = conn.execute(select(json_table.c.vector)).scalars().all()
+        np.array(rows, dtype=np.float32)
+        elapsed = time.perf_counter() - start
+        print(
+            f"  {'JSON array':16s} {size:8,.0f} bytes/vector"
+            f"  load matrix {elapsed * 1000:8.1f} ms"
+        )
+
+        for dtype in ("float32", "float16"):
+            table = build_table(
+                engine, f"{dtype}_vectors", EmbeddingVector(dtype), vectors
+            )
+            size = conn.execute(select(func.avg(func.length(table.c.vector)))).scalar()
+            start = time.perf_counter()
+            load_vector_matrix(conn, table.c.id, table.c.vector)
+            elapsed = time.perf_counter() - start
+            print(
+                f"  {dtype:16s} {size:8,.0f} bytes/vector"
+                f"  load matrix {elapsed * 1000:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
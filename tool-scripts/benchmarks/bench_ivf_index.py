@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+IVF Index Benchmark
+
+Recall@k versus query latency of IVFVectorIndex (flat and with product
+quantization) across nprobe values, against ExactVectorIndex as ground
+truth and latency baseline. Vectors are a synthetic Gaussian mixture, so
+cells have structure to exploit as real embeddings do.
+
+Usage (from the project root):
+    python tool-scripts/benchmarks/bench_ivf_index.py [--rows 200000] [--pq 48]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+import numpy as np  # noqa: E402
+
+from app.data.ivf_index import IVFVectorIndex  # noqa: E402
+from app.data.vector_index import ExactVectorIndex  # noqa: E402
+
+
+def make_vectors(rng, rows: int, dimension: int, clusters: int = 1000):
+    centers = rng.standard_normal((clusters, dimension), dtype=np.float32)
+    labels = rng.integers(0, clusters, rows)
+    noise = rng.standard_normal((rows, dimension), dtype=np.float32)
+    return centers[labels] + 0.6 * noise
+
+
+def run(label: str, index, queries, truth, k: int, **options):
+    samples, found = [], 0
+    for query, expected in zip(queries, truth, strict=True):
+        start = time.perf_counter()
+        hits = index.search(query, k, **options)
+        samples.append((time.perf_counter() - start) * 1000)
+        found += len(expected & {vector_id for vector_id, _ in hits})
+    p95 = sorted(samples)[int(len(samples) * 0.95) - 1]
+    print(
+        f"  {label:24s} recall@{k} {found / (k * len(queries)):6.3f}"
+        f"  median {statistics.median(samples):8.2f} ms  p95 {p95:8.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--pq", type=int, default=48, help="PQ subvectors (0: off)")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 16, 64])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    vectors = make_vectors(rng, args.rows, args.dimension)
+    ids = [f"job-{i}" for i in range(args.rows)]
+    queries = vectors[rng.integers(0, args.rows, args.queries)]
+    queries = queries + 0.3 * rng.standard_normal(queries.shape, dtype=np.float32)
+
+    exact = ExactVectorIndex(args.dimension)
+    exact.add(ids, vectors)
+    truth = [{vector_id for vector_id, _ in exact.search(q, args.k)} for q in queries]
+
+    print(f"{args.rows:,} vectors x {args.dimension} dims, {args.queries} queries")
+    run("exact", exact, queries, truth, args.k)
+
+    variants = [("flat", None)] + ([(f"pq{args.pq}", args.pq)] if args.pq else [])
+    for name, pq_subvectors in variants:
+        start = time.perf_counter()
+        index = IVFVectorIndex(args.dimension, pq_subvectors=pq_subvectors)
+        for offset in range(0, args.rows, 50_000):
+            index.add(ids[offset : offset + 50_000], vectors[offset : offset + 50_000])
+        print(
+            f"IVF {name}: {index.n_lists} lists, built in "
+            f"{time.perf_counter() - start:.1f} s"
+        )
+        for nprobe in args.nprobe:
+            run(f"nprobe={nprobe}", index, queries, truth, args.k, nprobe=nprobe)
+        del index
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Job Facet Benchmark
+
+Measures JobRepository.get_job_facets on a file-backed SQLite database:
+unfiltered counts read from the trigger-maintained job_facet_counts table
+versus per-facet GROUP BY scans of job_listings, plus filtered facets
+computed in one grouped query.
+
+Usage (from the project root):
+    python tool-scripts/benchmarks/bench_job_facets.py [--rows 100000] [--repeat 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from sqlalchemy import func, select  # noqa: E402
+
+from app.data.database import DatabaseManager, JobRepository  # noqa: E402
+from app.data.facets import FACET_COLUMNS, facet_count_query  # noqa: E402
+from app.data.models import (  # noqa: E402
+    ExperienceLevel,
+    JobListing,
+    JobListingDB,
+    JobStatus,
+    JobType,
+    RemoteType,
+)
+
+SKILLS = ["python", "sql", "aws", "react", "go", "rust", "docker", "java", "spark"]
+
+
+def make_jobs(start: int, count: int):
+    job_types, remote_types = list(JobType), list(RemoteType)
+    levels = list(ExperienceLevel)
+    return [
+        JobListing(
+            title=f"Engineer {i}",
+            company=f"Company {i % 2000}",
+            location="Remote",
+            job_type=job_types[i % len(job_types)],
+            remote_type=remote_types[i % len(remote_types)],
+            experience_level=levels[i % len(levels)],
+            skills_required=[SKILLS[i % 9], SKILLS[(i * 7) % 9], SKILLS[(i * 5) % 9]],
+            status=JobStatus.ACTIVE if i % 10 else JobStatus.EXPIRED,
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def group_by_scans(db_manager: DatabaseManager):
+    """One GROUP BY per facet over job_listings, the per-request baseline."""
+    with db_manager.engine.connect() as conn:
+        active = JobListingDB.status == JobStatus.ACTIVE
+        for column in FACET_COLUMNS.values():
+            column = getattr(JobListingDB, column)
+            conn.execute(
+                select(column, func.count()).where(active).group_by(column)
+            ).all()
+        conn.execute(
+            facet_count_query(
+                select(
+                    JobListingDB.id,
+                    JobListingDB.skills_required,
+                    *[getattr(JobListingDB, c) for c in FACET_COLUMNS.values()],
+                ).where(active)
+            )
+        ).all()
+
+
+def timed(label: str, repeat: int, action):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - start) * 1000)
+    print(
+        f"  {label:38s} median {statistics.median(samples):8.2f} ms"
+        f"  p95 {sorted(samples)[int(len(samples) * 0.95) - 1]:8.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = DatabaseManager(f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}")
+        job_repo = JobRepository(db_manager)
+
+        print(f"Loading {args.rows:,} jobs")
+        start = time.perf_counter()
+        for offset in range(0, args.rows, 10_000):
+            job_repo.bulk_create_jobs(
+                make_jobs(offset, min(10_000, args.rows - offset))
+            )
+        elapsed = time.perf_counter() - start
+        print(f"  loaded in {elapsed:.1f} s ({args.rows / elapsed:,.0f} rows/s)")
+
+        print(f"Facet counts ({args.repeat} runs)")
+        timed(
+            "GROUP BY per facet (baseline)",
+            args.repeat,
+            lambda: group_by_scans(db_manager),
+        )
+        timed("get_job_facets (materialized)", args.repeat, job_repo.get_job_facets)
+        timed(
+            "get_job_facets (job_types filter)",
+            args.repeat,
+            lambda: job_repo.get_job_facets(job_types=[JobType.CONTRACT]),
+        )
+        timed(
+            "get_job_facets (company filter)",
+            args.repeat,
+            lambda: job_repo.get_job_facets(companies=["Company 7"]),
+        )
+        db_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
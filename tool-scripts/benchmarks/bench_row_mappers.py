@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Row Mapper Benchmark
+
+Measures ORM-to-Pydantic conversion throughput for job listings: the
+original per-row sqlalchemy_to_pydantic logic versus the cached row mappers,
+with and without validation (model_construct).
+
+Usage (from the project root):
+    python tool-scripts/benchmarks/bench_row_mappers.py [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+from uuid import uuid4
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.data.models import (  # noqa: E402
+    Base,
+    JobListing,
+    JobListingDB,
+    JobType,
+    RemoteType,
+    get_row_mapper,
+)
+
+
+def legacy_sqlalchemy_to_pydantic(sqlalchemy_obj, pydantic_class):
+    """The converter as it was before row mappers, kept as the baseline."""
+    data = {}
+    for column in sqlalchemy_obj.__table__.columns:
+        value = getattr(sqlalchemy_obj, column.name)
+        column_name = column.name
+
+        if (
+            sqlalchemy_obj.__class__.__name__ == "RawJobCollectionDB"
+            and column_name == "response_metadata"
+        ):
+            column_name = "metadata"
+        elif (
+            sqlalchemy_obj.__class__.__name__ == "ETLOperationLogDB"
+            and column_name == "operation_metadata"
+        ):
+            column_name = "metadata"
+
+        if value is None and column_name in [
+            "skills",
+            "preferred_locations",
+            "preferred_job_types",
+            "preferred_remote_types",
+            "skills_required",
+            "skills_preferred",
+            "benefits",
+            "values",
+            "tags",
+            "tech_stack",
+            "matching_fields",
+        ]:
+            value = []
+        elif value is None and column_name == "event_data":
+            value = {}
+        elif value is None and column_name in [
+            "scraping_rules",
+            "rate_limit_config",
+            "source_metadata",
+            "benefits_parsed",
+            "metadata",
+            "operation_metadata",
+            "response_metadata",
+        ]:
+            value = {}
+        elif value is None and column_name in ["id", "created_at", "updated_at"]:
+            continue
+
+        data[column_name] = value
+    return pydantic_class(**data)
+
+
+def load_rows(count: int):
+    """Insert ``count`` job listings into an in-memory database and load them."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    session.add_all(
+        JobListingDB(
+            id=str(uuid4()),
+            title=f"Python Developer {i}",
+            company=f"Company {i % 50}",
+            location="Remote",
+            description="Build services. " * 20,
+            job_type=JobType.FULL_TIME,
+            remote_type=RemoteType.REMOTE,
+            salary_min=100000.0 + i,
+            salary_max=150000.0 + i,
+            skills_required=["python", "sql", "aws"],
+            canonical_id=str(uuid4()) if i % 3 == 0 else None,
+        )
+        for i in range(count)
+    )
+    session.commit()
+    rows = session.query(JobListingDB).all()
+    # Touch every column once so attribute loading is excluded from timings
+    for row in rows:
+        row.__dict__.get("title")
+    return rows
+
+
+def best_time(convert, rows, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for row in rows:
+            convert(row)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = load_rows(args.rows)
+    validated = get_row_mapper(JobListingDB, JobListing)
+    trusted = get_row_mapper(JobListingDB, JobListing, trusted=True)
+
+    results = [
+        (
+            "legacy sqlalchemy_to_pydantic",
+            lambda row: legacy_sqlalchemy_to_pydantic(row, JobListing),
+        ),
+        ("row mapper (validated)", validated),
+        ("row mapper (trusted)", trusted),
+    ]
+
+    print(f"Converting {args.rows:,} JobListingDB rows (best of {args.repeat})")
+    baseline = None
+    for name, convert in results:
+        elapsed = best_time(convert, rows, args.repeat)
+        per_10k = elapsed * 10_000 / args.rows
+        baseline = baseline or per_10k
+        print(
+            f"  {name:32s} {per_10k * 1000:8.1f} ms / 10k rows"
+            f"  {args.rows / elapsed:10,.0f} rows/s  x{baseline / per_10k:4.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Segment Index Benchmark
+
+Startup cost and query latency of SegmentVectorIndex against rebuilding an
+ExactVectorIndex, the in-memory simple backend, from stored vectors. Every
+worker process pays the rebuild and holds its own copy of the matrix; the
+segment index only maps its files, whose pages the workers share.
+
+Usage (from the project root):
+    python tool-scripts/benchmarks/bench_segment_index.py [--rows 200000]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+import numpy as np  # noqa: E402
+
+from app.data.segment_index import SegmentVectorIndex  # noqa: E402
+from app.data.vector_index import ExactVectorIndex  # noqa: E402
+
+
+def query_latency(index, queries, k: int) -> float:
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query, k)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--segments", type=int, default=4)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(11)
+    vectors = rng.standard_normal((args.rows, args.dimension), dtype=np.float32)
+    ids = [f"job-{i}" for i in range(args.rows)]
+    queries = rng.standard_normal((args.queries, args.dimension), dtype=np.float32)
+    print(f"{args.rows:,} vectors x {args.dimension} dims")
+
+    start = time.perf_counter()
+    exact = ExactVectorIndex(args.dimension)
+    exact.add(ids, vectors)
+    print(f"  rebuild simple index   {(time.perf_counter() - start) * 1000:9.1f} ms")
+    print(f"    query median         {query_latency(exact, queries, args.k):9.2f} ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        writer = SegmentVectorIndex(directory, args.dimension, flush_rows=args.rows)
+        step = -(-args.rows // args.segments)
+        for offset in range(0, args.rows, step):
+            writer.add(ids[offset : offset + step], vectors[offset : offset + step])
+            writer.flush()
+        writer.remove(ids[:: max(1, args.rows // 1000)])
+
+        start = time.perf_counter()
+        index = SegmentVectorIndex(directory, args.dimension, writable=False)
+        print(
+            f"  open segment index     {(time.perf_counter() - start) * 1000:9.1f} ms"
+        )
+        start = time.perf_counter()
+        index.search(queries[0], args.k)
+        print(
+            f"    first query          {(time.perf_counter() - start) * 1000:9.2f} ms"
+        )
+        print(
+            f"    query median         {query_latency(index, queries, args.k):9.2f} ms"
+        )
+
+        start = time.perf_counter()
+        writer.compact()
+        print(
+            f"  compact {args.segments} segments   {time.perf_counter() - start:9.2f} s"
+        )
+        print(
+            f"    query median         {query_latency(index, queries, args.k):9.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+SQLite Profile Benchmark
+
+Runs concurrent job searches (API reads) and single-job inserts and status
+updates (ETL writes) against a file-backed SQLite database, with the
+DatabaseManager performance profile off (SQLite defaults) and on.
+
+Usage (from the project root):
+    python tool-scripts/benchmarks/bench_sqlite_profile.py [--seconds 5] [--readers 4] [--writers 2]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from app.data.database import DatabaseManager, JobRepository  # noqa: E402
+from app.data.engine import SQLiteProfile  # noqa: E402
+from app.data.models import JobListing, JobStatus  # noqa: E402
+
+
+def make_job(i: int) -> JobListing:
+    return JobListing(
+        title=f"Python Developer {i}",
+        company=f"Company {i % 50}",
+        location="Remote",
+        description="Build services with Python and SQL. " * 10,
+        salary_min=100000.0 + i,
+        job_url=f"https://example.com/jobs/{i}",
+    )
+
+
+def run(profile, seconds: float, readers: int, writers: int, seed_rows: int):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = DatabaseManager(
+            f"sqlite:///{os.path.join(temp_dir, 'jobs.db')}", sqlite_profile=profile
+        )
+        job_repo = JobRepository(db_manager)
+        job_repo.bulk_create_jobs([make_job(i) for i in range(seed_rows)])
+
+        counts = {"reads": 0, "writes": 0, "errors": 0}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + seconds
+
+        def count(key):
+            with lock:
+                counts[key] += 1
+
+        def reader():
+            while time.perf_counter() < deadline:
+                try:
+                    job_repo.search_jobs(min_salary=100500, limit=20)
+                    count("reads")
+                except Exception:
+                    count("errors")
+
+        def writer(worker: int):
+            i = 0
+            while time.perf_counter() < deadline:
+                try:
+                    job = job_repo.create_job(make_job(seed_rows + worker * 10**6 + i))
+                    job_repo.update_job_status(str(job.id), JobStatus.FILLED)
+                    count("writes")
+                except Exception:
+                    count("errors")
+                i += 1
+
+        threads = [threading.Thread(target=reader) for _ in range(readers)]
+        threads += [threading.Thread(target=writer, args=(w,)) for w in range(writers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        db_manager.engine.dispose()
+        return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seed-rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(
+        f"{args.readers} readers, {args.writers} writers, {args.seconds:g}s, "
+        f"{args.seed_rows:,} seeded jobs"
+    )
+    for label, profile in (("profile off", None), ("profile on", SQLiteProfile())):
+        counts = run(profile, args.seconds, args.readers, args.writers, args.seed_rows)
+        print(
+            f"  {label:12s} {counts['reads'] / args.seconds:8,.0f} reads/s"
+            f"  {counts['writes'] / args.seconds:8,.0f} writes/s"
+            f"  {counts['errors']:5d} errors"
+        )
+
+
+if __name__ == "__main__":
+    main()
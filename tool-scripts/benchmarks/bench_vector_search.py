@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Vector Search Benchmark
+
+Measures top-k search latency of the simple vector store backend at
+several collection sizes: the previous per-vector loop (cosine similarity
+of 1x1 lists and a JobMatch for every candidate above threshold, then a
+full sort) versus ExactVectorIndex (one matmul over a normalized float32
+matrix, np.argpartition, JobMatch objects for the final k only).
+
+Usage (from the project root):
+    python tool-scripts/benchmarks/bench_vector_search.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from uuid import UUID, uuid4
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+import numpy as np  # noqa: E402
+
+from app.data.models import JobMatch  # noqa: E402
+from app.data.vector_index import ExactVectorIndex  # noqa: E402
+
+try:
+    from sklearn.metrics.pairwise import cosine_similarity
+except ImportError:  # same arithmetic as the sklearn call on one pair
+
+    def cosine_similarity(a, b):
+        a, b = np.asarray(a[0]), np.asarray(b[0])
+        return [[np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))]]
+
+
+PROFILE_ID = UUID(int=0)
+
+
+def job_match(job_id: str, similarity: float) -> JobMatch:
+    return JobMatch(
+        job_id=job_id,
+        user_profile_id=PROFILE_ID,
+        overall_score=similarity,
+        skills_match_score=similarity,
+        experience_match_score=0.5,
+        location_match_score=0.5,
+        salary_match_score=0.5,
+        match_reasons=[f"Semantic similarity: {similarity:.2f}"],
+        calculated_at=datetime.utcnow(),
+    )
+
+
+def legacy_search(embeddings: dict, query, k: int, threshold: float):
+    """The per-vector loop _search_simple used before ExactVectorIndex."""
+    matches = []
+    for job_id, vector in embeddings.items():
+        similarity = cosine_similarity([query], [np.array(vector)])[0][0]
+        if similarity >= threshold:
+            matches.append(job_match(job_id, float(similarity)))
+    matches.sort(key=lambda match: match.overall_score, reverse=True)
+    return matches[:k]
+
+
+def indexed_search(index: ExactVectorIndex, query, k: int, threshold: float):
+    return [
+        job_match(job_id, score) for job_id, score in index.search(query, k, threshold)
+    ]
+
+
+def timed(label: str, repeat: int, action):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - start) * 1000)
+    p95 = sorted(samples)[max(int(len(samples) * 0.95) - 1, 0)]
+    print(
+        f"  {label:28s} median {statistics.median(samples):10.2f} ms"
+        f"  p95 {p95:10.2f} ms"
+    )
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--threshold", type=float, default=0.0)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--legacy-max",
+        type=int,
+        default=100_000,
+        help="largest size to run the per-vector loop on",
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    queries = rng.standard_normal((args.repeat, args.dimension), dtype=np.float32)
+
+    for size in args.sizes:
+        print(f"{size:,} vectors x {args.dimension} dims (k={args.k})")
+        index = ExactVectorIndex(args.dimension)
+        for start in range(0, size, 100_000):
+            count = min(100_000, size - start)
+            vectors = rng.standard_normal((count, args.dimension), dtype=np.float32)
+            index.add([str(uuid4()) for _ in range(count)], vectors)
+
+        queue = iter(queries)
+        fast = timed(
+            "ExactVectorIndex",
+            args.repeat,
+            lambda index=index, queue=queue: indexed_search(
+                index, next(queue), args.k, args.threshold
+            ),
+        )
+
+        if size <= args.legacy_max:
+            embeddings = {
+                job_id: vector.tolist()
+                for job_id, vector in zip(index.ids, index.vectors, strict=True)
+            }
+            queue = iter(queries)
+            slow = timed(
+                "per-vector loop (previous)",
+                min(args.repeat, 3),
+                lambda embeddings=embeddings, queue=queue: legacy_search(
+                    embeddings, next(queue), args.k, args.threshold
+                ),
+            )
+            print(f"  speedup {slow / fast:,.0f}x")
+            del embeddings
+        del index
+
+
+if __name__ == "__main__":
+    main()
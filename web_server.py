@@ -6,7 +6,7 @@ A simple FastAPI web interface for the JobPilot job hunting agent system.
 
 import json
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
@@ -23,6 +23,7 @@ from app.api.resume_api import router as resume_router
 from app.api.skill_bank import router as skill_bank_router
 from app.api.timeline import router as timeline_router
 from app.api.user_profiles import router as user_profiles_router
+from app.data.counts import CountStrategy
 from app.logger import logger
 from app.prompt.jobpilot import get_jobpilot_prompt
 
@@ -80,6 +81,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include API routers
@@ -353,9 +355,14 @@ async def websocket_endpoint(websocket: WebSocket):
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
+    from app.data.cache import get_cache_stats
+    from app.utils.retry import get_retry_stats
+
     return {
         "status": "healthy",
         "service": "JobPilot-OpenManus",
+        "caches": get_cache_stats(),
+        "retry": get_retry_stats(),
         "timestamp": datetime.now(),
     }
 
@@ -377,10 +384,10 @@ async def test_saved_endpoint():
 async def get_recent_jobs(limit: int = 20):
     """Get recently posted jobs."""
     try:
-        from app.data.database import get_job_repository
+        from app.data.async_database import get_async_job_repository
 
-        job_repo = get_job_repository()
-        jobs = job_repo.get_recent_jobs(limit=min(limit, 50))
+        job_repo = get_async_job_repository()
+        jobs = await job_repo.get_recent_job_summaries(limit=min(limit, 50))
 
         return {
             "jobs": [
@@ -394,17 +401,11 @@ async def get_recent_jobs(limit: int = 20):
                     "salary_min": job.salary_min,
                     "salary_max": job.salary_max,
                     "salary_currency": job.salary_currency,
-                    "skills_required": (
-                        job.skills_required[:5] if job.skills_required else []
-                    ),
+                    "skills_required": job.skills_required,
                     "posted_date": (
                         job.posted_date.isoformat() if job.posted_date else None
                     ),
-                    "description": (
-                        job.description[:200] + "..."
-                        if job.description and len(job.description) > 200
-                        else job.description
-                    ),
+                    "description": job.description_snippet,
                     "job_url": job.job_url,
                 }
                 for job in jobs
@@ -418,14 +419,66 @@ async def get_recent_jobs(limit: int = 20):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/jobs/facets")
+async def get_job_facets(
+    query: str = "",
+    job_types: str = "",
+    locations: str = "",
+    companies: str = "",
+    min_salary: Optional[float] = None,
+    max_salary: Optional[float] = None,
+    limit: int = 20,
+):
+    """
+    Count active jobs per job type, remote type, experience level, seniority,
+    company and skill, for the filters of the job search.
+
+    Takes the same filters as /api/jobs/search. Without filters the counts
+    are read from a table kept current as listings change.
+    """
+    try:
+        from app.data.async_database import get_async_job_repository
+        from app.data.models import JobType
+
+        job_repo = get_async_job_repository()
+
+        parsed_job_types = []
+        for jt in job_types.split(","):
+            try:
+                parsed_job_types.append(JobType(jt.strip()))
+            except ValueError:
+                pass  # Skip invalid job types
+
+        facets = await job_repo.get_job_facets(
+            query=query or None,
+            job_types=parsed_job_types or None,
+            locations=[loc.strip() for loc in locations.split(",") if loc.strip()]
+            or None,
+            companies=[c.strip() for c in companies.split(",") if c.strip()] or None,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            limit=min(limit, 100),
+        )
+        return {"facets": facets, "timestamp": datetime.now().isoformat()}
+
+    except Exception as e:
+        logger.error(f"Error counting job facets: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/api/jobs/{job_id}")
-async def get_job_details(job_id: str):
-    """Get detailed information for a specific job."""
+async def get_job_details(job_id: str, include_archived: bool = False):
+    """
+    Get detailed information for a specific job.
+
+    Expired and filled jobs moved to the archive are only found with
+    ``include_archived``.
+    """
     try:
-        from app.data.database import get_job_repository
+        from app.data.async_database import get_async_job_repository
 
-        job_repo = get_job_repository()
-        job = job_repo.get_job(job_id)
+        job_repo = get_async_job_repository()
+        job = await job_repo.get_job(job_id, include_archived=include_archived)
 
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
@@ -467,14 +520,34 @@ async def get_job_details(job_id: str):
 
 @app.post("/api/jobs/search")
 async def search_jobs_simple(
-    query: str = "", job_types: str = "", locations: str = "", limit: int = 20
+    query: str = "",
+    job_types: str = "",
+    locations: str = "",
+    min_salary: Optional[float] = None,
+    max_salary: Optional[float] = None,
+    sort_by: Literal["recent", "salary"] = "recent",
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None,
+    count: CountStrategy = CountStrategy.CACHED,
 ):
-    """Search jobs using filters (simple version for direct API calls)."""
+    """
+    Search jobs using filters (simple version for direct API calls).
+
+    Salary bounds are annual USD amounts, whatever period and currency a
+    listing was posted in; ``sort_by=salary`` returns the best-paid first.
+    Results are keyset-paginated: pass ``next_cursor`` from a response as
+    ``cursor`` to get the following page. The total is computed for the first
+    page only unless ``include_total`` is given explicitly, using the ``count``
+    strategy; ``total_strategy`` in the response says which one produced it and
+    ``total_is_lower_bound`` whether more jobs than ``total`` match.
+    """
     try:
-        from app.data.database import get_job_repository
+        from app.data.async_database import get_async_job_repository
         from app.data.models import JobType
+        from app.data.pagination import InvalidCursorError
 
-        job_repo = get_job_repository()
+        job_repo = get_async_job_repository()
 
         # Parse job types
         parsed_job_types = None
@@ -493,12 +566,23 @@ async def search_jobs_simple(
             else None
         )
 
-        jobs, total = job_repo.search_jobs(
-            query=query or None,
-            job_types=parsed_job_types,
-            locations=location_list,
-            limit=min(limit, 50),
-        )
+        try:
+            page = await job_repo.search_job_summaries_page(
+                query=query or None,
+                job_types=parsed_job_types,
+                locations=location_list,
+                min_salary=min_salary,
+                max_salary=max_salary,
+                sort_by=sort_by,
+                limit=min(limit, 50),
+                cursor=cursor,
+                include_total=(
+                    cursor is None if include_total is None else include_total
+                ),
+                count_strategy=count,
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
         return {
             "jobs": [
@@ -511,26 +595,25 @@ async def search_jobs_simple(
                     "remote_type": job.remote_type.value if job.remote_type else None,
                     "salary_min": job.salary_min,
                     "salary_max": job.salary_max,
-                    "skills_required": (
-                        job.skills_required[:5] if job.skills_required else []
-                    ),
+                    "skills_required": job.skills_required,
                     "posted_date": (
                         job.posted_date.isoformat() if job.posted_date else None
                     ),
-                    "description": (
-                        job.description[:200] + "..."
-                        if job.description and len(job.description) > 200
-                        else job.description
-                    ),
+                    "description": job.description_snippet,
                 }
-                for job in jobs
+                for job in page.items
             ],
-            "total": total,
+            "total": page.total,
+            "total_strategy": page.total_strategy,
+            "total_is_lower_bound": page.total_is_lower_bound,
+            "next_cursor": page.next_cursor,
             "query": query,
             "filters": {"job_types": job_types, "locations": locations},
             "timestamp": datetime.now().isoformat(),
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error searching jobs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -576,21 +659,21 @@ DEFAULT_USER_ID = "00000000-0000-4000-8000-000000000001"  # Fixed UUID for defau
 async def save_job(job_id: str, request: SaveJobRequest):
     """Save a job for the user."""
     try:
-        from app.data.database import (
-            get_job_repository,
-            get_saved_job_repository,
-            get_user_repository,
+        from app.data.async_database import (
+            get_async_job_repository,
+            get_async_saved_job_repository,
+            get_async_user_repository,
         )
         from app.data.models import UserProfile
         from app.services.timeline_service import TimelineService
 
         # Get repositories
-        saved_job_repo = get_saved_job_repository()
-        user_repo = get_user_repository()
-        job_repo = get_job_repository()
+        saved_job_repo = get_async_saved_job_repository()
+        user_repo = get_async_user_repository()
+        job_repo = get_async_job_repository()
 
         # Ensure default user exists
-        user = user_repo.get_user(DEFAULT_USER_ID)
+        user = await user_repo.get_user(DEFAULT_USER_ID)
         if not user:
             # Create default user
             from uuid import UUID
@@ -601,10 +684,10 @@ async def save_job(job_id: str, request: SaveJobRequest):
                 last_name="User",
                 email="demo@jobpilot.com",
             )
-            user = user_repo.create_user(default_user)
+            user = await user_repo.create_user(default_user)
 
         # Save the job
-        saved_job = saved_job_repo.save_job(
+        saved_job = await saved_job_repo.save_job(
             job_id=request.job_id,
             user_profile_id=DEFAULT_USER_ID,
             notes=request.notes,
@@ -613,14 +696,12 @@ async def save_job(job_id: str, request: SaveJobRequest):
 
         # Log timeline event for job saved
         try:
-            job = job_repo.get_job(request.job_id)
+            job = await job_repo.get_job(request.job_id)
             if job:
-                from app.data.database import get_database_manager
+                from app.data.async_database import get_async_database_manager
 
-                db_manager = get_database_manager()
-                with db_manager.get_session() as db_session:
-                    timeline_service = TimelineService(db_session)
-                    timeline_service.log_job_saved(
+                def log_job_saved(db_session):
+                    TimelineService(db_session).log_job_saved(
                         user_profile_id=DEFAULT_USER_ID,
                         job_id=request.job_id,
                         job_title=job.title,
@@ -628,6 +709,10 @@ async def save_job(job_id: str, request: SaveJobRequest):
                         notes=request.notes,
                         tags=request.tags,
                     )
+
+                db_manager = get_async_database_manager()
+                async with db_manager.get_session() as db_session:
+                    await db_session.run_sync(log_job_saved)
         except Exception as e:
             logger.warning(f"Failed to log timeline event for saved job: {e}")
 
@@ -648,10 +733,10 @@ async def save_job(job_id: str, request: SaveJobRequest):
 async def unsave_job(job_id: str):
     """Remove a job from saved jobs."""
     try:
-        from app.data.database import get_saved_job_repository
+        from app.data.async_database import get_async_saved_job_repository
 
-        saved_job_repo = get_saved_job_repository()
-        success = saved_job_repo.unsave_job(job_id, DEFAULT_USER_ID)
+        saved_job_repo = get_async_saved_job_repository()
+        success = await saved_job_repo.unsave_job(job_id, DEFAULT_USER_ID)
 
         if success:
             return {
@@ -674,13 +759,13 @@ async def get_saved_jobs(limit: int = 20):
     """Get all saved jobs for the user."""
     logger.info(f"GET /api/saved-jobs called with limit={limit}")
     try:
-        from app.data.database import get_saved_job_repository
+        from app.data.async_database import get_async_saved_job_repository
 
-        logger.info("Imported get_saved_job_repository")
+        logger.info("Imported get_async_saved_job_repository")
 
-        saved_job_repo = get_saved_job_repository()
+        saved_job_repo = get_async_saved_job_repository()
         logger.info("Got saved job repository")
-        saved_jobs = saved_job_repo.get_saved_jobs(
+        saved_jobs = await saved_job_repo.get_saved_job_summaries(
             DEFAULT_USER_ID, limit=min(limit, 50)
         )
         logger.info(f"Retrieved {len(saved_jobs)} saved jobs")
@@ -702,15 +787,9 @@ async def get_saved_jobs(limit: int = 20):
                 "salary_min": job["salary_min"],
                 "salary_max": job["salary_max"],
                 "salary_currency": job["salary_currency"],
-                "skills_required": (
-                    job["skills_required"][:5] if job["skills_required"] else []
-                ),
+                "skills_required": job["skills_required"],
                 "posted_date": job["posted_date"],
-                "description": (
-                    job["description"][:200] + "..."
-                    if job["description"] and len(job["description"]) > 200
-                    else job["description"]
-                ),
+                "description": job["description_snippet"],
                 "job_url": job["job_url"],
                 # Saved job metadata
                 "saved_date": saved_job["saved_date"],
@@ -736,10 +815,10 @@ async def get_saved_jobs(limit: int = 20):
 async def check_job_saved(job_id: str):
     """Check if a job is saved by the user."""
     try:
-        from app.data.database import get_saved_job_repository
+        from app.data.async_database import get_async_saved_job_repository
 
-        saved_job_repo = get_saved_job_repository()
-        is_saved = saved_job_repo.is_job_saved(job_id, DEFAULT_USER_ID)
+        saved_job_repo = get_async_saved_job_repository()
+        is_saved = await saved_job_repo.is_job_saved(job_id, DEFAULT_USER_ID)
 
         return {
             "job_id": job_id,
@@ -756,10 +835,10 @@ async def check_job_saved(job_id: str):
 async def update_saved_job(job_id: str, request: SaveJobRequest):
     """Update notes and tags for a saved job."""
     try:
-        from app.data.database import get_saved_job_repository
+        from app.data.async_database import get_async_saved_job_repository
 
-        saved_job_repo = get_saved_job_repository()
-        updated_saved_job = saved_job_repo.update_saved_job(
+        saved_job_repo = get_async_saved_job_repository()
+        updated_saved_job = await saved_job_repo.update_saved_job(
             job_id=job_id,
             user_profile_id=DEFAULT_USER_ID,
             notes=request.notes,